@@ -0,0 +1,149 @@
+"""
+BM25 Keyword Search Benchmark
+
+Compares the inverted-index BM25Index used by AuditGuideRAG with the previous
+token-overlap scorer (which re-tokenized every chunk on every query) on
+synthetic Korean audit-guide corpora. Chunk text follows a Zipf-like term
+distribution; queries are four content words drawn uniformly from the
+vocabulary, like EGA names.
+
+Usage:
+    cd backend
+    python -m benchmarks.bench_bm25                       # 10k, 100k, 1M chunks
+    python -m benchmarks.bench_bm25 --sizes 10000 100000 --queries 50
+
+Note:
+    The 1M chunk corpus needs several GB of RAM for the pure-Python index.
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import List
+
+from src.services.audit_guide_rag import BM25Index, ChunkMetadata, TextChunk
+
+
+STEMS = [
+    "은행", "금융기관", "잔액", "조회서", "매출채권", "재고자산", "실사", "표본",
+    "존재성", "완전성", "평가", "측정", "권리", "의무", "공시", "주석", "분류",
+    "수익인식", "충당금", "감가상각", "유형자산", "리스", "차입금", "이자비용",
+    "외화환산", "파생상품", "특수관계자", "내부통제", "전표", "승인", "대사",
+    "조정표", "계약서", "송장", "선적", "기말", "기초", "증빙", "검토", "확인",
+]
+PARTICLES = ["", "을", "를", "이", "가", "은", "는", "의", "에", "과", "와", "에서"]
+ASCII_TERMS = ["FSLI", "AR", "AP", "PPE", "K-IFRS", "1115", "1109", "3.1", "4.2"]
+
+
+def _build_vocabulary(rng: random.Random, size: int = 5000) -> List[str]:
+    """Audit stems plus compounds and random syllable words for a long tail."""
+    vocab = list(STEMS)
+    vocab += [a + b for a in STEMS for b in STEMS if a != b][:size // 2]
+    while len(vocab) < size:
+        vocab.append("".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.randint(2, 4))))
+    return vocab
+
+
+_VOCAB = _build_vocabulary(random.Random(0))
+# Zipf-like term distribution, as in natural language corpora
+_WEIGHTS = [1 / (rank + 1) for rank in range(len(_VOCAB))]
+
+
+def _random_text(rng: random.Random, words: int) -> str:
+    parts = []
+    for stem in rng.choices(_VOCAB, weights=_WEIGHTS, k=words):
+        if rng.random() < 0.1:
+            parts.append(rng.choice(ASCII_TERMS))
+        else:
+            parts.append(stem + rng.choice(PARTICLES))
+    return " ".join(parts)
+
+
+def build_corpus(size: int, seed: int = 42, words: int = 20) -> List[TextChunk]:
+    """Generate `size` synthetic chunks of roughly `words` words each."""
+    rng = random.Random(seed)
+    return [
+        TextChunk(
+            text=_random_text(rng, words),
+            metadata=ChunkMetadata(
+                chunk_id=f"bench_{i}",
+                document_id="bench",
+                section_code="1.1",
+                section_title="1.1 Benchmark",
+                page_number=i // 10,
+                chunk_index=i,
+                total_chunks=size,
+            ),
+        )
+        for i in range(size)
+    ]
+
+
+def overlap_search(chunks: List[TextChunk], query: str, top_k: int) -> List[tuple]:
+    """Previous AuditGuideRAG._bm25_search: full scan with set overlap."""
+    query_tokens = set(query.lower().split())
+    scores = []
+    for chunk in chunks:
+        doc_tokens = set(chunk.text.lower().split())
+        overlap = len(query_tokens & doc_tokens)
+        scores.append((chunk, overlap / max(len(query_tokens), 1)))
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return scores[:top_k]
+
+
+def _time_queries(fn, queries: List[str]) -> List[float]:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run(sizes: List[int], num_queries: int, top_k: int) -> None:
+    rng = random.Random(7)
+    # EGA-style queries are content words, so draw query terms uniformly
+    queries = [
+        " ".join(w + rng.choice(PARTICLES) for w in rng.sample(_VOCAB, 4))
+        for _ in range(num_queries)
+    ]
+
+    print(f"{'chunks':>10} {'build_s':>9} {'bm25_p50_ms':>12} {'bm25_p99_ms':>12} "
+          f"{'overlap_p50_ms':>15} {'speedup':>8}")
+
+    for size in sizes:
+        chunks = build_corpus(size)
+
+        start = time.perf_counter()
+        index = BM25Index()
+        index.add(chunks)
+        build_s = time.perf_counter() - start
+
+        bm25 = _time_queries(lambda q: index.search(q, top_k), queries)
+        # The full-scan scorer is slow at scale; a handful of queries is enough
+        overlap = _time_queries(
+            lambda q: overlap_search(chunks, q, top_k),
+            queries[:max(3, num_queries // 10)],
+        )
+
+        bm25_p50 = statistics.median(bm25)
+        bm25_p99 = sorted(bm25)[int(len(bm25) * 0.99) - 1] if len(bm25) > 1 else bm25[0]
+        overlap_p50 = statistics.median(overlap)
+
+        print(f"{size:>10} {build_s:>9.2f} {bm25_p50:>12.2f} {bm25_p99:>12.2f} "
+              f"{overlap_p50:>15.2f} {overlap_p50 / bm25_p50:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=30)
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    run(args.sizes, args.queries, args.top_k)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+MCP Hedged Request Benchmark
+
+Compares tail latency of MCPRagClient.search_standards with and without
+hedged requests against an in-process fake MCP server. The fake server
+answers most requests in a few milliseconds, but a fraction of requests hit
+a "slow replica" and stall, which is what dominates p99 on the chat path.
+
+Usage:
+    cd backend
+    python -m benchmarks.bench_mcp_hedging
+    python -m benchmarks.bench_mcp_hedging --requests 1000 --slow-rate 0.05 --slow-ms 300
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from typing import List
+from unittest.mock import patch
+
+import httpx
+
+from src.services.mcp_cache import ToolResultCache
+from src.services.mcp_client import MCPHealthMonitor, MCPRagClient, SingleFlight
+from src.services.mcp_resilience import ServerResilience
+from src.services.mcp_transport import MCPTransport
+
+
+class _BodyStream(httpx.AsyncByteStream):
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+
+    async def __aiter__(self):
+        yield self._body
+
+
+class FakeRagServer:
+    """Fake mcp-rag answering in fast_ms, or slow_ms with probability slow_rate."""
+
+    def __init__(self, fast_ms: float, slow_ms: float, slow_rate: float, seed: int = 0):
+        self.fast_ms = fast_ms
+        self.slow_ms = slow_ms
+        self.slow_rate = slow_rate
+        self.requests = 0
+        self._rng = random.Random(seed)
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        slow = self._rng.random() < self.slow_rate
+        jitter = self._rng.uniform(0.8, 1.2)
+        await asyncio.sleep((self.slow_ms if slow else self.fast_ms) * jitter / 1000)
+
+        body = json.loads(request.content)
+        result = {"status": "success", "data": {"results": []}}
+        return httpx.Response(
+            200, stream=_BodyStream({"jsonrpc": "2.0", "id": body["id"], "result": result})
+        )
+
+
+async def _run(hedge: bool, args: argparse.Namespace) -> dict:
+    server = FakeRagServer(args.fast_ms, args.slow_ms, args.slow_rate)
+    resilience = ServerResilience()
+    transport = MCPTransport(
+        http2=False,
+        transport_factory=lambda: httpx.MockTransport(server.handler)
+    )
+
+    with patch("src.services.mcp_client.get_mcp_transport", return_value=transport), \
+         patch("src.services.mcp_client.get_health_monitor", return_value=MCPHealthMonitor()), \
+         patch("src.services.mcp_client.get_single_flight", return_value=SingleFlight()), \
+         patch("src.services.mcp_client.get_tool_cache", return_value=ToolResultCache(ttls={})), \
+         patch("src.services.mcp_client.get_server_resilience", return_value=resilience):
+        client = MCPRagClient(base_url="http://localhost:8001", hedge_requests=hedge)
+        client.config.hedge_min_delay = args.fast_ms * 1.5 / 1000
+        client.config.batch_window = 0  # Measure hedging alone, one request per call
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        timings: List[float] = []
+
+        async def one(i: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                await client.search_standards(f"query {i}", top_k=5)
+                timings.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*(one(i) for i in range(args.requests)))
+        await transport.aclose()
+
+    # Skip the warm-up phase in which the latency window is still empty
+    timings = timings[resilience.latencies.min_samples:]
+    ordered = sorted(timings)
+    return {
+        "p50": statistics.median(ordered),
+        "p99": ordered[int(len(ordered) * 0.99) - 1],
+        "max": ordered[-1],
+        "requests": server.requests,
+        "hedges": resilience.hedges_sent,
+        "won": resilience.hedges_won,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--fast-ms", type=float, default=5.0)
+    parser.add_argument("--slow-ms", type=float, default=200.0)
+    parser.add_argument("--slow-rate", type=float, default=0.03)
+    args = parser.parse_args()
+
+    print(f"{'mode':>8} {'p50_ms':>8} {'p99_ms':>8} {'max_ms':>8} "
+          f"{'requests':>9} {'hedges':>7} {'won':>5}")
+    for hedge in (False, True):
+        r = asyncio.run(_run(hedge, args))
+        print(f"{'hedged' if hedge else 'plain':>8} {r['p50']:>8.1f} {r['p99']:>8.1f} "
+              f"{r['max']:>8.1f} {r['requests']:>9} {r['hedges']:>7} {r['won']:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+MCP Intent Detection Benchmark
+
+Compares the compiled MCPIntentMatcher used by detect_mcp_need /
+detect_mcp_intents with the previous detection loop, which called
+re.search(pattern, message, re.IGNORECASE) for every pattern of every server
+until the first hit. The corpus is chat messages of the kind auditors send
+on the task chat (Korean and English, with and without tool keywords),
+repeated to the requested size.
+
+Usage:
+    cd backend
+    python -m benchmarks.bench_mcp_intent
+    python -m benchmarks.bench_mcp_intent --messages 50000 --repeat 5
+"""
+
+import argparse
+import re
+import statistics
+import time
+from typing import Callable, List, Optional
+
+from src.api.sse import MCP_KEYWORDS, MCPIntentMatcher
+
+
+CHAT_MESSAGES = [
+    # Finance
+    "매출 1,250억원 기준으로 중요성 금액을 계산해줘",
+    "중요성 기준 금액 산정 근거를 다시 알려줄래?",
+    "What is the materiality threshold for revenue of 50 billion won?",
+    "리스부채 현재가치 계산할 때 할인율은 얼마로 적용해야 하나요?",
+    "유형자산 감가상각 방법이 정액법에서 정률법으로 바뀐 이유 확인 부탁",
+    "Please recompute the present value of the lease payments at 4.5%",
+    "차입금 이자율이 시장 이자율과 차이가 크면 어떻게 검토하나요?",
+    # Excel
+    "이번 분기 매출 거래내역 엑셀 파일을 검토해줘",
+    "첨부한 시산표에서 계정과목별 잔액 합계가 맞는지 확인해줘",
+    "Can you parse the general ledger spreadsheet I uploaded?",
+    "총계정원장과 보조원장 잔액이 일치하는지 대사해줘",
+    "Please check the trial balance for unusual journal entries",
+    "특수관계자 transaction 목록 정리해줘",
+    # Document
+    "매출채권 조회 결과로 감사조서 초안 작성해줘",
+    "재고자산 실사 결과를 workpaper로 정리해줘",
+    "검토 결과를 pdf로 내보낼 수 있어?",
+    "경영진 면담 내용으로 문서 작성 부탁해요",
+    "Draft a memo in Word summarizing the cut-off testing",
+    # RAG
+    "K-IFRS 1115 수익인식 5단계 모형을 설명해주세요",
+    "KIFRS 1116 리스 식별 기준이 뭐야?",
+    "감사기준서 500 감사증거의 충분성과 적합성 요건 알려줘",
+    "금융상품 손상 모형에서 기대신용손실 측정 방법은?",
+    "Which accounting standard covers revenue from licensing?",
+    "K-GAAS에 따른 계속기업 가정 검토 절차를 알려줘",
+    "재무보고 내부통제 테스트 범위는 어떻게 정하나요?",
+    "What does the audit standard say about using the work of an expert?",
+    # Several tools at once
+    "시산표 엑셀 기준으로 중요성 금액을 계산하고 조서로 정리해줘",
+    "K-IFRS 1116 기준으로 리스 할인율 적용이 맞는지 원장에서 확인해줘",
+    "Compute materiality from the trial balance spreadsheet and draft the workpaper",
+    # No tool
+    "안녕하세요, 오늘 회의 일정이 어떻게 되나요?",
+    "감사 계획 수립 시 고려해야 할 위험 요소는 무엇인가요? 특히 재고자산 실사 관련해서 자세히 알려주세요.",
+    "매출채권 조회서 회신율이 낮은데 대체적 절차로 뭘 하면 될까?",
+    "Thanks, that looks good. Let's move on to payables.",
+    "담당자가 자료를 내일까지 준다고 했어요",
+    "현금및현금성자산 잔액 확인 절차 진행 상황 공유 부탁드립니다",
+    "What are the key audit matters we flagged last year?",
+    "네 확인했습니다",
+    "이 계정은 전기 대비 30% 증가했는데 원인 분석이 필요할 것 같아요. 경영진 설명을 받아볼까요?",
+]
+
+
+def legacy_detect(message: str) -> Optional[str]:
+    """Previous detect_mcp_need loop (first matching server)."""
+    message_lower = message.lower()
+    for server_name, config in MCP_KEYWORDS.items():
+        for pattern in config["patterns"]:
+            if re.search(pattern, message_lower, re.IGNORECASE):
+                return server_name
+    return None
+
+
+def _time(fn: Callable[[str], object], corpus: List[str], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for message in corpus:
+            fn(message)
+        timings.append((time.perf_counter() - start) / len(corpus) * 1e6)
+    return timings
+
+
+def run(num_messages: int, repeat: int) -> None:
+    corpus = (CHAT_MESSAGES * (num_messages // len(CHAT_MESSAGES) + 1))[:num_messages]
+    matcher = MCPIntentMatcher(MCP_KEYWORDS)
+
+    mismatches = [
+        m for m in CHAT_MESSAGES
+        if legacy_detect(m) != next(iter(matcher.match(m)), None)
+    ]
+    multi = sum(len(matcher.match(m)) > 1 for m in CHAT_MESSAGES)
+
+    # Warm re's compile cache for the legacy loop before timing
+    for message in CHAT_MESSAGES:
+        legacy_detect(message)
+
+    results = {
+        "legacy first-match": _time(legacy_detect, corpus, repeat),
+        "compiled all-intents": _time(matcher.match, corpus, repeat),
+    }
+
+    print(f"{len(corpus)} messages, {multi}/{len(CHAT_MESSAGES)} distinct messages "
+          f"with several intents, {len(mismatches)} primary-intent mismatches")
+    print(f"{'detector':>22} {'us/msg_p50':>11} {'us/msg_min':>11} {'speedup':>8}")
+    baseline = statistics.median(results["legacy first-match"])
+    for name, timings in results.items():
+        p50 = statistics.median(timings)
+        print(f"{name:>22} {p50:>11.2f} {min(timings):>11.2f} {baseline / p50:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    run(args.messages, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,7 @@ Reference:
 - MCP Clients: backend/src/services/mcp_client.py
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, Awaitable, Callable
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage, BaseMessage, AIMessage
 import json
@@ -66,6 +66,9 @@ class ExcelParserAgent:
     MCP Integration:
     - Uses MCP tools (read_excel_structure, analyze_workpaper_structure) bound to LLM
     - Enables intelligent workpaper analysis with anomaly detection
+    - Parses page by page, aggregating summary and anomalies as pages arrive
+      (stream_raw_data yields partial raw_data; run() publishes each snapshot
+      to the task's SSE stream as a "progress" event)
     - Falls back to mock data if MCP server is unavailable
 
     Tool Bindings:
@@ -73,16 +76,23 @@ class ExcelParserAgent:
     - analyze_workpaper_structure: Deep audit analysis of workpapers
     """
 
-    def __init__(self, model_name: str = "gpt-4o-mini", bind_tools: bool = True):
+    def __init__(
+        self,
+        model_name: str = "gpt-4o-mini",
+        bind_tools: bool = True,
+        page_size: Optional[int] = None
+    ):
         """
         Initialize Excel Parser agent.
 
         Args:
             model_name: GPT model to use for data validation and anomaly detection
             bind_tools: Whether to bind MCP tools to LLM (default: True)
+            page_size: Transactions per parse page (default: MCPExcelClientConfig.page_size)
         """
         self.llm = ChatOpenAI(model=model_name)
         self.agent_name = "Staff_Excel_Parser"
+        self.page_size = page_size
         self._mcp_client: Optional[Any] = None
 
         # Bind MCP Excel tools for tool-calling capability
@@ -131,8 +141,11 @@ class ExcelParserAgent:
             f"[{self.agent_name}] Starting Excel parsing for task {task_id} ({category})"
         )
 
-        # Try MCP Excel parsing first
-        raw_data = await self._parse_with_mcp(file_url, file_path, category)
+        # Try MCP Excel parsing first, reporting progress while pages arrive
+        async def on_snapshot(snapshot: Dict[str, Any]) -> None:
+            await self._publish_progress(task_id, snapshot)
+
+        raw_data = await self._parse_with_mcp(file_url, file_path, category, on_snapshot)
 
         # If MCP failed, use fallback mock data
         if raw_data is None:
@@ -163,21 +176,25 @@ class ExcelParserAgent:
         self,
         file_url: Optional[str],
         file_path: Optional[str],
-        category: str
+        category: str,
+        on_snapshot: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Parse Excel file using MCP Excel Processor.
 
+        Consumes stream_raw_data(), handing every snapshot to on_snapshot,
+        and returns the final one.
+
         Args:
             file_url: URL to Excel file (e.g., Supabase Storage)
             file_path: Local path to Excel file
             category: Account category for context
+            on_snapshot: Awaited with each raw_data snapshot as pages arrive
 
         Returns:
             Parsed data dict or None if MCP unavailable/failed
         """
         from ..services.mcp_client import (
-            MCPExcelClient,
             MCPExcelClientError,
             MCPExcelConnectionError,
             MCPExcelParseError
@@ -192,48 +209,18 @@ class ExcelParserAgent:
         try:
             mcp_client = await self._get_mcp_client()
 
-            # Check server health first
-            if not await mcp_client.health_check():
+            # Cached server health (kept fresh by the background monitor)
+            if not mcp_client.is_available():
                 logger.warning(
                     f"[{self.agent_name}] MCP Excel server unavailable, using fallback"
                 )
                 return None
 
-            # Parse Excel file
-            result = await mcp_client.parse_excel(
-                file_url=file_url,
-                file_path=file_path,
-                category=category,
-                validate_data=True,
-                detect_anomalies=True
-            )
-
-            if result.get("status") == "success":
-                data = result.get("data", {})
-                metadata = result.get("metadata", {})
-
-                # Transform MCP response to expected format
-                return {
-                    "category": category,
-                    "total_sales": int(data.get("total_amount", 0)),
-                    "transaction_count": data.get("transaction_count", 0),
-                    "period": data.get("period", "Unknown"),
-                    "sample_transactions": self._transform_transactions(
-                        data.get("transactions", [])[:3]
-                    ),
-                    "parsed_at": data.get("parsed_at", _get_current_timestamp()),
-                    "data_quality": data.get("data_quality", "UNKNOWN"),
-                    "anomalies_detected": len(data.get("anomalies", [])),
-                    "anomalies": data.get("anomalies", []),
-                    "summary": data.get("summary", {}),
-                    "mcp_metadata": metadata
-                }
-            else:
-                logger.warning(
-                    f"[{self.agent_name}] MCP parse returned non-success: "
-                    f"{result.get('message', 'Unknown error')}"
-                )
-                return None
+            raw_data = None
+            async for raw_data in self.stream_raw_data(file_url, file_path, category):
+                if on_snapshot is not None:
+                    await on_snapshot(raw_data)
+            return raw_data
 
         except MCPExcelConnectionError as e:
             logger.warning(f"[{self.agent_name}] MCP Excel connection error: {e}")
@@ -251,6 +238,93 @@ class ExcelParserAgent:
             logger.error(f"[{self.agent_name}] Unexpected error during MCP parse: {e}")
             return None
 
+    async def stream_raw_data(
+        self,
+        file_url: Optional[str],
+        file_path: Optional[str],
+        category: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parse an Excel file page by page, yielding partial raw_data.
+
+        Summary statistics and anomalies are aggregated as pages arrive, so
+        only one page of transactions is held at a time. Each yielded
+        snapshot has the raw_data shape with "parse_complete" False until
+        the last one; downstream agents can start on the first snapshot
+        (e.g. its sample_transactions) before the parse finishes.
+
+        Args:
+            file_url: URL to Excel file (e.g., Supabase Storage)
+            file_path: Local path to Excel file
+            category: Account category for context
+
+        Yields:
+            raw_data snapshots after each page, then a final complete one
+
+        Raises:
+            MCPExcelParseError: If parsing fails
+            MCPExcelConnectionError: If server is unavailable
+        """
+        from ..services.mcp_excel_stream import ExcelParseAggregator
+
+        mcp_client = await self._get_mcp_client()
+        aggregator = ExcelParseAggregator(category=category, sample_size=3)
+
+        async for page in mcp_client.iter_excel_pages(
+            file_url=file_url,
+            file_path=file_path,
+            category=category,
+            validate_data=True,
+            detect_anomalies=True,
+            page_size=self.page_size
+        ):
+            aggregator.add_page(page)
+            logger.debug(
+                f"[{self.agent_name}] Page {aggregator.pages}: "
+                f"{aggregator.transaction_count} transactions so far"
+            )
+            yield self._to_raw_data(aggregator, category, complete=False)
+
+        yield self._to_raw_data(aggregator, category, complete=True)
+
+    async def _publish_progress(self, task_id: str, raw_data: Dict[str, Any]) -> None:
+        """Publish a raw_data snapshot as a "progress" record on the task's broker topic."""
+        from ..services.message_broker import get_message_broker
+
+        await get_message_broker().publish(task_id, {
+            "type": "progress",
+            "task_id": task_id,
+            "agent_role": self.agent_name,
+            "transaction_count": raw_data["transaction_count"],
+            "total_amount": raw_data["total_sales"],
+            "anomalies_detected": raw_data["anomalies_detected"],
+            "pages": raw_data["mcp_metadata"].get("pages"),
+            "done": raw_data["parse_complete"],
+        })
+
+    def _to_raw_data(
+        self,
+        aggregator: Any,
+        category: str,
+        complete: bool
+    ) -> Dict[str, Any]:
+        """Transform aggregated MCP parse data to the raw_data format."""
+        data = aggregator.result()
+        return {
+            "category": category,
+            "total_sales": int(data["total_amount"]),
+            "transaction_count": data["transaction_count"],
+            "period": data["period"],
+            "sample_transactions": self._transform_transactions(data["transactions"]),
+            "parsed_at": data["parsed_at"],
+            "data_quality": data["data_quality"],
+            "anomalies_detected": data["anomaly_count"],
+            "anomalies": data["anomalies"],
+            "summary": data["summary"],
+            "mcp_metadata": dict(aggregator.metadata, pages=data["pages"]),
+            "parse_complete": complete
+        }
+
     def _transform_transactions(
         self,
         transactions: List[Dict[str, Any]]
@@ -848,17 +922,28 @@ class WorkPaperGeneratorAgent:
     MCP Integration:
     - Uses MCPDocumentClient for document generation when available
     - Falls back to LLM-based generation if MCP unavailable
+
+    Streaming Mode:
+    - Streams the draft with llm.astream and publishes the deltas to the
+      message broker, so SSE clients of the task see "token" events while
+      the draft is written; the final workpaper is returned (and persisted)
+      once, as before
     """
 
-    def __init__(self, model_name: str = "gpt-4o-mini"):
+    def __init__(self, model_name: str = "gpt-4o-mini", stream_tokens: Optional[bool] = None):
         """
         Initialize WorkPaper Generator agent.
 
         Args:
             model_name: GPT model to use for workpaper synthesis and drafting
+            stream_tokens: Stream draft tokens to SSE clients (defaults to
+                LLM_STREAM_TOKENS)
         """
+        from ..services.llm_stream import stream_tokens_enabled
+
         self.llm = ChatOpenAI(model=model_name)
         self.agent_name = "Staff_WorkPaper_Generator"
+        self.stream_tokens = stream_tokens_enabled() if stream_tokens is None else stream_tokens
         self._mcp_client: Optional[Any] = None
         logger.info(f"{self.agent_name} initialized with model {model_name}")
 
@@ -893,7 +978,7 @@ class WorkPaperGeneratorAgent:
         )
 
         # Generate workpaper content using LLM
-        response = await self.llm.ainvoke([
+        prompt = [
             SystemMessage(
                 content=(
                     "You are an experienced audit staff writing formal audit workpapers. "
@@ -930,9 +1015,13 @@ Generate a formal audit workpaper following K-GAAS documentation standards.
 Include sections for: Objective, Procedures, Findings, Exceptions, and Conclusion.
 """
             )
-        ])
+        ]
 
-        workpaper_content = response.content
+        if self.stream_tokens:
+            workpaper_content = await self._stream_draft(prompt, task_id)
+        else:
+            response = await self.llm.ainvoke(prompt)
+            workpaper_content = response.content
 
         # Build full workpaper with metadata
         full_workpaper = f"""
@@ -988,6 +1077,29 @@ Include sections for: Objective, Procedures, Findings, Exceptions, and Conclusio
 
         return result
 
+    async def _stream_draft(self, prompt: List[BaseMessage], task_id: str) -> str:
+        """
+        Generate the draft with astream, publishing deltas as they arrive.
+
+        Args:
+            prompt: Workpaper prompt messages
+            task_id: Task whose SSE clients receive the deltas
+
+        Returns:
+            Full generated workpaper content
+        """
+        from ..services.llm_stream import TokenPublisher, astream_text
+
+        publisher = TokenPublisher(task_id, agent_role=self.agent_name)
+        parts: List[str] = []
+        try:
+            async for delta in astream_text(self.llm, prompt):
+                parts.append(delta)
+                await publisher.add(delta)
+        finally:
+            await publisher.close()
+        return "".join(parts)
+
     async def _generate_document(
         self,
         content: str,
@@ -1015,8 +1127,8 @@ Include sections for: Objective, Procedures, Findings, Exceptions, and Conclusio
         try:
             mcp_client = await self._get_mcp_client()
 
-            # Check server health
-            if not await mcp_client.health_check():
+            # Cached server health (kept fresh by the background monitor)
+            if not mcp_client.is_available():
                 logger.info(
                     f"[{self.agent_name}] MCP Document server unavailable, "
                     f"skipping document generation"
@@ -12,9 +12,10 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
+import asyncio
 import logging
 
-from ...db.supabase_client import supabase
+from ...db.async_client import get_async_db
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -55,19 +56,20 @@ class DashboardMetricsResponse(BaseModel):
 # Helper Functions
 # ============================================================================
 
-def _get_active_projects_count() -> int:
+async def _get_active_projects_count() -> int:
     """
     Count active audit projects.
 
     Active status includes: 'Planning', 'Execution', 'in_progress', 'active'
     """
+    db = get_async_db()
     try:
         # Query for projects in active states
-        result = supabase.table("audit_projects").select(
+        result = await db.execute(db.table("audit_projects").select(
             "id", count="exact"
         ).in_(
             "status", ["Planning", "Execution", "in_progress", "active"]
-        ).execute()
+        ))
 
         return result.count if result.count is not None else 0
     except Exception as e:
@@ -75,18 +77,19 @@ def _get_active_projects_count() -> int:
         return 0
 
 
-def _get_pending_tasks_count() -> int:
+async def _get_pending_tasks_count() -> int:
     """
     Count pending audit tasks.
 
     Pending status includes: 'Pending', 'pending'
     """
+    db = get_async_db()
     try:
-        result = supabase.table("audit_tasks").select(
+        result = await db.execute(db.table("audit_tasks").select(
             "id", count="exact"
         ).in_(
             "status", ["Pending", "pending"]
-        ).execute()
+        ))
 
         return result.count if result.count is not None else 0
     except Exception as e:
@@ -94,18 +97,19 @@ def _get_pending_tasks_count() -> int:
         return 0
 
 
-def _get_completed_audits_count() -> int:
+async def _get_completed_audits_count() -> int:
     """
     Count completed audit projects.
 
     Completed status includes: 'Completed', 'completed', 'Review'
     """
+    db = get_async_db()
     try:
-        result = supabase.table("audit_projects").select(
+        result = await db.execute(db.table("audit_projects").select(
             "id", count="exact"
         ).in_(
             "status", ["Completed", "completed", "Review"]
-        ).execute()
+        ))
 
         return result.count if result.count is not None else 0
     except Exception as e:
@@ -113,14 +117,15 @@ def _get_completed_audits_count() -> int:
         return 0
 
 
-def _get_risk_alerts_count() -> int:
+async def _get_risk_alerts_count() -> int:
     """
     Count pending HITL requests (risk alerts requiring human attention).
     """
+    db = get_async_db()
     try:
-        result = supabase.table("hitl_requests").select(
+        result = await db.execute(db.table("hitl_requests").select(
             "id", count="exact"
-        ).eq("status", "pending").execute()
+        ).eq("status", "pending"))
 
         return result.count if result.count is not None else 0
     except Exception as e:
@@ -128,7 +133,7 @@ def _get_risk_alerts_count() -> int:
         return 0
 
 
-def _get_recent_activities(limit: int = 10) -> List[RecentActivity]:
+async def _get_recent_activities(limit: int = 10) -> List[RecentActivity]:
     """
     Get recent activities from agent_messages table.
 
@@ -144,12 +149,13 @@ def _get_recent_activities(limit: int = 10) -> List[RecentActivity]:
     Returns:
         List of RecentActivity objects
     """
+    db = get_async_db()
     try:
-        result = supabase.table("agent_messages").select(
+        result = await db.execute(db.table("agent_messages").select(
             "id, agent_role, content, message_type, created_at"
         ).order(
             "created_at", desc=True
-        ).limit(limit).execute()
+        ).limit(limit))
 
         activities = []
         type_mapping = {
@@ -224,12 +230,20 @@ async def get_dashboard_metrics() -> DashboardMetricsResponse:
     try:
         logger.info("Fetching dashboard metrics")
 
-        # Fetch all metrics (could be parallelized with asyncio.gather if needed)
-        active_projects = _get_active_projects_count()
-        pending_tasks = _get_pending_tasks_count()
-        completed_audits = _get_completed_audits_count()
-        risk_alerts = _get_risk_alerts_count()
-        recent_activities = _get_recent_activities(limit=10)
+        # Independent queries run concurrently on the async client
+        (
+            active_projects,
+            pending_tasks,
+            completed_audits,
+            risk_alerts,
+            recent_activities,
+        ) = await asyncio.gather(
+            _get_active_projects_count(),
+            _get_pending_tasks_count(),
+            _get_completed_audits_count(),
+            _get_risk_alerts_count(),
+            _get_recent_activities(limit=10),
+        )
 
         logger.info(
             f"Dashboard metrics: active={active_projects}, pending={pending_tasks}, "
@@ -20,7 +20,7 @@ import uuid
 import tempfile
 import os
 
-from ...db.supabase_client import supabase
+from ...db.async_client import get_async_db
 from ...graph.nodes.ega_parser import (
     parse_assigned_workflow,
     get_ega_summary,
@@ -115,11 +115,12 @@ async def list_egas(
     Returns:
         EGAListResponse with list of EGAs and optional summary
     """
+    db = get_async_db()
     try:
         logger.info(f"Listing EGAs for project: {project_id}")
 
         # Verify project exists
-        project_check = supabase.table("audit_projects").select("id").eq("id", project_id).execute()
+        project_check = await db.execute(db.table("audit_projects").select("id").eq("id", project_id))
         if not project_check.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -127,7 +128,7 @@ async def list_egas(
             )
 
         # Build query
-        query = supabase.table("audit_egas").select("*", count="exact").eq("project_id", project_id)
+        query = db.table("audit_egas").select("*", count="exact").eq("project_id", project_id)
 
         # Apply filters
         if risk_level:
@@ -159,7 +160,7 @@ async def list_egas(
         query = query.range(offset, offset + limit - 1)
 
         # Execute query
-        result = query.execute()
+        result = await db.execute(query)
 
         egas = [_convert_ega_row_to_response(row) for row in (result.data or [])]
         total = result.count if result.count is not None else len(egas)
@@ -211,11 +212,12 @@ async def get_ega(project_id: str, ega_id: str) -> EGADetailResponse:
     Returns:
         EGADetailResponse with EGA details
     """
+    db = get_async_db()
     try:
         logger.info(f"Getting EGA: {ega_id} for project: {project_id}")
 
         # Query for the EGA
-        result = supabase.table("audit_egas").select("*").eq("id", ega_id).eq("project_id", project_id).execute()
+        result = await db.execute(db.table("audit_egas").select("*").eq("id", ega_id).eq("project_id", project_id))
 
         if not result.data:
             logger.warning(f"EGA not found: {ega_id}")
@@ -267,11 +269,12 @@ async def create_ega(
     Returns:
         EGADetailResponse with created EGA details
     """
+    db = get_async_db()
     try:
         logger.info(f"Creating EGA for project: {project_id}")
 
         # Verify project exists
-        project_check = supabase.table("audit_projects").select("id").eq("id", project_id).execute()
+        project_check = await db.execute(db.table("audit_projects").select("id").eq("id", project_id))
         if not project_check.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -298,7 +301,7 @@ async def create_ega(
         }
 
         # Insert into Supabase
-        result = supabase.table("audit_egas").insert(ega_data).execute()
+        result = await db.execute(db.table("audit_egas").insert(ega_data))
 
         if not result.data:
             logger.error("Failed to create EGA - no data returned from Supabase")
@@ -354,11 +357,12 @@ async def update_ega(
     Returns:
         EGADetailResponse with updated EGA details
     """
+    db = get_async_db()
     try:
         logger.info(f"Updating EGA: {ega_id}")
 
         # Check if EGA exists
-        existing = supabase.table("audit_egas").select("id").eq("id", ega_id).eq("project_id", project_id).execute()
+        existing = await db.execute(db.table("audit_egas").select("id").eq("id", ega_id).eq("project_id", project_id))
         if not existing.data:
             logger.warning(f"EGA not found for update: {ega_id}")
             raise HTTPException(
@@ -385,7 +389,7 @@ async def update_ega(
             update_data["metadata"] = request_data.metadata
 
         # Update in Supabase
-        result = supabase.table("audit_egas").update(update_data).eq("id", ega_id).execute()
+        result = await db.execute(db.table("audit_egas").update(update_data).eq("id", ega_id))
 
         if not result.data:
             logger.error(f"Failed to update EGA - no data returned: {ega_id}")
@@ -433,11 +437,12 @@ async def delete_ega(project_id: str, ega_id: str) -> Dict[str, Any]:
     Returns:
         Confirmation of deletion
     """
+    db = get_async_db()
     try:
         logger.info(f"Deleting EGA: {ega_id}")
 
         # Check if EGA exists
-        existing = supabase.table("audit_egas").select("id, name").eq("id", ega_id).eq("project_id", project_id).execute()
+        existing = await db.execute(db.table("audit_egas").select("id, name").eq("id", ega_id).eq("project_id", project_id))
         if not existing.data:
             logger.warning(f"EGA not found for deletion: {ega_id}")
             raise HTTPException(
@@ -448,7 +453,7 @@ async def delete_ega(project_id: str, ega_id: str) -> Dict[str, Any]:
         ega_name = existing.data[0].get("name", "Unknown")
 
         # Delete from Supabase
-        supabase.table("audit_egas").delete().eq("id", ega_id).execute()
+        await db.execute(db.table("audit_egas").delete().eq("id", ega_id))
 
         logger.info(f"EGA deleted successfully: {ega_id}")
 
@@ -511,13 +516,14 @@ async def parse_egas(
     Returns:
         EGAParseResponse with created EGAs and parsing metadata
     """
+    db = get_async_db()
     temp_file_path = None
 
     try:
         logger.info(f"Parsing EGAs for project: {project_id}")
 
         # Verify project exists
-        project_check = supabase.table("audit_projects").select("id, client_name").eq("id", project_id).execute()
+        project_check = await db.execute(db.table("audit_projects").select("id, client_name").eq("id", project_id))
         if not project_check.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -574,7 +580,7 @@ async def parse_egas(
             ega_dict = ega.to_dict()
 
             try:
-                result = supabase.table("audit_egas").insert(ega_dict).execute()
+                result = await db.execute(db.table("audit_egas").insert(ega_dict))
 
                 if result.data:
                     created_egas.append(_convert_ega_row_to_response(result.data[0]))
@@ -5,14 +5,19 @@ This module provides health check endpoints for monitoring service availability.
 
 Endpoints:
 - GET /api/health: Service health check
+- GET /api/metrics: MCP call latency histograms and counters
 """
 
-from fastapi import APIRouter, HTTPException, Request, status
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import PlainTextResponse
+from typing import Dict, Any, Union
 from datetime import datetime
 import logging
 
-from ...db.supabase_client import supabase
+from ...db.async_client import get_async_db
+from ...services.mcp_cache import mcp_tool_cache_stats
+from ...services.mcp_metrics import get_mcp_metrics
+from ...services.mcp_transport import mcp_transport_stats
 from .schemas import ErrorResponse
 
 # Configure logging
@@ -42,24 +47,37 @@ async def health_check(request: Request) -> Dict[str, Any]:
     - LangGraph instance is initialized
     - Supabase client is accessible
 
+    Also reports utilization of the shared MCP connection pools, the direct
+    Postgres pool, the hit rate of the MCP tool result cache and the
+    checkpoint bytes written per superstep.
+
     Returns:
-        Health status with component checks
+        Health status with component checks, pool and cache metrics
     """
     try:
         # Check LangGraph initialization
         graph_healthy = request.app.state.graph is not None
 
-        # Check Supabase connectivity (simple check - could be enhanced)
-        supabase_healthy = supabase is not None
+        # Check Supabase configuration (simple check - could be enhanced)
+        db = get_async_db()
+        supabase_healthy = bool(db.url and db.service_key)
 
         overall_healthy = graph_healthy and supabase_healthy
 
+        # Only the Postgres saver reports write stats (MemorySaver in E2E mode)
+        checkpointer = getattr(request.app.state, "checkpointer", None)
+        checkpoint_stats = checkpointer.stats() if hasattr(checkpointer, "stats") else {}
+
         return {
             "status": "healthy" if overall_healthy else "degraded",
             "components": {
                 "langgraph": "ok" if graph_healthy else "error",
                 "supabase": "ok" if supabase_healthy else "error"
             },
+            "mcp_pools": mcp_transport_stats(),
+            "db_pool": db.stats(),
+            "mcp_tool_cache": mcp_tool_cache_stats(),
+            "checkpoints": checkpoint_stats,
             "timestamp": datetime.utcnow().isoformat()
         }
 
@@ -69,3 +87,43 @@ async def health_check(request: Request) -> Dict[str, Any]:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Service health check failed"
         )
+
+
+# ============================================================================
+# Metrics Endpoint
+# ============================================================================
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    response_model=None,
+    responses={
+        200: {"description": "MCP call metrics (Prometheus text or JSON)"},
+    }
+)
+async def metrics(
+    format: str = Query("prometheus", pattern="^(prometheus|json)$")
+) -> Union[PlainTextResponse, Dict[str, Any]]:
+    """
+    MCP client metrics for finding the bottleneck server under load.
+
+    Reports latency percentiles (p50/p90/p99/p99.9 from HDR-style
+    histograms) and call, error, cache hit, coalescing, attempt and byte
+    counters per MCP server and tool.
+
+    Args:
+        format: "prometheus" (text exposition, default) or "json"
+
+    Returns:
+        Prometheus exposition text, or a JSON snapshot keyed by server
+    """
+    mcp_metrics = get_mcp_metrics()
+    if format == "json":
+        return {
+            "mcp_servers": mcp_metrics.snapshot(),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    return PlainTextResponse(
+        mcp_metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
@@ -15,7 +15,7 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 import logging
 
-from ...db.supabase_client import supabase
+from ...db.async_client import get_async_db
 from .schemas import (
     HITLRequestResponse,
     HITLListResponse,
@@ -150,11 +150,12 @@ async def list_pending_hitl_requests(
     Returns:
         HITLListResponse with list of pending requests and optional summary
     """
+    db = get_async_db()
     try:
         logger.info(f"Listing pending HITL requests (project={project_id}, urgency={urgency_level})")
 
         # Build query for pending requests only
-        query = supabase.table("hitl_requests").select("*", count="exact").eq("status", "pending")
+        query = db.table("hitl_requests").select("*", count="exact").eq("status", "pending")
 
         # Apply filters
         if project_id:
@@ -176,7 +177,7 @@ async def list_pending_hitl_requests(
         query = query.range(offset, offset + limit - 1)
 
         # Execute query
-        result = query.execute()
+        result = await db.execute(query)
 
         requests = [_convert_hitl_row_to_response(row) for row in (result.data or [])]
         total = result.count if result.count is not None else len(requests)
@@ -245,11 +246,12 @@ async def list_hitl_requests(
     Returns:
         HITLListResponse with list of requests and optional summary
     """
+    db = get_async_db()
     try:
         logger.info(f"Listing HITL requests (status={status_filter}, type={request_type})")
 
         # Build query
-        query = supabase.table("hitl_requests").select("*", count="exact")
+        query = db.table("hitl_requests").select("*", count="exact")
 
         # Apply filters
         if project_id:
@@ -293,7 +295,7 @@ async def list_hitl_requests(
         query = query.range(offset, offset + limit - 1)
 
         # Execute query
-        result = query.execute()
+        result = await db.execute(query)
 
         requests = [_convert_hitl_row_to_response(row) for row in (result.data or [])]
         total = result.count if result.count is not None else len(requests)
@@ -347,11 +349,12 @@ async def get_hitl_request(request_id: str) -> HITLDetailResponse:
     Returns:
         HITLDetailResponse with request details
     """
+    db = get_async_db()
     try:
         logger.info(f"Getting HITL request: {request_id}")
 
         # Query Supabase for the request
-        result = supabase.table("hitl_requests").select("*").eq("id", request_id).execute()
+        result = await db.execute(db.table("hitl_requests").select("*").eq("id", request_id))
 
         if not result.data:
             logger.warning(f"HITL request not found: {request_id}")
@@ -413,11 +416,12 @@ async def respond_to_hitl_request(
     Returns:
         HITLRespondResponse with submission status and workflow state
     """
+    db = get_async_db()
     try:
         logger.info(f"Processing HITL response for request: {request_id} (action={request_data.action})")
 
         # Get the HITL request
-        hitl_result = supabase.table("hitl_requests").select("*").eq("id", request_id).execute()
+        hitl_result = await db.execute(db.table("hitl_requests").select("*").eq("id", request_id))
 
         if not hitl_result.data:
             logger.warning(f"HITL request not found: {request_id}")
@@ -458,7 +462,7 @@ async def respond_to_hitl_request(
             "updated_at": datetime.utcnow().isoformat()
         }
 
-        update_result = supabase.table("hitl_requests").update(update_data).eq("id", request_id).execute()
+        update_result = await db.execute(db.table("hitl_requests").update(update_data).eq("id", request_id))
 
         if not update_result.data:
             logger.error(f"Failed to update HITL request: {request_id}")
@@ -488,7 +492,7 @@ async def respond_to_hitl_request(
                 task_status = "hitl_approved"
 
             try:
-                supabase.table("audit_tasks").update(task_update).eq("id", task_id).execute()
+                await db.execute(db.table("audit_tasks").update(task_update).eq("id", task_id))
                 logger.info(f"Task {task_id} updated with HITL response")
             except Exception as task_error:
                 logger.warning(f"Failed to update task {task_id}: {task_error}")
@@ -19,7 +19,7 @@ from datetime import datetime
 import logging
 import uuid
 
-from ...db.supabase_client import supabase
+from ...db.async_client import get_async_db
 from .schemas import (
     StartAuditRequest,
     StartAuditResponse,
@@ -188,6 +188,7 @@ async def create_project(request_data: CreateProjectRequest) -> ProjectCreateRes
     Returns:
         ProjectCreateResponse with created project details
     """
+    db = get_async_db()
     try:
         # Generate UUID for the new project
         project_id = str(uuid.uuid4())
@@ -205,7 +206,7 @@ async def create_project(request_data: CreateProjectRequest) -> ProjectCreateRes
         logger.info(f"Creating project: {request_data.client_name} (FY{request_data.fiscal_year})")
 
         # Insert into Supabase
-        result = supabase.table("audit_projects").insert(project_data).execute()
+        result = await db.execute(db.table("audit_projects").insert(project_data))
 
         if not result.data:
             logger.error("Failed to create project - no data returned from Supabase")
@@ -261,11 +262,12 @@ async def list_projects(
     Returns:
         ProjectListResponse with list of projects and total count
     """
+    db = get_async_db()
     try:
         logger.info(f"Listing projects (status={status_filter}, limit={limit}, offset={offset})")
 
         # Build query
-        query = supabase.table("audit_projects").select("*", count="exact")
+        query = db.table("audit_projects").select("*", count="exact")
 
         # Apply status filter if provided
         if status_filter:
@@ -282,7 +284,7 @@ async def list_projects(
         query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
 
         # Execute query
-        result = query.execute()
+        result = await db.execute(query)
 
         projects = [_convert_project_row_to_response(row) for row in (result.data or [])]
         total = result.count if result.count is not None else len(projects)
@@ -326,11 +328,12 @@ async def get_project(project_id: str) -> ProjectDetailResponse:
     Returns:
         ProjectDetailResponse with project details
     """
+    db = get_async_db()
     try:
         logger.info(f"Getting project: {project_id}")
 
         # Query Supabase for the project
-        result = supabase.table("audit_projects").select("*").eq("id", project_id).execute()
+        result = await db.execute(db.table("audit_projects").select("*").eq("id", project_id))
 
         if not result.data:
             logger.warning(f"Project not found: {project_id}")
@@ -384,11 +387,12 @@ async def update_project(
     Returns:
         ProjectDetailResponse with updated project details
     """
+    db = get_async_db()
     try:
         logger.info(f"Updating project: {project_id}")
 
         # Check if project exists
-        existing = supabase.table("audit_projects").select("id").eq("id", project_id).execute()
+        existing = await db.execute(db.table("audit_projects").select("id").eq("id", project_id))
         if not existing.data:
             logger.warning(f"Project not found for update: {project_id}")
             raise HTTPException(
@@ -409,7 +413,7 @@ async def update_project(
             update_data["status"] = request_data.status.value
 
         # Update in Supabase
-        result = supabase.table("audit_projects").update(update_data).eq("id", project_id).execute()
+        result = await db.execute(db.table("audit_projects").update(update_data).eq("id", project_id))
 
         if not result.data:
             logger.error(f"Failed to update project - no data returned: {project_id}")
@@ -460,11 +464,12 @@ async def delete_project(project_id: str) -> ProjectDeleteResponse:
     Returns:
         ProjectDeleteResponse confirming deletion
     """
+    db = get_async_db()
     try:
         logger.info(f"Deleting project: {project_id}")
 
         # Check if project exists
-        existing = supabase.table("audit_projects").select("id, client_name").eq("id", project_id).execute()
+        existing = await db.execute(db.table("audit_projects").select("id, client_name").eq("id", project_id))
         if not existing.data:
             logger.warning(f"Project not found for deletion: {project_id}")
             raise HTTPException(
@@ -475,7 +480,7 @@ async def delete_project(project_id: str) -> ProjectDeleteResponse:
         client_name = existing.data[0].get("client_name", "Unknown")
 
         # Delete from Supabase
-        supabase.table("audit_projects").delete().eq("id", project_id).execute()
+        await db.execute(db.table("audit_projects").delete().eq("id", project_id))
 
         logger.info(f"Project deleted successfully: {project_id}")
 
@@ -1,7 +1,10 @@
 """Server-Sent Events (SSE) Streaming Endpoint
 
 This module provides real-time streaming of agent messages via SSE.
-Uses polling-based approach to query database for new messages.
+Messages are pushed through the in-process message broker
+(src/services/message_broker.py) as soon as they are written, and all
+connections watching a task share one numbered event stream
+(src/services/task_stream.py) that clients resume with Last-Event-ID.
 Supports message processing through LangGraph when a message query parameter is provided.
 Integrates MCP server tools for ad-hoc tool usage (RAG, Excel, Finance calculations).
 
@@ -11,11 +14,16 @@ Key Endpoint:
 
 SSE Event Types:
     - "message": New agent message inserted
+    - "token": Text delta of a message still being generated (streaming mode)
+    - "progress": Running totals of a Staff agent still parsing a ledger
+    - "gap": Events were dropped because the client fell too far behind
     - "heartbeat": Keep-alive ping every 30 seconds
     - "error": Error occurred during streaming
 
 MCP Integration:
-    - Detects keywords in messages to trigger appropriate MCP tools
+    - Detects keywords in messages to trigger appropriate MCP tools; the
+      keyword table is compiled once into a single matcher and every matching
+      tool is called concurrently
     - Stores MCP results in audit_artifacts table
     - Includes MCP context in LLM prompt for enhanced responses
 
@@ -47,6 +55,11 @@ import logging
 import os
 import re
 
+from ..db.async_client import get_async_db
+from ..services.llm_stream import TokenPublisher, astream_text, stream_tokens_enabled
+from ..services.message_broker import get_message_broker
+from ..services.task_stream import StreamLagError, get_task_stream_hub
+
 logger = logging.getLogger(__name__)
 
 # Simple chat LLM for ad-hoc messages (bypasses complex audit graph)
@@ -93,8 +106,8 @@ Please use this information to provide a comprehensive response to the user's qu
 # ============================================================================
 
 # MCP keyword patterns for detection
-# NOTE: Order matters! More specific patterns should be checked before general ones.
-# Use OrderedDict-like behavior - first match wins.
+# NOTE: Order matters! Servers are reported in this order and the first one
+# is the primary intent (detect_mcp_need), so more specific servers come first.
 MCP_KEYWORDS = {
     # Finance calculations - check BEFORE mcp-rag since "중요성 기준" contains "기준"
     "mcp-finance": {
@@ -168,11 +181,109 @@ MCP_KEYWORDS = {
 }
 
 
+class MCPIntentMatcher:
+    """Keyword table compiled into one regex that finds every MCP intent.
+
+    All patterns of all servers are joined into a single alternation, so a
+    message is scanned once instead of once per pattern. Every position
+    where some pattern matches is then checked against the per-server
+    patterns, which reports all matching servers (not just the first),
+    exactly as if each pattern had been searched separately.
+
+    Messages are lowercased before matching (as detect_mcp_need always did);
+    the table is compiled case-sensitively when every pattern is already
+    lowercase, which lets the regex engine skip quickly between candidates.
+
+    Example:
+        ```python
+        matcher = MCPIntentMatcher(MCP_KEYWORDS)
+        matcher.match("시산표 엑셀에서 중요성 금액을 계산해줘")
+        # ['mcp-finance', 'mcp-excel']
+        ```
+    """
+
+    def __init__(self, keywords: Dict[str, Dict[str, Any]]):
+        """Compile the keyword table.
+
+        Args:
+            keywords: Server name -> {"patterns": [...], "tool": ...}, in
+                priority order
+        """
+        self.servers = list(keywords)
+        patterns = [p for config in keywords.values() for p in config["patterns"]]
+        flags = 0 if all(p == p.lower() for p in patterns) else re.IGNORECASE
+
+        def alternation(items: List[str]) -> str:
+            return "|".join(f"(?:{p})" for p in items)
+
+        self._any = re.compile(alternation(patterns), flags)
+        self._server_patterns = [
+            re.compile(alternation(keywords[server]["patterns"]), flags)
+            for server in self.servers
+        ]
+
+    def match(self, message: str) -> List[str]:
+        """Find every server whose keywords appear in the message.
+
+        Args:
+            message: User message
+
+        Returns:
+            Matching server names in priority (table) order
+        """
+        text = message.lower()
+        found = [False] * len(self.servers)
+        remaining = len(self.servers)
+        pos = 0
+        while remaining:
+            hit = self._any.search(text, pos)
+            if hit is None:
+                break
+            start = hit.start()
+            for i, pattern in enumerate(self._server_patterns):
+                if not found[i] and pattern.match(text, start):
+                    found[i] = True
+                    remaining -= 1
+            pos = start + 1
+        return [server for server, hit in zip(self.servers, found) if hit]
+
+
+# Compiled once at import; rebuild if MCP_KEYWORDS is changed at runtime
+_intent_matcher = MCPIntentMatcher(MCP_KEYWORDS)
+
+
+async def detect_mcp_intents(message: str) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """Detect every MCP tool call a message asks for.
+
+    Args:
+        message: User message to analyze
+
+    Returns:
+        List of (server_name, tool_name, arguments) in MCP_KEYWORDS priority
+        order (finance and excel before document and rag); empty if no
+        keyword matches
+
+    Example:
+        >>> await detect_mcp_intents("시산표 엑셀 기준으로 중요성 금액을 계산해줘")
+        [('mcp-finance', 'calculate_materiality', {...}),
+         ('mcp-excel', 'parse_excel', {...}),
+         ('mcp-rag', 'search_standards', {...})]
+    """
+    intents = []
+    for server_name in _intent_matcher.match(message):
+        config = MCP_KEYWORDS[server_name]
+        logger.info(f"MCP tool detected: {server_name} ({config['description']})")
+        arguments = _build_mcp_arguments(server_name, config["tool"], message)
+        intents.append((server_name, config["tool"], arguments))
+    return intents
+
+
 async def detect_mcp_need(message: str) -> Optional[Tuple[str, str, Dict[str, Any]]]:
     """Detect if message needs MCP tool call based on keywords.
 
     Analyzes the message for keywords that indicate the need for specific
     MCP server tools (RAG search, finance calculations, Excel processing, etc.)
+    and returns the highest-priority one; see detect_mcp_intents for all.
 
     Args:
         message: User message to analyze
@@ -185,20 +296,14 @@ async def detect_mcp_need(message: str) -> Optional[Tuple[str, str, Dict[str, An
         >>> await detect_mcp_need("K-IFRS 1115에 대해 설명해주세요")
         ('mcp-rag', 'search_standards', {'query_text': '...', 'top_k': 5})
     """
-    message_lower = message.lower()
-
-    # Check each MCP server's keyword patterns
-    for server_name, config in MCP_KEYWORDS.items():
-        for pattern in config["patterns"]:
-            if re.search(pattern, message_lower, re.IGNORECASE):
-                logger.info(f"MCP tool detected: {server_name} ({config['description']})")
-
-                # Build tool-specific arguments
-                arguments = _build_mcp_arguments(server_name, config["tool"], message)
-
-                return (server_name, config["tool"], arguments)
+    servers = _intent_matcher.match(message)
+    if not servers:
+        return None
 
-    return None
+    server_name = servers[0]
+    config = MCP_KEYWORDS[server_name]
+    logger.info(f"MCP tool detected: {server_name} ({config['description']})")
+    return (server_name, config["tool"], _build_mcp_arguments(server_name, config["tool"], message))
 
 
 def _build_mcp_arguments(server_name: str, tool_name: str, message: str) -> Dict[str, Any]:
@@ -275,18 +380,19 @@ async def execute_mcp_tool(
         if server_name == "mcp-rag":
             from ..services.mcp_client import MCPRagClient
 
-            async with MCPRagClient() as client:
-                # Check health first
-                if not await client.health_check():
+            # Chat path is latency-critical: hedge slow (read-only) RAG calls
+            async with MCPRagClient(hedge_requests=True) as client:
+                # Cached health state (no extra round trip)
+                if not client.is_available():
                     logger.warning(
                         f"MCP {server_name}/{tool_name} failed after 0 retries: "
-                        "server health check failed"
+                        "server marked unavailable by health monitor"
                     )
                     return None, MCPError(
                         server=server_name,
                         tool=tool_name,
                         error_type="connection",
-                        message="MCP RAG server unavailable (health check failed)",
+                        message="MCP RAG server unavailable (health monitor)",
                         retries_attempted=0,
                         fallback_used=False
                     )
@@ -309,16 +415,16 @@ async def execute_mcp_tool(
             from ..services.mcp_client import MCPExcelClient
 
             async with MCPExcelClient() as client:
-                if not await client.health_check():
+                if not client.is_available():
                     logger.warning(
                         f"MCP {server_name}/{tool_name} failed after 0 retries: "
-                        "server health check failed"
+                        "server marked unavailable by health monitor"
                     )
                     return None, MCPError(
                         server=server_name,
                         tool=tool_name,
                         error_type="connection",
-                        message="MCP Excel server unavailable (health check failed)",
+                        message="MCP Excel server unavailable (health monitor)",
                         retries_attempted=0,
                         fallback_used=False
                     )
@@ -343,16 +449,16 @@ async def execute_mcp_tool(
             from ..services.mcp_client import MCPDocumentClient
 
             async with MCPDocumentClient() as client:
-                if not await client.health_check():
+                if not client.is_available():
                     logger.warning(
                         f"MCP {server_name}/{tool_name} failed after 0 retries: "
-                        "server health check failed"
+                        "server marked unavailable by health monitor"
                     )
                     return None, MCPError(
                         server=server_name,
                         tool=tool_name,
                         error_type="connection",
-                        message="MCP Document server unavailable (health check failed)",
+                        message="MCP Document server unavailable (health monitor)",
                         retries_attempted=0,
                         fallback_used=False
                     )
@@ -462,7 +568,7 @@ async def escalate_to_hitl(
         HITL request ID if created successfully, None otherwise
     """
     try:
-        from ..db.supabase_client import supabase
+        db = get_async_db()
 
         hitl_id = str(uuid4())
         hitl_record = {
@@ -480,7 +586,7 @@ async def escalate_to_hitl(
         }
 
         # Try to insert into hitl_requests table
-        insert_result = supabase.table("hitl_requests").insert(hitl_record).execute()
+        insert_result = await db.execute(db.table("hitl_requests").insert(hitl_record))
 
         if insert_result.data:
             logger.error(
@@ -559,7 +665,7 @@ async def store_mcp_result(
         Artifact ID if stored successfully, None otherwise
     """
     try:
-        from ..db.supabase_client import supabase
+        db = get_async_db()
 
         artifact_id = str(uuid4())
         artifact_record = {
@@ -575,7 +681,7 @@ async def store_mcp_result(
             }
         }
 
-        insert_result = supabase.table("audit_artifacts").insert(artifact_record).execute()
+        insert_result = await db.execute(db.table("audit_artifacts").insert(artifact_record))
 
         if insert_result.data:
             logger.info(f"MCP result stored as artifact: {artifact_id}")
@@ -685,30 +791,323 @@ router = APIRouter()
 # Maps task_id -> asyncio.Queue for message injection
 message_queues: Dict[str, asyncio.Queue] = {}
 
+HEARTBEAT_INTERVAL = 30.0  # seconds
+# Longest wait for stream events before re-checking disconnect/test injection
+WAIT_INTERVAL = 5.0  # seconds
+# A client not accepting an event for this long is disconnected (its
+# reader is detached; on reconnect it resumes via Last-Event-ID)
+SEND_TIMEOUT = 30.0  # seconds
+
+# Background chat tasks (kept referenced until they finish)
+_chat_tasks: Set[asyncio.Task] = set()
+
+
+async def publish_agent_message(record: Dict[str, Any]) -> None:
+    """Push an inserted agent_messages row to open SSE streams of its task.
+
+    Args:
+        record: Inserted row (must include "task_id")
+    """
+    await get_message_broker().publish(record["task_id"], record)
+
+
+async def _run_mcp_intent(
+    task_id: str,
+    intent: Tuple[str, str, Dict[str, Any]],
+    decoded_message: str
+) -> Tuple[str, Optional[Dict[str, Any]], Optional["MCPError"]]:
+    """Execute one detected MCP tool call for the chat path.
+
+    On success the result is stored as an audit artifact and formatted as
+    LLM context. On failure the chat degrades gracefully: an error notice is
+    inserted and published, and an open circuit breaker escalates to HITL.
+
+    Args:
+        task_id: UUID of the audit task
+        intent: (server_name, tool_name, arguments) from detect_mcp_intents
+        decoded_message: Decoded user message (for HITL escalation)
+
+    Returns:
+        Tuple of (mcp_context, mcp_result, mcp_error); mcp_context is ""
+        unless the tool succeeded
+    """
+    db = get_async_db()
+
+    server_name, tool_name, arguments = intent
+    logger.info(
+        f"MCP tool needed for task {task_id}: "
+        f"{server_name}/{tool_name}"
+    )
+
+    # Execute MCP tool with error handling
+    mcp_result, mcp_error = await execute_mcp_tool(
+        server_name, tool_name, arguments
+    )
+
+    mcp_context = ""
+    if mcp_result and not mcp_error:
+        # Success: Store MCP result in database for audit trail
+        await store_mcp_result(
+            task_id, server_name, tool_name, mcp_result
+        )
+
+        # Format result for LLM context
+        mcp_context = format_mcp_result_for_context(
+            server_name, tool_name, mcp_result
+        )
+
+        logger.info(
+            f"MCP context added for task {task_id}: "
+            f"{len(mcp_context)} chars"
+        )
+    elif mcp_error:
+        # MCP failed - apply graceful degradation
+        mcp_error.fallback_used = True
+
+        logger.info(
+            f"Falling back to basic LLM for {task_id}"
+        )
+
+        # Insert system message about MCP error
+        error_msg_data = create_mcp_error_message(mcp_error, fallback_used=True)
+        error_msg_id = str(uuid4())
+        error_msg_timestamp = datetime.now(timezone.utc).isoformat()
+
+        error_message_record = {
+            "id": error_msg_id,
+            "task_id": task_id,
+            "agent_role": error_msg_data["agent_role"],
+            "content": error_msg_data["content"],
+            "message_type": "system",
+            "metadata": error_msg_data["metadata"],
+            "created_at": error_msg_timestamp
+        }
+        await db.execute(db.table("agent_messages").insert(error_message_record))
+        await publish_agent_message(error_message_record)
+
+        # Escalate to HITL for critical errors (circuit breaker open)
+        if mcp_error.error_type == "circuit_breaker":
+            await escalate_to_hitl(
+                task_id, mcp_error, decoded_message
+            )
+    else:
+        logger.info(
+            f"MCP tool returned no result for task {task_id}"
+        )
+
+    return mcp_context, mcp_result, mcp_error
+
+
+async def _process_chat_message(task_id: str, message: str, stream: Optional[bool]) -> None:
+    """Answer a chat message sent with the SSE request.
+
+    Runs as a background task next to the SSE stream: every row it inserts
+    into agent_messages (user message, MCP notices, answer) and every token
+    delta is published to the message broker, so the requesting connection
+    and every other viewer of the task receive them through the shared task
+    stream. The answer is still persisted if the client disconnects.
+
+    Args:
+        task_id: UUID of the audit task
+        message: URL-encoded user message
+        stream: Stream the answer as token events (defaults to LLM_STREAM_TOKENS)
+    """
+    db = get_async_db()
+
+    try:
+        # Decode URL-encoded message (may be double-encoded from frontend)
+        decoded_message = unquote(unquote(message))
+        logger.info(f"Processing user message for task {task_id}: {decoded_message[:100]}...")
+
+        # 1. Insert user message into agent_messages table
+        user_msg_id = str(uuid4())
+        user_msg_timestamp = datetime.now(timezone.utc).isoformat()
+        user_message_record = {
+            "id": user_msg_id,
+            "task_id": task_id,
+            "agent_role": "user",
+            "content": decoded_message,
+            "message_type": "instruction",
+            "metadata": {},
+            "created_at": user_msg_timestamp
+        }
+
+        insert_result = await db.execute(db.table("agent_messages").insert(user_message_record))
+        if not insert_result.data:
+            logger.error(f"Failed to insert user message for task {task_id}")
+        else:
+            logger.info(f"User message inserted: {user_msg_id}")
+            await publish_agent_message(user_message_record)
+
+        # 2. Use simple chat LLM for ad-hoc messages with MCP integration
+        # NOTE: The full audit graph has HITL interrupts which block execution.
+        # For ad-hoc chat, we use a simple LLM call instead.
+        try:
+            from langchain_core.messages import HumanMessage, SystemMessage
+
+            # Get the chat LLM
+            chat_llm = get_chat_llm()
+
+            # ====================================
+            # MCP TOOL DETECTION AND EXECUTION
+            # ====================================
+            mcp_intents = await detect_mcp_intents(decoded_message)
+
+            # Independent tools (e.g. materiality + standards search) run concurrently
+            mcp_outcomes = await asyncio.gather(*(
+                _run_mcp_intent(task_id, intent, decoded_message) for intent in mcp_intents
+            ))
+            mcp_context = "\n".join(context for context, _, _ in mcp_outcomes if context)
+
+            # Get recent conversation history for context
+            history_messages = []
+            try:
+                history_rows = await db.recent_agent_messages(task_id, limit=10)
+
+                if history_rows:
+                    # Reverse to get chronological order
+                    for msg in reversed(history_rows):
+                        if msg.get("agent_role") == "user":
+                            history_messages.append(HumanMessage(content=msg.get("content", "")))
+                        else:
+                            from langchain_core.messages import AIMessage
+                            history_messages.append(AIMessage(content=msg.get("content", "")))
+            except Exception as history_err:
+                logger.warning(f"Could not fetch message history: {history_err}")
+
+            # Build system prompt with MCP context if available
+            enhanced_system_prompt = CHAT_SYSTEM_PROMPT
+            if mcp_context:
+                enhanced_system_prompt = CHAT_SYSTEM_PROMPT + "\n" + mcp_context
+
+            # Build messages for LLM
+            llm_messages = [
+                SystemMessage(content=enhanced_system_prompt),
+                *history_messages[-6:],  # Last 6 messages for context
+                HumanMessage(content=decoded_message)
+            ]
+
+            logger.info(f"Invoking chat LLM for task {task_id}")
+
+            ai_msg_id = str(uuid4())
+            stream_tokens = stream_tokens_enabled() if stream is None else stream
+
+            if stream_tokens:
+                # Forward deltas as they arrive; persist the message once at the end
+                publisher = TokenPublisher(
+                    task_id, agent_role="partner", message_id=ai_msg_id, flush_interval=0
+                )
+                parts: List[str] = []
+                try:
+                    async for delta in astream_text(chat_llm, llm_messages):
+                        parts.append(delta)
+                        await publisher.add(delta)
+                finally:
+                    await publisher.close()
+                ai_content = "".join(parts)
+            else:
+                # Invoke the LLM
+                response = await chat_llm.ainvoke(llm_messages)
+                ai_content = response.content
+
+            logger.info(f"Chat LLM response received for task {task_id}: {ai_content[:100]}...")
+
+            # Insert AI response into agent_messages
+            ai_msg_timestamp = datetime.now(timezone.utc).isoformat()
+
+            # Build metadata with MCP tool info if used
+            response_metadata = {"source": "chat_llm", "streamed": stream_tokens}
+            if mcp_intents:
+                mcp_tools = [
+                    {
+                        "server": server_name,
+                        "tool": tool_name,
+                        "used": mcp_result is not None and not mcp_error,
+                        "fallback": mcp_error is not None
+                    }
+                    for (server_name, tool_name, _), (_, mcp_result, mcp_error)
+                    in zip(mcp_intents, mcp_outcomes)
+                ]
+                # Primary (highest-priority) tool, as before multi-intent dispatch
+                response_metadata["mcp_tool"] = mcp_tools[0]
+                if len(mcp_tools) > 1:
+                    response_metadata["mcp_tools"] = mcp_tools
+                mcp_errors = [error for _, _, error in mcp_outcomes if error]
+                if mcp_errors:
+                    response_metadata["mcp_error"] = mcp_errors[0].to_dict()
+
+            ai_message_record = {
+                "id": ai_msg_id,
+                "task_id": task_id,
+                "agent_role": "partner",
+                "content": ai_content,
+                "message_type": "response",
+                "metadata": response_metadata,
+                "created_at": ai_msg_timestamp
+            }
+
+            insert_result = await db.execute(db.table("agent_messages").insert(ai_message_record))
+            if insert_result.data:
+                logger.info(f"AI response inserted: {ai_msg_id}")
+                await publish_agent_message(ai_message_record)
+            else:
+                logger.error(f"Failed to insert AI response for task {task_id}")
+
+        except Exception as chat_error:
+            import traceback
+            logger.error(f"Chat LLM error for task {task_id}: {chat_error}")
+            logger.error(f"Full traceback: {traceback.format_exc()}")
+            # Insert error message for user feedback
+            error_msg_id = str(uuid4())
+            error_msg_timestamp = datetime.now(timezone.utc).isoformat()
+            error_message_record = {
+                "id": error_msg_id,
+                "task_id": task_id,
+                "agent_role": "system",
+                "content": f"죄송합니다. 메시지 처리 중 오류가 발생했습니다: {str(chat_error)}",
+                "message_type": "response",
+                "metadata": {"error": True},
+                "created_at": error_msg_timestamp
+            }
+            await db.execute(db.table("agent_messages").insert(error_message_record))
+            await publish_agent_message(error_message_record)
+
+    except Exception as msg_error:
+        logger.error(f"Error processing message for task {task_id}: {msg_error}")
+        # Streaming continues even if message processing fails
+
 
 @router.get("/{task_id}")
 def stream_agent_messages(
     task_id: str,
     request: Request,
-    message: Optional[str] = None
+    message: Optional[str] = None,
+    stream: Optional[bool] = None,
+    last_event_id: Optional[str] = None
 ) -> EventSourceResponse:
     """Stream agent messages via SSE for specific task.
 
-    This endpoint establishes a Server-Sent Events connection that streams
-    agent messages by polling the database for new entries. If a message
-    query parameter is provided, the message will be processed through
-    LangGraph before starting the polling loop.
+    This endpoint establishes a Server-Sent Events connection reading the
+    task's shared event stream: earlier messages first, then messages and
+    token deltas as they are published. If a message query parameter is
+    provided, the message is processed in the background and its answer
+    arrives on the same stream.
 
     Args:
         task_id: UUID of the audit task to stream messages for
         request: FastAPI Request object (used for disconnect detection)
         message: Optional user message to process through LangGraph
+        stream: Stream the chat answer as "token" events while it is
+            generated (defaults to LLM_STREAM_TOKENS)
+        last_event_id: Event id to resume after, for clients that cannot
+            send the Last-Event-ID header (the header takes precedence)
 
     Returns:
         EventSourceResponse: SSE stream with agent messages
 
     SSE Event Format:
         ```
+        id: 3f9a1c2e7b40:42
         event: message
         data: {
             "id": "msg-uuid",
@@ -716,11 +1115,30 @@ def stream_agent_messages(
             "content": "Analysis complete...",
             "timestamp": "2024-01-06T12:00:00Z"
         }
+
+        event: token
+        data: {
+            "id": "msg-uuid",
+            "agent_role": "partner",
+            "delta": "Revenue is",
+            "index": 0,
+            "done": false
+        }
         ```
 
+    Token events share the id of the message they build up; the last one
+    has "done": true, and the persisted "message" event follows with the
+    full content. Drafts of graph agents (WorkPaperGeneratorAgent) arrive
+    the same way through the message broker.
+
+    The SSE event id ("<epoch>:<seq>") increases by one per event of the
+    task. EventSource sends the last one as Last-Event-ID when it
+    reconnects, and the stream resumes right after it while it is still
+    buffered; otherwise the task's history is replayed from the database.
+
     Usage (Frontend):
         ```javascript
-        // Simple polling (no message)
+        // Stream only (no message)
         const eventSource = new EventSource(`/api/stream/${taskId}`);
 
         // With message processing
@@ -733,6 +1151,11 @@ def stream_agent_messages(
             console.log(`[${message.agent_role}] ${message.content}`);
         });
 
+        eventSource.addEventListener('token', (event) => {
+            const token = JSON.parse(event.data);
+            drafts[token.id] = (drafts[token.id] || '') + token.delta;
+        });
+
         eventSource.addEventListener('heartbeat', () => {
             console.log('Connection alive');
         });
@@ -746,237 +1169,47 @@ def stream_agent_messages(
     Connection Management:
         - Auto-closes when client disconnects
         - Heartbeat every 30 seconds prevents timeout
-        - Polls database every 1 second for new messages
+        - One shared upstream per task_id (broker subscription plus a
+          database backfill on start, after missed broker deliveries and
+          every 15 seconds as a safety net), however many clients connect
+        - Clients falling out of the ring buffer get a "gap" event and
+          continue from the oldest buffered event; clients not accepting
+          data for 30 seconds are disconnected
     """
 
     async def event_generator() -> AsyncGenerator[Dict[str, Any], None]:
-        """Generate SSE events by polling database for new messages.
+        """Generate SSE events from the task's shared stream.
 
         Yields:
-            Dict with "event" and "data" keys for SSE protocol
+            Dict with "event", "data" and (for resumable events) "id" keys
         """
 
-        from ..db.supabase_client import supabase
-
-        # Track seen message IDs to avoid duplicates
-        seen_message_ids: Set[str] = set()
-
-        # Track last message timestamp for efficient queries
-        last_check_time: Optional[str] = None
-
         # Get or create message queue for this task (for testing injection)
         if task_id not in message_queues:
             message_queues[task_id] = asyncio.Queue()
         message_queue = message_queues[task_id]
 
-        # Process incoming message through LangGraph if provided
-        if message:
-            try:
-                # Decode URL-encoded message (may be double-encoded from frontend)
-                decoded_message = unquote(unquote(message))
-                logger.info(f"Processing user message for task {task_id}: {decoded_message[:100]}...")
-
-                # 1. Insert user message into agent_messages table
-                user_msg_id = str(uuid4())
-                user_msg_timestamp = datetime.now(timezone.utc).isoformat()
-                user_message_record = {
-                    "id": user_msg_id,
-                    "task_id": task_id,
-                    "agent_role": "user",
-                    "content": decoded_message,
-                    "message_type": "instruction",
-                    "metadata": {},
-                    "created_at": user_msg_timestamp
-                }
-
-                insert_result = supabase.table("agent_messages").insert(user_message_record).execute()
-                if not insert_result.data:
-                    logger.error(f"Failed to insert user message for task {task_id}")
-                else:
-                    logger.info(f"User message inserted: {user_msg_id}")
-
-                # 2. Use simple chat LLM for ad-hoc messages with MCP integration
-                # NOTE: The full audit graph has HITL interrupts which block execution.
-                # For ad-hoc chat, we use a simple LLM call instead.
-                try:
-                    from langchain_core.messages import HumanMessage, SystemMessage
-
-                    # Get the chat LLM
-                    chat_llm = get_chat_llm()
-
-                    # ====================================
-                    # MCP TOOL DETECTION AND EXECUTION
-                    # ====================================
-                    mcp_context = ""
-                    mcp_result = None
-                    mcp_error = None
-                    fallback_used = False
-                    mcp_detection = await detect_mcp_need(decoded_message)
-
-                    if mcp_detection:
-                        server_name, tool_name, arguments = mcp_detection
-                        logger.info(
-                            f"MCP tool needed for task {task_id}: "
-                            f"{server_name}/{tool_name}"
-                        )
-
-                        # Execute MCP tool with error handling
-                        mcp_result, mcp_error = await execute_mcp_tool(
-                            server_name, tool_name, arguments
-                        )
-
-                        if mcp_result and not mcp_error:
-                            # Success: Store MCP result in database for audit trail
-                            await store_mcp_result(
-                                task_id, server_name, tool_name, mcp_result
-                            )
-
-                            # Format result for LLM context
-                            mcp_context = format_mcp_result_for_context(
-                                server_name, tool_name, mcp_result
-                            )
-
-                            logger.info(
-                                f"MCP context added for task {task_id}: "
-                                f"{len(mcp_context)} chars"
-                            )
-                        elif mcp_error:
-                            # MCP failed - apply graceful degradation
-                            fallback_used = True
-                            mcp_error.fallback_used = True
-
-                            logger.info(
-                                f"Falling back to basic LLM for {task_id}"
-                            )
-
-                            # Insert system message about MCP error
-                            error_msg_data = create_mcp_error_message(mcp_error, fallback_used)
-                            error_msg_id = str(uuid4())
-                            error_msg_timestamp = datetime.now(timezone.utc).isoformat()
-
-                            error_message_record = {
-                                "id": error_msg_id,
-                                "task_id": task_id,
-                                "agent_role": error_msg_data["agent_role"],
-                                "content": error_msg_data["content"],
-                                "message_type": "system",
-                                "metadata": error_msg_data["metadata"],
-                                "created_at": error_msg_timestamp
-                            }
-                            supabase.table("agent_messages").insert(error_message_record).execute()
-
-                            # Escalate to HITL for critical errors (circuit breaker open)
-                            if mcp_error.error_type == "circuit_breaker":
-                                await escalate_to_hitl(
-                                    task_id, mcp_error, decoded_message
-                                )
-                        else:
-                            logger.info(
-                                f"MCP tool returned no result for task {task_id}"
-                            )
-
-                    # Get recent conversation history for context
-                    history_messages = []
-                    try:
-                        history_result = supabase.table("agent_messages") \
-                            .select("agent_role, content") \
-                            .eq("task_id", task_id) \
-                            .order("created_at", desc=True) \
-                            .limit(10) \
-                            .execute()
-
-                        if history_result.data:
-                            # Reverse to get chronological order
-                            for msg in reversed(history_result.data):
-                                if msg.get("agent_role") == "user":
-                                    history_messages.append(HumanMessage(content=msg.get("content", "")))
-                                else:
-                                    from langchain_core.messages import AIMessage
-                                    history_messages.append(AIMessage(content=msg.get("content", "")))
-                    except Exception as history_err:
-                        logger.warning(f"Could not fetch message history: {history_err}")
-
-                    # Build system prompt with MCP context if available
-                    enhanced_system_prompt = CHAT_SYSTEM_PROMPT
-                    if mcp_context:
-                        enhanced_system_prompt = CHAT_SYSTEM_PROMPT + "\n" + mcp_context
-
-                    # Build messages for LLM
-                    llm_messages = [
-                        SystemMessage(content=enhanced_system_prompt),
-                        *history_messages[-6:],  # Last 6 messages for context
-                        HumanMessage(content=decoded_message)
-                    ]
-
-                    logger.info(f"Invoking chat LLM for task {task_id}")
-
-                    # Invoke the LLM
-                    response = await chat_llm.ainvoke(llm_messages)
-                    ai_content = response.content
-
-                    logger.info(f"Chat LLM response received for task {task_id}: {ai_content[:100]}...")
-
-                    # Insert AI response into agent_messages
-                    ai_msg_id = str(uuid4())
-                    ai_msg_timestamp = datetime.now(timezone.utc).isoformat()
-
-                    # Build metadata with MCP tool info if used
-                    response_metadata = {"source": "chat_llm"}
-                    if mcp_detection:
-                        response_metadata["mcp_tool"] = {
-                            "server": mcp_detection[0],
-                            "tool": mcp_detection[1],
-                            "used": mcp_result is not None and not mcp_error,
-                            "fallback": fallback_used
-                        }
-                        if mcp_error:
-                            response_metadata["mcp_error"] = mcp_error.to_dict()
-
-                    ai_message_record = {
-                        "id": ai_msg_id,
-                        "task_id": task_id,
-                        "agent_role": "partner",
-                        "content": ai_content,
-                        "message_type": "response",
-                        "metadata": response_metadata,
-                        "created_at": ai_msg_timestamp
-                    }
-
-                    insert_result = supabase.table("agent_messages").insert(ai_message_record).execute()
-                    if insert_result.data:
-                        logger.info(f"AI response inserted: {ai_msg_id}")
-                    else:
-                        logger.error(f"Failed to insert AI response for task {task_id}")
-
-                except Exception as chat_error:
-                    import traceback
-                    logger.error(f"Chat LLM error for task {task_id}: {chat_error}")
-                    logger.error(f"Full traceback: {traceback.format_exc()}")
-                    # Insert error message for user feedback
-                    error_msg_id = str(uuid4())
-                    error_msg_timestamp = datetime.now(timezone.utc).isoformat()
-                    error_message_record = {
-                        "id": error_msg_id,
-                        "task_id": task_id,
-                        "agent_role": "system",
-                        "content": f"죄송합니다. 메시지 처리 중 오류가 발생했습니다: {str(chat_error)}",
-                        "message_type": "response",
-                        "metadata": {"error": True},
-                        "created_at": error_msg_timestamp
-                    }
-                    supabase.table("agent_messages").insert(error_message_record).execute()
+        # Attach before processing the message so none of its events are missed
+        reader = get_task_stream_hub().open(
+            task_id, last_event_id=request.headers.get("last-event-id") or last_event_id
+        )
 
-            except Exception as msg_error:
-                logger.error(f"Error processing message for task {task_id}: {msg_error}")
-                # Continue to polling even if message processing fails
+        # Process the message in the background; its events arrive through
+        # the shared stream like those of every other writer
+        if message:
+            chat_task = asyncio.create_task(_process_chat_message(task_id, message, stream))
+            _chat_tasks.add(chat_task)
+            chat_task.add_done_callback(_chat_tasks.discard)
 
         try:
-            logger.info(f"SSE stream started for task {task_id}")
+            logger.info(
+                f"SSE stream started for task {task_id}"
+                + (f" (resuming after event {reader.cursor})" if reader.resumed else "")
+            )
 
             # Stream messages and heartbeats
-            last_heartbeat = asyncio.get_event_loop().time()
-            heartbeat_interval = 30  # seconds
-            poll_interval = 1.0  # seconds
+            loop = asyncio.get_event_loop()
+            last_heartbeat = loop.time()
 
             while True:
                 # Check for client disconnect
@@ -992,59 +1225,24 @@ def stream_agent_messages(
                 except asyncio.QueueEmpty:
                     pass
 
-                # Poll database for new messages
-                try:
-                    query = supabase.table("agent_messages") \
-                        .select("id, agent_role, content, created_at") \
-                        .eq("task_id", task_id) \
-                        .order("created_at", desc=False)
-
-                    # Filter by timestamp if we have a last check time
-                    if last_check_time:
-                        query = query.gt("created_at", last_check_time)
-
-                    result = query.execute()
-
-                    if result.data:
-                        for db_msg in result.data:
-                            msg_id = db_msg.get("id")
-
-                            # Skip already-seen messages
-                            if msg_id in seen_message_ids:
-                                continue
-
-                            seen_message_ids.add(msg_id)
-
-                            # Update last check time
-                            msg_timestamp = db_msg.get("created_at")
-                            if msg_timestamp:
-                                last_check_time = msg_timestamp
-
-                            yield {
-                                "event": "message",
-                                "data": json.dumps({
-                                    "id": msg_id,
-                                    "agent_role": db_msg.get("agent_role"),
-                                    "content": db_msg.get("content"),
-                                    "timestamp": msg_timestamp
-                                })
-                            }
-
-                except Exception as db_error:
-                    logger.error(f"Database query error for task {task_id}: {db_error}")
-                    # Continue polling, don't break the stream
-
                 # Send heartbeat if interval exceeded
-                current_time = asyncio.get_event_loop().time()
-                if current_time - last_heartbeat >= heartbeat_interval:
+                current_time = loop.time()
+                if current_time - last_heartbeat >= HEARTBEAT_INTERVAL:
                     yield {
                         "event": "heartbeat",
                         "data": json.dumps({"timestamp": current_time})
                     }
                     last_heartbeat = current_time
 
-                # Wait before next poll
-                await asyncio.sleep(poll_interval)
+                # Wait for the next event until the next heartbeat is due
+                wait = last_heartbeat + HEARTBEAT_INTERVAL - loop.time()
+                event = await reader.next(timeout=max(0.0, min(wait, WAIT_INTERVAL)))
+                if event is not None:
+                    yield event.to_sse()
+
+        except StreamLagError as lag:
+            # Drop policy "close": the client reconnects and replays history
+            logger.warning(f"Closing lagging SSE stream: {lag}")
 
         except Exception as e:
             logger.error(f"SSE stream error for task {task_id}: {e}")
@@ -1053,4 +1251,7 @@ def stream_agent_messages(
                 "data": json.dumps({"error": str(e)})
             }
 
-    return EventSourceResponse(event_generator())
+        finally:
+            reader.close()
+
+    return EventSourceResponse(event_generator(), send_timeout=SEND_TIMEOUT)
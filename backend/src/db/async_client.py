@@ -0,0 +1,374 @@
+"""Async Database Access Layer
+
+Non-blocking counterpart of ``supabase_client``. API routes, services and the
+SSE streams run their queries through this module, so a slow query suspends
+only the request that issued it instead of stalling the event loop (and
+with it every SSE stream served by the worker).
+
+Key Features:
+    - PostgREST queries through supabase-py's ``AsyncClient`` (same schema,
+      same query builder); its httpx connection pool is shared process-wide
+    - Per-query timeouts (DB_QUERY_TIMEOUT, overridable per call) raising
+      QueryTimeoutError instead of hanging the caller
+    - Hot read paths (agent_messages backfill, chat history) run as prepared
+      statements on a psycopg connection pool when POSTGRES_CONNECTION_STRING
+      is set, and fall back to PostgREST otherwise
+    - Lifecycle tied to the FastAPI lifespan (see ``src/main.py``)
+
+Configuration (environment variables):
+    - SUPABASE_URL / SUPABASE_SERVICE_KEY: PostgREST endpoint and key
+    - DB_QUERY_TIMEOUT: Default per-query timeout in seconds (default: 10)
+    - DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE: Direct Postgres pool size (default: 1/10)
+    - DB_DIRECT_QUERIES: "false" keeps hot queries on PostgREST (default: "true")
+
+Key Classes:
+    - AsyncDatabase: Async client, query execution and hot queries
+
+Usage:
+    ```python
+    from src.db.async_client import get_async_db
+
+    db = get_async_db()
+    result = await db.execute(
+        db.table("audit_tasks").select("*").eq("project_id", project_id)
+    )
+    tasks = result.data
+
+    # Hot query (prepared statement when the direct pool is configured)
+    rows = await db.agent_messages_after(task_id, after=cursor)
+    ```
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_QUERY_TIMEOUT = 10.0
+DEFAULT_POOL_MIN_SIZE = 1
+DEFAULT_POOL_MAX_SIZE = 10
+
+
+# Hot queries, executed as prepared statements on the direct pool
+AGENT_MESSAGES_AFTER_SQL = (
+    "SELECT id, agent_role, content, created_at FROM agent_messages "
+    "WHERE task_id = %(task_id)s AND (%(after)s::timestamptz IS NULL OR created_at > %(after)s::timestamptz) "
+    "ORDER BY created_at ASC"
+)
+RECENT_AGENT_MESSAGES_SQL = (
+    "SELECT agent_role, content, created_at FROM agent_messages "
+    "WHERE task_id = %(task_id)s ORDER BY created_at DESC LIMIT %(limit)s"
+)
+
+
+class QueryTimeoutError(TimeoutError):
+    """A database query did not finish within its timeout."""
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean environment variable."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _jsonable_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a psycopg row to the shape PostgREST returns (ISO strings)."""
+    converted = {}
+    for key, value in row.items():
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, UUID):
+            value = str(value)
+        converted[key] = value
+    return converted
+
+
+class AsyncDatabase:
+    """Async PostgREST client with per-query timeouts and a direct pool for hot queries.
+
+    The PostgREST client is created on first use; the direct Postgres pool
+    is opened on the first hot query (or by ``connect``) and only if a
+    connection string is configured.
+
+    Attributes:
+        timeout: Default per-query timeout in seconds
+        conninfo: Direct Postgres connection string (None: PostgREST only)
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        service_key: Optional[str] = None,
+        conninfo: Optional[str] = None,
+        timeout: Optional[float] = None,
+        pool_min_size: Optional[int] = None,
+        pool_max_size: Optional[int] = None,
+    ):
+        """Initialize the database layer (no connections are opened yet).
+
+        Args:
+            url: Supabase project URL (default: SUPABASE_URL)
+            service_key: Service role key (default: SUPABASE_SERVICE_KEY)
+            conninfo: Direct Postgres connection string for hot queries
+                (default: POSTGRES_CONNECTION_STRING unless DB_DIRECT_QUERIES=false)
+            timeout: Default per-query timeout (default: DB_QUERY_TIMEOUT)
+            pool_min_size: Direct pool minimum size (default: DB_POOL_MIN_SIZE)
+            pool_max_size: Direct pool maximum size (default: DB_POOL_MAX_SIZE)
+        """
+        self.url = url or os.getenv("SUPABASE_URL")
+        self.service_key = service_key or os.getenv("SUPABASE_SERVICE_KEY")
+        if conninfo is None and _env_flag("DB_DIRECT_QUERIES", True):
+            conninfo = os.getenv("POSTGRES_CONNECTION_STRING")
+        self.conninfo = conninfo
+        self.timeout = timeout if timeout is not None else float(
+            os.getenv("DB_QUERY_TIMEOUT", DEFAULT_QUERY_TIMEOUT)
+        )
+        self.pool_min_size = pool_min_size if pool_min_size is not None else int(
+            os.getenv("DB_POOL_MIN_SIZE", DEFAULT_POOL_MIN_SIZE)
+        )
+        self.pool_max_size = pool_max_size if pool_max_size is not None else int(
+            os.getenv("DB_POOL_MAX_SIZE", DEFAULT_POOL_MAX_SIZE)
+        )
+
+        self._client = None
+        self._pool = None
+        self._pool_failed = False
+        self._pool_lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # PostgREST
+    # ------------------------------------------------------------------
+
+    @property
+    def client(self):
+        """supabase-py ``AsyncClient`` (created on first access).
+
+        Raises:
+            ValueError: If SUPABASE_URL or SUPABASE_SERVICE_KEY is not set
+        """
+        if self._client is None:
+            if not self.url:
+                raise ValueError(
+                    "SUPABASE_URL not found in environment. "
+                    "Get it from Supabase Dashboard → Project Settings → API → Project URL"
+                )
+            if not self.service_key:
+                raise ValueError(
+                    "SUPABASE_SERVICE_KEY not found in environment. "
+                    "Get it from Supabase Dashboard → Project Settings → API → service_role (secret)"
+                )
+            from supabase import AsyncClient, AsyncClientOptions  # type: ignore[attr-defined]
+
+            # HTTP timeout as a backstop; execute() enforces the per-query timeout
+            options = AsyncClientOptions(postgrest_client_timeout=max(self.timeout, 1.0) * 3)
+            self._client = AsyncClient(self.url, self.service_key, options)
+        return self._client
+
+    def table(self, name: str):
+        """Start an async PostgREST query on a table (run it with ``execute``)."""
+        return self.client.table(name)
+
+    async def execute(self, query, timeout: Optional[float] = None):
+        """Run a PostgREST query built with ``table``.
+
+        Args:
+            query: Async request builder (e.g. ``db.table("x").select("*")``)
+            timeout: Seconds before the query is abandoned (default: self.timeout)
+
+        Returns:
+            APIResponse with ``data`` (and ``count`` when requested)
+
+        Raises:
+            QueryTimeoutError: The query did not finish in time
+        """
+        limit = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(query.execute(), limit)
+        except asyncio.TimeoutError:
+            raise QueryTimeoutError(f"Database query timed out after {limit}s") from None
+
+    # ------------------------------------------------------------------
+    # Direct pool (prepared statements)
+    # ------------------------------------------------------------------
+
+    async def _get_pool(self):
+        """Open the direct pool on first use; None if unavailable."""
+        if self._pool is not None or self._pool_failed or not self.conninfo:
+            return self._pool
+        async with self._pool_lock:
+            if self._pool is None and not self._pool_failed:
+                try:
+                    from psycopg.rows import dict_row
+                    from psycopg_pool import AsyncConnectionPool
+
+                    statement_timeout_ms = int(self.timeout * 1000)
+                    pool = AsyncConnectionPool(
+                        self.conninfo,
+                        min_size=self.pool_min_size,
+                        max_size=self.pool_max_size,
+                        kwargs={
+                            "autocommit": True,
+                            "row_factory": dict_row,
+                            # UTC timestamps match what PostgREST returns
+                            "options": f"-c statement_timeout={statement_timeout_ms} -c timezone=UTC",
+                        },
+                        open=False,
+                    )
+                    await asyncio.wait_for(pool.open(wait=True), self.timeout)
+                    self._pool = pool
+                    logger.info(
+                        f"Direct Postgres pool ready (size {self.pool_min_size}-{self.pool_max_size})"
+                    )
+                except Exception as e:
+                    # Hot queries keep working through PostgREST
+                    self._pool_failed = True
+                    logger.warning(f"Direct Postgres pool unavailable, using PostgREST: {e}")
+        return self._pool
+
+    async def _fetch_prepared(
+        self, pool, sql: str, params: Dict[str, Any], timeout: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """Run a prepared read on the direct pool."""
+
+        async def run() -> List[Dict[str, Any]]:
+            async with pool.connection() as conn:
+                cursor = await conn.execute(sql, params, prepare=True)
+                return [_jsonable_row(row) for row in await cursor.fetchall()]
+
+        limit = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(run(), limit)
+        except asyncio.TimeoutError:
+            raise QueryTimeoutError(f"Database query timed out after {limit}s") from None
+
+    # ------------------------------------------------------------------
+    # Hot queries
+    # ------------------------------------------------------------------
+
+    async def agent_messages_after(
+        self, task_id: str, after: Optional[str] = None, timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Read agent_messages rows of a task in creation order (SSE backfill).
+
+        Args:
+            task_id: Task UUID
+            after: Only rows created after this timestamp
+            timeout: Per-query timeout override
+
+        Returns:
+            Rows with id, agent_role, content and created_at
+        """
+        pool = await self._get_pool()
+        if pool is not None:
+            return await self._fetch_prepared(
+                pool, AGENT_MESSAGES_AFTER_SQL, {"task_id": task_id, "after": after}, timeout
+            )
+
+        query = self.table("agent_messages") \
+            .select("id, agent_role, content, created_at") \
+            .eq("task_id", task_id) \
+            .order("created_at", desc=False)
+        if after:
+            query = query.gt("created_at", after)
+        result = await self.execute(query, timeout=timeout)
+        return result.data or []
+
+    async def recent_agent_messages(
+        self, task_id: str, limit: int = 10, timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Read the newest agent_messages rows of a task (chat history).
+
+        Args:
+            task_id: Task UUID
+            limit: Maximum rows
+            timeout: Per-query timeout override
+
+        Returns:
+            Rows with agent_role, content and created_at, newest first
+        """
+        pool = await self._get_pool()
+        if pool is not None:
+            return await self._fetch_prepared(
+                pool, RECENT_AGENT_MESSAGES_SQL, {"task_id": task_id, "limit": limit}, timeout
+            )
+
+        result = await self.execute(
+            self.table("agent_messages")
+                .select("agent_role, content, created_at")
+                .eq("task_id", task_id)
+                .order("created_at", desc=True)
+                .limit(limit),
+            timeout=timeout,
+        )
+        return result.data or []
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def connect(self) -> None:
+        """Create the PostgREST client and open the direct pool (if configured)."""
+        self.client  # Property access creates the client
+        await self._get_pool()
+
+    async def aclose(self) -> None:
+        """Close the direct pool and the PostgREST HTTP connections."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        if self._client is not None:
+            postgrest = getattr(self._client, "_postgrest", None)
+            if postgrest is not None:
+                await postgrest.aclose()
+            self._client = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Direct pool statistics (empty when the pool is not open)."""
+        return dict(self._pool.get_stats()) if self._pool is not None else {}
+
+
+# ============================================================================
+# PROCESS-WIDE INSTANCE
+# ============================================================================
+
+_db: Optional[AsyncDatabase] = None
+
+
+def get_async_db() -> AsyncDatabase:
+    """Get the process-wide async database layer, creating it on first use.
+
+    Returns:
+        Shared AsyncDatabase instance
+    """
+    global _db
+    if _db is None:
+        _db = AsyncDatabase()
+    return _db
+
+
+async def close_async_db() -> None:
+    """Close the process-wide database layer (called on application shutdown)."""
+    global _db
+    if _db is not None:
+        await _db.aclose()
+        _db = None
+        logger.info("Async database layer closed")
+
+
+__all__ = [
+    "AsyncDatabase",
+    "QueryTimeoutError",
+    "get_async_db",
+    "close_async_db",
+]
@@ -0,0 +1,680 @@
+"""Compact Checkpoint Storage for Long-Running Audit Threads
+
+Every superstep of the parent graph checkpoints ``AuditState``. LangGraph's
+Postgres saver already writes a blob only for channels whose version
+changed, but a changed channel is always rewritten in full, so append-only
+channels such as ``messages`` cost more on every superstep, and large
+channels (``tasks``, ``egas``, ``specification``) are stored uncompressed.
+This module keeps checkpoint storage and write latency flat as projects grow.
+
+Key Features:
+    - Channel-level deltas: an append-only channel stores only the items
+      appended since its previous version, with a full snapshot every
+      ``snapshot_every`` versions so a read resolves a bounded chain
+    - Compression: blobs above ``compress_min_bytes`` are stored as
+      zstd-compressed msgpack (requires the ``zstandard`` package; stored
+      uncompressed without it)
+    - Compaction: prunes superseded checkpoints per thread_id, keeping the
+      newest ``keep_last`` per namespace and every blob they still need
+    - Bytes written per superstep (blobs and pending writes), exposed by
+      ``stats()`` and logged at DEBUG level
+
+Configuration (environment variables):
+    - CHECKPOINT_SNAPSHOT_EVERY: Full snapshot interval per channel (default: 20)
+    - CHECKPOINT_COMPRESS_MIN_BYTES: Compression threshold (default: 1024)
+    - CHECKPOINT_ZSTD_LEVEL: zstd level (default: 3)
+    - CHECKPOINT_KEEP_LAST: Checkpoints kept per thread by compaction (default: 10)
+    - CHECKPOINT_COMPACTION_INTERVAL: Seconds between compaction runs (default: 3600, 0 disables)
+
+Key Classes:
+    - DeltaPostgresSaver: AsyncPostgresSaver with channel deltas and write stats
+    - CheckpointSerializer: msgpack + zstd serializer with delta records
+    - CheckpointCompactor: Prunes superseded checkpoints (on demand or periodically)
+
+Usage:
+    ```python
+    from src.db.checkpointer import get_async_checkpointer
+    from src.db.checkpoint_storage import CheckpointCompactor
+
+    async with get_async_checkpointer() as checkpointer:  # DeltaPostgresSaver
+        compactor = CheckpointCompactor(checkpointer)
+        await compactor.compact_thread("project-abc-2024")
+        print(checkpointer.stats()["avg_superstep_bytes"])
+    ```
+"""
+
+import asyncio
+import logging
+import os
+from collections import OrderedDict, defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+try:
+    import zstandard
+except ImportError:  # Optional: blobs are stored uncompressed without it
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_SNAPSHOT_EVERY = 20
+DEFAULT_COMPRESS_MIN_BYTES = 1024
+DEFAULT_ZSTD_LEVEL = 3
+DEFAULT_KEEP_LAST = 10
+DEFAULT_COMPACTION_INTERVAL = 3600.0
+DEFAULT_BASE_CACHE_SIZE = 4096
+
+# Append-only channels of AuditState/TaskState stored as deltas. Items of a
+# delta channel must never be mutated in place once checkpointed.
+DEFAULT_DELTA_CHANNELS = ("messages",)
+
+ZSTD_SUFFIX = "+zstd"
+DELTA_TYPE = "delta"  # Stored as "delta@<base version>", so compaction reads bases from the type
+
+
+# ============================================================================
+# SERIALIZATION
+# ============================================================================
+
+@dataclass
+class ChannelDelta:
+    """Items appended to a list channel since its ``base_version``.
+
+    The value is ``base[:base_length] + tail``, where ``base`` is the
+    (resolved) value stored under ``base_version``.
+    """
+
+    base_version: str
+    base_length: int
+    tail: List[Any]
+
+
+@dataclass
+class _WriteTally:
+    raw_bytes: int = 0
+    stored_bytes: int = 0
+
+
+# Bytes serialized by the current aput/aput_writes call (copied into the
+# worker thread the saver serializes in, so concurrent threads never mix)
+_tally: ContextVar[Optional[_WriteTally]] = ContextVar("checkpoint_write_tally", default=None)
+
+
+def delta_base(type_: str) -> Optional[str]:
+    """Base version of a stored delta blob type, or None for other types."""
+    if type_.endswith(ZSTD_SUFFIX):
+        type_ = type_[:-len(ZSTD_SUFFIX)]
+    if type_.startswith(DELTA_TYPE + "@"):
+        return type_[len(DELTA_TYPE) + 1:]
+    return None
+
+
+class CheckpointSerializer:
+    """LangGraph serializer storing msgpack blobs, zstd-compressed when large.
+
+    Wraps ``JsonPlusSerializer`` (msgpack for checkpoint values) and adds
+    ChannelDelta records. Blobs written by the plain serializer still load,
+    so the saver can be switched on an existing database.
+    """
+
+    def __init__(
+        self,
+        inner: Optional[JsonPlusSerializer] = None,
+        compress_min_bytes: Optional[int] = None,
+        level: Optional[int] = None,
+    ):
+        """Initialize the serializer.
+
+        Args:
+            inner: Serializer for plain values (default: JsonPlusSerializer)
+            compress_min_bytes: Compress payloads of at least this size
+                (default: CHECKPOINT_COMPRESS_MIN_BYTES)
+            level: zstd compression level (default: CHECKPOINT_ZSTD_LEVEL)
+        """
+        self.inner = inner or JsonPlusSerializer()
+        self.compress_min_bytes = compress_min_bytes if compress_min_bytes is not None else int(
+            os.getenv("CHECKPOINT_COMPRESS_MIN_BYTES", DEFAULT_COMPRESS_MIN_BYTES)
+        )
+        level = level if level is not None else int(os.getenv("CHECKPOINT_ZSTD_LEVEL", DEFAULT_ZSTD_LEVEL))
+        self._compressor = zstandard.ZstdCompressor(level=level) if zstandard else None
+        self._decompressor = zstandard.ZstdDecompressor() if zstandard else None
+
+    # SerializerProtocol (untyped values are not used by the Postgres saver)
+    def dumps(self, obj: Any) -> bytes:
+        return self.inner.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.inner.loads(data)
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        if isinstance(obj, ChannelDelta):
+            tail_type, tail_data = self.inner.dumps_typed(obj.tail)
+            _, payload = self.inner.dumps_typed([obj.base_length, tail_type, tail_data])
+            type_ = f"{DELTA_TYPE}@{obj.base_version}"
+        else:
+            type_, payload = self.inner.dumps_typed(obj)
+
+        raw_size = len(payload)
+        if self._compressor is not None and raw_size >= self.compress_min_bytes:
+            compressed = self._compressor.compress(payload)
+            if len(compressed) < raw_size:
+                type_, payload = type_ + ZSTD_SUFFIX, compressed
+
+        tally = _tally.get()
+        if tally is not None:
+            tally.raw_bytes += raw_size
+            tally.stored_bytes += len(payload)
+        return type_, payload
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_.endswith(ZSTD_SUFFIX):
+            if self._decompressor is None:
+                raise RuntimeError("Checkpoint blob is zstd-compressed but zstandard is not installed")
+            type_ = type_[:-len(ZSTD_SUFFIX)]
+            payload = self._decompressor.decompress(payload)
+
+        base_version = delta_base(type_)
+        if base_version is not None:
+            base_length, tail_type, tail_data = self.inner.loads_typed(("msgpack", payload))
+            return ChannelDelta(base_version, base_length, self.inner.loads_typed((tail_type, tail_data)))
+        return self.inner.loads_typed((type_, payload))
+
+
+# ============================================================================
+# SAVER
+# ============================================================================
+
+@dataclass
+class _Base:
+    version: str
+    value: List[Any]
+    chain: int  # Deltas stored since the last full snapshot
+
+
+@dataclass
+class CheckpointWriteStats:
+    """Checkpoint bytes written by one saver."""
+
+    supersteps: int = 0
+    bytes_written: int = 0
+    raw_bytes: int = 0
+    last_superstep_bytes: int = 0
+    max_superstep_bytes: int = 0
+    deltas: int = 0
+    snapshots: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "supersteps": self.supersteps,
+            "bytes_written": self.bytes_written,
+            "raw_bytes": self.raw_bytes,
+            "compression_ratio": round(self.raw_bytes / self.bytes_written, 2) if self.bytes_written else None,
+            "last_superstep_bytes": self.last_superstep_bytes,
+            "max_superstep_bytes": self.max_superstep_bytes,
+            "avg_superstep_bytes": self.bytes_written // self.supersteps if self.supersteps else 0,
+            "deltas": self.deltas,
+            "snapshots": self.snapshots,
+        }
+
+
+def _next_of(base_version: str, version: str) -> bool:
+    """Whether ``version`` directly follows ``base_version`` (Postgres saver format)."""
+    try:
+        return int(str(version).split(".")[0]) == int(str(base_version).split(".")[0]) + 1
+    except ValueError:
+        return False
+
+
+class DeltaPostgresSaver(AsyncPostgresSaver):
+    """AsyncPostgresSaver storing append-only channels as deltas.
+
+    A delta is written only when the channel's new version directly follows
+    the version this process last wrote or read, and the previous value is an
+    unchanged prefix of the new one; anything else (a rewritten message, a
+    restart, another worker writing the thread) stores a full snapshot.
+    Reads resolve deltas against their base blobs.
+
+    Attributes:
+        delta_channels: Channels eligible for delta storage
+        snapshot_every: Maximum deltas between full snapshots of a channel
+        write_stats: Bytes written per superstep
+    """
+
+    def __init__(
+        self,
+        conn,
+        pipe=None,
+        serde: Optional[CheckpointSerializer] = None,
+        delta_channels: Iterable[str] = DEFAULT_DELTA_CHANNELS,
+        snapshot_every: Optional[int] = None,
+        base_cache_size: int = DEFAULT_BASE_CACHE_SIZE,
+    ):
+        """Initialize the saver.
+
+        Args:
+            conn: psycopg AsyncConnectionPool (or AsyncConnection)
+            pipe: Optional pipeline (see AsyncPostgresSaver)
+            serde: Serializer (default: CheckpointSerializer())
+            delta_channels: Append-only channels stored as deltas
+            snapshot_every: Full snapshot interval (default: CHECKPOINT_SNAPSHOT_EVERY)
+            base_cache_size: Channel values remembered as delta bases
+        """
+        super().__init__(conn, pipe=pipe, serde=serde or CheckpointSerializer())
+        self.delta_channels = frozenset(delta_channels)
+        self.snapshot_every = snapshot_every if snapshot_every is not None else int(
+            os.getenv("CHECKPOINT_SNAPSHOT_EVERY", DEFAULT_SNAPSHOT_EVERY)
+        )
+        self.base_cache_size = base_cache_size
+        self.write_stats = CheckpointWriteStats()
+        self._bases: "OrderedDict[Tuple[str, str, str], _Base]" = OrderedDict()
+        self._pending_write_bytes: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        configurable = config["configurable"]
+        thread_key = (configurable["thread_id"], configurable.get("checkpoint_ns", ""))
+
+        stored, bases = self._encode_deltas(thread_key, checkpoint, new_versions)
+
+        tally = _WriteTally()
+        token = _tally.set(tally)
+        try:
+            next_config = await super().aput(config, stored, metadata, new_versions)
+        finally:
+            _tally.reset(token)
+
+        for channel, base in bases.items():
+            self._remember(thread_key + (channel,), base)
+        self._record_superstep(thread_key, metadata, tally)
+        return next_config
+
+    async def aput_writes(self, config, writes, task_id, task_path: str = "") -> None:
+        configurable = config["configurable"]
+        thread_key = (configurable["thread_id"], configurable.get("checkpoint_ns", ""))
+
+        tally = _WriteTally()
+        token = _tally.set(tally)
+        try:
+            await super().aput_writes(config, writes, task_id, task_path)
+        finally:
+            _tally.reset(token)
+
+        pending = self._pending_write_bytes.pop(thread_key, 0) + tally.stored_bytes
+        self._pending_write_bytes[thread_key] = pending
+        while len(self._pending_write_bytes) > self.base_cache_size:
+            self._pending_write_bytes.popitem(last=False)
+
+    def _encode_deltas(
+        self, thread_key: Tuple[str, str], checkpoint, new_versions
+    ) -> Tuple[Dict[str, Any], Dict[str, _Base]]:
+        """Copy of the checkpoint with eligible channels replaced by deltas.
+
+        Returns:
+            The checkpoint to store and the bases to remember once it is written
+        """
+        values = dict(checkpoint["channel_values"])
+        pending: Dict[str, _Base] = {}
+        for channel in self.delta_channels:
+            value = values.get(channel)
+            if channel not in new_versions or not isinstance(value, list):
+                continue
+            version = str(new_versions[channel])
+            base = self._bases.get(thread_key + (channel,))
+
+            n = len(base.value) if base else 0
+            if (
+                base is not None
+                and base.chain < self.snapshot_every
+                and _next_of(base.version, version)
+                and len(value) >= n
+                and value[:n] == base.value
+            ):
+                values[channel] = ChannelDelta(base.version, n, value[n:])
+                pending[channel] = _Base(version, list(value), base.chain + 1)
+                self.write_stats.deltas += 1
+            else:
+                pending[channel] = _Base(version, list(value), 0)
+                self.write_stats.snapshots += 1
+
+        return {**checkpoint, "channel_values": values}, pending
+
+    def _remember(self, key: Tuple[str, str, str], base: _Base) -> None:
+        self._bases.pop(key, None)
+        self._bases[key] = base
+        while len(self._bases) > self.base_cache_size:
+            self._bases.popitem(last=False)
+
+    def _record_superstep(self, thread_key: Tuple[str, str], metadata, tally: _WriteTally) -> None:
+        written = tally.stored_bytes + self._pending_write_bytes.pop(thread_key, 0)
+        stats = self.write_stats
+        stats.supersteps += 1
+        stats.bytes_written += written
+        stats.raw_bytes += tally.raw_bytes
+        stats.last_superstep_bytes = written
+        stats.max_superstep_bytes = max(stats.max_superstep_bytes, written)
+        logger.debug(
+            f"Checkpoint thread={thread_key[0]} ns={thread_key[1]!r} "
+            f"step={(metadata or {}).get('step')} bytes={written} raw={tally.raw_bytes}"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Bytes written per superstep, delta/snapshot counts and compression ratio."""
+        return self.write_stats.to_dict()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def aget_tuple(self, config):
+        checkpoint_tuple = await super().aget_tuple(config)
+        if checkpoint_tuple is not None:
+            await self._resolve_checkpoint(checkpoint_tuple)
+        return checkpoint_tuple
+
+    async def alist(self, config, *, filter=None, before=None, limit=None) -> AsyncIterator[Any]:
+        async for checkpoint_tuple in super().alist(config, filter=filter, before=before, limit=limit):
+            await self._resolve_checkpoint(checkpoint_tuple)
+            yield checkpoint_tuple
+
+    async def _resolve_checkpoint(self, checkpoint_tuple) -> None:
+        configurable = checkpoint_tuple.config["configurable"]
+        thread_key = (configurable["thread_id"], configurable.get("checkpoint_ns", ""))
+        values = checkpoint_tuple.checkpoint["channel_values"]
+        versions = checkpoint_tuple.checkpoint["channel_versions"]
+
+        for channel, value in list(values.items()):
+            if not isinstance(value, ChannelDelta):
+                continue
+            resolved, chain = await self._resolve(thread_key, channel, value)
+            values[channel] = resolved
+            if channel in versions:
+                # Lets the next write of a resumed thread continue the chain
+                self._remember(thread_key + (channel,), _Base(str(versions[channel]), list(resolved), chain))
+
+    async def _resolve(
+        self, thread_key: Tuple[str, str], channel: str, delta: ChannelDelta
+    ) -> Tuple[List[Any], int]:
+        """Resolve a delta chain to the full list and its length."""
+        chain: List[ChannelDelta] = []
+        value: Any = delta
+        while isinstance(value, ChannelDelta):
+            chain.append(value)
+            value = await self._load_blob(thread_key, channel, value.base_version)
+
+        resolved = list(value)
+        for link in reversed(chain):
+            resolved = resolved[:link.base_length] + list(link.tail)
+        return resolved, len(chain)
+
+    async def _load_blob(self, thread_key: Tuple[str, str], channel: str, version: str) -> Any:
+        async with self._cursor() as cur:
+            await cur.execute(
+                "SELECT type, blob FROM checkpoint_blobs "
+                "WHERE thread_id = %s AND checkpoint_ns = %s AND channel = %s AND version = %s",
+                (thread_key[0], thread_key[1], channel, version),
+            )
+            row = await cur.fetchone()
+        if row is None:
+            raise RuntimeError(
+                f"Delta base {channel}@{version} missing for thread {thread_key[0]}"
+            )
+        if row["type"] == "empty":
+            return []
+        return self.serde.loads_typed((row["type"], row["blob"]))
+
+
+# ============================================================================
+# COMPACTION
+# ============================================================================
+
+@dataclass
+class CompactionResult:
+    """Rows pruned by one compaction run."""
+
+    threads: int = 0
+    checkpoints: int = 0
+    blobs: int = 0
+    writes: int = 0
+
+    def add(self, other: "CompactionResult") -> None:
+        self.threads += other.threads
+        self.checkpoints += other.checkpoints
+        self.blobs += other.blobs
+        self.writes += other.writes
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "threads": self.threads,
+            "checkpoints": self.checkpoints,
+            "blobs": self.blobs,
+            "writes": self.writes,
+        }
+
+
+def plan_blob_pruning(
+    blobs: Sequence[Tuple[str, str, str, str]],
+    kept_versions: Sequence[Tuple[str, Dict[str, Any]]],
+) -> Dict[Tuple[str, str], List[str]]:
+    """Select blobs no kept checkpoint needs.
+
+    A blob is needed when a kept checkpoint references it or a needed delta
+    uses it as its base. Only blobs older than the channel's version in the
+    newest checkpoint are pruned, so blobs of a checkpoint being written
+    concurrently are never touched.
+
+    Args:
+        blobs: (checkpoint_ns, channel, version, type) of the thread's blobs
+        kept_versions: (checkpoint_ns, channel_versions) of kept checkpoints,
+            newest first per namespace
+
+    Returns:
+        Versions to delete per (checkpoint_ns, channel)
+    """
+    types = {(ns, channel, version): type_ for ns, channel, version, type_ in blobs}
+
+    needed: Set[Tuple[str, str, str]] = set()
+    newest: Dict[Tuple[str, str], str] = {}
+    seen_ns: Set[str] = set()
+    for ns, channel_versions in kept_versions:
+        first = ns not in seen_ns
+        seen_ns.add(ns)
+        for channel, version in (channel_versions or {}).items():
+            needed.add((ns, channel, str(version)))
+            if first:
+                newest[(ns, channel)] = str(version)
+
+    stack = list(needed)
+    while stack:
+        ns, channel, version = stack.pop()
+        base = delta_base(types.get((ns, channel, version), ""))
+        if base is not None and (ns, channel, base) not in needed:
+            needed.add((ns, channel, base))
+            stack.append((ns, channel, base))
+
+    prune: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+    for key in types:
+        ns, channel, version = key
+        limit = newest.get((ns, channel))
+        if key not in needed and limit is not None and version < limit:
+            prune[(ns, channel)].append(version)
+    return dict(prune)
+
+
+class CheckpointCompactor:
+    """Prunes superseded checkpoints of a DeltaPostgresSaver's threads.
+
+    Keeps the newest ``keep_last`` checkpoints per (thread_id, checkpoint_ns)
+    and deletes older checkpoints, their pending writes and every blob no
+    kept checkpoint (or delta chain) needs. Runs on demand or periodically.
+
+    Example:
+        ```python
+        compactor = CheckpointCompactor(checkpointer, keep_last=5)
+        result = await compactor.compact_all()
+        compactor.start()  # every CHECKPOINT_COMPACTION_INTERVAL seconds
+        ```
+    """
+
+    def __init__(
+        self,
+        saver: AsyncPostgresSaver,
+        keep_last: Optional[int] = None,
+        interval: Optional[float] = None,
+    ):
+        """Initialize the compactor.
+
+        Args:
+            saver: Saver whose ``conn`` is a psycopg AsyncConnectionPool
+            keep_last: Checkpoints kept per thread (default: CHECKPOINT_KEEP_LAST)
+            interval: Seconds between periodic runs (default: CHECKPOINT_COMPACTION_INTERVAL)
+        """
+        self.saver = saver
+        self.keep_last = max(1, keep_last if keep_last is not None else int(
+            os.getenv("CHECKPOINT_KEEP_LAST", DEFAULT_KEEP_LAST)
+        ))
+        self.interval = interval if interval is not None else float(
+            os.getenv("CHECKPOINT_COMPACTION_INTERVAL", DEFAULT_COMPACTION_INTERVAL)
+        )
+        self.last_result: Optional[CompactionResult] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def compact_thread(self, thread_id: str) -> CompactionResult:
+        """Prune superseded checkpoints of one thread.
+
+        Args:
+            thread_id: LangGraph thread identifier
+
+        Returns:
+            Rows pruned
+        """
+        result = CompactionResult()
+        async with self.saver.conn.connection() as conn, conn.transaction():
+            cur = conn.cursor()
+            # Blobs are listed before checkpoints: a blob written after this
+            # point is newer than every version considered below
+            await cur.execute(
+                "SELECT checkpoint_ns, channel, version, type FROM checkpoint_blobs WHERE thread_id = %s",
+                (thread_id,),
+            )
+            blobs = [(r["checkpoint_ns"], r["channel"], r["version"], r["type"]) for r in await cur.fetchall()]
+
+            await cur.execute(
+                "SELECT checkpoint_ns, checkpoint_id, checkpoint -> 'channel_versions' AS channel_versions "
+                "FROM checkpoints WHERE thread_id = %s ORDER BY checkpoint_ns, checkpoint_id DESC",
+                (thread_id,),
+            )
+            rows = await cur.fetchall()
+
+            kept: List[Tuple[str, Dict[str, Any]]] = []
+            superseded: Dict[str, List[str]] = defaultdict(list)
+            per_ns: Dict[str, int] = defaultdict(int)
+            for row in rows:
+                ns = row["checkpoint_ns"]
+                per_ns[ns] += 1
+                if per_ns[ns] <= self.keep_last:
+                    kept.append((ns, row["channel_versions"]))
+                else:
+                    superseded[ns].append(row["checkpoint_id"])
+            if not superseded:
+                return result
+
+            for ns, checkpoint_ids in superseded.items():
+                await cur.execute(
+                    "DELETE FROM checkpoint_writes "
+                    "WHERE thread_id = %s AND checkpoint_ns = %s AND checkpoint_id = ANY(%s)",
+                    (thread_id, ns, checkpoint_ids),
+                )
+                result.writes += cur.rowcount
+                await cur.execute(
+                    "DELETE FROM checkpoints "
+                    "WHERE thread_id = %s AND checkpoint_ns = %s AND checkpoint_id = ANY(%s)",
+                    (thread_id, ns, checkpoint_ids),
+                )
+                result.checkpoints += cur.rowcount
+
+            for (ns, channel), versions in plan_blob_pruning(blobs, kept).items():
+                await cur.execute(
+                    "DELETE FROM checkpoint_blobs "
+                    "WHERE thread_id = %s AND checkpoint_ns = %s AND channel = %s AND version = ANY(%s)",
+                    (thread_id, ns, channel, versions),
+                )
+                result.blobs += cur.rowcount
+
+        result.threads = 1
+        logger.info(
+            f"Compacted checkpoints of {thread_id}: {result.checkpoints} checkpoints, "
+            f"{result.blobs} blobs, {result.writes} writes pruned"
+        )
+        return result
+
+    async def compact_all(self) -> CompactionResult:
+        """Prune every thread with more than ``keep_last`` checkpoints.
+
+        Returns:
+            Rows pruned across threads
+        """
+        async with self.saver.conn.connection() as conn:
+            cur = await conn.execute(
+                "SELECT DISTINCT thread_id FROM checkpoints "
+                "GROUP BY thread_id, checkpoint_ns HAVING count(*) > %s",
+                (self.keep_last,),
+            )
+            thread_ids = [row["thread_id"] for row in await cur.fetchall()]
+
+        total = CompactionResult()
+        for thread_id in thread_ids:
+            try:
+                total.add(await self.compact_thread(thread_id))
+            except Exception as e:
+                logger.error(f"Checkpoint compaction failed for {thread_id}: {e}")
+        self.last_result = total
+        return total
+
+    def start(self) -> None:
+        """Start periodic compaction on the running event loop (idempotent)."""
+        if self.interval <= 0:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Checkpoint compaction started (interval={self.interval}s, keep_last={self.keep_last})"
+            )
+
+    async def stop(self) -> None:
+        """Stop periodic compaction."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Checkpoint compaction stopped")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.compact_all()
+            except Exception as e:
+                logger.error(f"Checkpoint compaction round failed: {e}")
+
+
+__all__ = [
+    "ChannelDelta",
+    "CheckpointCompactor",
+    "CheckpointSerializer",
+    "CheckpointWriteStats",
+    "CompactionResult",
+    "DeltaPostgresSaver",
+    "plan_blob_pruning",
+]
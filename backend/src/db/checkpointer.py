@@ -10,18 +10,82 @@ PostgresSaver automatically creates:
 - checkpoints table (stores full state snapshots)
 - checkpoint_writes table (stores individual state updates)
 
+The application itself runs on ``get_async_checkpointer``: an
+AsyncPostgresSaver on a psycopg connection pool, opened once in the FastAPI
+lifespan and shared by every request and worker. The pool is sized from the
+Send fan-out width (GRAPH_MAX_CONCURRENCY), the number of Manager subgraphs
+that may write checkpoints at the same time. It stores append-only channels
+as deltas and large blobs compressed (see ``checkpoint_storage``).
+
+Configuration (environment variables):
+    - POSTGRES_CONNECTION_STRING: Direct Postgres connection (required)
+    - GRAPH_MAX_CONCURRENCY: Manager subgraphs run concurrently (default: 16)
+    - CHECKPOINT_POOL_MAX_SIZE: Pool size override (default: fan-out + 4)
+    - CHECKPOINT_POOL_TIMEOUT: Seconds to open the pool (default: 10)
+
 Reference: /libs/checkpoint-postgres/langgraph/checkpoint/postgres/__init__.py
 """
 
 from langgraph.checkpoint.postgres import PostgresSaver
 import os
 from dotenv import load_dotenv
-from typing import Optional, ContextManager
-from contextlib import contextmanager
+from typing import Any, AsyncIterator, Optional, ContextManager
+from contextlib import asynccontextmanager, contextmanager
 
 load_dotenv()
 
 
+DEFAULT_GRAPH_MAX_CONCURRENCY = 16
+# Connections beyond the fan-out: parent graph supersteps and API state reads
+DEFAULT_POOL_HEADROOM = 4
+DEFAULT_POOL_TIMEOUT = 10.0
+
+
+def _connection_string() -> str:
+    """Read POSTGRES_CONNECTION_STRING, raising ValueError if it is not set."""
+    connection_string = os.getenv("POSTGRES_CONNECTION_STRING")
+
+    if not connection_string:
+        raise ValueError(
+            "POSTGRES_CONNECTION_STRING not found in environment. "
+            "Get it from Supabase Dashboard → Project Settings → Database → Connection string (Direct)"
+        )
+    return connection_string
+
+
+def get_graph_max_concurrency() -> int:
+    """Send fan-out width: Manager subgraphs allowed to run at the same time.
+
+    Applied to the compiled graph as LangGraph's ``max_concurrency`` so the
+    number of concurrent checkpoint writers never exceeds the pool size.
+
+    Returns:
+        GRAPH_MAX_CONCURRENCY (default: 16)
+    """
+    return max(1, int(os.getenv("GRAPH_MAX_CONCURRENCY", DEFAULT_GRAPH_MAX_CONCURRENCY)))
+
+
+def checkpoint_pool_size(max_concurrency: Optional[int] = None) -> int:
+    """Connection pool size for the async checkpointer.
+
+    One connection per concurrently running Manager subgraph plus headroom
+    for the parent graph and API state reads, unless CHECKPOINT_POOL_MAX_SIZE
+    is set.
+
+    Args:
+        max_concurrency: Send fan-out width (default: get_graph_max_concurrency())
+
+    Returns:
+        Maximum pool size
+    """
+    override = os.getenv("CHECKPOINT_POOL_MAX_SIZE")
+    if override:
+        return max(1, int(override))
+    if max_concurrency is None:
+        max_concurrency = get_graph_max_concurrency()
+    return max_concurrency + DEFAULT_POOL_HEADROOM
+
+
 @contextmanager
 def get_checkpointer() -> ContextManager[PostgresSaver]:
     """Initialize PostgresSaver with Supabase Postgres connection.
@@ -52,13 +116,7 @@ def get_checkpointer() -> ContextManager[PostgresSaver]:
         - POSTGRES_CONNECTION_STRING: Direct Postgres connection (NOT Supabase API URL)
     """
 
-    connection_string = os.getenv("POSTGRES_CONNECTION_STRING")
-
-    if not connection_string:
-        raise ValueError(
-            "POSTGRES_CONNECTION_STRING not found in environment. "
-            "Get it from Supabase Dashboard → Project Settings → Database → Connection string (Direct)"
-        )
+    connection_string = _connection_string()
 
     # PostgresSaver.from_conn_string returns a context manager
     # Yield the checkpointer from the context manager
@@ -66,6 +124,74 @@ def get_checkpointer() -> ContextManager[PostgresSaver]:
         yield checkpointer
 
 
+@asynccontextmanager
+async def get_async_checkpointer(
+    connection_string: Optional[str] = None,
+    max_size: Optional[int] = None,
+    min_size: int = 1,
+    setup: bool = True,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[Any]:
+    """Open a DeltaPostgresSaver (AsyncPostgresSaver) on a psycopg connection pool.
+
+    Unlike ``get_checkpointer`` (one synchronous connection), concurrent
+    Manager subgraph threads each borrow a pooled connection for their
+    checkpoint writes, and the saver can be shared across requests for the
+    lifetime of the application.
+
+    Args:
+        connection_string: Postgres connection string (default: POSTGRES_CONNECTION_STRING)
+        max_size: Maximum pool size (default: checkpoint_pool_size())
+        min_size: Connections kept open while idle
+        setup: Create the checkpoint tables if needed (idempotent)
+        timeout: Seconds to wait for the pool to open (default: CHECKPOINT_POOL_TIMEOUT)
+
+    Yields:
+        DeltaPostgresSaver: Checkpointer for ``graph.ainvoke``
+
+    Raises:
+        ValueError: If POSTGRES_CONNECTION_STRING is not set
+        psycopg_pool.PoolTimeout: If no connection could be opened in time
+
+    Usage:
+        ```python
+        from src.db.checkpointer import get_async_checkpointer
+
+        async with get_async_checkpointer() as checkpointer:
+            graph = create_parent_graph(checkpointer)
+            result = await graph.ainvoke(state, {"configurable": {"thread_id": "task-001"}})
+        ```
+    """
+    connection_string = connection_string or _connection_string()
+
+    from psycopg.rows import dict_row
+    from psycopg_pool import AsyncConnectionPool
+
+    from .checkpoint_storage import DeltaPostgresSaver
+
+    if max_size is None:
+        max_size = checkpoint_pool_size()
+    if timeout is None:
+        timeout = float(os.getenv("CHECKPOINT_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT))
+
+    pool = AsyncConnectionPool(
+        connection_string,
+        min_size=min(min_size, max_size),
+        max_size=max_size,
+        # Settings required by AsyncPostgresSaver
+        kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        open=False,
+    )
+    try:
+        await pool.open(wait=True, timeout=timeout)
+        checkpointer = DeltaPostgresSaver(pool)
+        if setup:
+            await checkpointer.setup()
+        yield checkpointer
+    finally:
+        await pool.close()
+
+
 def setup_checkpoint_tables() -> None:
     """Setup PostgresSaver checkpoint tables (run once on deployment).
 
@@ -541,8 +541,8 @@ async def parse_assigned_workflow(
         should_close = True
 
     try:
-        # Check MCP server availability
-        if not await client.health_check():
+        # Cached MCP server availability (no extra round trip)
+        if not client.is_available():
             logger.warning("MCP Excel server unavailable, using fallback EGAs")
             return EGAParseResult(
                 success=True,
@@ -13,12 +13,14 @@ Key Features:
 Architecture:
     1. Receives initial search results with related_paragraphs references
     2. Uses GPT-4o-mini to evaluate if expansion is needed
-    3. Fetches additional paragraphs via MCP client (when available)
+    3. Fetches additional paragraphs via MCP client (when available),
+       concurrently per candidate so they share one JSON-RPC batch
     4. Returns expanded context with hop metadata
 
 Reference: K-IFRS RAG Architecture Document
 """
 
+import asyncio
 import json
 import logging
 from typing import Dict, Any, List, Set, Optional
@@ -338,13 +340,16 @@ async def multihop_node(state: Dict[str, Any]) -> Dict[str, Any]:
             # Get refs to fetch (limit to 3 per candidate)
             refs_to_fetch = result.get("refs_to_fetch", [])[:3]
 
+            # Select refs within the remaining hop budget
+            to_fetch: List[tuple[str, str, str]] = []
+            selected_refs: Set[str] = set()
             for ref in refs_to_fetch:
                 # Check hop limit
-                if total_hops >= max_hops:
+                if total_hops + len(to_fetch) >= max_hops:
                     break
 
-                # Skip already fetched refs
-                if ref in fetched_ids:
+                # Skip already fetched (or already selected) refs
+                if ref in fetched_ids or ref in selected_refs:
                     continue
 
                 # Parse reference
@@ -358,45 +363,51 @@ async def multihop_node(state: Dict[str, Any]) -> Dict[str, Any]:
                     continue
 
                 standard_id, paragraph_no = parsed
+                to_fetch.append((ref, standard_id, paragraph_no))
+                selected_refs.add(ref)
+
+            # Fetch via MCP concurrently (micro-batched into one round trip)
+            fetch_results = await asyncio.gather(*(
+                mcp_client.get_paragraph_by_id(
+                    standard_id=standard_id,
+                    paragraph_no=paragraph_no
+                )
+                for _, standard_id, paragraph_no in to_fetch
+            ), return_exceptions=True)
 
-                # Fetch via MCP
-                try:
-                    fetch_result = await mcp_client.get_paragraph_by_id(
-                        standard_id=standard_id,
-                        paragraph_no=paragraph_no
+            for (ref, _, _), fetch_result in zip(to_fetch, fetch_results):
+                if isinstance(fetch_result, Exception):
+                    logger.error(
+                        f"[Multi-hop] MCP client error for {ref}: {fetch_result}"
                     )
+                    multihop_metadata["skipped_refs"].append({
+                        "ref": ref,
+                        "reason": f"MCP exception: {str(fetch_result)}"
+                    })
+                    continue
 
-                    if fetch_result.get("status") == "success":
-                        data = fetch_result.get("data", {})
-                        total_hops += 1
-
-                        # Format and add to expanded content
-                        formatted_content = format_multihop_content(
-                            data, total_hops
-                        )
-                        expanded_content.append(formatted_content)
-                        fetched_ids.add(ref)
-
-                        logger.info(
-                            f"[Multi-hop] Fetched {ref} (hop {total_hops}/{max_hops})"
-                        )
-                    else:
-                        error_msg = fetch_result.get("message", "Unknown error")
-                        logger.warning(
-                            f"[Multi-hop] Failed to fetch {ref}: {error_msg}"
-                        )
-                        multihop_metadata["skipped_refs"].append({
-                            "ref": ref,
-                            "reason": f"MCP fetch failed: {error_msg}"
-                        })
-
-                except Exception as e:
-                    logger.error(
-                        f"[Multi-hop] MCP client error for {ref}: {e}"
+                if fetch_result.get("status") == "success":
+                    data = fetch_result.get("data", {})
+                    total_hops += 1
+
+                    # Format and add to expanded content
+                    formatted_content = format_multihop_content(
+                        data, total_hops
+                    )
+                    expanded_content.append(formatted_content)
+                    fetched_ids.add(ref)
+
+                    logger.info(
+                        f"[Multi-hop] Fetched {ref} (hop {total_hops}/{max_hops})"
+                    )
+                else:
+                    error_msg = fetch_result.get("message", "Unknown error")
+                    logger.warning(
+                        f"[Multi-hop] Failed to fetch {ref}: {error_msg}"
                     )
                     multihop_metadata["skipped_refs"].append({
                         "ref": ref,
-                        "reason": f"MCP exception: {str(e)}"
+                        "reason": f"MCP fetch failed: {error_msg}"
                     })
 
         except json.JSONDecodeError as e:
@@ -1,7 +1,7 @@
 """FastAPI Application Entry Point
 
 This is the main FastAPI application that orchestrates:
-1. LangGraph workflow engine initialization with PostgresSaver
+1. LangGraph workflow engine initialization with a pooled AsyncPostgresSaver
 2. REST API routes for audit operations
 3. SSE streaming for real-time agent messages
 4. CORS middleware for frontend integration
@@ -21,7 +21,7 @@ Architecture:
 Reference: Plan section T3.5, Specification section 8.1-8.3
 """
 
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
@@ -30,7 +30,13 @@ import sys
 from typing import AsyncGenerator
 from dotenv import load_dotenv
 
-from .db.checkpointer import get_checkpointer, setup_checkpoint_tables
+from .db.async_client import close_async_db, get_async_db
+from .db.checkpoint_storage import CheckpointCompactor
+from .db.checkpointer import checkpoint_pool_size, get_async_checkpointer, get_graph_max_concurrency
+from .services.mcp_client import get_health_monitor
+from .services.mcp_transport import close_mcp_transport, get_mcp_transport
+from .services.message_broker import close_message_broker, get_message_broker
+from .services.task_stream import close_task_stream_hub
 
 # Load environment variables early
 load_dotenv()
@@ -53,13 +59,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """FastAPI lifespan context manager for resource initialization and cleanup.
 
     Startup:
-        1. Initialize PostgresSaver (create checkpoint tables if needed)
+        1. Open the pooled AsyncPostgresSaver (create checkpoint tables if needed),
+           falling back to MemorySaver without database credentials
         2. Create LangGraph workflow graph (placeholder - will be implemented by Window 2)
         3. Store graph instance in app.state for route access
+        4. Create the shared MCP transport (per-server connection pools)
+        5. Start the background MCP health monitor
+        6. Start the agent message broker (SSE push delivery)
+        7. Open the async database layer (PostgREST client, direct pool)
 
     Shutdown:
         1. Cleanup graph resources
-        2. Close database connections
+        2. Stop the MCP health monitor and close shared connection pools
+        3. Stop shared SSE task streams and close the message broker
+        4. Close database connections (async client, direct pool, checkpointer pool)
 
     Reference: https://fastapi.tiangolo.com/advanced/events/#lifespan
     """
@@ -67,46 +80,62 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting AI Audit Platform Backend")
     logger.info("=" * 80)
 
+    # Holds the checkpointer's connection pool open until shutdown
+    exit_stack = AsyncExitStack()
+
     try:
         # ============================================================================
-        # STARTUP: Initialize PostgresSaver
+        # STARTUP: Initialize AsyncPostgresSaver
         # ============================================================================
-        logger.info("Initializing PostgresSaver checkpointer...")
+        # One pooled saver for the whole app lifecycle: the graph holds a
+        # reference to it, so the pool stays open until shutdown. The pool is
+        # sized for the Send fan-out width (concurrent Manager subgraphs).
+        logger.info("Initializing AsyncPostgresSaver checkpointer...")
+
+        max_concurrency = get_graph_max_concurrency()
+        pool_size = checkpoint_pool_size(max_concurrency)
+        checkpointer = None
 
-        # Setup checkpoint tables (idempotent - safe to run multiple times)
-        logger.info("Setting up PostgresSaver checkpoint tables...")
         try:
-            setup_checkpoint_tables()
-            logger.info("✅ PostgresSaver initialized successfully")
+            # Creates the checkpoint tables if needed (idempotent)
+            checkpointer = await exit_stack.enter_async_context(
+                get_async_checkpointer(max_size=pool_size)
+            )
+            logger.info(
+                f"✅ AsyncPostgresSaver initialized (pool max_size={pool_size}, "
+                f"fan-out={max_concurrency})"
+            )
+
+            # Prune superseded checkpoints of long-running audit threads;
+            # stopped by the exit stack before the pool closes
+            compactor = CheckpointCompactor(checkpointer)
+            compactor.start()
+            exit_stack.push_async_callback(compactor.stop)
         except Exception as e:
-            logger.warning(f"⚠️  PostgresSaver initialization failed: {e}")
-            logger.warning("    Continuing without checkpointer (E2E test mode or missing DB credentials)")
-            logger.warning("    Graph functionality will be disabled.")
+            logger.warning(f"⚠️  AsyncPostgresSaver initialization failed: {e}")
+            logger.warning("    Falling back to MemorySaver (E2E test mode or missing DB credentials)")
+            logger.warning("    Workflow state will not survive restarts or be shared across workers.")
 
         # ============================================================================
         # STARTUP: Create LangGraph Workflow
         # ============================================================================
-        # NOTE: We need to keep the checkpointer connection alive during the entire
-        # app lifecycle. The graph holds a reference to the checkpointer, so if we
-        # close the connection, graph.ainvoke() will fail.
-
         logger.info("Initializing LangGraph workflow...")
 
-        checkpointer = None
         graph = None
 
         try:
             # Try to import graph builder (may not exist yet if Window 2 incomplete)
             from .graph.graph import create_parent_graph
-            from langgraph.checkpoint.memory import MemorySaver
 
-            # For async graph invocation (ainvoke), we need an async-compatible checkpointer
-            # MemorySaver works for both sync and async, and is simpler for ad-hoc chat
-            # PostgresSaver requires psycopg async setup which is more complex
-            logger.info("Using MemorySaver checkpointer (in-memory, no persistence)")
-            checkpointer = MemorySaver()
+            if checkpointer is None:
+                from langgraph.checkpoint.memory import MemorySaver
+
+                logger.info("Using MemorySaver checkpointer (in-memory, no persistence)")
+                checkpointer = MemorySaver()
 
-            graph = create_parent_graph(checkpointer)
+            # Cap concurrently running Manager subgraphs so checkpoint writers
+            # never outnumber the pooled connections
+            graph = create_parent_graph(checkpointer).with_config(max_concurrency=max_concurrency)
             logger.info("✅ LangGraph workflow initialized successfully")
 
         except ImportError as e:
@@ -123,6 +152,48 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
         # Store graph in app.state for access in route handlers
         app.state.graph = graph
+        app.state.checkpointer = checkpointer
+
+        # ============================================================================
+        # STARTUP: Shared MCP Transport
+        # ============================================================================
+        # All MCP clients borrow keep-alive connections from this transport;
+        # it is closed on shutdown below.
+        mcp_transport = get_mcp_transport()
+        app.state.mcp_transport = mcp_transport
+        logger.info(
+            f"✅ MCP transport ready (max_connections="
+            f"{mcp_transport.limits.max_connections} per server, "
+            f"http2={mcp_transport.http2})"
+        )
+
+        # Probe MCP servers in the background so call sites read cached
+        # health instead of awaiting a health check before every call
+        get_health_monitor().start()
+
+        # ============================================================================
+        # STARTUP: Agent Message Broker
+        # ============================================================================
+        # Writers publish agent_messages rows here and SSE streams subscribe
+        # per task_id (MESSAGE_BROKER_BACKEND=postgres relays across workers)
+        message_broker = get_message_broker()
+        await message_broker.start()
+        logger.info(f"✅ Message broker ready ({type(message_broker.backend).__name__})")
+
+        # ============================================================================
+        # STARTUP: Async Database Layer
+        # ============================================================================
+        # Routes and SSE streams query through this layer so a slow query
+        # never blocks the event loop; hot reads use the direct pool if set
+        try:
+            db = get_async_db()
+            await db.connect()
+            logger.info(
+                f"✅ Async database ready (timeout={db.timeout}s, "
+                f"direct pool={'on' if db.stats() else 'off'})"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Async database initialization failed: {e}")
 
         # ============================================================================
         # STARTUP: Log Environment Info
@@ -156,7 +227,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Cleanup graph resources if needed
         if hasattr(app.state, 'graph') and app.state.graph:
             logger.info("Cleaning up LangGraph workflow...")
-            # MemorySaver doesn't need explicit cleanup
+
+        # Stop MCP health probing, then close the shared keep-alive connections
+        await get_health_monitor().stop()
+        await close_mcp_transport()
+        await close_task_stream_hub()
+        await close_message_broker()
+        await close_async_db()
+
+        # Stop checkpoint compaction and close the checkpointer's connection pool
+        await exit_stack.aclose()
 
         logger.info("✅ Shutdown complete")
 
@@ -7,20 +7,36 @@ searching PWC Audit Guide PDFs to generate task proposals based on EGA descripti
 Key Features:
     - PDF text extraction and preprocessing
     - Text chunking with configurable overlap
+    - Streaming ingestion pipeline (pages -> chunks -> embed -> store)
+      with bounded queues between stages
+    - Batched, concurrency-bounded embedding and bulk vector upserts
     - Hybrid search (semantic embeddings + BM25 keyword matching)
-    - EGA to audit procedure mapping with assertion classification
+    - TTL/LRU search result cache invalidated on corpus changes
+    - Inverted-index BM25 with Korean-aware (Hangul bigram) tokenization
+    - EGA to audit procedure mapping with assertion tags precomputed at ingest
 
 Key Classes:
     - AuditGuideRAG: Main RAG service for processing and searching audit guides
+    - BM25Index: Inverted index with postings lists for BM25 keyword ranking
+    - SearchCache: Bounded TTL/LRU cache for search results
+    - AssertionClassifier: Single-pass keyword matcher for assertion tags
     - AuditProcedure: Represents a single audit procedure from PWC Guide
     - RAGSearchResult: Container for search results with metadata
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, AsyncIterator, Set
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import Counter, OrderedDict, defaultdict
+import asyncio
+import copy
+import heapq
 import logging
 import hashlib
+import math
+import re
+import time
+import uuid
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -96,7 +112,12 @@ class ChunkMetadata:
         section_title: Human-readable section title
         page_number: Page number in source PDF
         chunk_index: Index of this chunk in the document
-        total_chunks: Total number of chunks in the document
+        total_chunks: Total number of chunks in the document (None while the
+            document is still being ingested; vector stores keep None because
+            chunks are stored before the count is known, and it is filled in
+            when chunks are loaded back)
+        assertions: Assertion tags computed at ingest time
+            (None if the chunk has not been classified yet)
     """
     chunk_id: str
     document_id: str
@@ -104,7 +125,8 @@ class ChunkMetadata:
     section_title: str
     page_number: Optional[int]
     chunk_index: int
-    total_chunks: int
+    total_chunks: Optional[int] = None
+    assertions: Optional[List[str]] = None
 
 
 @dataclass
@@ -122,6 +144,418 @@ class TextChunk:
     embedding: Optional[List[float]] = None
 
 
+# Hangul syllable runs, or ASCII words/numbers (section codes like "3.1" stay whole)
+_TOKEN_PATTERN = re.compile(r"[\uac00-\ud7a3]+|[a-z0-9]+(?:[.\-][a-z0-9]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Tokenize text for BM25 indexing and querying.
+
+    Korean is agglutinative, so whitespace tokens such as "은행조회서를" never
+    match a query term like "은행". Hangul runs are therefore split into
+    overlapping character bigrams ("은행", "행조", "조회", ...), which matches
+    stems regardless of attached particles without a morphological analyzer.
+    ASCII words and numbers are kept whole.
+
+    Args:
+        text: Raw text to tokenize
+
+    Returns:
+        List of lowercase tokens (duplicates preserved for term frequency)
+
+    Examples:
+        >>> tokenize("은행조회 FSLI 3.1")
+        ['은행', '행조', '조회', 'fsli', '3.1']
+    """
+    tokens: List[str] = []
+
+    for match in _TOKEN_PATTERN.finditer(text.lower()):
+        token = match.group()
+        if len(token) > 1 and "\uac00" <= token[0] <= "\ud7a3":
+            tokens.extend(token[i:i + 2] for i in range(len(token) - 1))
+        else:
+            tokens.append(token)
+
+    return tokens
+
+
+class BM25Index:
+    """
+    Inverted index for Okapi BM25 keyword ranking.
+
+    Keeps a postings list (term -> {doc_id: term frequency}) per term, the
+    length of every document and an IDF table, so a query only touches the
+    postings of its own terms instead of scanning the whole corpus.
+
+    The index is updated in place: add() and remove_document() only touch
+    the postings of the affected chunks, and IDF values are memoized per
+    term and invalidated whenever the corpus changes.
+
+    Scores are normalized by the score of an average-length document that
+    contains every query term exactly once and capped at 1.0, so they stay
+    comparable with AuditGuideRAG.MIN_RELEVANCE_SCORE.
+
+    Attributes:
+        K1: Term frequency saturation parameter (default 1.2)
+        B: Document length normalization parameter (default 0.75)
+
+    Examples:
+        >>> index = BM25Index()
+        >>> index.add(chunks)
+        >>> for chunk, score in index.search("은행 잔액", top_k=5):
+        ...     print(chunk.metadata.chunk_id, score)
+        >>> index.remove_document("doc1")
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self.doc_lengths: Dict[int, int] = {}
+        self.chunks: Dict[int, TextChunk] = {}
+        self.idf: Dict[str, float] = {}
+        self._doc_terms: Dict[int, List[str]] = {}
+        self._documents: Dict[str, List[int]] = defaultdict(list)
+        self._total_length = 0
+        self._next_doc_id = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def has_document(self, document_id: str) -> bool:
+        """Return True if any chunk of the source document is indexed."""
+        return document_id in self._documents
+
+    def add(self, chunks: List[TextChunk]) -> None:
+        """
+        Index chunks in place.
+
+        Cost is proportional to the number of tokens in the added chunks.
+
+        Args:
+            chunks: TextChunk objects to index
+        """
+        for chunk in chunks:
+            doc_id = self._next_doc_id
+            self._next_doc_id += 1
+
+            term_freqs = Counter(tokenize(chunk.text))
+            for term, tf in term_freqs.items():
+                self.postings[term][doc_id] = tf
+
+            length = sum(term_freqs.values())
+            self.doc_lengths[doc_id] = length
+            self.chunks[doc_id] = chunk
+            self._doc_terms[doc_id] = list(term_freqs)
+            self._documents[chunk.metadata.document_id].append(doc_id)
+            self._total_length += length
+
+        if chunks:
+            self.idf = {}
+
+    def remove_document(self, document_id: str) -> int:
+        """
+        Remove every chunk of a source document from the index.
+
+        Cost is proportional to the number of distinct terms in the
+        document's chunks.
+
+        Args:
+            document_id: ID of the source document
+
+        Returns:
+            Number of chunks removed
+        """
+        doc_ids = self._documents.pop(document_id, [])
+
+        for doc_id in doc_ids:
+            for term in self._doc_terms.pop(doc_id):
+                docs = self.postings[term]
+                del docs[doc_id]
+                if not docs:
+                    del self.postings[term]
+
+            self._total_length -= self.doc_lengths.pop(doc_id)
+            del self.chunks[doc_id]
+
+        if doc_ids:
+            self.idf = {}
+
+        return len(doc_ids)
+
+    def search(self, query: str, top_k: int) -> List[tuple]:
+        """
+        Rank indexed chunks against a query.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+
+        Returns:
+            List of (chunk, score) tuples sorted by score descending
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.doc_lengths:
+            return []
+
+        base, per_token = self._length_params()
+        doc_lengths = self.doc_lengths
+
+        scores: Dict[int, float] = defaultdict(float)
+        norm = 0.0
+
+        for term in terms:
+            idf = self._term_idf(term)
+            if idf is None:
+                # Unseen term: count it as the rarest possible term
+                norm += self._idf(0)
+                continue
+            norm += idf
+
+            weight = idf * (self.K1 + 1)
+            for doc_id, tf in self.postings[term].items():
+                scores[doc_id] += weight * tf / (tf + base + per_token * doc_lengths[doc_id])
+
+        top = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+
+        return [
+            (self.chunks[doc_id], min(1.0, score / norm))
+            for doc_id, score in top
+        ]
+
+    def search_many(self, queries: List[str], top_k: int) -> List[List[tuple]]:
+        """
+        Rank indexed chunks against many queries in one pass over the postings.
+
+        Each distinct term's postings list is traversed once and its
+        contribution is added to every query containing the term, so queries
+        sharing terms (e.g. EGAs of the same FSLI) share the scan.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results per query
+
+        Returns:
+            Per query, a list of (chunk, score) tuples sorted by score descending
+        """
+        if not self.doc_lengths:
+            return [[] for _ in queries]
+
+        queries_by_term: Dict[str, List[int]] = defaultdict(list)
+        for query_index, query in enumerate(queries):
+            for term in dict.fromkeys(tokenize(query)):
+                queries_by_term[term].append(query_index)
+
+        base, per_token = self._length_params()
+        doc_lengths = self.doc_lengths
+
+        scores: List[Dict[int, float]] = [defaultdict(float) for _ in queries]
+        norms = [0.0] * len(queries)
+
+        for term, query_indexes in queries_by_term.items():
+            idf = self._term_idf(term)
+            if idf is None:
+                for query_index in query_indexes:
+                    norms[query_index] += self._idf(0)
+                continue
+            for query_index in query_indexes:
+                norms[query_index] += idf
+
+            weight = idf * (self.K1 + 1)
+            for doc_id, tf in self.postings[term].items():
+                contribution = weight * tf / (tf + base + per_token * doc_lengths[doc_id])
+                for query_index in query_indexes:
+                    scores[query_index][doc_id] += contribution
+
+        results = []
+        for query_scores, norm in zip(scores, norms):
+            top = heapq.nlargest(top_k, query_scores.items(), key=lambda item: item[1])
+            results.append([
+                (self.chunks[doc_id], min(1.0, score / norm))
+                for doc_id, score in top
+            ])
+
+        return results
+
+    def _length_params(self) -> tuple:
+        """
+        Split length normalization K1 * (1 - B + B * dl / avgdl) into a
+        constant and a per-token factor, so the corpus-wide average never
+        has to be cached per document.
+        """
+        avg_length = (self._total_length / len(self.doc_lengths)) or 1.0
+        return self.K1 * (1 - self.B), self.K1 * self.B / avg_length
+
+    def _idf(self, doc_freq: int) -> float:
+        """BM25 IDF with the +1 smoothing used by Lucene (never negative)."""
+        n = len(self.doc_lengths)
+        return math.log(1 + (n - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def _term_idf(self, term: str) -> Optional[float]:
+        """Return the memoized IDF of an indexed term, or None if unseen."""
+        idf = self.idf.get(term)
+        if idf is None:
+            docs = self.postings.get(term)
+            if not docs:
+                return None
+            idf = self.idf[term] = self._idf(len(docs))
+        return idf
+
+
+class SearchCache:
+    """
+    Bounded LRU cache with per-entry TTL for search results.
+
+    Entries expire ttl_seconds after insertion; when the cache is full the
+    least recently used entry is evicted. Hit, miss and eviction counters
+    are kept for monitoring.
+
+    Examples:
+        >>> cache = SearchCache(max_entries=2, ttl_seconds=60)
+        >>> cache.set("a", 1)
+        >>> cache.get("a")
+        1
+        >>> cache.stats()["hits"]
+        1
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached entries
+            ttl_seconds: Lifetime of an entry in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self.max_entries <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dict with size, max_entries, hits, misses, evictions and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+class AssertionClassifier:
+    """
+    Single-pass multi-keyword assertion tagger.
+
+    All keywords are compiled into one regex alternation (longest first)
+    wrapped in a lookahead, so the text is scanned once regardless of how
+    many keywords the table holds. At each position the longest matching
+    keyword wins; its tags include the assertions of every keyword it
+    contains, which makes the result identical to testing each keyword
+    as a substring.
+
+    Examples:
+        >>> classifier = AssertionClassifier({"existence": ["실재"], "valuation": ["평가"]})
+        >>> classifier.classify("재고자산의 실재성과 평가")
+        ['existence', 'valuation']
+    """
+
+    def __init__(self, keywords: Dict[str, List[str]]):
+        """
+        Compile the keyword table.
+
+        Args:
+            keywords: Assertion name -> keywords (matched case-insensitively)
+        """
+        self._order = list(keywords)
+
+        assertions_by_keyword: Dict[str, set] = defaultdict(set)
+        for assertion, words in keywords.items():
+            for word in words:
+                if word:
+                    assertions_by_keyword[word.lower()].add(assertion)
+
+        self._tags: Dict[str, frozenset] = {
+            keyword: frozenset().union(*(
+                tags for other, tags in assertions_by_keyword.items()
+                if other in keyword
+            ))
+            for keyword in assertions_by_keyword
+        }
+
+        alternation = "|".join(
+            re.escape(keyword)
+            for keyword in sorted(self._tags, key=len, reverse=True)
+        )
+        self._pattern = re.compile(f"(?=({alternation}))") if alternation else None
+
+    def classify(self, text: str) -> List[str]:
+        """
+        Tag text with the assertions whose keywords it contains.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            Assertion names in keyword-table order
+        """
+        if self._pattern is None:
+            return []
+
+        found = set()
+        for match in self._pattern.finditer(text.lower()):
+            found |= self._tags[match.group(1)]
+            if len(found) == len(self._order):
+                break
+
+        return [assertion for assertion in self._order if assertion in found]
+
+
 class AuditGuideRAG:
     """
     RAG service for PWC Audit Guide.
@@ -147,10 +581,19 @@ class AuditGuideRAG:
     CHUNK_SIZE = 1000  # characters
     CHUNK_OVERLAP = 200  # characters
 
+    # Ingestion settings
+    EMBED_BATCH_SIZE = 64  # chunks per embedding request
+    MAX_CONCURRENT_REQUESTS = 4  # in-flight embedding/upsert batches
+    PIPELINE_QUEUE_SIZE = 8  # items buffered between ingestion stages
+
     # Search settings
     TOP_K = 10
     MIN_RELEVANCE_SCORE = 0.5
 
+    # Search result cache settings
+    SEARCH_CACHE_SIZE = 1024  # entries
+    SEARCH_CACHE_TTL = 3600.0  # seconds
+
     # Assertion keywords for classification (Korean and English)
     ASSERTION_KEYWORDS = {
         "existence": ["존재", "실재", "발생", "existence", "occurrence", "실물", "확인"],
@@ -163,19 +606,42 @@ class AuditGuideRAG:
     def __init__(
         self,
         embedding_model: Optional[Any] = None,
-        vector_store: Optional[Any] = None
+        vector_store: Optional[Any] = None,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        index_dir: Optional[str] = None
     ):
         """
         Initialize RAG service.
 
+        The embedding model must provide ``async embed(text)`` and may provide
+        ``async embed_batch(texts)``. The vector store must provide
+        ``async upsert(id, embedding, metadata, text)`` and ``async search(...)``,
+        and may provide ``async upsert_many(records)`` for bulk writes,
+        ``async delete_document(document_id, keep=())`` for removals and
+        ``async delete(ids)`` for discarding a failed ingest.
+
         Args:
             embedding_model: Model for generating embeddings (e.g., OpenAI ada-002)
             vector_store: Vector database for storing/querying embeddings
+            batch_size: Chunks per embedding/upsert batch (default: EMBED_BATCH_SIZE)
+            max_concurrency: Maximum in-flight batches (default: MAX_CONCURRENT_REQUESTS)
+            index_dir: Directory for the built-in LocalVectorStore, used when no
+                vector_store is given (reopened via mmap on restart)
         """
+        if vector_store is None and index_dir:
+            from .vector_store import LocalVectorStore
+            vector_store = LocalVectorStore(index_dir)
+
         self.embedding_model = embedding_model
         self.vector_store = vector_store
+        self.batch_size = batch_size or self.EMBED_BATCH_SIZE
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENT_REQUESTS
         self.chunks: List[TextChunk] = []
-        self.bm25_index: Optional[Dict[str, Any]] = None
+        self.bm25_index: Optional[BM25Index] = None
+        self.search_cache = SearchCache(self.SEARCH_CACHE_SIZE, self.SEARCH_CACHE_TTL)
+        self.assertion_classifier = AssertionClassifier(self.ASSERTION_KEYWORDS)
+        self._index_version = 0
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -192,8 +658,9 @@ class AuditGuideRAG:
         if self.vector_store:
             await self._load_from_vector_store()
 
-        # Build BM25 index
-        self._build_bm25_index()
+        # Build BM25 index (ingest_pdf may already have built it incrementally)
+        if self.bm25_index is None:
+            self._build_bm25_index()
 
         self._initialized = True
         logger.info(f"AuditGuideRAG initialized with {len(self.chunks)} chunks")
@@ -206,8 +673,20 @@ class AuditGuideRAG:
         """
         Ingest a PDF document into the RAG system.
 
-        Extracts text from PDF, chunks it with overlap, generates embeddings,
-        and stores in vector database.
+        Streams the PDF through a pipeline of concurrent stages connected by
+        bounded queues: pages are extracted one at a time, chunked with
+        overlap, embedded in batches and stored in the vector database.
+        Stages overlap, and memory held in flight is bounded by the queue
+        sizes rather than the document size. Once a batch is stored, its
+        embeddings are released (the vector store owns them).
+
+        Every ingest stores its chunks under ids tagged with a fresh version,
+        so the previous version of a re-ingested document_id is never
+        overwritten in place. It is deleted only once the new version is
+        stored; a failed ingest deletes the chunks it already stored instead
+        (when the store provides ``delete``) and keeps the previous version.
+        The keyword index is updated in place, so the cost is proportional to
+        the document rather than the whole corpus.
 
         Args:
             pdf_path: Path to PDF file
@@ -218,47 +697,132 @@ class AuditGuideRAG:
                 - document_id: ID assigned to document
                 - pages_processed: Number of pages extracted
                 - chunks_created: Number of chunks created
+                - chunks_replaced: Number of previous chunks removed for this document
                 - processing_time_ms: Processing time in milliseconds
+                - stage_times_ms: Busy time per stage (extract, chunk, embed, store),
+                  excluding time spent waiting on queues
+                - stage_throughput: Chunks per second of busy time per stage
+
+        Note:
+            Chunks are persisted to the vector store before the document's
+            chunk count is known, so stored metadata has total_chunks=None;
+            only the returned and cached chunks carry the count.
 
         Examples:
             >>> result = await rag.ingest_pdf("/path/to/pwc_guide.pdf")
             >>> print(f"Created {result['chunks_created']} chunks")
         """
-        import time
         start_time = time.time()
 
         if not document_id:
             document_id = hashlib.md5(pdf_path.encode()).hexdigest()[:12]
 
-        # Extract text from PDF
-        pages = await self._extract_pdf_text(pdf_path)
-
-        # Chunk the text
-        new_chunks = self._chunk_text(pages, document_id)
+        stats: Dict[str, Any] = {
+            "pages": 0,
+            "stage_times": {"extract": 0.0, "chunk": 0.0, "embed": 0.0, "store": 0.0}
+        }
+        version = uuid.uuid4().hex[:8]
+        new_chunks = await self._run_ingest_pipeline(pdf_path, document_id, stats, version)
 
-        # Generate embeddings
-        if self.embedding_model:
-            await self._generate_embeddings(new_chunks)
+        for chunk in new_chunks:
+            chunk.metadata.total_chunks = len(new_chunks)
 
-        # Store in vector database
-        if self.vector_store:
-            await self._store_chunks(new_chunks)
+        # Drop the previous version only now, so a failed re-ingest keeps it
+        chunks_replaced = self._drop_document(document_id)
+        await self._delete_stored_document(
+            document_id, keep={chunk.metadata.chunk_id for chunk in new_chunks}
+        )
 
-        # Add to local cache
+        # Add to local cache and index only the new chunks
         self.chunks.extend(new_chunks)
-
-        # Rebuild BM25 index
-        self._build_bm25_index()
+        self._index_chunks(new_chunks)
 
         elapsed = (time.time() - start_time) * 1000
+        stage_times = stats["stage_times"]
 
         return {
             "document_id": document_id,
-            "pages_processed": len(pages),
+            "pages_processed": stats["pages"],
             "chunks_created": len(new_chunks),
-            "processing_time_ms": elapsed
+            "chunks_replaced": chunks_replaced,
+            "processing_time_ms": elapsed,
+            "stage_times_ms": {
+                stage: seconds * 1000 for stage, seconds in stage_times.items()
+            },
+            "stage_throughput": {
+                stage: len(new_chunks) / seconds if seconds > 0 else 0.0
+                for stage, seconds in stage_times.items()
+            }
         }
 
+    async def remove_document(self, document_id: str) -> int:
+        """
+        Remove all chunks of a document from the local cache and indexes.
+
+        Also deletes the document from the vector store when the store
+        supports ``delete_document``, even if it is not indexed locally.
+
+        Args:
+            document_id: ID of the document to remove
+
+        Returns:
+            Number of chunks removed from the local cache (0 if the document
+            was not indexed)
+
+        Examples:
+            >>> removed = await rag.remove_document("a1b2c3d4e5f6")
+        """
+        removed = self._drop_document(document_id)
+
+        # The store may hold chunks that were never loaded into this instance
+        await self._delete_stored_document(document_id)
+
+        if removed:
+            self._invalidate_search_cache()
+
+        logger.info(f"Removed {removed} chunks of document {document_id}")
+        return removed
+
+    def _drop_document(self, document_id: str) -> int:
+        """Remove a document's chunks from the local cache and BM25 index."""
+        if self.bm25_index is not None:
+            if not self.bm25_index.has_document(document_id):
+                return 0
+            removed = self.bm25_index.remove_document(document_id)
+        else:
+            removed = sum(1 for chunk in self.chunks if chunk.metadata.document_id == document_id)
+            if not removed:
+                return 0
+
+        # Single pointer scan; no re-tokenization of the remaining corpus
+        self.chunks = [
+            chunk for chunk in self.chunks
+            if chunk.metadata.document_id != document_id
+        ]
+        return removed
+
+    async def _delete_stored_document(
+        self,
+        document_id: str,
+        keep: Optional[Set[str]] = None
+    ) -> None:
+        """Delete a document from the vector store, keeping the given chunk ids."""
+        if not self.vector_store or not hasattr(self.vector_store, "delete_document"):
+            return
+        if keep is None:
+            await self.vector_store.delete_document(document_id=document_id)
+        else:
+            await self.vector_store.delete_document(document_id=document_id, keep=keep)
+
+    async def _delete_stored_chunks(self, chunk_ids: List[str]) -> None:
+        """Delete chunks from the vector store by id, if the store supports it."""
+        if not chunk_ids or not _has_method(self.vector_store, "delete"):
+            return
+        try:
+            await self.vector_store.delete(ids=chunk_ids)
+        except Exception as e:
+            logger.warning(f"Failed to delete {len(chunk_ids)} chunks of a failed ingest: {e}")
+
     async def search(
         self,
         query: str,
@@ -270,7 +834,9 @@ class AuditGuideRAG:
         Search for relevant audit procedures.
 
         Performs search using specified mode and returns matching procedures
-        sorted by relevance score.
+        sorted by relevance score. Results are cached by normalized query,
+        mode, top_k, min_score and index version, so repeated lookups skip
+        embedding and retrieval until the corpus changes.
 
         Args:
             query: Search query (e.g., EGA description)
@@ -285,7 +851,6 @@ class AuditGuideRAG:
             >>> result = await rag.search("매출채권 확인", mode=SearchMode.HYBRID)
             >>> print(f"Found {len(result.procedures)} procedures in {result.search_time_ms}ms")
         """
-        import time
         start_time = time.time()
 
         if not self._initialized:
@@ -294,6 +859,11 @@ class AuditGuideRAG:
         top_k = top_k or self.TOP_K
         min_score = min_score or self.MIN_RELEVANCE_SCORE
 
+        cache_key = self._cache_key(query, mode, top_k, min_score)
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            return self._copy_result(cached, query, start_time)
+
         results: List[tuple] = []  # (chunk, score)
 
         if mode == SearchMode.SEMANTIC:
@@ -305,7 +875,133 @@ class AuditGuideRAG:
             bm25_results = self._bm25_search(query, top_k)
             results = self._merge_results(semantic_results, bm25_results)
 
-        # Convert chunks to procedures
+        result = self._build_result(query, mode, results, top_k, min_score, start_time)
+        self.search_cache.set(cache_key, result)
+
+        return self._copy_result(result, query, start_time)
+
+    async def search_many(
+        self,
+        queries: List[str],
+        mode: SearchMode = SearchMode.HYBRID,
+        top_k: Optional[int] = None,
+        min_score: Optional[float] = None
+    ) -> List[RAGSearchResult]:
+        """
+        Search for audit procedures for many queries at once.
+
+        Cached queries are answered from the search cache. The remaining
+        queries are embedded in one batch, scored against the corpus as a
+        single matrix product (when the vector store provides search_many)
+        and ranked by BM25 in one pass over the postings lists.
+
+        Args:
+            queries: Search queries (e.g., one per EGA)
+            mode: Search mode (semantic, bm25, or hybrid)
+            top_k: Number of results per query (default: TOP_K)
+            min_score: Minimum relevance score threshold (default: MIN_RELEVANCE_SCORE)
+
+        Returns:
+            One RAGSearchResult per query, in input order. search_time_ms is
+            the elapsed time of the whole batch.
+
+        Examples:
+            >>> results = await rag.search_many(["매출채권 확인", "재고자산 실사"])
+            >>> for result in results:
+            ...     print(result.query, len(result.procedures))
+        """
+        start_time = time.time()
+
+        if not self._initialized:
+            await self.initialize()
+
+        top_k = top_k or self.TOP_K
+        min_score = min_score or self.MIN_RELEVANCE_SCORE
+
+        results: List[Optional[RAGSearchResult]] = [None] * len(queries)
+        misses: Dict[tuple, List[int]] = {}
+
+        for i, query in enumerate(queries):
+            cache_key = self._cache_key(query, mode, top_k, min_score)
+            if cache_key in misses:
+                misses[cache_key].append(i)
+                continue
+            cached = self.search_cache.get(cache_key)
+            if cached is not None:
+                results[i] = self._copy_result(cached, query, start_time)
+            else:
+                misses[cache_key] = [i]
+
+        if misses:
+            miss_queries = [queries[indexes[0]] for indexes in misses.values()]
+            fetch_k = top_k if mode == SearchMode.HYBRID else top_k * 2
+
+            if mode == SearchMode.BM25:
+                semantic = [[] for _ in miss_queries]
+            else:
+                semantic = await self._semantic_search_many(miss_queries, fetch_k)
+
+            if mode == SearchMode.SEMANTIC or not self.bm25_index:
+                bm25 = [[] for _ in miss_queries]
+            else:
+                bm25 = self.bm25_index.search_many(miss_queries, fetch_k)
+
+            for (cache_key, indexes), sem, kw in zip(misses.items(), semantic, bm25):
+                if mode == SearchMode.SEMANTIC:
+                    ranked = sem
+                elif mode == SearchMode.BM25:
+                    ranked = kw
+                else:
+                    ranked = self._merge_results(sem, kw)
+
+                result = self._build_result(
+                    queries[indexes[0]], mode, ranked, top_k, min_score, start_time
+                )
+                self.search_cache.set(cache_key, result)
+                for i in indexes:
+                    results[i] = self._copy_result(result, queries[i], start_time)
+
+        return results
+
+    def _cache_key(
+        self,
+        query: str,
+        mode: SearchMode,
+        top_k: int,
+        min_score: float
+    ) -> tuple:
+        """Build the search cache key for a query and its parameters."""
+        return (
+            " ".join(query.lower().split()),
+            mode.value,
+            top_k,
+            min_score,
+            self._index_version
+        )
+
+    def _build_result(
+        self,
+        query: str,
+        mode: SearchMode,
+        results: List[tuple],
+        top_k: int,
+        min_score: float,
+        start_time: float
+    ) -> RAGSearchResult:
+        """
+        Convert ranked (chunk, score) tuples to a RAGSearchResult.
+
+        Args:
+            query: Original search query
+            mode: Search mode used
+            results: Ranked (chunk, score) tuples
+            top_k: Maximum number of procedures
+            min_score: Minimum relevance score threshold
+            start_time: time.time() when the search started
+
+        Returns:
+            RAGSearchResult with deduplicated, thresholded procedures
+        """
         procedures = []
         seen_ids = set()
 
@@ -332,6 +1028,35 @@ class AuditGuideRAG:
             search_time_ms=elapsed
         )
 
+    def _copy_result(
+        self,
+        result: RAGSearchResult,
+        query: str,
+        start_time: float
+    ) -> RAGSearchResult:
+        """Return a copy of a cached result that the caller may mutate freely."""
+        return RAGSearchResult(
+            query=query,
+            procedures=copy.deepcopy(result.procedures),
+            total_found=result.total_found,
+            search_mode=result.search_mode,
+            search_time_ms=(time.time() - start_time) * 1000
+        )
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get search result cache statistics.
+
+        Returns:
+            Dict with size, max_entries, hits, misses, evictions, hit_rate
+            and the current index_version
+
+        Examples:
+            >>> stats = rag.get_cache_stats()
+            >>> print(f"hit rate: {stats['hit_rate']:.0%}")
+        """
+        return {**self.search_cache.stats(), "index_version": self._index_version}
+
     async def search_for_ega(
         self,
         ega_name: str,
@@ -360,7 +1085,55 @@ class AuditGuideRAG:
             ...     context={"business_process": "Revenue", "fsli": "AR"}
             ... )
         """
-        # Build enhanced query
+        query = self._build_ega_query(ega_name, ega_description, context)
+
+        # Perform hybrid search
+        result = await self.search(query, mode=SearchMode.HYBRID)
+
+        return result.procedures
+
+    async def search_for_egas(
+        self,
+        egas: List[Dict[str, Any]]
+    ) -> List[List[AuditProcedure]]:
+        """
+        Search for audit procedures for many EGAs in one batch.
+
+        Batch counterpart of search_for_ega built on search_many.
+
+        Args:
+            egas: Dicts with ega_name and optional ega_description and context
+                (same meaning as the search_for_ega arguments)
+
+        Returns:
+            One list of AuditProcedure objects per EGA, in input order
+
+        Examples:
+            >>> results = await rag.search_for_egas([
+            ...     {"ega_name": "매출채권 잔액을 확인한다", "context": {"fsli": "AR"}},
+            ...     {"ega_name": "재고자산 실사에 입회한다"},
+            ... ])
+        """
+        queries = [
+            self._build_ega_query(
+                ega["ega_name"],
+                ega.get("ega_description"),
+                ega.get("context")
+            )
+            for ega in egas
+        ]
+
+        results = await self.search_many(queries, mode=SearchMode.HYBRID)
+
+        return [result.procedures for result in results]
+
+    def _build_ega_query(
+        self,
+        ega_name: str,
+        ega_description: Optional[str] = None,
+        context: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Build an enhanced search query from EGA information and context."""
         query_parts = [ega_name]
 
         if ega_description:
@@ -372,12 +1145,7 @@ class AuditGuideRAG:
             if context.get("fsli"):
                 query_parts.append(f"FSLI: {context['fsli']}")
 
-        query = " ".join(query_parts)
-
-        # Perform hybrid search
-        result = await self.search(query, mode=SearchMode.HYBRID)
-
-        return result.procedures
+        return " ".join(query_parts)
 
     async def _extract_pdf_text(self, pdf_path: str) -> List[Dict[str, Any]]:
         """
@@ -406,6 +1174,130 @@ class AuditGuideRAG:
             }
         ]
 
+    async def _iter_pdf_pages(self, pdf_path: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield PDF pages one at a time.
+
+        This is the streaming source of the ingestion pipeline. The default
+        implementation wraps _extract_pdf_text; a page-at-a-time extractor
+        (e.g. iterating a PyMuPDF document) should override this method so
+        the whole document is never held in memory.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Yields:
+            Page dicts with page_number, text, and section keys
+        """
+        for page in await self._extract_pdf_text(pdf_path):
+            yield page
+
+    async def _run_ingest_pipeline(
+        self,
+        pdf_path: str,
+        document_id: str,
+        stats: Dict[str, Any],
+        version: Optional[str] = None
+    ) -> List[TextChunk]:
+        """
+        Run the extract -> chunk -> embed -> store pipeline for one document.
+
+        One extractor and one chunker feed ``max_concurrency`` embedding
+        workers and ``max_concurrency`` storage workers. Every queue holds at
+        most PIPELINE_QUEUE_SIZE items, so a fast extractor blocks instead of
+        buffering the whole document. If any stage fails, the others are
+        cancelled, chunks already sent to the vector store are deleted and
+        the error is re-raised.
+
+        Args:
+            pdf_path: Path to PDF file
+            document_id: ID of the source document
+            stats: Dict updated in place with "pages" and per-stage busy
+                seconds under "stage_times"
+            version: Version tag included in chunk ids (see _chunk_page)
+
+        Returns:
+            All chunks of the document, ordered by chunk_index
+        """
+        done = object()  # end-of-stream marker
+        workers = self.max_concurrency
+        times = stats["stage_times"]
+        pages_queue: asyncio.Queue = asyncio.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        store_queue: asyncio.Queue = asyncio.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        stored: List[TextChunk] = []
+        sent_ids: List[str] = []
+
+        async def extract() -> None:
+            pages = self._iter_pdf_pages(pdf_path)
+            while True:
+                stage_start = time.perf_counter()
+                try:
+                    page = await pages.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    times["extract"] += time.perf_counter() - stage_start
+                await pages_queue.put(page)
+            await pages_queue.put(done)
+
+        async def chunk() -> None:
+            chunk_index = 0
+            batch: List[TextChunk] = []
+            while (page := await pages_queue.get()) is not done:
+                stage_start = time.perf_counter()
+                stats["pages"] += 1
+                page_chunks = self._chunk_page(page, document_id, chunk_index, version)
+                chunk_index += len(page_chunks)
+                times["chunk"] += time.perf_counter() - stage_start
+
+                for text_chunk in page_chunks:
+                    batch.append(text_chunk)
+                    if len(batch) >= self.batch_size:
+                        await embed_queue.put(batch)
+                        batch = []
+
+            if batch:
+                await embed_queue.put(batch)
+            for _ in range(workers):
+                await embed_queue.put(done)
+
+        async def embed() -> None:
+            while (batch := await embed_queue.get()) is not done:
+                stage_start = time.perf_counter()
+                if self.embedding_model:
+                    await self._embed_batch(batch)
+                times["embed"] += time.perf_counter() - stage_start
+                await store_queue.put(batch)
+            await store_queue.put(done)
+
+        async def store() -> None:
+            while (batch := await store_queue.get()) is not done:
+                stage_start = time.perf_counter()
+                if self.vector_store:
+                    sent_ids.extend(c.metadata.chunk_id for c in batch)
+                    await self._store_batch(batch)
+                    for text_chunk in batch:
+                        text_chunk.embedding = None
+                times["store"] += time.perf_counter() - stage_start
+                stored.extend(batch)
+
+        tasks = [asyncio.create_task(extract()), asyncio.create_task(chunk())]
+        tasks += [asyncio.create_task(embed()) for _ in range(workers)]
+        tasks += [asyncio.create_task(store()) for _ in range(workers)]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._delete_stored_chunks(sent_ids)
+            raise
+
+        stored.sort(key=lambda c: c.metadata.chunk_index)
+        return stored
+
     def _chunk_text(
         self,
         pages: List[Dict[str, Any]],
@@ -424,35 +1316,9 @@ class AuditGuideRAG:
             List of TextChunk objects with metadata
         """
         chunks = []
-        chunk_index = 0
 
         for page in pages:
-            text = page.get("text", "")
-            page_num = page.get("page_number")
-            section = page.get("section", "Unknown")
-
-            # Split into chunks with overlap
-            start = 0
-            while start < len(text):
-                end = start + self.CHUNK_SIZE
-                chunk_text = text[start:end]
-
-                # Create chunk metadata
-                chunk_id = f"{document_id}_{chunk_index}"
-                metadata = ChunkMetadata(
-                    chunk_id=chunk_id,
-                    document_id=document_id,
-                    section_code=section.split()[0] if section else "",
-                    section_title=section,
-                    page_number=page_num,
-                    chunk_index=chunk_index,
-                    total_chunks=-1  # Updated later
-                )
-
-                chunks.append(TextChunk(text=chunk_text, metadata=metadata))
-                chunk_index += 1
-
-                start += self.CHUNK_SIZE - self.CHUNK_OVERLAP
+            chunks.extend(self._chunk_page(page, document_id, len(chunks)))
 
         # Update total_chunks
         for chunk in chunks:
@@ -460,73 +1326,228 @@ class AuditGuideRAG:
 
         return chunks
 
+    def _chunk_page(
+        self,
+        page: Dict[str, Any],
+        document_id: str,
+        start_index: int,
+        version: Optional[str] = None
+    ) -> List[TextChunk]:
+        """
+        Split a single page into overlapping chunks.
+
+        Chunk ids are "<document_id>_<chunk_index>", or
+        "<document_id>_<version>_<chunk_index>" when a version is given.
+
+        Args:
+            page: Page dict with page_number, text, and section keys
+            document_id: ID of the source document
+            start_index: chunk_index of the page's first chunk
+            version: Version tag distinguishing this ingest's chunk ids
+
+        Returns:
+            List of TextChunk objects with total_chunks=None (set by the caller)
+        """
+        chunks = []
+        chunk_index = start_index
+
+        text = page.get("text", "")
+        page_num = page.get("page_number")
+        section = page.get("section", "Unknown")
+
+        # Split into chunks with overlap
+        start = 0
+        while start < len(text):
+            end = start + self.CHUNK_SIZE
+            chunk_text = text[start:end]
+
+            # Create chunk metadata
+            chunk_id = (
+                f"{document_id}_{version}_{chunk_index}" if version
+                else f"{document_id}_{chunk_index}"
+            )
+            metadata = ChunkMetadata(
+                chunk_id=chunk_id,
+                document_id=document_id,
+                section_code=section.split()[0] if section else "",
+                section_title=section,
+                page_number=page_num,
+                chunk_index=chunk_index,
+                total_chunks=None  # Set once the whole document is chunked
+            )
+
+            metadata.assertions = self.assertion_classifier.classify(chunk_text)
+
+            chunks.append(TextChunk(text=chunk_text, metadata=metadata))
+            chunk_index += 1
+
+            start += self.CHUNK_SIZE - self.CHUNK_OVERLAP
+
+        return chunks
+
     async def _generate_embeddings(self, chunks: List[TextChunk]) -> None:
         """
         Generate embeddings for chunks.
 
+        Splits chunks into batches of ``batch_size`` and keeps at most
+        ``max_concurrency`` batches in flight.
+
         Args:
             chunks: List of TextChunk objects to embed
-
-        Note:
-            In production, batch embedding calls for efficiency.
         """
         if not self.embedding_model:
             return
 
-        for chunk in chunks:
-            # In production, batch this for efficiency
-            embedding = await self.embedding_model.embed(chunk.text)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(batch: List[TextChunk]) -> None:
+            async with semaphore:
+                await self._embed_batch(batch)
+
+        await asyncio.gather(*(bounded(b) for b in self._batches(chunks)))
+
+    async def _embed_batch(self, batch: List[TextChunk]) -> None:
+        """
+        Embed one batch of chunks in place.
+
+        Args:
+            batch: Chunks to embed
+        """
+        embeddings = await self._embed_texts([chunk.text for chunk in batch])
+
+        for chunk, embedding in zip(batch, embeddings):
             chunk.embedding = embedding
 
+    async def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts with one batch request when the model supports it.
+
+        Uses ``embed_batch`` when the model provides it, otherwise embeds the
+        texts concurrently.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings in input order
+        """
+        if _has_method(self.embedding_model, "embed_batch"):
+            return await self.embedding_model.embed_batch(texts)
+
+        return await asyncio.gather(
+            *(self.embedding_model.embed(text) for text in texts)
+        )
+
     async def _store_chunks(self, chunks: List[TextChunk]) -> None:
         """
         Store chunks in vector database.
 
+        Splits chunks into batches of ``batch_size`` and keeps at most
+        ``max_concurrency`` batches in flight.
+
         Args:
             chunks: List of TextChunk objects to store
         """
         if not self.vector_store:
             return
 
-        for chunk in chunks:
-            await self.vector_store.upsert(
-                id=chunk.metadata.chunk_id,
-                embedding=chunk.embedding,
-                metadata=vars(chunk.metadata),
-                text=chunk.text
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(batch: List[TextChunk]) -> None:
+            async with semaphore:
+                await self._store_batch(batch)
+
+        await asyncio.gather(*(bounded(b) for b in self._batches(chunks)))
+
+    async def _store_batch(self, batch: List[TextChunk]) -> None:
+        """
+        Store one batch of chunks.
+
+        Uses ``upsert_many`` when the store provides it (one request per
+        batch), otherwise falls back to concurrent per-chunk ``upsert`` calls.
+
+        Args:
+            batch: Chunks to store
+        """
+        records = [
+            {
+                "id": chunk.metadata.chunk_id,
+                "embedding": chunk.embedding,
+                "metadata": vars(chunk.metadata),
+                "text": chunk.text
+            }
+            for chunk in batch
+        ]
+
+        if _has_method(self.vector_store, "upsert_many"):
+            await self.vector_store.upsert_many(records)
+        else:
+            await asyncio.gather(
+                *(self.vector_store.upsert(**record) for record in records)
             )
 
+    def _batches(self, chunks: List[TextChunk]) -> List[List[TextChunk]]:
+        """Split chunks into lists of at most ``batch_size`` items."""
+        return [
+            chunks[i:i + self.batch_size]
+            for i in range(0, len(chunks), self.batch_size)
+        ]
+
     async def _load_from_vector_store(self) -> None:
         """
         Load existing chunks from vector store.
 
-        Note:
-            Implementation depends on vector store API.
+        Uses ``load_chunks`` when the store provides it (e.g. LocalVectorStore);
+        other stores are left as-is. Loaded chunks replace the local cache and
+        the BM25 index is rebuilt from them.
         """
         if not self.vector_store:
             return
 
-        # Implementation depends on vector store API
-        pass
+        if not _has_method(self.vector_store, "load_chunks"):
+            return
+
+        loaded = await self.vector_store.load_chunks()
+        if loaded:
+            _fill_total_chunks(loaded)
+            self.chunks = loaded
+            self.bm25_index = None
 
     def _build_bm25_index(self) -> None:
         """
         Build BM25 index for keyword search.
 
-        Creates a simple token-based index for BM25 scoring.
-
-        Note:
-            In production, use rank_bm25 library for proper BM25 implementation.
+        Tokenizes every chunk once and builds postings lists, document
+        lengths and the IDF table used by _bm25_search.
         """
         if not self.chunks:
             return
 
-        # In production, use rank_bm25 library
-        # For now, simple token-based index
-        self.bm25_index = {
-            "documents": [chunk.text for chunk in self.chunks],
-            "chunks": self.chunks
-        }
+        index = BM25Index()
+        index.add(self.chunks)
+        self.bm25_index = index
+        self._invalidate_search_cache()
+
+    def _index_chunks(self, chunks: List[TextChunk]) -> None:
+        """
+        Add chunks to the BM25 index in place.
+
+        Falls back to a full build when no index exists yet, so chunks that
+        were already in self.chunks are indexed too.
+
+        Args:
+            chunks: Newly added chunks (already appended to self.chunks)
+        """
+        if self.bm25_index is None:
+            self._build_bm25_index()
+        else:
+            self.bm25_index.add(chunks)
+            self._invalidate_search_cache()
+
+    def _invalidate_search_cache(self) -> None:
+        """Bump the index version and drop cached results after corpus changes."""
+        self._index_version += 1
+        self.search_cache.clear()
 
     async def _semantic_search(
         self,
@@ -555,6 +1576,40 @@ class AuditGuideRAG:
         # Map back to chunks
         return [(chunk, score) for chunk, score in results]
 
+    async def _semantic_search_many(
+        self,
+        queries: List[str],
+        top_k: int
+    ) -> List[List[tuple]]:
+        """
+        Perform semantic search for many queries.
+
+        Embeds all queries in one batch and, when the vector store provides
+        ``search_many``, scores them against the corpus in one call.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results per query
+
+        Returns:
+            Per query, a list of (chunk, score) tuples sorted by score descending
+        """
+        if not self.embedding_model or not self.vector_store:
+            return [[] for _ in queries]
+
+        embeddings = await self._embed_texts(queries)
+
+        if _has_method(self.vector_store, "search_many"):
+            return await self.vector_store.search_many(
+                embeddings=embeddings,
+                top_k=top_k
+            )
+
+        return await asyncio.gather(*(
+            self.vector_store.search(embedding=embedding, top_k=top_k)
+            for embedding in embeddings
+        ))
+
     def _bm25_search(
         self,
         query: str,
@@ -563,7 +1618,7 @@ class AuditGuideRAG:
         """
         Perform BM25 keyword search.
 
-        Uses simple token overlap scoring (replace with proper BM25 in production).
+        Only the postings lists of the query terms are scored.
 
         Args:
             query: Search query
@@ -575,20 +1630,7 @@ class AuditGuideRAG:
         if not self.bm25_index:
             return []
 
-        # Simple keyword matching (replace with proper BM25 in production)
-        query_tokens = set(query.lower().split())
-        scores = []
-
-        for i, doc in enumerate(self.bm25_index["documents"]):
-            doc_tokens = set(doc.lower().split())
-            overlap = len(query_tokens & doc_tokens)
-            score = overlap / max(len(query_tokens), 1)
-            scores.append((self.bm25_index["chunks"][i], score))
-
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
-
-        return scores[:top_k]
+        return self.bm25_index.search(query, top_k)
 
     def _merge_results(
         self,
@@ -635,7 +1677,9 @@ class AuditGuideRAG:
         """
         Convert a text chunk to an audit procedure.
 
-        Classifies assertions based on keyword matching.
+        Uses the assertion tags computed at ingest time. Chunks without tags
+        (e.g. loaded from an index built before tagging) are classified once
+        and the tags are kept on their metadata.
 
         Args:
             chunk: TextChunk to convert
@@ -644,29 +1688,51 @@ class AuditGuideRAG:
         Returns:
             AuditProcedure with classified assertions
         """
-        # Classify assertions based on keywords
-        related_assertions = []
-        text_lower = chunk.text.lower()
-
-        for assertion, keywords in self.ASSERTION_KEYWORDS.items():
-            if any(kw in text_lower for kw in keywords):
-                related_assertions.append(assertion)
+        if chunk.metadata.assertions is None:
+            chunk.metadata.assertions = self.assertion_classifier.classify(chunk.text)
 
         return AuditProcedure(
             id=chunk.metadata.chunk_id,
             section_code=chunk.metadata.section_code,
             section_title=chunk.metadata.section_title,
             procedure_text=chunk.text,
-            related_assertions=related_assertions,
+            related_assertions=list(chunk.metadata.assertions),
             risk_indicators=[],  # Could extract from text
             relevance_score=score,
             source_page=chunk.metadata.page_number
         )
 
 
+def _fill_total_chunks(chunks: List[TextChunk]) -> None:
+    """
+    Set total_chunks on chunks stored without it.
+
+    Counts are taken per document over the given chunks. Indexes written by
+    earlier versions stored -1 instead of None, which is treated the same.
+    """
+    counts = Counter(chunk.metadata.document_id for chunk in chunks)
+    for chunk in chunks:
+        if chunk.metadata.total_chunks is None or chunk.metadata.total_chunks < 0:
+            chunk.metadata.total_chunks = counts[chunk.metadata.document_id]
+
+
+def _has_method(obj: Any, name: str) -> bool:
+    """
+    Check whether an object's class implements an optional protocol method.
+
+    Looks at the type rather than the instance so that optional capabilities
+    (e.g. ``embed_batch``, ``upsert_many``) are only used when actually
+    implemented, not when synthesized by dynamic attribute access.
+    """
+    return callable(getattr(type(obj), name, None))
+
+
 def create_audit_guide_rag(
     embedding_model: Optional[Any] = None,
-    vector_store: Optional[Any] = None
+    vector_store: Optional[Any] = None,
+    batch_size: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    index_dir: Optional[str] = None
 ) -> AuditGuideRAG:
     """
     Factory function to create an AuditGuideRAG instance.
@@ -674,6 +1740,9 @@ def create_audit_guide_rag(
     Args:
         embedding_model: Optional embedding model for semantic search
         vector_store: Optional vector database for persistent storage
+        batch_size: Optional chunks per embedding/upsert batch
+        max_concurrency: Optional limit on in-flight embedding/upsert batches
+        index_dir: Optional directory for the built-in persistent vector store
 
     Returns:
         Configured AuditGuideRAG instance
@@ -684,8 +1753,15 @@ def create_audit_guide_rag(
         ...     embedding_model=OpenAIEmbeddings(),
         ...     vector_store=PineconeStore()
         ... )
+        >>> rag = create_audit_guide_rag(
+        ...     embedding_model=OpenAIEmbeddings(),
+        ...     index_dir="/var/lib/audit/guide_index"  # built-in mmap store
+        ... )
     """
     return AuditGuideRAG(
         embedding_model=embedding_model,
-        vector_store=vector_store
+        vector_store=vector_store,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+        index_dir=index_dir
     )
@@ -0,0 +1,198 @@
+"""Token-Level Streaming of LLM Completions
+
+Long completions (chat answers, workpaper drafts) are generated with
+``astream`` instead of ``ainvoke`` in streaming mode, so readers see text as
+soon as the first tokens arrive instead of after the whole completion. The
+final message is still persisted once, at the end, by the caller.
+
+Token deltas reach SSE clients through a single path: producers publish
+them to the task's message broker topic with TokenPublisher, and the shared
+TaskStream of that task turns them into "token" events for every reader of
+stream_agent_messages. Graph agents (WorkPaperGeneratorAgent) coalesce
+deltas per flush interval; the SSE chat path publishes every delta as it
+arrives (flush_interval=0).
+
+Key Features:
+    - Text deltas from any LangChain chat model (string or content blocks)
+    - Coalescing of deltas into at most one broker message per flush
+      interval, so a LISTEN/NOTIFY broker is not hit once per token
+    - A final "done" token record marking the end of each stream
+
+Key Classes:
+    - TokenPublisher: Publishes coalesced deltas of one stream to the broker
+
+Usage:
+    ```python
+    from src.services.llm_stream import TokenPublisher, astream_text
+
+    publisher = TokenPublisher(task_id, agent_role="Staff_WorkPaper_Generator")
+    parts = []
+    async for delta in astream_text(llm, messages):
+        parts.append(delta)
+        await publisher.add(delta)
+    await publisher.close()
+    content = "".join(parts)
+    ```
+
+Configuration:
+    LLM_STREAM_TOKENS=true enables streaming mode by default (chat requests
+    can still choose per request with ?stream=true/false).
+"""
+
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import uuid4
+
+from .message_broker import MessageBroker, get_message_broker
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_FLUSH_INTERVAL = 0.05  # seconds
+
+
+def stream_tokens_enabled() -> bool:
+    """Whether streaming mode is on by default (LLM_STREAM_TOKENS)."""
+    return os.getenv("LLM_STREAM_TOKENS", "false").lower() in ("1", "true", "yes")
+
+
+def _chunk_text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):  # Content blocks (e.g. Anthropic models)
+        return "".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in content
+        )
+    return ""
+
+
+async def astream_text(llm: Any, messages: List[Any]) -> AsyncIterator[str]:
+    """Stream the text deltas of a chat completion.
+
+    Args:
+        llm: LangChain chat model
+        messages: Prompt messages
+
+    Yields:
+        Non-empty text deltas in generation order
+    """
+    async for chunk in llm.astream(messages):
+        delta = _chunk_text(getattr(chunk, "content", chunk))
+        if delta:
+            yield delta
+
+
+def token_record(
+    task_id: str,
+    message_id: str,
+    agent_role: str,
+    delta: str,
+    index: int,
+    done: bool = False,
+) -> Dict[str, Any]:
+    """Build a broker record carrying one token delta.
+
+    Args:
+        task_id: Task the stream belongs to
+        message_id: Stream id (id of the final message, when known)
+        agent_role: Role shown for the streamed message
+        delta: Text appended by this record
+        index: Position of the record within the stream (0-based)
+        done: True for the last record of the stream
+
+    Returns:
+        Record with "type": "token"
+    """
+    return {
+        "type": "token",
+        "id": message_id,
+        "task_id": task_id,
+        "agent_role": agent_role,
+        "delta": delta,
+        "index": index,
+        "done": done,
+    }
+
+
+class TokenPublisher:
+    """Publishes the token deltas of one stream to the message broker.
+
+    Deltas are buffered and published at most once per ``flush_interval``,
+    plus a final record with ``done=True`` on close.
+
+    Example:
+        ```python
+        publisher = TokenPublisher("task-uuid", agent_role="partner")
+        await publisher.add("Revenue ")
+        await publisher.add("is recognized...")
+        await publisher.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        agent_role: str,
+        message_id: Optional[str] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        broker: Optional[MessageBroker] = None,
+    ):
+        """Initialize a publisher for one stream.
+
+        Args:
+            task_id: Task (broker topic) to publish to
+            agent_role: Role shown for the streamed message
+            message_id: Stream id (random UUID when None)
+            flush_interval: Minimum seconds between published records
+            broker: Broker to publish to (process-wide when None)
+        """
+        self.task_id = task_id
+        self.agent_role = agent_role
+        self.message_id = message_id or str(uuid4())
+        self.flush_interval = flush_interval
+        self.published = 0
+        self._broker = broker
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+
+    async def add(self, delta: str) -> None:
+        """Buffer a delta, publishing the buffer if the interval has passed.
+
+        Args:
+            delta: Text delta
+        """
+        self._buffer.append(delta)
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            await self.flush()
+
+    async def flush(self, done: bool = False) -> None:
+        """Publish buffered deltas now.
+
+        Args:
+            done: Mark the record as the last of the stream
+        """
+        if not self._buffer and not done:
+            return
+        delta = "".join(self._buffer)
+        self._buffer.clear()
+        self._last_flush = time.monotonic()
+        broker = self._broker or get_message_broker()
+        await broker.publish(self.task_id, token_record(
+            self.task_id, self.message_id, self.agent_role, delta, self.published, done
+        ))
+        self.published += 1
+
+    async def close(self) -> None:
+        """Publish the remaining deltas and the end of the stream."""
+        await self.flush(done=True)
+
+
+__all__ = [
+    "TokenPublisher",
+    "astream_text",
+    "stream_tokens_enabled",
+    "token_record",
+]
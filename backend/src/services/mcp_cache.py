@@ -0,0 +1,438 @@
+"""Two-Tier Cache for Deterministic MCP Tool Results
+
+This module caches results of MCP tools whose output only changes when the
+standards corpus is re-indexed (e.g. ``search_standards``,
+``get_paragraph_by_id``, ``get_standard_context`` on mcp-rag), so repeated
+lookups during multi-hop retrieval are served from memory instead of the
+network.
+
+Key Features:
+    - Tier 1: in-memory LRU with per-entry expiry
+    - Tier 2: on-disk SQLite store shared across restarts and workers
+    - Content-addressed keys: sha256(server, tool, canonical arguments,
+      corpus version)
+    - Per-tool TTLs; tools without a TTL are never cached
+    - Explicit corpus-version invalidation hook (set_corpus_version)
+    - On-disk tool schema cache so MCPToolRegistry can serve tool schemas
+      right after a restart, before the servers answer tools/list
+
+Configuration (environment variables):
+    - MCP_CACHE_PATH: SQLite file for the disk tier (unset: memory only)
+    - MCP_CACHE_MAX_ENTRIES: Memory tier size (default: 4096)
+    - MCP_RAG_CORPUS_VERSION: Initial corpus version (default: "0")
+    - MCP_SCHEMA_CACHE_PATH: JSON file for tool schemas (unset: not persisted)
+
+Key Classes:
+    - ToolResultCache: Two-tier cache with hit/miss statistics
+    - ToolSchemaCache: Tool schemas per server, persisted as JSON
+
+Usage:
+    ```python
+    from src.services.mcp_cache import get_tool_cache
+
+    cache = get_tool_cache()
+    result = cache.get(server_url, "get_paragraph_by_id", arguments)
+    if result is None:
+        result = await fetch()
+        cache.set(server_url, "get_paragraph_by_id", arguments, result)
+
+    # After re-indexing the standards corpus
+    cache.set_corpus_version("2026-10-16")
+    ```
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds a result stays valid per tool (absent tools are not cached)
+DEFAULT_TOOL_TTLS: Dict[str, float] = {
+    "search_standards": 24 * 3600.0,
+    "get_paragraph_by_id": 7 * 24 * 3600.0,
+    "get_standard_context": 7 * 24 * 3600.0,
+}
+
+
+class ToolResultCache:
+    """Two-tier (memory LRU + SQLite) cache for deterministic tool results.
+
+    Lookups check the memory tier first, then the disk tier (promoting hits
+    into memory). Keys include the corpus version, so bumping it makes all
+    older entries unreachable; set_corpus_version() also purges them.
+
+    Attributes:
+        ttls: Tool name -> TTL in seconds
+        corpus_version: Version string mixed into every key
+
+    Example:
+        ```python
+        cache = ToolResultCache(path="/var/cache/mcp.sqlite")
+        cache.set("http://localhost:8001", "get_paragraph_by_id", args, result)
+        cache.get("http://localhost:8001", "get_paragraph_by_id", args)
+        ```
+    """
+
+    DEFAULT_MAX_ENTRIES = 4096
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        corpus_version: Optional[str] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file for the disk tier (None: memory tier only)
+            max_entries: Memory tier capacity
+            ttls: Per-tool TTLs in seconds (default: DEFAULT_TOOL_TTLS)
+            corpus_version: Initial corpus version
+        """
+        self.path = path
+        self.max_entries = max_entries if max_entries is not None else self.DEFAULT_MAX_ENTRIES
+        self.ttls = dict(DEFAULT_TOOL_TTLS if ttls is None else ttls)
+        self.corpus_version = str(corpus_version) if corpus_version is not None else "0"
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if path:
+            self._open(path)
+
+    def is_cacheable(self, tool_name: str) -> bool:
+        """Whether results of a tool are cached (it has a TTL)."""
+        return self.ttls.get(tool_name, 0) > 0
+
+    def key(self, server: str, tool_name: str, arguments: Dict[str, Any]) -> str:
+        """Build the content-addressed key for a tool call.
+
+        Args:
+            server: Server base URL
+            tool_name: Tool name
+            arguments: Tool arguments (key order is ignored)
+
+        Returns:
+            Hex sha256 digest
+        """
+        canonical = json.dumps(
+            [server.rstrip('/'), tool_name, arguments, self.corpus_version],
+            sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, server: str, tool_name: str, arguments: Dict[str, Any]) -> Optional[Any]:
+        """Look up a cached result.
+
+        Args:
+            server: Server base URL
+            tool_name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            A copy of the cached result, or None on miss/expiry
+        """
+        if not self.is_cacheable(tool_name):
+            return None
+
+        key = self.key(server, tool_name, arguments)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return copy.deepcopy(entry[1])
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT expires_at, value FROM tool_results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[0] > now:
+                    value = json.loads(row[1])
+                    self._remember(key, row[0], value)
+                    self.disk_hits += 1
+                    return copy.deepcopy(value)
+
+            self.misses += 1
+            return None
+
+    def set(
+        self,
+        server: str,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        value: Any
+    ) -> None:
+        """Store a result for a cacheable tool.
+
+        Error results (dicts with status "error") are not stored.
+
+        Args:
+            server: Server base URL
+            tool_name: Tool name
+            arguments: Tool arguments
+            value: JSON-serializable tool result
+        """
+        if not self.is_cacheable(tool_name):
+            return
+        if isinstance(value, dict) and value.get("status") == "error":
+            return
+
+        key = self.key(server, tool_name, arguments)
+        expires_at = time.time() + self.ttls[tool_name]
+        value = copy.deepcopy(value)
+
+        with self._lock:
+            self._remember(key, expires_at, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO tool_results "
+                    "(key, tool, corpus_version, expires_at, value) VALUES (?, ?, ?, ?, ?)",
+                    (key, tool_name, self.corpus_version, expires_at,
+                     json.dumps(value, ensure_ascii=False, default=str))
+                )
+                self._db.commit()
+
+    def set_corpus_version(self, version: str) -> None:
+        """Invalidation hook: switch to a new corpus version.
+
+        Call after the standards corpus is re-indexed. Entries cached under
+        other versions are dropped from both tiers.
+
+        Args:
+            version: New corpus version identifier
+        """
+        version = str(version)
+        if version == self.corpus_version:
+            return
+
+        with self._lock:
+            self.corpus_version = version
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute(
+                    "DELETE FROM tool_results WHERE corpus_version != ?", (version,)
+                )
+                self._db.commit()
+
+        logger.info(f"MCP tool cache switched to corpus version {version}")
+
+    def invalidate(self, tool_name: Optional[str] = None) -> None:
+        """Drop cached results of one tool, or of all tools.
+
+        Args:
+            tool_name: Tool to drop (None: everything)
+        """
+        with self._lock:
+            # Memory keys are opaque hashes, so the memory tier is always cleared
+            self._memory.clear()
+            if self._db is not None:
+                if tool_name is None:
+                    self._db.execute("DELETE FROM tool_results")
+                else:
+                    self._db.execute("DELETE FROM tool_results WHERE tool = ?", (tool_name,))
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters.
+
+        Returns:
+            Dict with memory_size, disk_size, memory_hits, disk_hits,
+            misses, hit_rate, corpus_version and persistent
+        """
+        with self._lock:
+            disk_size = (
+                self._db.execute("SELECT COUNT(*) FROM tool_results").fetchone()[0]
+                if self._db is not None else 0
+            )
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_size": len(self._memory),
+                "disk_size": disk_size,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "corpus_version": self.corpus_version,
+                "persistent": self._db is not None,
+            }
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _open(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS tool_results ("
+            "key TEXT PRIMARY KEY, tool TEXT NOT NULL, corpus_version TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        self._db.execute("DELETE FROM tool_results WHERE expires_at <= ?", (time.time(),))
+        self._db.commit()
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# ============================================================================
+# TOOL SCHEMA CACHE
+# ============================================================================
+
+class ToolSchemaCache:
+    """Tool schemas per MCP server, persisted as a JSON file.
+
+    Entries are keyed by server name and remember the server URL they were
+    loaded from; an entry for a different URL is ignored.
+
+    Attributes:
+        path: JSON file (None: schemas are kept in memory only)
+
+    Example:
+        ```python
+        schemas = ToolSchemaCache(path="./data/mcp_tool_schemas.json")
+        schemas.set("mcp-rag", "http://localhost:8001", tools)
+        schemas.get("mcp-rag", "http://localhost:8001")  # -> tools
+        ```
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the cache, loading the file if it exists.
+
+        Args:
+            path: JSON file (None: memory only)
+        """
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable tool schema cache {path}: {e}")
+
+    def get(self, server_name: str, url: str) -> Optional[List[Dict[str, Any]]]:
+        """Get the cached tool schemas of a server.
+
+        Args:
+            server_name: Server name (e.g. "mcp-rag")
+            url: Current server base URL
+
+        Returns:
+            Copy of the tool schemas, or None if unknown or cached for another URL
+        """
+        with self._lock:
+            entry = self._entries.get(server_name)
+            if entry is None or entry.get("url") != url.rstrip('/'):
+                return None
+            return copy.deepcopy(entry["tools"])
+
+    def set(self, server_name: str, url: str, tools: List[Dict[str, Any]]) -> None:
+        """Store the tool schemas of a server and write the file.
+
+        Args:
+            server_name: Server name
+            url: Server base URL
+            tools: Tool schemas from tools/list
+        """
+        with self._lock:
+            self._entries[server_name] = {
+                "url": url.rstrip('/'),
+                "tools": copy.deepcopy(tools),
+                "updated_at": time.time(),
+            }
+            if self.path:
+                self._write()
+
+    def _write(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write tool schema cache {self.path}: {e}")
+
+
+# ============================================================================
+# PROCESS-WIDE INSTANCES
+# ============================================================================
+
+_tool_cache: Optional[ToolResultCache] = None
+_schema_cache: Optional[ToolSchemaCache] = None
+
+
+def get_tool_cache() -> ToolResultCache:
+    """Get the process-wide tool result cache, creating it from env vars.
+
+    Returns:
+        Shared ToolResultCache instance
+    """
+    global _tool_cache
+    if _tool_cache is None:
+        _tool_cache = ToolResultCache(
+            path=os.getenv("MCP_CACHE_PATH") or None,
+            max_entries=int(os.getenv("MCP_CACHE_MAX_ENTRIES", ToolResultCache.DEFAULT_MAX_ENTRIES)),
+            corpus_version=os.getenv("MCP_RAG_CORPUS_VERSION", "0")
+        )
+    return _tool_cache
+
+
+def get_schema_cache() -> ToolSchemaCache:
+    """Get the process-wide tool schema cache, creating it from env vars.
+
+    Returns:
+        Shared ToolSchemaCache instance
+    """
+    global _schema_cache
+    if _schema_cache is None:
+        _schema_cache = ToolSchemaCache(path=os.getenv("MCP_SCHEMA_CACHE_PATH") or None)
+    return _schema_cache
+
+
+def mcp_tool_cache_stats() -> Dict[str, Any]:
+    """Statistics of the process-wide cache (empty if not created)."""
+    return _tool_cache.stats() if _tool_cache is not None else {}
+
+
+__all__ = [
+    "DEFAULT_TOOL_TTLS",
+    "ToolResultCache",
+    "ToolSchemaCache",
+    "get_schema_cache",
+    "get_tool_cache",
+    "mcp_tool_cache_stats",
+]
@@ -16,12 +16,22 @@ MCP Servers Supported:
 
 Key Features:
     - Async HTTP client using httpx for non-blocking I/O
+    - Shared keep-alive connection pools per server (see mcp_transport)
     - Circuit breaker pattern (5 failures → 60s cooldown)
-    - Retry with exponential backoff (3 attempts)
+    - Retry with decorrelated-jitter backoff (3 attempts) under a per-server
+      retry budget, plus opt-in hedged requests (see mcp_resilience)
     - Health check methods for all servers
-    - MCPToolRegistry for unified tool management across all servers
+    - Background health monitor with cached, synchronous health reads
+    - Single-flight coalescing of identical concurrent tool calls
+    - Two-tier result cache for deterministic RAG tools (see mcp_cache)
+    - JSON-RPC 2.0 batch requests with opt-in micro-batching (batch_window)
+    - Adaptive (AIMD) per-server concurrency limits (see mcp_concurrency)
+    - MCPToolRegistry for unified tool management across all servers, with
+      concurrent registration under a startup deadline, lazy registration of
+      late servers and on-disk tool schema caching
     - Environment variable support for server URLs
-    - OpenTelemetry tracing integration
+    - OpenTelemetry spans and HDR-style latency histograms per server and
+      tool (see mcp_metrics)
 
 Usage:
     ```python
@@ -47,15 +57,25 @@ Reference:
 """
 
 import asyncio
+import copy
+import json
 import os
 import logging
 import time
+import weakref
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, List, Callable
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, List, Callable, Tuple
 from enum import Enum
+from urllib.parse import urlsplit
 
 import httpx
 
+from .mcp_cache import ToolSchemaCache, get_schema_cache, get_tool_cache
+from .mcp_concurrency import ConcurrencySettings, set_settings_resolver
+from .mcp_metrics import get_mcp_metrics, mark_cache_hit, mark_coalesced, observe_attempt, observe_call
+from .mcp_resilience import decorrelated_jitter, get_server_resilience, hedged_call
+from .mcp_transport import get_mcp_transport
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -75,7 +95,10 @@ class MCPServerType(Enum):
     EXCEL_PROCESSOR = "mcp-excel-processor"
 
 
-# Default server URLs and their environment variable mappings
+# Default server URLs and their environment variable mappings.
+# "concurrency" bounds the adaptive per-server concurrency limit (initial,
+# min, max; optional backoff, latency_tolerance, queue_timeout), see
+# src/services/mcp_concurrency.py.
 MCP_SERVER_CONFIG = {
     MCPServerType.RAG: {
         "name": "mcp-rag",
@@ -83,6 +106,7 @@ MCP_SERVER_CONFIG = {
         "default_url": "http://localhost:8001",
         "description": "Semantic search for K-IFRS, K-GAAS standards",
         "timeout": 30.0,
+        "concurrency": {"initial": 16, "min": 2, "max": 64},
     },
     MCPServerType.PROCESSOR: {
         "name": "mcp-processor",
@@ -90,6 +114,7 @@ MCP_SERVER_CONFIG = {
         "default_url": "http://localhost:8002",
         "description": "Document processing and parsing",
         "timeout": 60.0,
+        "concurrency": {"initial": 4, "min": 1, "max": 16},
     },
     MCPServerType.FINANCE: {
         "name": "mcp-finance",
@@ -97,6 +122,7 @@ MCP_SERVER_CONFIG = {
         "default_url": "http://localhost:8003",
         "description": "Accounting calculations and validations",
         "timeout": 30.0,
+        "concurrency": {"initial": 8, "min": 1, "max": 32},
     },
     MCPServerType.VISION: {
         "name": "mcp-vision",
@@ -104,6 +130,7 @@ MCP_SERVER_CONFIG = {
         "default_url": "http://localhost:8004",
         "description": "OCR and table extraction from images/PDFs",
         "timeout": 120.0,  # Longer timeout for OCR
+        "concurrency": {"initial": 2, "min": 1, "max": 8},
     },
     MCPServerType.FILESYSTEM: {
         "name": "mcp-filesystem",
@@ -111,6 +138,7 @@ MCP_SERVER_CONFIG = {
         "default_url": "http://localhost:8005",
         "description": "File management operations",
         "timeout": 30.0,
+        "concurrency": {"initial": 8, "min": 1, "max": 32},
     },
     MCPServerType.WEB_RESEARCH: {
         "name": "mcp-web-research",
@@ -118,6 +146,7 @@ MCP_SERVER_CONFIG = {
         "default_url": "http://localhost:8006",
         "description": "External research and web scraping",
         "timeout": 60.0,
+        "concurrency": {"initial": 4, "min": 1, "max": 16},
     },
     MCPServerType.EXCEL_PROCESSOR: {
         "name": "mcp-excel-processor",
@@ -125,6 +154,7 @@ MCP_SERVER_CONFIG = {
         "default_url": "http://localhost:8007",
         "description": "Excel workpaper automation",
         "timeout": 60.0,
+        "concurrency": {"initial": 4, "min": 1, "max": 12},
     },
 }
 
@@ -142,6 +172,29 @@ def get_server_url(server_type: MCPServerType) -> str:
     return os.getenv(config["env_var"], config["default_url"])
 
 
+def get_concurrency_settings(origin: str) -> Optional[ConcurrencySettings]:
+    """Resolve a server origin to the concurrency settings of its server type.
+
+    Installed as the MCP transport's settings resolver, so every pooled
+    server picks up its limits from MCP_SERVER_CONFIG.
+
+    Args:
+        origin: Server origin (scheme://host:port)
+
+    Returns:
+        ConcurrencySettings, or None if no configured server matches
+    """
+    origin = origin.rstrip('/').lower()
+    for server_type, config in MCP_SERVER_CONFIG.items():
+        parts = urlsplit(get_server_url(server_type))
+        if f"{parts.scheme}://{parts.netloc}".lower() == origin:
+            return ConcurrencySettings.from_config(config.get("concurrency"))
+    return None
+
+
+set_settings_resolver(get_concurrency_settings)
+
+
 # ============================================================================
 # MCP ERROR REPORTING
 # ============================================================================
@@ -237,6 +290,16 @@ class CircuitBreaker:
             self._state = CircuitState.CLOSED
             logger.info("Circuit breaker CLOSED after successful recovery")
 
+    def half_open(self) -> None:
+        """Allow a test request before reset_timeout, keeping the failure count.
+
+        Used when a health probe passes: the next real call decides whether
+        the circuit closes.
+        """
+        if self._state == CircuitState.OPEN:
+            self._state = CircuitState.HALF_OPEN
+            logger.info("Circuit breaker transitioning to HALF_OPEN after a passing probe")
+
     def record_failure(self) -> None:
         """Record a failed call, potentially opening the circuit."""
         self._failure_count += 1
@@ -275,6 +338,650 @@ class CircuitBreakerOpen(Exception):
     pass
 
 
+# ============================================================================
+# BACKGROUND HEALTH MONITOR
+# ============================================================================
+
+@dataclass
+class ServerHealth:
+    """Cached health state of one MCP server.
+
+    Attributes:
+        name: Server name for identification (e.g., "mcp-rag")
+        base_url: Server base URL
+        healthy: Last known health (None until first probe or call)
+        last_checked: time.time() of the last observation
+        latency_ms: Latency of the last successful probe
+        consecutive_failures: Failed observations since the last success
+        error: Last failure message
+        circuit_breakers: Breakers fed by probe results (weakly referenced)
+    """
+    name: str
+    base_url: str
+    healthy: Optional[bool] = None
+    last_checked: Optional[float] = None
+    latency_ms: Optional[float] = None
+    consecutive_failures: int = 0
+    error: Optional[str] = None
+    circuit_breakers: weakref.WeakValueDictionary = field(
+        default_factory=weakref.WeakValueDictionary, repr=False
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "name": self.name,
+            "url": self.base_url,
+            "healthy": self.healthy,
+            "last_checked": self.last_checked,
+            "latency_ms": self.latency_ms,
+            "consecutive_failures": self.consecutive_failures,
+            "error": self.error,
+        }
+
+
+class MCPHealthMonitor:
+    """Background prober publishing a cached health state per MCP server.
+
+    Servers are watched as clients are created. While running, the monitor
+    probes every watched server's /health endpoint each ``interval`` seconds
+    and feeds the result into the servers' CircuitBreakers: a failed probe
+    counts as a failure, a passing probe only moves an OPEN breaker to
+    HALF_OPEN (it never clears failures of real tool calls). Successful and
+    failed tool calls update the same state, so call sites can read health
+    synchronously via is_healthy() instead of awaiting a health check
+    before every request.
+
+    Servers that have never been observed are reported healthy; the first
+    real call (or probe) decides. While the monitor is not running, nothing
+    but a real call can clear a failed observation, so one older than
+    ``interval`` is treated as stale and lets the next call through.
+
+    Example:
+        ```python
+        monitor = get_health_monitor()
+        monitor.start()
+
+        if monitor.is_healthy("http://localhost:8001"):
+            result = await client.search_standards("수익인식")
+
+        await monitor.stop()
+        ```
+    """
+
+    DEFAULT_INTERVAL = 15.0
+    PROBE_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        probe_timeout: Optional[float] = None
+    ):
+        """Initialize health monitor.
+
+        Args:
+            interval: Seconds between probe rounds (default: MCP_HEALTH_INTERVAL
+                env var or 15s)
+            probe_timeout: Timeout for each /health probe in seconds
+        """
+        self.interval = interval or float(
+            os.getenv("MCP_HEALTH_INTERVAL", self.DEFAULT_INTERVAL)
+        )
+        self.probe_timeout = probe_timeout or self.PROBE_TIMEOUT
+        self._servers: Dict[str, ServerHealth] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def watch(
+        self,
+        name: str,
+        base_url: str,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ) -> ServerHealth:
+        """Start tracking a server (idempotent).
+
+        Args:
+            name: Server name for identification
+            base_url: Server base URL
+            circuit_breaker: Optional breaker to feed with probe results
+
+        Returns:
+            The server's ServerHealth entry
+        """
+        key = base_url.rstrip('/')
+        state = self._servers.get(key)
+        if state is None:
+            state = ServerHealth(name=name, base_url=key)
+            self._servers[key] = state
+        if circuit_breaker is not None:
+            state.circuit_breakers[id(circuit_breaker)] = circuit_breaker
+        return state
+
+    def is_healthy(self, base_url: str) -> bool:
+        """Read the cached health of a server without any I/O.
+
+        Args:
+            base_url: Server base URL
+
+        Returns:
+            False if the last observation failed (and is still fresh, or
+            probes are running) or a breaker is open, True otherwise
+            (including servers never observed)
+        """
+        state = self._servers.get(base_url.rstrip('/'))
+        if state is None:
+            return True
+        if state.healthy is False and (self.running or not self._is_stale(state)):
+            return False
+        return all(
+            breaker.state != CircuitState.OPEN
+            for breaker in list(state.circuit_breakers.values())
+        )
+
+    def _is_stale(self, state: ServerHealth) -> bool:
+        return state.last_checked is None or time.time() - state.last_checked >= self.interval
+
+    def get_state(self, base_url: str) -> Optional[ServerHealth]:
+        """Get the cached ServerHealth entry for a server, if watched."""
+        return self._servers.get(base_url.rstrip('/'))
+
+    def record(
+        self,
+        base_url: str,
+        healthy: bool,
+        latency_ms: Optional[float] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """Record a health observation from a probe or a real call.
+
+        Args:
+            base_url: Server base URL
+            healthy: Whether the server responded successfully
+            latency_ms: Observed latency (probes only)
+            error: Failure message
+        """
+        state = self._servers.get(base_url.rstrip('/'))
+        if state is None:
+            return
+
+        if state.healthy is not healthy and state.healthy is not None:
+            if healthy:
+                logger.info(f"[{state.name}] Server recovered")
+            else:
+                logger.warning(f"[{state.name}] Server marked unhealthy: {error}")
+
+        state.healthy = healthy
+        state.last_checked = time.time()
+        if healthy:
+            state.consecutive_failures = 0
+            state.error = None
+            if latency_ms is not None:
+                state.latency_ms = latency_ms
+        else:
+            state.consecutive_failures += 1
+            state.error = error
+
+    async def probe(self, base_url: str) -> bool:
+        """Probe one server's /health endpoint and feed its breakers.
+
+        A /health 200 does not prove the tool endpoint works, so a passing
+        probe only lets open breakers try one real call.
+
+        Args:
+            base_url: Server base URL
+
+        Returns:
+            True if the server answered 200
+        """
+        state = self._servers.get(base_url.rstrip('/'))
+        if state is None:
+            return False
+
+        start = time.perf_counter()
+        try:
+            client = get_mcp_transport().client_for(state.base_url)
+            response = await client.get(
+                f"{state.base_url}/health",
+                timeout=self.probe_timeout
+            )
+            healthy = response.status_code == 200
+            error = None if healthy else f"HTTP {response.status_code}"
+        except Exception as e:
+            healthy = False
+            error = str(e) or type(e).__name__
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.record(state.base_url, healthy, latency_ms=latency_ms, error=error)
+
+        for breaker in list(state.circuit_breakers.values()):
+            if healthy:
+                breaker.half_open()
+            else:
+                breaker.record_failure()
+
+        return healthy
+
+    async def probe_all(self) -> Dict[str, bool]:
+        """Probe every watched server concurrently.
+
+        Returns:
+            Dict mapping base URL to probe result
+        """
+        urls = list(self._servers)
+        results = await asyncio.gather(*(self.probe(url) for url in urls))
+        return dict(zip(urls, results))
+
+    def start(self) -> None:
+        """Start periodic probing on the running event loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"MCP health monitor started (interval={self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop periodic probing."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("MCP health monitor stopped")
+
+    @property
+    def running(self) -> bool:
+        """Whether the background probe task is active."""
+        return self._task is not None and not self._task.done()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get cached health of all watched servers keyed by server name.
+
+        Returns:
+            Dict mapping server name to ServerHealth.to_dict() plus
+            "available" (the is_healthy() result)
+        """
+        return {
+            state.name: {**state.to_dict(), "available": self.is_healthy(url)}
+            for url, state in self._servers.items()
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.probe_all()
+            except Exception as e:
+                logger.error(f"MCP health probe round failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+_health_monitor: Optional[MCPHealthMonitor] = None
+
+
+def get_health_monitor() -> MCPHealthMonitor:
+    """Get the process-wide MCP health monitor, creating it on first use.
+
+    Returns:
+        Shared MCPHealthMonitor instance
+    """
+    global _health_monitor
+    if _health_monitor is None:
+        _health_monitor = MCPHealthMonitor()
+    return _health_monitor
+
+
+# ============================================================================
+# REQUEST COALESCING (Single-flight)
+# ============================================================================
+
+@dataclass
+class CoalescingStats:
+    """Single-flight counters for one tool.
+
+    Attributes:
+        calls: Calls that entered the single-flight group
+        executed: Calls that actually sent a request
+        coalesced: Calls that joined an identical in-flight request
+    """
+    calls: int = 0
+    executed: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """Deduplicates identical concurrent MCP tool calls.
+
+    The first call for a key (server, tool, canonicalized arguments) runs
+    the request in its own task; identical calls arriving while it is in
+    flight await the same task and receive a copy of its result (or its
+    exception). Nothing is cached: the key is released as soon as the
+    request completes.
+
+    Example:
+        ```python
+        flight = get_single_flight()
+        key = flight.key("http://localhost:8001", "search_standards", arguments)
+        result = await flight.do(key, lambda: client._send(arguments))
+        ```
+    """
+
+    def __init__(self):
+        """Initialize with no in-flight calls."""
+        # key -> [task, number of coalesced callers]
+        self._in_flight: Dict[tuple, list] = {}
+        self._stats: Dict[str, CoalescingStats] = {}
+
+    @staticmethod
+    def key(server: str, tool_name: str, arguments: Dict[str, Any]) -> tuple:
+        """Build the coalescing key for a tool call.
+
+        Args:
+            server: Server base URL
+            tool_name: Tool name
+            arguments: Tool arguments (canonicalized: key order is ignored)
+
+        Returns:
+            Hashable key
+        """
+        canonical = json.dumps(
+            arguments, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+        )
+        return (server.rstrip('/'), tool_name, canonical)
+
+    async def do(
+        self,
+        key: tuple,
+        func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run func once per key among concurrent callers.
+
+        Args:
+            key: Coalescing key from key()
+            func: Zero-argument coroutine function sending the request
+
+        Returns:
+            The request result; when callers were coalesced each gets its
+            own deep copy, so one caller mutating it cannot affect another
+        """
+        stats = self._stats.setdefault(key[1], CoalescingStats())
+        stats.calls += 1
+
+        entry = self._in_flight.get(key)
+        if entry is not None and entry[0].get_loop() is asyncio.get_running_loop():
+            stats.coalesced += 1
+            entry[1] += 1
+            mark_coalesced()
+            return copy.deepcopy(await asyncio.shield(entry[0]))
+
+        stats.executed += 1
+        task = asyncio.ensure_future(func())
+        entry = [task, 0]
+        self._in_flight[key] = entry
+        task.add_done_callback(lambda done: self._release(key, done))
+
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result) if entry[1] else result
+
+    def stats(self) -> Dict[str, Any]:
+        """Get coalescing counters.
+
+        Returns:
+            Dict with totals (calls, executed, coalesced, in_flight,
+            coalesce_rate) and per-tool counters under "tools"
+        """
+        calls = sum(s.calls for s in self._stats.values())
+        coalesced = sum(s.coalesced for s in self._stats.values())
+        return {
+            "calls": calls,
+            "executed": sum(s.executed for s in self._stats.values()),
+            "coalesced": coalesced,
+            "in_flight": len(self._in_flight),
+            "coalesce_rate": coalesced / calls if calls else 0.0,
+            "tools": {tool: vars(s).copy() for tool, s in self._stats.items()},
+        }
+
+    def reset_stats(self) -> None:
+        """Reset counters (in-flight calls are unaffected)."""
+        self._stats.clear()
+
+    def _release(self, key: tuple, task: asyncio.Task) -> None:
+        entry = self._in_flight.get(key)
+        if entry is not None and entry[0] is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every caller was cancelled
+
+
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the process-wide single-flight group shared by all MCP clients.
+
+    Returns:
+        Shared SingleFlight instance
+    """
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
+async def _call_with_cache(
+    base_url: str,
+    tool_name: str,
+    arguments: Dict[str, Any],
+    fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Serve a tool call from the tool result cache, fetching on a miss.
+
+    Tools without a TTL in the cache bypass it entirely.
+
+    Args:
+        base_url: Server base URL
+        tool_name: Tool name
+        arguments: Tool arguments
+        fetch: Coroutine factory performing the actual call
+
+    Returns:
+        Cached or freshly fetched tool result
+    """
+    cache = get_tool_cache()
+    if not cache.is_cacheable(tool_name):
+        return await fetch()
+
+    cached = cache.get(base_url, tool_name, arguments)
+    if cached is not None:
+        mark_cache_hit()
+        return cached
+
+    result = await fetch()
+    cache.set(base_url, tool_name, arguments, result)
+    return result
+
+
+# ============================================================================
+# JSON-RPC BATCHING
+# ============================================================================
+
+# Servers that answered a JSON-RPC batch array with an error; calls to them
+# are sent one request per call from then on.
+_batch_unsupported: set = set()
+
+
+def _build_batch_request(calls: List[tuple]) -> List[Dict[str, Any]]:
+    """Build a JSON-RPC 2.0 batch array of tools/call requests.
+
+    Args:
+        calls: List of (tool_name, arguments) pairs
+
+    Returns:
+        Batch payload; request ids are the call positions
+    """
+    return [
+        {
+            "jsonrpc": "2.0",
+            "id": index,
+            "method": "tools/call",
+            "params": {"name": tool_name, "arguments": arguments}
+        }
+        for index, (tool_name, arguments) in enumerate(calls)
+    ]
+
+
+def _map_batch_response(
+    server_name: str,
+    calls: List[tuple],
+    responses: List[Dict[str, Any]]
+) -> List[Any]:
+    """Map batch response items back to calls by request id.
+
+    Args:
+        server_name: Server name for error messages
+        calls: The (tool_name, arguments) pairs that were sent
+        responses: JSON-RPC response array (any order)
+
+    Returns:
+        One entry per call: the tool result, or an MCPToolExecutionError
+    """
+    by_id = {item.get("id"): item for item in responses if isinstance(item, dict)}
+    results: List[Any] = []
+
+    for index, (tool_name, _) in enumerate(calls):
+        item = by_id.get(index)
+        if item is None:
+            results.append(MCPToolExecutionError(
+                f"[{server_name}] Tool '{tool_name}' error: missing batch response"
+            ))
+        elif "error" in item:
+            error_msg = item.get("error", {})
+            if isinstance(error_msg, dict):
+                error_msg = error_msg.get("message", str(error_msg))
+            results.append(MCPToolExecutionError(
+                f"[{server_name}] Tool '{tool_name}' error: {error_msg}"
+            ))
+        else:
+            results.append(item.get("result", {}))
+
+    return results
+
+
+class MicroBatcher:
+    """Collects tool calls issued within a short window into one batch.
+
+    Callers await submit() as if it were a single call; calls submitted
+    before the window closes (or until max_batch_size is reached) are handed
+    to send_batch together, turning concurrent fan-out into one round trip.
+
+    Attributes:
+        window: Seconds to wait for more calls after the first one
+        max_batch_size: Calls per batch before flushing early
+        batches_sent: Number of flushed batches
+        calls_sent: Number of calls across all batches
+
+    Example:
+        ```python
+        batcher = MicroBatcher(client._send_tool_batch, window=0.002)
+        results = await asyncio.gather(
+            batcher.submit("get_paragraph_by_id", {"standard_id": "K-IFRS 1115", "paragraph_no": "9"}),
+            batcher.submit("get_paragraph_by_id", {"standard_id": "K-IFRS 1115", "paragraph_no": "22"}),
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[tuple]], Awaitable[List[Any]]],
+        window: float = 0.002,
+        max_batch_size: int = 32
+    ):
+        """Initialize the batcher.
+
+        Args:
+            send_batch: Coroutine sending (tool_name, arguments) pairs and
+                returning one result or exception per pair
+            window: Seconds to wait for more calls after the first one
+            max_batch_size: Calls per batch before flushing early
+        """
+        self.send_batch = send_batch
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.batches_sent = 0
+        self.calls_sent = 0
+        self._pending: List[tuple] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: set = set()
+
+    async def submit(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Queue a tool call and wait for its result.
+
+        Args:
+            tool_name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            The tool result
+
+        Raises:
+            MCPToolExecutionError: If this call failed within the batch
+            MCPConnectionError: If the batch request failed
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Pending calls of a previous (closed) loop can never complete
+            self._loop = loop
+            self._pending = []
+            self._timer = None
+
+        future = loop.create_future()
+        self._pending.append((tool_name, arguments, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = [item for item in self._pending if not item[2].done()]
+        self._pending = []
+        if not batch:
+            return
+
+        self.batches_sent += 1
+        self.calls_sent += len(batch)
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: List[tuple]) -> None:
+        calls = [(tool_name, arguments) for tool_name, arguments, _ in batch]
+
+        try:
+            results = await self.send_batch(calls)
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
 # ============================================================================
 # UNIFIED MCP CLIENT (Generic for any MCP Server)
 # ============================================================================
@@ -291,6 +998,19 @@ class MCPClientConfig:
         retry_backoff: Exponential backoff multiplier (default: 2.0)
         circuit_breaker_fail_max: Failures before circuit opens (default: 5)
         circuit_breaker_reset_timeout: Seconds before circuit recovery (default: 60)
+        coalesce_requests: Share one request among identical concurrent
+            tool calls (default: True)
+        cache_results: Serve deterministic tools (see DEFAULT_TOOL_TTLS)
+            from the two-tier tool result cache (default: True)
+        batch_window: Seconds concurrent tool calls wait to be sent as one
+            JSON-RPC batch, e.g. 0.002; a failed batch request fails every
+            call in it, so 0 (no micro-batching) is the default
+        max_batch_size: Maximum calls per JSON-RPC batch (default: 32)
+        hedge_requests: Send a duplicate request when the first is slower
+            than the server's hedge_quantile latency; only enable for
+            idempotent (read-only) tools (default: False)
+        hedge_quantile: Latency quantile that triggers a hedge (default: 0.95)
+        hedge_min_delay: Minimum seconds before hedging (default: 0.05)
     """
     base_url: str = "http://localhost:8001"
     timeout: float = 30.0
@@ -299,6 +1019,13 @@ class MCPClientConfig:
     retry_backoff: float = 2.0
     circuit_breaker_fail_max: int = 5
     circuit_breaker_reset_timeout: float = 60.0
+    coalesce_requests: bool = True
+    cache_results: bool = True
+    batch_window: float = 0.0
+    max_batch_size: int = 32
+    hedge_requests: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_delay: float = 0.05
 
 
 class MCPClientError(Exception):
@@ -323,7 +1050,8 @@ class MCPClient:
     audit-mcp-suite. It provides:
     - HTTP JSON-RPC communication
     - Circuit breaker protection (5 failures → 60s cooldown)
-    - Retry with exponential backoff (3 attempts)
+    - Retry with jittered backoff under a per-server retry budget (3 attempts)
+    - Opt-in hedged requests (MCPClientConfig.hedge_requests)
     - Health check capabilities
     - Tool listing and execution
 
@@ -378,31 +1106,28 @@ class MCPClient:
 
         self.mcp_endpoint = f"{self.base_url}/mcp"
         self.health_endpoint = f"{self.base_url}/health"
-        self._client: Optional[httpx.AsyncClient] = None
 
         # Circuit breaker for this server
         self.circuit_breaker = CircuitBreaker(
             fail_max=self.config.circuit_breaker_fail_max,
             reset_timeout=self.config.circuit_breaker_reset_timeout
         )
+        get_health_monitor().watch(name, self.base_url, self.circuit_breaker)
+        self._batcher: Optional[MicroBatcher] = None
 
         logger.info(f"MCPClient '{name}' initialized: {self.base_url}")
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client with connection pooling."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
-                headers={"Content-Type": "application/json"}
-            )
-        return self._client
+        """Borrow the shared pooled HTTP client for this server."""
+        return get_mcp_transport().client_for(self.base_url)
 
     async def close(self) -> None:
-        """Close the HTTP client connection."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
-            logger.debug(f"MCPClient '{self.name}' connection closed")
+        """Release the client.
+
+        Connections belong to the shared MCP transport and stay pooled for
+        other clients; the transport is closed on application shutdown.
+        """
+        logger.debug(f"MCPClient '{self.name}' released")
 
     async def __aenter__(self) -> "MCPClient":
         """Async context manager entry."""
@@ -439,13 +1164,34 @@ class MCPClient:
                 f"Will retry after {self.circuit_breaker.reset_timeout}s"
             )
 
+        resilience = get_server_resilience(self.base_url)
+        resilience.budget.deposit()
+        hedge_delay = (
+            resilience.hedge_delay(self.config.hedge_quantile, self.config.hedge_min_delay)
+            if self.config.hedge_requests else None
+        )
+        max_backoff = self.config.retry_delay * (
+            self.config.retry_backoff ** (self.config.max_retries - 1)
+        )
+        backoff = self.config.retry_delay
         last_error: Optional[Exception] = None
+        attempts = 0
 
         for attempt in range(self.config.max_retries):
+            attempts = attempt + 1
             try:
-                response = await request_func(*args, **kwargs)
+                started = time.perf_counter()
+                with observe_attempt(self.name, attempts) as observed:
+                    observed.response = response = await hedged_call(
+                        lambda: request_func(*args, **kwargs),
+                        hedge_delay,
+                        allow_hedge=resilience.try_hedge,
+                        on_hedge_won=resilience.record_hedge_win
+                    )
                 response.raise_for_status()
+                resilience.latencies.record(time.perf_counter() - started)
                 self.circuit_breaker.record_success()
+                get_health_monitor().record(self.base_url, True)
                 return response
 
             except httpx.ConnectError as e:
@@ -478,19 +1224,32 @@ class MCPClient:
                     f"(attempt {attempt + 1}/{self.config.max_retries}): {e}"
                 )
 
-            # Exponential backoff before retry
+            # Backoff with decorrelated jitter, if the retry budget allows
             if attempt < self.config.max_retries - 1:
-                delay = self.config.retry_delay * (
-                    self.config.retry_backoff ** attempt
-                )
-                await asyncio.sleep(delay)
+                if not resilience.try_retry():
+                    logger.warning(f"[{self.name}] Retry budget exhausted, not retrying")
+                    break
+                backoff = decorrelated_jitter(self.config.retry_delay, max_backoff, backoff)
+                await asyncio.sleep(backoff)
 
         # All retries exhausted
+        get_health_monitor().record(self.base_url, False, error=str(last_error))
         raise MCPConnectionError(
-            f"[{self.name}] Failed after {self.config.max_retries} attempts. "
+            f"[{self.name}] Failed after {attempts} attempts. "
             f"Last error: {last_error}"
         )
 
+    def is_available(self) -> bool:
+        """Read the cached server health (no network round trip).
+
+        Backed by the background MCPHealthMonitor and the outcome of recent
+        calls; use this instead of awaiting health_check() before a call.
+
+        Returns:
+            False if the server is known to be down, True otherwise
+        """
+        return get_health_monitor().is_healthy(self.base_url)
+
     async def health_check(self) -> bool:
         """Check if MCP server is available.
 
@@ -543,7 +1302,8 @@ class MCPClient:
         response = await self._execute_with_retry(
             client.post,
             self.mcp_endpoint,
-            json=request
+            json=request,
+            timeout=self.timeout
         )
 
         result = response.json()
@@ -576,6 +1336,138 @@ class MCPClient:
             MCPConnectionError: If server is unavailable
             MCPToolExecutionError: If tool execution fails
         """
+        with observe_call(self.name, tool_name):
+            if self.config.cache_results:
+                return await _call_with_cache(
+                    self.base_url, tool_name, arguments,
+                    lambda: self._coalesced_call(tool_name, arguments)
+                )
+
+            return await self._coalesced_call(tool_name, arguments)
+
+    async def _coalesced_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send a tool call, sharing it with identical in-flight calls."""
+        if self.config.coalesce_requests:
+            flight = get_single_flight()
+            return await flight.do(
+                flight.key(self.base_url, tool_name, arguments),
+                lambda: self._submit_tool_call(tool_name, arguments)
+            )
+
+        return await self._submit_tool_call(tool_name, arguments)
+
+    async def _submit_tool_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send a tool call, micro-batched with concurrent calls if enabled."""
+        if self.config.batch_window <= 0:
+            return await self._send_tool_call(tool_name, arguments)
+
+        if self._batcher is None:
+            self._batcher = MicroBatcher(
+                self._send_tool_batch,
+                window=self.config.batch_window,
+                max_batch_size=self.config.max_batch_size
+            )
+        return await self._batcher.submit(tool_name, arguments)
+
+    async def call_tools_batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Call several tools in one JSON-RPC 2.0 batch request.
+
+        Cached results are served locally; the remaining calls are sent as
+        one batch array. Servers that reject batch arrays are remembered and
+        called once per tool instead.
+
+        Args:
+            calls: List of (tool_name, arguments) pairs
+
+        Returns:
+            One entry per call, in order: the tool result, or the
+            MCPToolExecutionError raised for that call
+
+        Raises:
+            MCPConnectionError: If the batch request itself fails
+
+        Example:
+            ```python
+            results = await client.call_tools_batch([
+                ("get_paragraph_by_id", {"standard_id": "K-IFRS 1115", "paragraph_no": "9"}),
+                ("get_paragraph_by_id", {"standard_id": "K-IFRS 1115", "paragraph_no": "B34"}),
+            ])
+            ```
+        """
+        cache = get_tool_cache() if self.config.cache_results else None
+        results: List[Any] = [None] * len(calls)
+        pending: List[int] = []
+
+        for index, (tool_name, arguments) in enumerate(calls):
+            cached = cache.get(self.base_url, tool_name, arguments) if cache else None
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+
+        if pending:
+            with observe_call(self.name, "tools/batch"):
+                fetched = await self._send_tool_batch([calls[i] for i in pending])
+            for index, result in zip(pending, fetched):
+                results[index] = result
+                if cache is not None and not isinstance(result, Exception):
+                    tool_name, arguments = calls[index]
+                    cache.set(self.base_url, tool_name, arguments, result)
+
+        return results
+
+    async def _send_tool_batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Send tool calls as one JSON-RPC batch (a lone call as a plain request).
+
+        Returns:
+            One tool result or MCPToolExecutionError per call
+        """
+        if len(calls) == 1:
+            try:
+                return [await self._send_tool_call(*calls[0])]
+            except MCPToolExecutionError as e:
+                return [e]
+
+        if self.base_url not in _batch_unsupported:
+            try:
+                responses = await self._post_batch(_build_batch_request(calls))
+            except MCPToolExecutionError:
+                responses = None
+
+            if isinstance(responses, list):
+                return _map_batch_response(self.name, calls, responses)
+
+            _batch_unsupported.add(self.base_url)
+            logger.info(
+                f"[{self.name}] JSON-RPC batches not supported, "
+                f"sending calls individually"
+            )
+
+        return list(await asyncio.gather(
+            *(self._send_tool_call(tool_name, arguments) for tool_name, arguments in calls),
+            return_exceptions=True
+        ))
+
+    async def _send_tool_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send one tools/call request (no coalescing)."""
         request = {
             "jsonrpc": "2.0",
             "id": 2,
@@ -606,6 +1498,17 @@ class MCPClient:
 
         return result.get("result", {})
 
+    async def _post_batch(self, payload: List[Dict[str, Any]]) -> Any:
+        """POST a JSON-RPC batch array and return the parsed response."""
+        client = await self._get_client()
+        response = await self._execute_with_retry(
+            client.post,
+            self.mcp_endpoint,
+            json=payload,
+            timeout=self.timeout
+        )
+        return response.json()
+
 
 # ============================================================================
 # MCP TOOL REGISTRY (Unified Management of All MCP Servers)
@@ -628,17 +1531,24 @@ class MCPToolRegistry:
 
     Features:
         - Server registration with automatic tool discovery
+        - Concurrent registration under a startup deadline; servers that miss
+          it keep registering in the background and are awaited on first use
+        - Tool schemas cached on disk and served immediately after a restart
         - Health check aggregation across all servers
+        - Background health probing with cached, synchronous health reads
         - Tool routing by name
+        - Coalescing of identical concurrent tool calls (single-flight)
         - Circuit breaker status monitoring
+        - Per-server latency histograms in health_check_all()
 
     Example:
         ```python
         # Create registry
         registry = MCPToolRegistry()
 
-        # Register all servers from environment
-        await registry.register_all_servers()
+        # Register all servers from environment (slow servers are deferred
+        # to first use after the deadline)
+        await registry.register_all_servers(startup_deadline=5.0)
 
         # Or register specific servers
         await registry.register_server(MCPServerType.RAG)
@@ -656,17 +1566,47 @@ class MCPToolRegistry:
         # Health check all servers
         status = await registry.health_check_all()
 
+        # Probe in the background and read cached health without I/O
+        registry.start_health_monitor()
+        if registry.is_server_healthy("mcp-rag"):
+            ...
+
         # Cleanup
         await registry.close_all()
         ```
     """
 
-    def __init__(self):
-        """Initialize empty registry."""
+    # Seconds register_all_servers waits before deferring servers to first use
+    DEFAULT_STARTUP_DEADLINE = 10.0
+
+    def __init__(
+        self,
+        health_monitor: Optional[MCPHealthMonitor] = None,
+        schema_cache: Optional[ToolSchemaCache] = None
+    ):
+        """Initialize empty registry.
+
+        Args:
+            health_monitor: Monitor for cached server health
+                (default: the process-wide monitor)
+            schema_cache: Persistent tool schema cache
+                (default: the process-wide cache, see MCP_SCHEMA_CACHE_PATH)
+        """
         self.servers: Dict[str, MCPClient] = {}
         self.tools: Dict[str, RegisteredTool] = {}
+        self.health_monitor = health_monitor or get_health_monitor()
+        self.schema_cache = schema_cache or get_schema_cache()
         self._initialized = False
 
+        # Server name -> (type, URL override) for lazy registration
+        self._server_specs: Dict[str, Tuple[MCPServerType, Optional[str]]] = {}
+        # Server name -> registration still running or failed
+        self._registrations: Dict[str, asyncio.Task] = {}
+        # Longest wait for running registrations when resolving an unknown tool
+        self.startup_deadline = float(
+            os.getenv("MCP_STARTUP_DEADLINE", self.DEFAULT_STARTUP_DEADLINE)
+        )
+
     async def register_server(
         self,
         server_type: MCPServerType,
@@ -690,6 +1630,7 @@ class MCPToolRegistry:
         server_name = config["name"]
         server_url = url or get_server_url(server_type)
         timeout = config["timeout"]
+        self._server_specs[server_name] = (server_type, url)
 
         logger.info(f"Registering server: {server_name} at {server_url}")
 
@@ -720,8 +1661,16 @@ class MCPToolRegistry:
             raise
 
         self.servers[server_name] = client
-
-        # Register each tool
+        self.health_monitor.watch(server_name, client.base_url, client.circuit_breaker)
+        if not skip_health_check:
+            self.health_monitor.record(client.base_url, True)
+        self.schema_cache.set(server_name, client.base_url, tools)
+
+        # Register each tool (replacing cached schemas of this server)
+        for tool_name in [
+            name for name, tool in self.tools.items() if tool.server_name == server_name
+        ]:
+            del self.tools[tool_name]
         for tool in tools:
             tool_name = tool["name"]
             self.tools[tool_name] = RegisteredTool(
@@ -734,37 +1683,190 @@ class MCPToolRegistry:
         logger.info(f"  Registered {len(tools)} tools from {server_name}")
         return True
 
-    async def register_all_servers(
-        self,
-        skip_unavailable: bool = True
-    ) -> Dict[str, bool]:
-        """Register all configured MCP servers.
+    async def register_all_servers(
+        self,
+        skip_unavailable: bool = True,
+        startup_deadline: Optional[float] = None
+    ) -> Dict[str, bool]:
+        """Register all configured MCP servers concurrently.
+
+        Tool schemas cached on disk are loaded first, so get_tool_schemas()
+        answers even before any server does. Servers still registering when
+        the deadline passes keep registering in the background; calls to
+        their tools wait for (or retry) the registration on first use.
+
+        Args:
+            skip_unavailable: If True, continue even if some servers fail
+            startup_deadline: Seconds to wait for registrations (default:
+                MCP_STARTUP_DEADLINE env var or DEFAULT_STARTUP_DEADLINE)
+
+        Returns:
+            Dict mapping server name to registration success status (False
+            for failed servers and for servers deferred past the deadline)
+        """
+        if startup_deadline is None:
+            startup_deadline = self.startup_deadline
+        self.startup_deadline = startup_deadline
+
+        self.load_cached_schemas()
+        tasks = {
+            MCP_SERVER_CONFIG[server_type]["name"]: self._start_registration(server_type)
+            for server_type in MCPServerType
+        }
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=startup_deadline)
+
+        results = {}
+        deferred = []
+        for server_name, task in tasks.items():
+            if not task.done():
+                deferred.append(server_name)
+                results[server_name] = False
+            elif task.cancelled():
+                results[server_name] = False
+            elif task.exception() is not None:
+                results[server_name] = False
+                if not skip_unavailable:
+                    raise task.exception()
+            else:
+                results[server_name] = True
+
+        self._initialized = True
+        successful = sum(1 for v in results.values() if v)
+        logger.info(
+            f"MCPToolRegistry initialized: {successful}/{len(results)} servers"
+            + (f" ({', '.join(deferred)} deferred to first use)" if deferred else "")
+        )
+        return results
+
+    def load_cached_schemas(self) -> int:
+        """Serve tool schemas cached on disk until their servers register.
+
+        Tools of servers that are not registered yet are added from the
+        schema cache; calling one registers its server first.
+
+        Returns:
+            Number of tools loaded from the cache
+        """
+        loaded = 0
+        for server_type in MCPServerType:
+            config = MCP_SERVER_CONFIG[server_type]
+            server_name = config["name"]
+            if server_name in self.servers:
+                continue
+
+            server_url = get_server_url(server_type)
+            tools = self.schema_cache.get(server_name, server_url)
+            if not tools:
+                continue
+
+            self._server_specs.setdefault(server_name, (server_type, None))
+            client = MCPClient(name=server_name, base_url=server_url, timeout=config["timeout"])
+            for tool in tools:
+                self.tools.setdefault(tool["name"], RegisteredTool(
+                    name=tool["name"],
+                    schema=tool,
+                    server_name=server_name,
+                    client=client
+                ))
+                loaded += 1
+
+        if loaded:
+            logger.info(f"Loaded {loaded} cached tool schemas")
+        return loaded
+
+    @property
+    def pending_servers(self) -> List[str]:
+        """Servers known to the registry that are not registered yet."""
+        return [name for name in self._server_specs if name not in self.servers]
+
+    def _start_registration(
+        self,
+        server_type: MCPServerType,
+        url: Optional[str] = None
+    ) -> asyncio.Task:
+        server_name = MCP_SERVER_CONFIG[server_type]["name"]
+        self._server_specs[server_name] = (server_type, url)
+        task = asyncio.create_task(self.register_server(server_type, url))
+        self._registrations[server_name] = task
+
+        def on_done(task: asyncio.Task) -> None:
+            if task.cancelled():
+                return
+            if task.exception() is not None:
+                logger.warning(f"Failed to register {server_name}: {task.exception()}")
+            elif self._registrations.get(server_name) is task:
+                del self._registrations[server_name]
+
+        task.add_done_callback(on_done)
+        return task
+
+    async def _ensure_server(self, server_name: str) -> MCPClient:
+        """Return a registered server, registering it now if necessary.
+
+        Joins a registration still running from register_all_servers, or
+        retries one that failed.
+
+        Raises:
+            MCPConnectionError: If the server cannot be registered
+        """
+        client = self.servers.get(server_name)
+        if client is not None:
+            return client
+        if server_name not in self._server_specs:
+            raise MCPConnectionError(f"Server {server_name} is not registered")
+
+        task = self._registrations.get(server_name)
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            logger.info(f"Registering {server_name} on first use")
+            task = self._start_registration(*self._server_specs[server_name])
+
+        try:
+            # Shielded: a cancelled caller must not cancel the shared registration
+            await asyncio.shield(task)
+        except MCPConnectionError:
+            raise
+        except Exception as e:
+            raise MCPConnectionError(f"Server {server_name} could not be registered: {e}") from e
+        return self.servers[server_name]
+
+    async def _resolve_tool(self, tool_name: str) -> RegisteredTool:
+        """Find a tool, registering its server on first use.
 
-        Args:
-            skip_unavailable: If True, continue even if some servers fail
+        Unknown tools wait (at most startup_deadline seconds) for running
+        registrations of servers whose tools are not known yet; servers with
+        cached schemas cannot add an unknown tool and are not waited for.
 
-        Returns:
-            Dict mapping server name to registration success status
+        Raises:
+            ValueError: If the tool is unknown
+            MCPConnectionError: If the tool's server cannot be registered
         """
-        results = {}
-
-        for server_type in MCPServerType:
-            server_name = MCP_SERVER_CONFIG[server_type]["name"]
-            try:
-                await self.register_server(server_type)
-                results[server_name] = True
-            except Exception as e:
-                logger.warning(f"Failed to register {server_name}: {e}")
-                results[server_name] = False
-                if not skip_unavailable:
-                    raise
+        if tool_name not in self.tools:
+            known = {tool.server_name for tool in self.tools.values()}
+            running = [
+                task for server_name, task in self._registrations.items()
+                if not task.done() and server_name not in known
+            ]
+            if running:
+                await asyncio.wait(running, timeout=self.startup_deadline)
+
+        tool_info = self.tools.get(tool_name)
+        if tool_info is None:
+            available = ", ".join(sorted(self.tools.keys())[:10])
+            raise ValueError(
+                f"Unknown tool: {tool_name}. "
+                f"Available tools: {available}..."
+            )
 
-        self._initialized = True
-        successful = sum(1 for v in results.values() if v)
-        logger.info(
-            f"MCPToolRegistry initialized: {successful}/{len(results)} servers"
-        )
-        return results
+        if tool_info.server_name not in self.servers:
+            await self._ensure_server(tool_info.server_name)
+            tool_info = self.tools.get(tool_name)
+            if tool_info is None:
+                raise ValueError(
+                    f"Unknown tool: {tool_name}. "
+                    f"It is no longer provided by its server."
+                )
+        return tool_info
 
     def get_tool_schemas(self) -> List[Dict[str, Any]]:
         """Get all tool schemas for LangChain integration.
@@ -804,28 +1906,80 @@ class MCPToolRegistry:
 
         Raises:
             ValueError: If tool is not registered
+            MCPConnectionError: If the tool's server cannot be registered
             MCPToolExecutionError: If execution fails
         """
-        if tool_name not in self.tools:
-            available = ", ".join(sorted(self.tools.keys())[:10])
-            raise ValueError(
-                f"Unknown tool: {tool_name}. "
-                f"Available tools: {available}..."
-            )
-
-        tool_info = self.tools[tool_name]
+        tool_info = await self._resolve_tool(tool_name)
         logger.debug(
             f"Routing tool '{tool_name}' to server '{tool_info.server_name}'"
         )
         return await tool_info.client.call_tool(tool_name, arguments)
 
+    async def call_tools_batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Call several tools, sending one JSON-RPC batch per server.
+
+        Calls are grouped by the server that owns each tool and the
+        per-server batches are sent concurrently.
+
+        Args:
+            calls: List of (tool_name, arguments) pairs
+
+        Returns:
+            One entry per call, in order: the tool result, or the exception
+            raised for that call (ValueError for unknown tools,
+            MCPToolExecutionError / MCPConnectionError otherwise)
+
+        Example:
+            ```python
+            results = await registry.call_tools_batch([
+                ("search_standards", {"query_text": "리스", "top_k": 5}),
+                ("get_paragraph_by_id", {"standard_id": "K-IFRS 1116", "paragraph_no": "22"}),
+            ])
+            ```
+        """
+        results: List[Any] = [None] * len(calls)
+        groups: Dict[str, List[int]] = {}
+
+        tool_names = list(dict.fromkeys(tool_name for tool_name, _ in calls))
+        resolved = await asyncio.gather(
+            *(self._resolve_tool(tool_name) for tool_name in tool_names),
+            return_exceptions=True
+        )
+        tools = dict(zip(tool_names, resolved))
+
+        for index, (tool_name, _) in enumerate(calls):
+            tool_info = tools[tool_name]
+            if isinstance(tool_info, Exception):
+                results[index] = tool_info
+            else:
+                groups.setdefault(tool_info.server_name, []).append(index)
+
+        async def run_group(server_name: str, indices: List[int]) -> None:
+            client = self.servers[server_name]
+            try:
+                fetched = await client.call_tools_batch([calls[i] for i in indices])
+            except Exception as e:
+                fetched = [e] * len(indices)
+            for index, result in zip(indices, fetched):
+                results[index] = result
+
+        await asyncio.gather(*(
+            run_group(server_name, indices) for server_name, indices in groups.items()
+        ))
+        return results
+
     async def health_check_all(self) -> Dict[str, Dict[str, Any]]:
         """Check health of all registered servers.
 
         Returns:
-            Dict mapping server name to health status
+            Dict mapping server name to health status, including the
+            server's call latency percentiles and counters under "latency"
         """
         results = {}
+        metrics = get_mcp_metrics()
 
         for server_name, client in self.servers.items():
             try:
@@ -842,9 +1996,116 @@ class MCPToolRegistry:
                     "circuit_state": client.circuit_breaker.state.value,
                     "url": client.base_url
                 }
+            results[server_name]["latency"] = metrics.server_snapshot(server_name)
+
+        return results
+
+    def start_health_monitor(self, interval: Optional[float] = None) -> None:
+        """Start background health probing of the registered servers.
+
+        Args:
+            interval: Optional probe interval in seconds
+        """
+        if interval is not None:
+            self.health_monitor.interval = interval
+        self.health_monitor.start()
 
+    async def stop_health_monitor(self) -> None:
+        """Stop background health probing."""
+        await self.health_monitor.stop()
+
+    def is_server_healthy(self, server_name: str) -> bool:
+        """Read the cached health of a registered server (no I/O).
+
+        Args:
+            server_name: Name of the server (e.g., "mcp-rag")
+
+        Returns:
+            False if the server is unknown or known to be down
+        """
+        client = self.servers.get(server_name)
+        if client is None:
+            return False
+        return self.health_monitor.is_healthy(client.base_url)
+
+    def get_health_states(self) -> Dict[str, Dict[str, Any]]:
+        """Get cached health of all registered servers.
+
+        Returns:
+            Dict mapping server name to cached health state
+        """
+        states = {}
+        for server_name, client in self.servers.items():
+            state = self.health_monitor.get_state(client.base_url)
+            states[server_name] = {
+                **(state.to_dict() if state else {}),
+                "available": self.health_monitor.is_healthy(client.base_url),
+                "circuit_state": client.circuit_breaker.state.value,
+            }
+        return states
+
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """Get single-flight statistics for identical concurrent tool calls.
+
+        Counters are process-wide: they include calls made through the
+        specialized clients as well as through this registry.
+
+        Returns:
+            Dict with calls, executed, coalesced, in_flight, coalesce_rate
+            and per-tool counters under "tools"
+        """
+        return get_single_flight().stats()
+
+    def get_concurrency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get adaptive concurrency limiter metrics per registered server.
+
+        Returns:
+            Dict mapping server name to limit, in_flight, queue_depth and
+            the other AdaptiveConcurrencyLimiter.stats() fields (empty for
+            servers that have not been called yet)
+        """
+        pools = get_mcp_transport().stats()
+        results = {}
+        for server_name, client in self.servers.items():
+            parts = urlsplit(client.base_url)
+            pool = pools.get(f"{parts.scheme}://{parts.netloc}".lower())
+            results[server_name] = pool["concurrency"] if pool else {}
         return results
 
+    def get_resilience_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get retry budget and hedging counters per registered server.
+
+        Returns:
+            Dict mapping server name to retry_tokens, retries,
+            retries_denied, hedges_sent, hedges_won, p50_ms and p95_ms
+        """
+        return {
+            server_name: get_server_resilience(client.base_url).stats()
+            for server_name, client in self.servers.items()
+        }
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get statistics of the process-wide tool result cache.
+
+        Returns:
+            Dict with memory_size, disk_size, memory_hits, disk_hits,
+            misses, hit_rate, corpus_version and persistent
+        """
+        return get_tool_cache().stats()
+
+    def set_corpus_version(self, version: str) -> None:
+        """Invalidate cached RAG results after the standards corpus changes.
+
+        Args:
+            version: New corpus version identifier (e.g. index build date)
+
+        Example:
+            ```python
+            registry.set_corpus_version("2026-10-16")
+            ```
+        """
+        get_tool_cache().set_corpus_version(version)
+
     def get_circuit_breaker_status(self) -> Dict[str, str]:
         """Get circuit breaker status for all servers.
 
@@ -858,6 +2119,10 @@ class MCPToolRegistry:
 
     async def close_all(self) -> None:
         """Close all server connections."""
+        for task in self._registrations.values():
+            task.cancel()
+        self._registrations.clear()
+
         for server_name, client in self.servers.items():
             await client.close()
             logger.debug(f"Closed connection to {server_name}")
@@ -935,7 +2200,8 @@ class MCPRagClient:
         self,
         base_url: Optional[str] = None,
         timeout: float = 30.0,
-        config: Optional[MCPClientConfig] = None
+        config: Optional[MCPClientConfig] = None,
+        hedge_requests: bool = False
     ):
         """Initialize MCP RAG client.
 
@@ -944,7 +2210,9 @@ class MCPRagClient:
                      or http://localhost:8001
             timeout: Request timeout in seconds (default: 30s)
             config: Optional MCPClientConfig for advanced settings.
-                   If provided, base_url and timeout parameters are ignored.
+                   If provided, base_url, timeout and hedge_requests are ignored.
+            hedge_requests: Hedge slow requests with a duplicate (all RAG
+                   tools are read-only); for latency-critical callers
         """
         if config:
             self.config = config
@@ -955,38 +2223,37 @@ class MCPRagClient:
             )
             self.config = MCPClientConfig(
                 base_url=resolved_url.rstrip('/'),
-                timeout=timeout
+                timeout=timeout,
+                hedge_requests=hedge_requests
             )
 
         self.base_url = self.config.base_url
         self.timeout = self.config.timeout
         self.mcp_endpoint = f"{self.base_url}/mcp"
         self.health_endpoint = f"{self.base_url}/health"
-        self._client: Optional[httpx.AsyncClient] = None
+
+        get_health_monitor().watch("mcp-rag", self.base_url)
+        self._batcher: Optional[MicroBatcher] = None
 
         logger.info(f"MCPRagClient initialized with server: {self.base_url}")
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client.
+        """Borrow the shared pooled HTTP client for the RAG server.
 
         Returns:
-            httpx.AsyncClient: Configured async HTTP client
+            httpx.AsyncClient: Shared client from the process-wide MCP transport
 
         Note:
-            The client is lazily initialized and reused for connection pooling.
+            Connections are kept alive in the shared pool, so clients created
+            per invocation do not pay connection setup on every call.
         """
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=httpx.Timeout(self.timeout),
-                headers={"Content-Type": "application/json"}
-            )
-        return self._client
+        return get_mcp_transport().client_for(self.base_url)
 
     async def close(self) -> None:
-        """Close the HTTP client connection.
+        """Release the client.
 
-        Call this method when done using the client to release resources.
+        Pooled connections stay open for other clients and are closed on
+        application shutdown. Kept for the async context manager protocol.
 
         Example:
             ```python
@@ -997,9 +2264,7 @@ class MCPRagClient:
                 await client.close()
             ```
         """
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        logger.debug("MCPRagClient released")
 
     async def __aenter__(self) -> "MCPRagClient":
         """Async context manager entry."""
@@ -1030,19 +2295,41 @@ class MCPRagClient:
             MCPToolExecutionError: If server returns error status
         """
         client = await self._get_client()
+        if method.upper() == "POST":
+            send = lambda: client.post(endpoint, json=payload, timeout=self.timeout)
+        elif method.upper() == "GET":
+            send = lambda: client.get(endpoint, params=payload, timeout=self.timeout)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        resilience = get_server_resilience(self.base_url)
+        resilience.budget.deposit()
+        hedge_delay = (
+            resilience.hedge_delay(self.config.hedge_quantile, self.config.hedge_min_delay)
+            if self.config.hedge_requests else None
+        )
+        max_backoff = self.config.retry_delay * (
+            self.config.retry_backoff ** (self.config.max_retries - 1)
+        )
+        backoff = self.config.retry_delay
         last_error: Optional[Exception] = None
+        attempts = 0
 
         for attempt in range(self.config.max_retries):
+            attempts = attempt + 1
             try:
-                if method.upper() == "POST":
-                    response = await client.post(endpoint, json=payload)
-                elif method.upper() == "GET":
-                    response = await client.get(endpoint, params=payload)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                started = time.perf_counter()
+                with observe_attempt("mcp-rag", attempts) as observed:
+                    observed.response = response = await hedged_call(
+                        send,
+                        hedge_delay,
+                        allow_hedge=resilience.try_hedge,
+                        on_hedge_won=resilience.record_hedge_win
+                    )
 
                 response.raise_for_status()
                 result = response.json()
+                resilience.latencies.record(time.perf_counter() - started)
 
                 # Check for JSON-RPC error
                 if "error" in result:
@@ -1051,6 +2338,7 @@ class MCPRagClient:
                         error_msg = error_msg.get("message", str(error_msg))
                     raise MCPToolExecutionError(f"MCP tool error: {error_msg}")
 
+                get_health_monitor().record(self.base_url, True)
                 return result
 
             except httpx.ConnectError as e:
@@ -1077,17 +2365,32 @@ class MCPRagClient:
                 # Don't retry on MCP tool errors
                 raise
 
-            # Exponential backoff before retry
+            # Backoff with decorrelated jitter, if the retry budget allows
             if attempt < self.config.max_retries - 1:
-                delay = self.config.retry_delay * (self.config.retry_backoff ** attempt)
-                await asyncio.sleep(delay)
+                if not resilience.try_retry():
+                    logger.warning("MCP RAG retry budget exhausted, not retrying")
+                    break
+                backoff = decorrelated_jitter(self.config.retry_delay, max_backoff, backoff)
+                await asyncio.sleep(backoff)
 
         # All retries exhausted
+        get_health_monitor().record(self.base_url, False, error=str(last_error))
         raise MCPConnectionError(
-            f"Failed to connect to MCP server after {self.config.max_retries} attempts. "
+            f"Failed to connect to MCP server after {attempts} attempts. "
             f"Last error: {last_error}"
         )
 
+    def is_available(self) -> bool:
+        """Read the cached server health (no network round trip).
+
+        Backed by the background MCPHealthMonitor and the outcome of recent
+        calls; use this instead of awaiting health_check() before a call.
+
+        Returns:
+            False if the server is known to be down, True otherwise
+        """
+        return get_health_monitor().is_healthy(self.base_url)
+
     async def health_check(self) -> bool:
         """Check if MCP RAG server is available.
 
@@ -1156,7 +2459,9 @@ class MCPRagClient:
 
         This method constructs a JSON-RPC 2.0 request and sends it to the
         MCP endpoint. It includes automatic retry with exponential backoff
-        for transient failures.
+        for transient failures. Deterministic tools are served from the tool
+        result cache, and identical concurrent calls share one request (see
+        SingleFlight).
 
         Args:
             tool_name: Name of the MCP tool to call
@@ -1169,6 +2474,138 @@ class MCPRagClient:
             MCPConnectionError: If connection fails after retries
             MCPToolExecutionError: If tool execution fails
         """
+        with observe_call("mcp-rag", tool_name):
+            if self.config.cache_results:
+                return await _call_with_cache(
+                    self.base_url, tool_name, arguments,
+                    lambda: self._coalesced_call(tool_name, arguments)
+                )
+
+            return await self._coalesced_call(tool_name, arguments)
+
+    async def _coalesced_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send a tool call, sharing it with identical in-flight calls."""
+        if self.config.coalesce_requests:
+            flight = get_single_flight()
+            return await flight.do(
+                flight.key(self.base_url, tool_name, arguments),
+                lambda: self._submit_tool_call(tool_name, arguments)
+            )
+
+        return await self._submit_tool_call(tool_name, arguments)
+
+    async def _submit_tool_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send a tool call, micro-batched with concurrent calls if enabled."""
+        if self.config.batch_window <= 0:
+            return await self._send_tool_call(tool_name, arguments)
+
+        if self._batcher is None:
+            self._batcher = MicroBatcher(
+                self._send_tool_batch,
+                window=self.config.batch_window,
+                max_batch_size=self.config.max_batch_size
+            )
+        return await self._batcher.submit(tool_name, arguments)
+
+    async def call_tools_batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Call several tools in one JSON-RPC 2.0 batch request.
+
+        Cached results are served locally; the remaining calls are sent as
+        one batch array. Servers that reject batch arrays are remembered and
+        called once per tool instead.
+
+        Args:
+            calls: List of (tool_name, arguments) pairs
+
+        Returns:
+            One entry per call, in order: the tool result, or the
+            MCPToolExecutionError raised for that call
+
+        Raises:
+            MCPConnectionError: If the batch request itself fails
+
+        Example:
+            ```python
+            results = await client.call_tools_batch([
+                ("get_paragraph_by_id", {"standard_id": "K-IFRS 1115", "paragraph_no": "9"}),
+                ("get_paragraph_by_id", {"standard_id": "K-IFRS 1115", "paragraph_no": "B34"}),
+            ])
+            ```
+        """
+        cache = get_tool_cache() if self.config.cache_results else None
+        results: List[Any] = [None] * len(calls)
+        pending: List[int] = []
+
+        for index, (tool_name, arguments) in enumerate(calls):
+            cached = cache.get(self.base_url, tool_name, arguments) if cache else None
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+
+        if pending:
+            with observe_call("mcp-rag", "tools/batch"):
+                fetched = await self._send_tool_batch([calls[i] for i in pending])
+            for index, result in zip(pending, fetched):
+                results[index] = result
+                if cache is not None and not isinstance(result, Exception):
+                    tool_name, arguments = calls[index]
+                    cache.set(self.base_url, tool_name, arguments, result)
+
+        return results
+
+    async def _send_tool_batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Send tool calls as one JSON-RPC batch (a lone call as a plain request).
+
+        Returns:
+            One tool result or MCPToolExecutionError per call
+        """
+        if len(calls) == 1:
+            try:
+                return [await self._send_tool_call(*calls[0])]
+            except MCPToolExecutionError as e:
+                return [e]
+
+        if self.base_url not in _batch_unsupported:
+            try:
+                responses = await self._post_batch(_build_batch_request(calls))
+            except MCPToolExecutionError:
+                responses = None
+
+            if isinstance(responses, list):
+                return _map_batch_response("mcp-rag", calls, responses)
+
+            _batch_unsupported.add(self.base_url)
+            logger.info(
+                "[mcp-rag] JSON-RPC batches not supported, "
+                "sending calls individually"
+            )
+
+        return list(await asyncio.gather(
+            *(self._send_tool_call(tool_name, arguments) for tool_name, arguments in calls),
+            return_exceptions=True
+        ))
+
+    async def _send_tool_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send one tools/call request (no coalescing)."""
         request = {
             "jsonrpc": "2.0",
             "id": 1,
@@ -1182,6 +2619,10 @@ class MCPRagClient:
         result = await self._execute_with_retry("POST", self.mcp_endpoint, request)
         return result.get("result", {})
 
+    async def _post_batch(self, payload: List[Dict[str, Any]]) -> Any:
+        """POST a JSON-RPC batch array and return the parsed response."""
+        return await self._execute_with_retry("POST", self.mcp_endpoint, payload)
+
     async def search_standards(
         self,
         query_text: str,
@@ -1362,12 +2803,19 @@ class MCPExcelClientConfig:
         max_retries: Maximum retry attempts for failed requests (default: 3)
         retry_delay: Initial delay between retries in seconds (default: 1.0)
         retry_backoff: Exponential backoff multiplier (default: 2.0)
+        coalesce_requests: Share one request among identical concurrent
+            tool calls (default: True)
+        page_size: Transactions per page in iter_excel_pages (default: 5000)
+        prefetch_pages: Pages fetched ahead of the consumer (default: 1)
     """
     base_url: str = "http://localhost:8003"
     timeout: float = 60.0
     max_retries: int = 3
     retry_delay: float = 1.0
     retry_backoff: float = 2.0
+    coalesce_requests: bool = True
+    page_size: int = 5000
+    prefetch_pages: int = 1
 
 
 class MCPExcelClientError(Exception):
@@ -1389,7 +2837,8 @@ class MCPExcelClient:
     """MCP Excel Processor Client for financial data extraction.
 
     This client provides access to the MCP Excel Processor server for:
-    - Parsing Excel files (trial balance, financial statements)
+    - Parsing Excel files (trial balance, financial statements), whole or
+      page by page for large ledgers (iter_excel_pages)
     - Extracting transaction data with validation
     - Detecting anomalies in financial data
     - Supporting multiple Excel formats (.xlsx, .xls)
@@ -1438,25 +2887,18 @@ class MCPExcelClient:
         self.timeout = self.config.timeout
         self.mcp_endpoint = f"{self.base_url}/mcp"
         self.health_endpoint = f"{self.base_url}/health"
-        self._client: Optional[httpx.AsyncClient] = None
+
+        get_health_monitor().watch("mcp-excel-processor", self.base_url)
 
         logger.info(f"MCPExcelClient initialized with server: {self.base_url}")
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=httpx.Timeout(self.timeout),
-                headers={"Content-Type": "application/json"}
-            )
-        return self._client
+        """Borrow the shared pooled HTTP client for this server."""
+        return get_mcp_transport().client_for(self.base_url)
 
     async def close(self) -> None:
-        """Close the HTTP client connection."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Release the client (pooled connections stay open for reuse)."""
+        logger.debug("MCPExcelClient released")
 
     async def __aenter__(self) -> "MCPExcelClient":
         """Async context manager entry."""
@@ -1474,16 +2916,30 @@ class MCPExcelClient:
     ) -> Dict[str, Any]:
         """Execute HTTP request with retry logic."""
         client = await self._get_client()
+        resilience = get_server_resilience(self.base_url)
+        resilience.budget.deposit()
+        max_backoff = self.config.retry_delay * (
+            self.config.retry_backoff ** (self.config.max_retries - 1)
+        )
+        backoff = self.config.retry_delay
         last_error: Optional[Exception] = None
+        attempts = 0
 
         for attempt in range(self.config.max_retries):
+            attempts = attempt + 1
             try:
-                if method.upper() == "POST":
-                    response = await client.post(endpoint, json=payload)
-                elif method.upper() == "GET":
-                    response = await client.get(endpoint, params=payload)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                with observe_attempt("mcp-excel-processor", attempts) as observed:
+                    if method.upper() == "POST":
+                        response = await client.post(
+                            endpoint, json=payload, timeout=self.timeout
+                        )
+                    elif method.upper() == "GET":
+                        response = await client.get(
+                            endpoint, params=payload, timeout=self.timeout
+                        )
+                    else:
+                        raise ValueError(f"Unsupported HTTP method: {method}")
+                    observed.response = response
 
                 response.raise_for_status()
                 result = response.json()
@@ -1494,6 +2950,7 @@ class MCPExcelClient:
                         error_msg = error_msg.get("message", str(error_msg))
                     raise MCPExcelParseError(f"MCP Excel error: {error_msg}")
 
+                get_health_monitor().record(self.base_url, True)
                 return result
 
             except httpx.ConnectError as e:
@@ -1518,14 +2975,29 @@ class MCPExcelClient:
                 raise
 
             if attempt < self.config.max_retries - 1:
-                delay = self.config.retry_delay * (self.config.retry_backoff ** attempt)
-                await asyncio.sleep(delay)
+                if not resilience.try_retry():
+                    logger.warning(f"Retry budget exhausted for {self.base_url}, not retrying")
+                    break
+                backoff = decorrelated_jitter(self.config.retry_delay, max_backoff, backoff)
+                await asyncio.sleep(backoff)
 
+        get_health_monitor().record(self.base_url, False, error=str(last_error))
         raise MCPExcelConnectionError(
-            f"Failed to connect to MCP Excel server after {self.config.max_retries} "
+            f"Failed to connect to MCP Excel server after {attempts} "
             f"attempts. Last error: {last_error}"
         )
 
+    def is_available(self) -> bool:
+        """Read the cached server health (no network round trip).
+
+        Backed by the background MCPHealthMonitor and the outcome of recent
+        calls; use this instead of awaiting health_check() before a call.
+
+        Returns:
+            False if the server is known to be down, True otherwise
+        """
+        return get_health_monitor().is_healthy(self.base_url)
+
     async def health_check(self) -> bool:
         """Check if MCP Excel server is available."""
         try:
@@ -1542,6 +3014,22 @@ class MCPExcelClient:
         arguments: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Call an MCP tool via JSON-RPC protocol."""
+        with observe_call("mcp-excel-processor", tool_name):
+            if self.config.coalesce_requests:
+                flight = get_single_flight()
+                return await flight.do(
+                    flight.key(self.base_url, tool_name, arguments),
+                    lambda: self._send_tool_call(tool_name, arguments)
+                )
+
+            return await self._send_tool_call(tool_name, arguments)
+
+    async def _send_tool_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send one tools/call request (no coalescing)."""
         request = {
             "jsonrpc": "2.0",
             "id": 1,
@@ -1645,6 +3133,124 @@ class MCPExcelClient:
 
         return await self._call_tool("parse_excel", arguments)
 
+    async def iter_excel_pages(
+        self,
+        file_path: Optional[str] = None,
+        file_url: Optional[str] = None,
+        sheet_name: Optional[str] = None,
+        category: str = "General",
+        validate_data: bool = True,
+        detect_anomalies: bool = True,
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parse an Excel file page by page, yielding transaction batches.
+
+        Sends cursor-paged ``parse_excel`` calls (``page_size`` and
+        ``cursor`` arguments) and yields each page as it arrives, fetching
+        up to ``config.prefetch_pages`` pages ahead of the consumer. Only
+        those pages are held in memory. Fold them with
+        ``mcp_excel_stream.ExcelParseAggregator`` to get the summary that
+        parse_excel() returns.
+
+        Servers without paging (no "next_cursor" in the result) answer with
+        the full result, which is then yielded in page_size slices.
+
+        Args:
+            file_path: Local path to Excel file
+            file_url: URL to download Excel file (e.g., Supabase Storage URL)
+            sheet_name: Specific sheet to parse (default: first sheet)
+            category: Account category for context (Sales, Inventory, AR, etc.)
+            validate_data: Perform data validation checks (default: True)
+            detect_anomalies: Run anomaly detection (default: True)
+            page_size: Transactions per page (default: config.page_size)
+
+        Yields:
+            Page dicts with "transactions", "anomalies" (for the page),
+            "metadata" and the other parse_excel data fields the server sent
+
+        Raises:
+            MCPExcelParseError: If parsing fails
+            MCPExcelConnectionError: If server is unavailable
+
+        Example:
+            ```python
+            async for page in client.iter_excel_pages(file_path="ledger.xlsx"):
+                await vouch(page["transactions"])
+            ```
+        """
+        if not file_path and not file_url:
+            raise ValueError("Either file_path or file_url must be provided")
+
+        page_size = page_size or self.config.page_size
+        arguments: Dict[str, Any] = {
+            "category": category,
+            "validate_data": validate_data,
+            "detect_anomalies": detect_anomalies,
+            "page_size": page_size
+        }
+        if file_path:
+            arguments["file_path"] = file_path
+        if file_url:
+            arguments["file_url"] = file_url
+        if sheet_name:
+            arguments["sheet_name"] = sheet_name
+
+        logger.info(
+            f"iter_excel_pages: file={file_path or file_url}, "
+            f"category={category}, page_size={page_size}"
+        )
+
+        # Bounded queue: the producer runs at most prefetch_pages ahead
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.config.prefetch_pages))
+        done = object()
+
+        async def produce() -> None:
+            cursor: Optional[str] = None
+            try:
+                while True:
+                    page_arguments = dict(arguments, cursor=cursor) if cursor else arguments
+                    # Pages are read once, so they bypass single-flight coalescing
+                    with observe_call("mcp-excel-processor", "parse_excel"):
+                        result = await self._send_tool_call("parse_excel", page_arguments)
+                    if result.get("status", "success") != "success":
+                        raise MCPExcelParseError(
+                            f"parse_excel failed: {result.get('message', 'Unknown error')}"
+                        )
+
+                    data = result.get("data", {})
+                    metadata = result.get("metadata", {})
+                    if "next_cursor" not in data:
+                        # Server without paging: slice the full result
+                        transactions = data.get("transactions", [])
+                        for start in range(0, max(len(transactions), 1), page_size):
+                            page = dict(data, transactions=transactions[start:start + page_size])
+                            page["anomalies"] = data.get("anomalies", []) if start == 0 else []
+                            page["metadata"] = metadata if start == 0 else {}
+                            await queue.put(page)
+                        break
+
+                    cursor = data.get("next_cursor")
+                    await queue.put(dict(data, metadata=metadata))
+                    if not cursor:
+                        break
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(done)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+
     async def extract_trial_balance(
         self,
         file_path: Optional[str] = None,
@@ -1718,6 +3324,9 @@ class MCPDocumentClientConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     retry_backoff: float = 2.0
+    # Generation has side effects (creates files), so identical concurrent
+    # calls are not coalesced unless explicitly enabled
+    coalesce_requests: bool = False
 
 
 class MCPDocumentClientError(Exception):
@@ -1777,25 +3386,18 @@ class MCPDocumentClient:
         self.timeout = self.config.timeout
         self.mcp_endpoint = f"{self.base_url}/mcp"
         self.health_endpoint = f"{self.base_url}/health"
-        self._client: Optional[httpx.AsyncClient] = None
+
+        get_health_monitor().watch("mcp-document", self.base_url)
 
         logger.info(f"MCPDocumentClient initialized with server: {self.base_url}")
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=httpx.Timeout(self.timeout),
-                headers={"Content-Type": "application/json"}
-            )
-        return self._client
+        """Borrow the shared pooled HTTP client for this server."""
+        return get_mcp_transport().client_for(self.base_url)
 
     async def close(self) -> None:
-        """Close the HTTP client connection."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Release the client (pooled connections stay open for reuse)."""
+        logger.debug("MCPDocumentClient released")
 
     async def __aenter__(self) -> "MCPDocumentClient":
         """Async context manager entry."""
@@ -1813,14 +3415,26 @@ class MCPDocumentClient:
     ) -> Dict[str, Any]:
         """Execute HTTP request with retry logic."""
         client = await self._get_client()
+        resilience = get_server_resilience(self.base_url)
+        resilience.budget.deposit()
+        max_backoff = self.config.retry_delay * (
+            self.config.retry_backoff ** (self.config.max_retries - 1)
+        )
+        backoff = self.config.retry_delay
         last_error: Optional[Exception] = None
+        attempts = 0
 
         for attempt in range(self.config.max_retries):
+            attempts = attempt + 1
             try:
-                if method.upper() == "POST":
-                    response = await client.post(endpoint, json=payload)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                with observe_attempt("mcp-document", attempts) as observed:
+                    if method.upper() == "POST":
+                        response = await client.post(
+                            endpoint, json=payload, timeout=self.timeout
+                        )
+                    else:
+                        raise ValueError(f"Unsupported HTTP method: {method}")
+                    observed.response = response
 
                 response.raise_for_status()
                 result = response.json()
@@ -1831,6 +3445,7 @@ class MCPDocumentClient:
                         error_msg = error_msg.get("message", str(error_msg))
                     raise MCPDocumentGenerationError(f"MCP Document error: {error_msg}")
 
+                get_health_monitor().record(self.base_url, True)
                 return result
 
             except httpx.ConnectError as e:
@@ -1855,14 +3470,29 @@ class MCPDocumentClient:
                 raise
 
             if attempt < self.config.max_retries - 1:
-                delay = self.config.retry_delay * (self.config.retry_backoff ** attempt)
-                await asyncio.sleep(delay)
+                if not resilience.try_retry():
+                    logger.warning(f"Retry budget exhausted for {self.base_url}, not retrying")
+                    break
+                backoff = decorrelated_jitter(self.config.retry_delay, max_backoff, backoff)
+                await asyncio.sleep(backoff)
 
+        get_health_monitor().record(self.base_url, False, error=str(last_error))
         raise MCPDocumentConnectionError(
-            f"Failed to connect to MCP Document server after {self.config.max_retries} "
+            f"Failed to connect to MCP Document server after {attempts} "
             f"attempts. Last error: {last_error}"
         )
 
+    def is_available(self) -> bool:
+        """Read the cached server health (no network round trip).
+
+        Backed by the background MCPHealthMonitor and the outcome of recent
+        calls; use this instead of awaiting health_check() before a call.
+
+        Returns:
+            False if the server is known to be down, True otherwise
+        """
+        return get_health_monitor().is_healthy(self.base_url)
+
     async def health_check(self) -> bool:
         """Check if MCP Document server is available."""
         try:
@@ -1879,6 +3509,22 @@ class MCPDocumentClient:
         arguments: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Call an MCP tool via JSON-RPC protocol."""
+        with observe_call("mcp-document", tool_name):
+            if self.config.coalesce_requests:
+                flight = get_single_flight()
+                return await flight.do(
+                    flight.key(self.base_url, tool_name, arguments),
+                    lambda: self._send_tool_call(tool_name, arguments)
+                )
+
+            return await self._send_tool_call(tool_name, arguments)
+
+    async def _send_tool_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send one tools/call request (no coalescing)."""
         request = {
             "jsonrpc": "2.0",
             "id": 1,
@@ -2096,10 +3742,21 @@ __all__ = [
     "MCPServerType",
     "MCP_SERVER_CONFIG",
     "get_server_url",
+    "get_concurrency_settings",
     # Circuit breaker
     "CircuitBreaker",
     "CircuitState",
     "CircuitBreakerOpen",
+    # Health monitoring
+    "MCPHealthMonitor",
+    "ServerHealth",
+    "get_health_monitor",
+    # Request coalescing
+    "SingleFlight",
+    "CoalescingStats",
+    "get_single_flight",
+    # JSON-RPC batching
+    "MicroBatcher",
     # Error reporting
     "MCPError",
     # Base client and registry
@@ -0,0 +1,308 @@
+"""Adaptive Concurrency Limits for MCP Servers
+
+This module bounds how many requests may be in flight against one MCP server
+at a time. Excess calls wait in a FIFO queue instead of piling onto a slow
+server (e.g. 120s OCR on mcp-vision) until it times out and trips the
+CircuitBreaker. The limit adapts to the server: it grows additively while
+latency stays near the observed baseline and shrinks multiplicatively on
+errors, overload responses (429/5xx) or latency spikes (AIMD).
+
+Key Features:
+    - Per-server limiter with FIFO queueing of excess calls
+    - AIMD adjustment from observed latency and errors
+    - Per-server settings via ``MCP_SERVER_CONFIG[...]["concurrency"]``
+    - Metrics: current limit, in-flight calls, queue depth, adjustments
+
+Key Classes:
+    - ConcurrencySettings: Limit bounds and AIMD parameters
+    - AdaptiveConcurrencyLimiter: The limiter used by the MCP transport
+
+Usage:
+    ```python
+    limiter = AdaptiveConcurrencyLimiter("mcp-vision", ConcurrencySettings(initial_limit=2))
+
+    started = await limiter.acquire()
+    try:
+        response = await send()
+        limiter.release(started, overloaded=response.status_code >= 500)
+    except Exception:
+        limiter.release(started, overloaded=True)
+        raise
+    ```
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConcurrencySettings:
+    """Limit bounds and AIMD parameters for one server.
+
+    Attributes:
+        initial_limit: Concurrent requests allowed before any feedback
+        min_limit: Lower bound of the limit
+        max_limit: Upper bound of the limit
+        backoff: Multiplier applied on overload (multiplicative decrease)
+        latency_tolerance: Latency above baseline * tolerance counts as overload
+        queue_timeout: Max seconds a call may wait for a slot (None: no limit)
+    """
+    initial_limit: int = 8
+    min_limit: int = 1
+    max_limit: int = 32
+    backoff: float = 0.75
+    latency_tolerance: float = 3.0
+    queue_timeout: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "ConcurrencySettings":
+        """Build settings from a ``"concurrency"`` config dict.
+
+        Args:
+            config: Dict with optional keys initial, min, max, backoff,
+                latency_tolerance and queue_timeout
+
+        Returns:
+            ConcurrencySettings with defaults for missing keys
+        """
+        config = config or {}
+        defaults = cls()
+        return cls(
+            initial_limit=config.get("initial", defaults.initial_limit),
+            min_limit=config.get("min", defaults.min_limit),
+            max_limit=config.get("max", defaults.max_limit),
+            backoff=config.get("backoff", defaults.backoff),
+            latency_tolerance=config.get("latency_tolerance", defaults.latency_tolerance),
+            queue_timeout=config.get("queue_timeout", defaults.queue_timeout),
+        )
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter with a FIFO wait queue.
+
+    Every successful request that finishes within ``latency_tolerance`` times
+    the baseline latency raises the limit by ``1 / limit`` (about +1 per
+    round of requests). An error, overload response or slow request
+    multiplies it by ``backoff``, at most once per round: only requests
+    started after the previous decrease can trigger the next one.
+
+    The baseline is an exponential moving average of successful request
+    latencies, so only spikes well above the server's usual response time
+    count as overload.
+
+    Attributes:
+        name: Server name for logs and metrics
+        settings: Limit bounds and AIMD parameters
+        limit: Current (fractional) concurrency limit
+        in_flight: Requests currently holding a slot
+
+    Example:
+        ```python
+        limiter = AdaptiveConcurrencyLimiter("mcp-rag", ConcurrencySettings(max_limit=64))
+        print(limiter.stats()["limit"], limiter.stats()["queue_depth"])
+        ```
+    """
+
+    # Weight of a new sample in the baseline latency average
+    BASELINE_WEIGHT = 0.05
+
+    def __init__(self, name: str, settings: Optional[ConcurrencySettings] = None):
+        """Initialize the limiter.
+
+        Args:
+            name: Server name for logs and metrics
+            settings: Limit bounds and AIMD parameters (default: ConcurrencySettings())
+        """
+        self.name = name
+        self.settings = settings or ConcurrencySettings()
+        self.limit = float(min(
+            max(self.settings.initial_limit, self.settings.min_limit),
+            self.settings.max_limit
+        ))
+        self.in_flight = 0
+        self.baseline_latency: Optional[float] = None
+
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self.acquired_total = 0
+        self.queued_total = 0
+        self.queue_timeouts = 0
+        self.peak_queue_depth = 0
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a slot."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def acquire(self) -> float:
+        """Wait for a slot.
+
+        Returns:
+            Start timestamp to pass to release()
+
+        Raises:
+            asyncio.TimeoutError: If queue_timeout elapsed while waiting
+        """
+        self.acquired_total += 1
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return time.monotonic()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued_total += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+
+        try:
+            await asyncio.wait_for(waiter, self.settings.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as we gave up: pass it on
+                self.in_flight -= 1
+                self._wake()
+            if isinstance(e, asyncio.TimeoutError):
+                self.queue_timeouts += 1
+            raise
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+        return time.monotonic()
+
+    def record(self, started: float, overloaded: bool = False) -> None:
+        """Adjust the limit from a request outcome (the slot stays held).
+
+        Args:
+            started: Timestamp returned by acquire()
+            overloaded: True for errors and overload responses (429/5xx)
+        """
+        self._adjust(started, time.monotonic() - started, overloaded)
+
+    def release(self, started: float, overloaded: bool = False) -> None:
+        """Adjust the limit from a request outcome and return its slot.
+
+        Args:
+            started: Timestamp returned by acquire()
+            overloaded: True for errors and overload responses (429/5xx)
+        """
+        self.record(started, overloaded)
+        self.discard()
+
+    def discard(self) -> None:
+        """Return a slot without feedback (e.g. a cancelled request)."""
+        self.in_flight -= 1
+        self._wake()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get limiter metrics.
+
+        Returns:
+            Dict with limit, in_flight, queue_depth, peak_queue_depth,
+            min_limit, max_limit, baseline_latency_ms, acquired_total,
+            queued_total, queue_timeouts, increases and decreases
+        """
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "min_limit": self.settings.min_limit,
+            "max_limit": self.settings.max_limit,
+            "baseline_latency_ms": (
+                round(self.baseline_latency * 1000, 2)
+                if self.baseline_latency is not None else None
+            ),
+            "acquired_total": self.acquired_total,
+            "queued_total": self.queued_total,
+            "queue_timeouts": self.queue_timeouts,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+    def _adjust(self, started: float, latency: float, overloaded: bool) -> None:
+        baseline = self.baseline_latency
+        if not overloaded:
+            self.baseline_latency = latency if baseline is None else (
+                baseline + (latency - baseline) * self.BASELINE_WEIGHT
+            )
+
+        slow = baseline is not None and latency > baseline * self.settings.latency_tolerance
+        if overloaded or slow:
+            if started < self._last_decrease:
+                return  # Already backed off for this round of requests
+            new_limit = max(self.settings.min_limit, self.limit * self.settings.backoff)
+            if new_limit < self.limit:
+                self.decreases += 1
+                logger.info(
+                    f"[{self.name}] Concurrency limit {int(self.limit)} -> {int(new_limit)} "
+                    f"({'error' if overloaded else f'latency {latency * 1000:.0f}ms'})"
+                )
+            self.limit = new_limit
+            self._last_decrease = time.monotonic()
+        elif self.limit < self.settings.max_limit:
+            before = int(self.limit)
+            self.limit = min(self.settings.max_limit, self.limit + 1.0 / self.limit)
+            if int(self.limit) > before:
+                self.increases += 1
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+# ============================================================================
+# SERVER SETTINGS RESOLUTION
+# ============================================================================
+
+# Maps a server origin to its settings; installed by src.services.mcp_client
+# so limits follow MCP_SERVER_CONFIG without importing it here.
+_settings_resolver: Optional[Callable[[str], Optional[ConcurrencySettings]]] = None
+
+
+def set_settings_resolver(
+    resolver: Optional[Callable[[str], Optional[ConcurrencySettings]]]
+) -> None:
+    """Install the function resolving a server origin to its settings.
+
+    Args:
+        resolver: Callable returning settings for an origin, or None for defaults
+    """
+    global _settings_resolver
+    _settings_resolver = resolver
+
+
+def resolve_settings(origin: str) -> ConcurrencySettings:
+    """Get the concurrency settings for a server origin.
+
+    Args:
+        origin: Server origin (scheme://host:port)
+
+    Returns:
+        Configured settings, or ConcurrencySettings() defaults
+    """
+    if _settings_resolver is not None:
+        settings = _settings_resolver(origin)
+        if settings is not None:
+            return settings
+    return ConcurrencySettings()
+
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencySettings",
+    "resolve_settings",
+    "set_settings_resolver",
+]
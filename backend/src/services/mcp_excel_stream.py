@@ -0,0 +1,223 @@
+"""Incremental Aggregation of Paged Excel Parse Results
+
+``MCPExcelClient.iter_excel_pages`` fetches large parse results from
+mcp-excel-processor page by page (cursor-based ``parse_excel`` calls). This
+module folds those pages into the same summary that a single ``parse_excel``
+call returns, without keeping the transactions in memory, so a 500k-row
+ledger costs one page of memory instead of the whole result.
+
+Key Features:
+    - Running count, total, min/max, mean and standard deviation (Welford)
+    - Period from the earliest and latest transaction dates
+    - Bounded sample of transactions and of anomalies (full anomaly count kept)
+    - Snapshots after every page, so consumers can start before parsing ends
+    - Server totals (total_amount, transaction_count, period, summary) used
+      as-is for unpaged results instead of being recomputed from the rows
+
+Key Classes:
+    - ExcelParseAggregator: Folds transaction pages into parse summary data
+
+Usage:
+    ```python
+    from src.services.mcp_client import MCPExcelClient
+    from src.services.mcp_excel_stream import ExcelParseAggregator
+
+    aggregator = ExcelParseAggregator(category="Sales")
+    async for page in MCPExcelClient().iter_excel_pages(file_path="ledger.xlsx"):
+        aggregator.add_page(page)
+
+    data = aggregator.result()  # same shape as parse_excel()["data"]
+    ```
+"""
+
+import logging
+import math
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExcelParseAggregator:
+    """Folds pages of parsed transactions into parse summary data.
+
+    Memory use is bounded by ``sample_size`` and ``max_anomalies`` however
+    many transactions are added.
+
+    Attributes:
+        category: Account category of the parsed file
+        transaction_count: Transactions added so far
+        total_amount: Sum of transaction amounts
+        anomaly_count: Anomalies reported so far (including dropped ones)
+        pages: Pages added so far
+
+    Example:
+        ```python
+        aggregator = ExcelParseAggregator("Sales", sample_size=3)
+        aggregator.add_transactions([{"date": "2024-01-15", "amount": 100.0}])
+        aggregator.result()["summary"]["avg_amount"]  # 100.0
+        ```
+    """
+
+    # Share of anomalous transactions above which data quality is POOR
+    POOR_QUALITY_RATIO = 0.05
+
+    # Whole-file fields of an unpaged parse_excel result
+    SERVER_TOTALS = ("total_amount", "transaction_count", "period", "summary")
+
+    def __init__(self, category: str = "General", sample_size: int = 3, max_anomalies: int = 100):
+        """Initialize an empty aggregate.
+
+        Args:
+            category: Account category of the parsed file
+            sample_size: Number of leading transactions kept as samples
+            max_anomalies: Number of anomalies kept (later ones are only counted)
+        """
+        self.category = category
+        self.sample_size = sample_size
+        self.max_anomalies = max_anomalies
+
+        self.transaction_count = 0
+        self.total_amount = 0.0
+        self.anomaly_count = 0
+        self.pages = 0
+        self.metadata: Dict[str, Any] = {}
+
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._first_date: Optional[str] = None
+        self._last_date: Optional[str] = None
+        self._samples: List[Dict[str, Any]] = []
+        self._anomalies: List[Dict[str, Any]] = []
+        self._data_quality: Optional[str] = None
+        self._server_totals: Dict[str, Any] = {}
+
+    def add_transactions(self, transactions: List[Dict[str, Any]]) -> None:
+        """Fold transactions into the running statistics.
+
+        Args:
+            transactions: Transactions with "amount" and optional "date"
+        """
+        for txn in transactions:
+            if len(self._samples) < self.sample_size:
+                self._samples.append(txn)
+
+            try:
+                amount = float(txn.get("amount", 0) or 0)
+            except (TypeError, ValueError):
+                amount = 0.0
+
+            self.transaction_count += 1
+            self.total_amount += amount
+            self._min = amount if self._min is None else min(self._min, amount)
+            self._max = amount if self._max is None else max(self._max, amount)
+            delta = amount - self._mean
+            self._mean += delta / self.transaction_count
+            self._m2 += delta * (amount - self._mean)
+
+            date = txn.get("date")
+            if date:
+                date = str(date)
+                if self._first_date is None or date < self._first_date:
+                    self._first_date = date
+                if self._last_date is None or date > self._last_date:
+                    self._last_date = date
+
+    def add_anomalies(self, anomalies: List[Dict[str, Any]]) -> None:
+        """Count anomalies, keeping the first max_anomalies of them.
+
+        Args:
+            anomalies: Anomalies reported for a page
+        """
+        self.anomaly_count += len(anomalies)
+        room = self.max_anomalies - len(self._anomalies)
+        if room > 0:
+            self._anomalies.extend(anomalies[:room])
+
+    def add_page(self, page: Dict[str, Any]) -> None:
+        """Fold one page yielded by MCPExcelClient.iter_excel_pages.
+
+        Pages without "next_cursor" are slices of an unpaged result; their
+        server-computed totals describe the whole file and take precedence
+        over the running statistics in result().
+
+        Args:
+            page: Page data with "transactions", "anomalies", optional
+                "data_quality", "metadata" and (unpaged) server totals
+        """
+        if "next_cursor" not in page:
+            for key in self.SERVER_TOTALS:
+                if page.get(key) is not None:
+                    self._server_totals[key] = page[key]
+
+        self.pages += 1
+        self.add_transactions(page.get("transactions", []))
+        self.add_anomalies(page.get("anomalies", []))
+        if page.get("data_quality"):
+            self._data_quality = page["data_quality"]
+        if page.get("metadata"):
+            self.metadata.update(page["metadata"])
+
+    @property
+    def data_quality(self) -> str:
+        """Server-reported quality, or one derived from the anomaly ratio."""
+        if self._data_quality:
+            return self._data_quality
+        if self.anomaly_count == 0:
+            return "GOOD"
+        if self.anomaly_count <= self.transaction_count * self.POOR_QUALITY_RATIO:
+            return "WARNING"
+        return "POOR"
+
+    def summary(self) -> Dict[str, float]:
+        """Get amount statistics.
+
+        Returns:
+            Dict with min_amount, max_amount, avg_amount and std_dev
+        """
+        if self.transaction_count == 0:
+            return {"min_amount": 0.0, "max_amount": 0.0, "avg_amount": 0.0, "std_dev": 0.0}
+        return {
+            "min_amount": self._min,
+            "max_amount": self._max,
+            "avg_amount": self._mean,
+            "std_dev": math.sqrt(self._m2 / self.transaction_count),
+        }
+
+    def result(self) -> Dict[str, Any]:
+        """Build the aggregate in the shape of parse_excel()["data"].
+
+        Only the sampled transactions are included under "transactions".
+        Server totals of an unpaged result replace the running statistics.
+
+        Returns:
+            Dict with category, total_amount, transaction_count, period,
+            transactions, summary, data_quality, anomalies, anomaly_count,
+            pages and parsed_at
+        """
+        period = (
+            f"{self._first_date} to {self._last_date}"
+            if self._first_date else "Unknown"
+        )
+        result = {
+            "category": self.category,
+            "total_amount": self.total_amount,
+            "transaction_count": self.transaction_count,
+            "period": period,
+            "transactions": list(self._samples),
+            "summary": self.summary(),
+            "data_quality": self.data_quality,
+            "anomalies": list(self._anomalies),
+            "anomaly_count": self.anomaly_count,
+            "pages": self.pages,
+            "parsed_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        result.update(self._server_totals)
+        return result
+
+
+__all__ = [
+    "ExcelParseAggregator",
+]
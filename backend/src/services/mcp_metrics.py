@@ -0,0 +1,485 @@
+"""Latency Histograms and Tracing for MCP Calls
+
+This module instruments the MCP client layer: every tool call is timed into
+HDR-style latency histograms per server and tool, and traced with
+OpenTelemetry spans when the ``opentelemetry`` package is installed (spans
+are exported only if an SDK/exporter is configured by the application).
+
+Key Features:
+    - Log-linear (HDR-style) histograms with bounded relative error and
+      constant memory per server/tool
+    - Call spans (server, tool, cache hit, coalesced) with one child span
+      per HTTP attempt (attempt number, status, request/response bytes)
+    - Per-server and per-tool counters: calls, errors, cache hits,
+      coalesced calls, attempts and bytes
+    - Prometheus text exposition for the ``/api/metrics`` endpoint
+
+Key Classes:
+    - LatencyHistogram: HDR-style latency histogram with percentiles
+    - MCPMetrics: Histograms and counters per server and tool
+    - CallObservation: Flags of the call in progress (via contextvar)
+
+Usage:
+    ```python
+    from src.services.mcp_metrics import observe_call, observe_attempt
+
+    with observe_call("mcp-rag", "search_standards"):
+        with observe_attempt("mcp-rag", 1) as attempt:
+            response = await client.post(url, json=request)
+            attempt.response = response
+
+    get_mcp_metrics().snapshot()["mcp-rag"]["p99_ms"]
+    ```
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # Tracing is optional
+    otel_trace = None
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# HISTOGRAM
+# ============================================================================
+
+class LatencyHistogram:
+    """HDR-style latency histogram.
+
+    Values are recorded in microseconds into log-linear buckets: exact below
+    ``2 ** sub_bucket_bits`` µs, then ``2 ** (sub_bucket_bits - 1)`` buckets
+    per power of two, so every percentile is within
+    ``2 ** -(sub_bucket_bits - 1)`` relative error (under 1% by default)
+    and memory grows only with the number of distinct buckets hit.
+
+    Example:
+        ```python
+        histogram = LatencyHistogram()
+        histogram.record(0.012)
+        histogram.percentile(0.99)  # ~0.012 seconds
+        ```
+    """
+
+    def __init__(self, sub_bucket_bits: int = 8):
+        """Initialize an empty histogram.
+
+        Args:
+            sub_bucket_bits: Precision; 8 gives < 0.8% relative error
+        """
+        self._sub_bits = sub_bucket_bits
+        self._sub_count = 1 << sub_bucket_bits
+        self._half = self._sub_count // 2
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, seconds: float) -> None:
+        """Record a latency sample.
+
+        Args:
+            seconds: Latency in seconds
+        """
+        seconds = max(0.0, seconds)
+        index = self._index(int(seconds * 1_000_000))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency at quantile q.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Latency in seconds (bucket midpoint, clamped to min/max), or
+            None if empty
+        """
+        if not self.count:
+            return None
+
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                low, high = self._bounds(index)
+                value = (low + high) / 2 / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean latency in seconds, or None if empty."""
+        return self.total / self.count if self.count else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarize the histogram in milliseconds.
+
+        Returns:
+            Dict with count, mean_ms, min_ms, p50_ms, p90_ms, p99_ms,
+            p999_ms and max_ms
+        """
+        def ms(value: Optional[float]) -> Optional[float]:
+            return round(value * 1000, 3) if value is not None else None
+
+        return {
+            "count": self.count,
+            "mean_ms": ms(self.mean),
+            "min_ms": ms(self.min),
+            "p50_ms": ms(self.percentile(0.5)),
+            "p90_ms": ms(self.percentile(0.9)),
+            "p99_ms": ms(self.percentile(0.99)),
+            "p999_ms": ms(self.percentile(0.999)),
+            "max_ms": ms(self.max),
+        }
+
+    def _index(self, micros: int) -> int:
+        if micros < self._sub_count:
+            return micros
+        shift = micros.bit_length() - self._sub_bits
+        return shift * self._half + (micros >> shift)
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        if index < self._sub_count:
+            return index, index
+        shift = index // self._half - 1
+        mantissa = index - shift * self._half
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+# ============================================================================
+# METRICS REGISTRY
+# ============================================================================
+
+@dataclass
+class _CallStats:
+    """Histogram and counters of one server or (server, tool) pair."""
+    histogram: LatencyHistogram
+    calls: int = 0
+    errors: int = 0
+    cancelled: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    attempts: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = self.histogram.snapshot()
+        data.update(
+            calls=self.calls,
+            errors=self.errors,
+            cancelled=self.cancelled,
+            cache_hits=self.cache_hits,
+            coalesced=self.coalesced,
+            attempts=self.attempts,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+        )
+        return data
+
+
+class MCPMetrics:
+    """Latency histograms and counters per MCP server and tool.
+
+    Example:
+        ```python
+        metrics = get_mcp_metrics()
+        metrics.snapshot()["mcp-rag"]["tools"]["search_standards"]["p99_ms"]
+        print(metrics.render_prometheus())
+        ```
+    """
+
+    def __init__(self):
+        """Initialize with no recorded calls."""
+        self._servers: Dict[str, _CallStats] = {}
+        self._tools: Dict[Tuple[str, str], _CallStats] = {}
+
+    def record_call(self, observation: "CallObservation", seconds: float, outcome: str) -> None:
+        """Record a finished tool call.
+
+        Args:
+            observation: Flags and byte counts of the call
+            seconds: Call latency
+            outcome: "ok", "error" or "cancelled"
+        """
+        key = (observation.server, observation.tool)
+        for stats in (
+            self._servers.setdefault(observation.server, _CallStats(LatencyHistogram())),
+            self._tools.setdefault(key, _CallStats(LatencyHistogram())),
+        ):
+            stats.calls += 1
+            if outcome == "cancelled":
+                stats.cancelled += 1
+                continue
+            stats.histogram.record(seconds)
+            stats.errors += outcome == "error"
+            stats.cache_hits += observation.cache_hit
+            stats.coalesced += observation.coalesced
+            stats.attempts += observation.attempts
+            stats.request_bytes += observation.request_bytes
+            stats.response_bytes += observation.response_bytes
+
+    def server_snapshot(self, server: str) -> Dict[str, Any]:
+        """Get latency and counters of one server and its tools.
+
+        Args:
+            server: Server name (e.g. "mcp-rag")
+
+        Returns:
+            Server snapshot with a "tools" dict, or {} if never called
+        """
+        stats = self._servers.get(server)
+        if stats is None:
+            return {}
+        data = stats.snapshot()
+        data["tools"] = {
+            tool: tool_stats.snapshot()
+            for (name, tool), tool_stats in sorted(self._tools.items())
+            if name == server
+        }
+        return data
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get latency and counters of every server, keyed by server name."""
+        return {server: self.server_snapshot(server) for server in sorted(self._servers)}
+
+    def render_prometheus(self) -> str:
+        """Render metrics in the Prometheus text exposition format.
+
+        Latencies are exported as summaries (quantiles 0.5/0.9/0.99/0.999)
+        per server and tool.
+
+        Returns:
+            Exposition text
+        """
+        lines: List[str] = [
+            "# HELP mcp_call_duration_seconds MCP tool call latency",
+            "# TYPE mcp_call_duration_seconds summary",
+        ]
+        for (server, tool), stats in sorted(self._tools.items()):
+            labels = f'server="{_escape(server)}",tool="{_escape(tool)}"'
+            for q in (0.5, 0.9, 0.99, 0.999):
+                value = stats.histogram.percentile(q)
+                if value is not None:
+                    lines.append(f'mcp_call_duration_seconds{{{labels},quantile="{q}"}} {value:.6f}')
+            lines.append(f"mcp_call_duration_seconds_sum{{{labels}}} {stats.histogram.total:.6f}")
+            lines.append(f"mcp_call_duration_seconds_count{{{labels}}} {stats.histogram.count}")
+
+        counters = (
+            ("calls", "MCP tool calls"),
+            ("errors", "MCP tool calls that failed"),
+            ("cancelled", "MCP tool calls cancelled by the caller"),
+            ("cache_hits", "MCP tool calls served from the result cache"),
+            ("coalesced", "MCP tool calls joined to an identical in-flight call"),
+            ("attempts", "HTTP attempts made for MCP tool calls"),
+            ("request_bytes", "Request bytes sent for MCP tool calls"),
+            ("response_bytes", "Response bytes received for MCP tool calls"),
+        )
+        for field_name, help_text in counters:
+            metric = f"mcp_{field_name}_total"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for (server, tool), stats in sorted(self._tools.items()):
+                labels = f'server="{_escape(server)}",tool="{_escape(tool)}"'
+                lines.append(f"{metric}{{{labels}}} {getattr(stats, field_name)}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        self._servers.clear()
+        self._tools.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_metrics = MCPMetrics()
+
+
+def get_mcp_metrics() -> MCPMetrics:
+    """Get the process-wide MCP metrics registry."""
+    return _metrics
+
+
+# ============================================================================
+# CALL OBSERVATION AND SPANS
+# ============================================================================
+
+@dataclass
+class CallObservation:
+    """Flags of the tool call in progress, filled in by the client layers.
+
+    Attributes:
+        server: Server name
+        tool: Tool name
+        cache_hit: Served from the tool result cache
+        coalesced: Joined an identical in-flight call
+        attempts: HTTP attempts made for the call
+        request_bytes: Request body bytes sent
+        response_bytes: Response body bytes received
+    """
+    server: str
+    tool: str
+    cache_hit: bool = False
+    coalesced: bool = False
+    attempts: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+
+@dataclass
+class AttemptObservation:
+    """One HTTP attempt; set ``response`` once it arrives."""
+    attempt: int
+    response: Any = None
+
+
+_current_call: ContextVar[Optional[CallObservation]] = ContextVar("mcp_current_call", default=None)
+
+
+def current_call() -> Optional[CallObservation]:
+    """Observation of the tool call running in this context, if any."""
+    return _current_call.get()
+
+
+def mark_cache_hit() -> None:
+    """Flag the current call as served from the result cache."""
+    observation = _current_call.get()
+    if observation is not None:
+        observation.cache_hit = True
+
+
+def mark_coalesced() -> None:
+    """Flag the current call as joined to an identical in-flight call."""
+    observation = _current_call.get()
+    if observation is not None:
+        observation.coalesced = True
+
+
+@contextmanager
+def _span(name: str, attributes: Dict[str, Any]) -> Iterator[Any]:
+    if otel_trace is None:
+        yield None
+        return
+    tracer = otel_trace.get_tracer(__name__)
+    with tracer.start_as_current_span(name, attributes=attributes) as span:
+        yield span
+
+
+def _set_attributes(span: Any, attributes: Dict[str, Any]) -> None:
+    if span is not None and span.is_recording():
+        span.set_attributes(attributes)
+
+
+@contextmanager
+def observe_call(server: str, tool: str) -> Iterator[CallObservation]:
+    """Time and trace one tool call.
+
+    Opens an ``mcp.call`` span and makes the observation current, so the
+    cache, single-flight and retry layers can flag it; on exit the latency
+    is recorded into the server and tool histograms.
+
+    Args:
+        server: Server name (e.g. "mcp-rag")
+        tool: Tool name
+
+    Yields:
+        CallObservation for the call
+    """
+    observation = CallObservation(server=server, tool=tool)
+    token = _current_call.set(observation)
+    started = time.perf_counter()
+    outcome = "ok"
+
+    with _span("mcp.call", {"mcp.server": server, "mcp.tool": tool}) as span:
+        try:
+            yield observation
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            _current_call.reset(token)
+            _metrics.record_call(observation, time.perf_counter() - started, outcome)
+            _set_attributes(span, {
+                "mcp.cache_hit": observation.cache_hit,
+                "mcp.coalesced": observation.coalesced,
+                "mcp.attempts": observation.attempts,
+                "mcp.request_bytes": observation.request_bytes,
+                "mcp.response_bytes": observation.response_bytes,
+                "mcp.outcome": outcome,
+            })
+
+
+@contextmanager
+def observe_attempt(server: str, attempt: int) -> Iterator[AttemptObservation]:
+    """Trace one HTTP attempt of a tool call.
+
+    Opens an ``mcp.attempt`` span; set ``.response`` on the yielded object
+    to record the status code and payload sizes.
+
+    Args:
+        server: Server name
+        attempt: Attempt number (1-based)
+
+    Yields:
+        AttemptObservation for the attempt
+    """
+    observation = _current_call.get()
+    attempt_observation = AttemptObservation(attempt=attempt)
+    attributes: Dict[str, Any] = {"mcp.server": server, "mcp.attempt": attempt}
+    if observation is not None:
+        observation.attempts += 1
+        attributes["mcp.tool"] = observation.tool
+
+    with _span("mcp.attempt", attributes) as span:
+        try:
+            yield attempt_observation
+        finally:
+            response = attempt_observation.response
+            if response is not None:
+                try:
+                    request_bytes = int(response.request.headers.get("content-length") or 0)
+                except RuntimeError:  # Response built without a request
+                    request_bytes = 0
+                response_bytes = len(response.content) if response.is_stream_consumed else 0
+                if observation is not None:
+                    observation.request_bytes += request_bytes
+                    observation.response_bytes += response_bytes
+                _set_attributes(span, {
+                    "http.status_code": response.status_code,
+                    "mcp.request_bytes": request_bytes,
+                    "mcp.response_bytes": response_bytes,
+                })
+
+
+__all__ = [
+    "CallObservation",
+    "LatencyHistogram",
+    "MCPMetrics",
+    "current_call",
+    "get_mcp_metrics",
+    "mark_cache_hit",
+    "mark_coalesced",
+    "observe_attempt",
+    "observe_call",
+]
@@ -0,0 +1,346 @@
+"""Retry Budgets, Backoff Jitter and Hedged Requests for MCP Clients
+
+This module keeps retries and duplicate requests from turning a slow or
+failing MCP server into an overloaded one, and trims tail latency for
+latency-critical read calls (e.g. the chat path in ``api/sse.py``).
+
+Key Features:
+    - Token-bucket retry budget per server: every request deposits a fraction
+      of a token, every retry or hedge spends one, so retries cannot amplify
+      load during an outage
+    - Decorrelated jitter for retry backoff
+    - Opt-in hedged requests: after a p95-derived delay a duplicate request is
+      sent and the first response wins
+    - Per-server latency window and retry/hedge counters
+
+Key Classes:
+    - RetryBudget: Token bucket limiting retries relative to requests
+    - LatencyWindow: Sliding window of recent latencies with quantiles
+    - ServerResilience: Budget, latency window and counters of one server
+
+Usage:
+    ```python
+    from src.services.mcp_resilience import get_server_resilience, hedged_call
+
+    resilience = get_server_resilience("http://localhost:8001")
+    resilience.budget.deposit()
+    response = await hedged_call(
+        lambda: client.post(url, json=request),
+        delay=resilience.hedge_delay(0.95, min_delay=0.05),
+        allow_hedge=resilience.try_hedge,
+        on_hedge_won=resilience.record_hedge_win
+    )
+    ```
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# ============================================================================
+# RETRY BUDGET
+# ============================================================================
+
+class RetryBudget:
+    """Token bucket that caps retries at a fraction of request volume.
+
+    Each request deposits ``ratio`` tokens; each retry (or hedge) withdraws
+    one. A small time-based refill (``min_per_second``) keeps retries
+    possible for low-traffic servers.
+
+    Attributes:
+        ratio: Tokens deposited per request (e.g. 0.2 = 20% extra load)
+        min_per_second: Tokens refilled per second regardless of traffic
+        capacity: Maximum tokens held
+        tokens: Current token count
+
+    Example:
+        ```python
+        budget = RetryBudget(ratio=0.2)
+        budget.deposit()
+        if budget.try_withdraw():
+            ...  # retry
+        ```
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        capacity: float = 10.0
+    ):
+        """Initialize a full bucket.
+
+        Args:
+            ratio: Tokens deposited per request
+            min_per_second: Tokens refilled per second
+            capacity: Maximum tokens held
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.withdrawn = 0
+        self.rejected = 0
+        self._refilled_at = time.monotonic()
+
+    def deposit(self) -> None:
+        """Credit the bucket for one request."""
+        self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Spend one token for a retry or hedge.
+
+        Returns:
+            True if the retry may proceed
+        """
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self._refilled_at) * self.min_per_second
+        )
+        self._refilled_at = now
+
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            self.withdrawn += 1
+            return True
+
+        self.rejected += 1
+        return False
+
+
+def decorrelated_jitter(base: float, cap: float, previous: float) -> float:
+    """Next backoff delay using decorrelated jitter.
+
+    ``sleep = min(cap, uniform(base, previous * 3))`` spreads retries from
+    many clients apart instead of synchronizing them on fixed steps.
+
+    Args:
+        base: Minimum delay in seconds
+        cap: Maximum delay in seconds
+        previous: Previous delay (use base for the first retry)
+
+    Returns:
+        Delay in seconds
+    """
+    if base <= 0:
+        return 0.0
+    return min(cap, random.uniform(base, max(base, previous * 3)))
+
+
+# ============================================================================
+# LATENCY WINDOW
+# ============================================================================
+
+class LatencyWindow:
+    """Sliding window of recent request latencies.
+
+    Attributes:
+        size: Number of samples kept
+        min_samples: Samples required before quantiles are reported
+    """
+
+    def __init__(self, size: int = 200, min_samples: int = 20):
+        """Initialize the window.
+
+        Args:
+            size: Number of samples kept
+            min_samples: Samples required before quantiles are reported
+        """
+        self.size = size
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample."""
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency at quantile q, or None until min_samples were recorded.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Latency in seconds, or None
+        """
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+# ============================================================================
+# HEDGED REQUESTS
+# ============================================================================
+
+async def hedged_call(
+    func: Callable[[], Awaitable[T]],
+    delay: Optional[float],
+    allow_hedge: Callable[[], bool] = lambda: True,
+    on_hedge_won: Optional[Callable[[], None]] = None
+) -> T:
+    """Run func, sending one duplicate if it has not finished after delay.
+
+    The first successful result wins and the other attempt is cancelled. If
+    one attempt fails, the other is awaited; the error is raised only when
+    both fail. Only use for idempotent calls.
+
+    Args:
+        func: Coroutine factory for one attempt
+        delay: Seconds before hedging (None: no hedging)
+        allow_hedge: Called before sending the duplicate; False skips it
+            (e.g. retry budget exhausted)
+        on_hedge_won: Called when the duplicate produced the result
+
+    Returns:
+        Result of the first successful attempt
+    """
+    if delay is None:
+        return await func()
+
+    primary = asyncio.ensure_future(func())
+    tasks = {primary}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done or not allow_hedge():
+            return await primary
+
+        hedge = asyncio.ensure_future(func())
+        tasks.add(hedge)
+        last_error: Optional[BaseException] = None
+
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge and on_hedge_won is not None:
+                        on_hedge_won()
+                    return task.result()
+                last_error = task.exception()
+
+        raise last_error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+# ============================================================================
+# PER-SERVER STATE
+# ============================================================================
+
+@dataclass
+class ServerResilience:
+    """Retry budget, latency window and counters for one server.
+
+    Attributes:
+        budget: Retry budget shared by all clients of the server
+        latencies: Latencies of successful requests
+        retries: Retries that were allowed
+        hedges_sent: Duplicate requests sent
+        hedges_won: Duplicates that answered first
+    """
+    budget: RetryBudget = field(default_factory=RetryBudget)
+    latencies: LatencyWindow = field(default_factory=LatencyWindow)
+    retries: int = 0
+    hedges_sent: int = 0
+    hedges_won: int = 0
+
+    def try_retry(self) -> bool:
+        """Spend budget for a retry; False means give up."""
+        if self.budget.try_withdraw():
+            self.retries += 1
+            return True
+        return False
+
+    def try_hedge(self) -> bool:
+        """Spend budget for a hedge; False means wait for the first attempt."""
+        if self.budget.try_withdraw():
+            self.hedges_sent += 1
+            return True
+        return False
+
+    def record_hedge_win(self) -> None:
+        """Count a hedge that answered first."""
+        self.hedges_won += 1
+
+    def hedge_delay(self, quantile: float, min_delay: float) -> Optional[float]:
+        """Delay before hedging, derived from the latency quantile.
+
+        Args:
+            quantile: Latency quantile to wait for (e.g. 0.95)
+            min_delay: Lower bound in seconds
+
+        Returns:
+            Delay in seconds, or None while too few latencies are known
+        """
+        latency = self.latencies.quantile(quantile)
+        return None if latency is None else max(min_delay, latency)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters.
+
+        Returns:
+            Dict with retry_tokens, retries, retries_denied, hedges_sent,
+            hedges_won, p50_ms and p95_ms
+        """
+        p50 = self.latencies.quantile(0.5)
+        p95 = self.latencies.quantile(0.95)
+        return {
+            "retry_tokens": round(self.budget.tokens, 2),
+            "retries": self.retries,
+            "retries_denied": self.budget.rejected,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+            "p50_ms": round(p50 * 1000, 2) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 2) if p95 is not None else None,
+        }
+
+
+_servers: Dict[str, ServerResilience] = {}
+
+
+def get_server_resilience(base_url: str) -> ServerResilience:
+    """Get the shared resilience state of a server, creating it on first use.
+
+    Args:
+        base_url: Server base URL
+
+    Returns:
+        ServerResilience for the server
+    """
+    key = base_url.rstrip('/')
+    state = _servers.get(key)
+    if state is None:
+        state = _servers[key] = ServerResilience()
+    return state
+
+
+def resilience_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters of every server seen so far, keyed by base URL."""
+    return {url: state.stats() for url, state in _servers.items()}
+
+
+__all__ = [
+    "LatencyWindow",
+    "RetryBudget",
+    "ServerResilience",
+    "decorrelated_jitter",
+    "get_server_resilience",
+    "hedged_call",
+    "resilience_stats",
+]
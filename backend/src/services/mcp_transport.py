@@ -0,0 +1,382 @@
+"""Shared HTTP Transport for MCP Clients
+
+This module provides one process-wide transport layer that every MCP client
+(MCPClient, MCPRagClient, MCPExcelClient, MCPDocumentClient) borrows its
+``httpx.AsyncClient`` from, so call sites that construct a fresh client per
+invocation reuse warm keep-alive connections instead of paying TCP/TLS setup
+on every call.
+
+Key Features:
+    - One connection pool per MCP server origin (scheme://host:port)
+    - Keep-alive with configurable pool limits (environment variables)
+    - HTTP/2 for https servers when the ``h2`` package is installed
+    - Pool-utilization metrics (in-flight requests, open/idle connections)
+    - Adaptive per-server concurrency limit with queueing (see mcp_concurrency)
+    - Lifecycle tied to the FastAPI lifespan (see ``src/main.py``)
+
+Configuration (environment variables):
+    - MCP_POOL_MAX_CONNECTIONS: Max connections per server (default: 20)
+    - MCP_POOL_MAX_KEEPALIVE: Max idle keep-alive connections per server (default: 10)
+    - MCP_POOL_KEEPALIVE_EXPIRY: Idle connection expiry in seconds (default: 30)
+    - MCP_HTTP2: "auto" (default), "true" or "false"
+
+Key Classes:
+    - MCPTransport: Registry of per-server pooled clients with metrics
+
+Usage:
+    ```python
+    from src.services.mcp_transport import get_mcp_transport
+
+    client = get_mcp_transport().client_for("http://localhost:8001")
+    response = await client.post("http://localhost:8001/mcp", json=request, timeout=30.0)
+
+    # Pool metrics
+    stats = get_mcp_transport().stats()
+    ```
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from .mcp_concurrency import AdaptiveConcurrencyLimiter, ConcurrencySettings, resolve_settings
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_TIMEOUT = 30.0
+
+
+def _env_limits() -> httpx.Limits:
+    """Build pool limits from environment variables."""
+    return httpx.Limits(
+        max_connections=int(os.getenv("MCP_POOL_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)),
+        max_keepalive_connections=int(os.getenv("MCP_POOL_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE)),
+        keepalive_expiry=float(os.getenv("MCP_POOL_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY)),
+    )
+
+
+def _env_http2() -> bool:
+    """Resolve MCP_HTTP2; "auto" enables HTTP/2 only if ``h2`` is installed."""
+    setting = os.getenv("MCP_HTTP2", "auto").strip().lower()
+    if setting in ("1", "true", "yes", "on"):
+        return True
+    if setting in ("0", "false", "no", "off"):
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+def _origin(base_url: str) -> str:
+    """Normalize a server URL to its origin (scheme://host:port)."""
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+@dataclass
+class PoolMetrics:
+    """Request counters for one server pool.
+
+    Attributes:
+        requests_total: Requests sent through the pool
+        errors_total: Requests that failed at the transport level
+        in_flight: Requests currently holding a connection
+        peak_in_flight: Highest in_flight value observed
+    """
+    requests_total: int = 0
+    errors_total: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    """Response stream that releases its in-flight slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._on_close()
+
+
+class _MeteredTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that counts requests holding a pooled connection.
+
+    Requests other than health probes first wait for a slot from the
+    server's adaptive concurrency limiter; the slot is returned once the
+    response body is closed.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        metrics: PoolMetrics,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None
+    ):
+        self._transport = transport
+        self._metrics = metrics
+        self._limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = self._limiter
+        if limiter is not None and request.url.path.endswith("/health"):
+            limiter = None  # Probes must not queue behind the calls they check
+
+        started = 0.0
+        if limiter is not None:
+            try:
+                started = await limiter.acquire()
+            except asyncio.TimeoutError:
+                raise httpx.PoolTimeout(
+                    f"Timed out waiting for a concurrency slot on {request.url.host}",
+                    request=request
+                )
+
+        metrics = self._metrics
+        metrics.requests_total += 1
+        metrics.in_flight += 1
+        metrics.peak_in_flight = max(metrics.peak_in_flight, metrics.in_flight)
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            metrics.in_flight -= 1
+            metrics.errors_total += 1
+            if limiter is not None:
+                limiter.release(started, overloaded=True)
+            raise
+        except BaseException:
+            metrics.in_flight -= 1
+            metrics.errors_total += 1
+            if limiter is not None:
+                limiter.discard()
+            raise
+
+        overloaded = response.status_code == 429 or response.status_code >= 500
+        if limiter is not None:
+            # Feedback uses latency to the headers; the slot is held until
+            # the body is closed
+            limiter.record(started, overloaded=overloaded)
+
+        def on_close() -> None:
+            metrics.in_flight -= 1
+            if limiter is not None:
+                limiter.discard()
+
+        response.stream = _MeteredStream(response.stream, on_close)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def connection_counts(self) -> Dict[str, int]:
+        """Open and idle connection counts from the underlying pool."""
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+        return {
+            "open": len(connections),
+            "idle": sum(1 for c in connections if c.is_idle()),
+        }
+
+
+@dataclass
+class _ServerPool:
+    """A pooled client bound to the event loop it was created on."""
+    client: httpx.AsyncClient
+    transport: _MeteredTransport
+    loop: asyncio.AbstractEventLoop
+    limiter: AdaptiveConcurrencyLimiter
+    metrics: PoolMetrics = field(default_factory=PoolMetrics)
+
+
+class MCPTransport:
+    """Process-wide registry of pooled HTTP clients, one per MCP server.
+
+    Clients are created lazily on first use and shared by every MCP client
+    talking to the same origin. Request timeouts are passed per request so
+    clients with different timeouts can share a pool.
+
+    Attributes:
+        limits: Pool limits applied to each server pool
+        http2: Whether HTTP/2 is negotiated (https servers only)
+
+    Example:
+        ```python
+        transport = MCPTransport(limits=httpx.Limits(max_connections=50))
+        client = transport.client_for("http://localhost:8003")
+        ...
+        await transport.aclose()
+        ```
+    """
+
+    def __init__(
+        self,
+        limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        transport_factory: Optional[Callable[[], httpx.AsyncBaseTransport]] = None,
+        concurrency_resolver: Optional[Callable[[str], ConcurrencySettings]] = None
+    ):
+        """Initialize the transport registry.
+
+        Args:
+            limits: Pool limits per server (default: from environment)
+            http2: Enable HTTP/2 (default: MCP_HTTP2 / auto-detect ``h2``)
+            transport_factory: Optional factory for the underlying transport
+                (e.g. ``httpx.MockTransport`` in tests)
+            concurrency_resolver: Maps a server origin to its concurrency
+                settings (default: MCP_SERVER_CONFIG via resolve_settings)
+        """
+        self.limits = limits or _env_limits()
+        self.http2 = _env_http2() if http2 is None else http2
+        self._transport_factory = transport_factory
+        self._resolve_concurrency = concurrency_resolver or resolve_settings
+        self._pools: Dict[str, _ServerPool] = {}
+
+    def client_for(self, base_url: str) -> httpx.AsyncClient:
+        """Get the shared client for a server, creating its pool if needed.
+
+        Must be called from a running event loop. A pool created on another
+        (e.g. closed test) event loop is discarded and replaced.
+
+        Args:
+            base_url: Server URL; only its origin selects the pool
+
+        Returns:
+            Shared httpx.AsyncClient for the server
+        """
+        origin = _origin(base_url)
+        loop = asyncio.get_running_loop()
+
+        pool = self._pools.get(origin)
+        if pool is not None and pool.loop is loop and not pool.client.is_closed:
+            return pool.client
+
+        metrics = pool.metrics if pool is not None else PoolMetrics()
+        metrics.in_flight = 0
+        limiter = AdaptiveConcurrencyLimiter(origin, self._resolve_concurrency(origin))
+        transport = _MeteredTransport(self._build_transport(), metrics, limiter)
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+            headers={"Content-Type": "application/json"}
+        )
+        self._pools[origin] = _ServerPool(client, transport, loop, limiter, metrics)
+
+        logger.debug(
+            f"MCP transport pool created for {origin} "
+            f"(max_connections={self.limits.max_connections}, http2={self.http2})"
+        )
+        return client
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get pool-utilization metrics per server origin.
+
+        Returns:
+            Dict mapping origin to requests_total, errors_total, in_flight,
+            peak_in_flight, connections_open, connections_idle,
+            max_connections, max_keepalive_connections, utilization
+            (in_flight / max_connections), http2, concurrency_limit,
+            queue_depth and the full limiter metrics under "concurrency"
+        """
+        results = {}
+        max_connections = self.limits.max_connections
+
+        for origin, pool in self._pools.items():
+            connections = pool.transport.connection_counts()
+            metrics = pool.metrics
+            results[origin] = {
+                "requests_total": metrics.requests_total,
+                "errors_total": metrics.errors_total,
+                "in_flight": metrics.in_flight,
+                "peak_in_flight": metrics.peak_in_flight,
+                "connections_open": connections["open"],
+                "connections_idle": connections["idle"],
+                "max_connections": max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "utilization": (
+                    metrics.in_flight / max_connections if max_connections else 0.0
+                ),
+                "http2": self.http2,
+                "concurrency_limit": int(pool.limiter.limit),
+                "queue_depth": pool.limiter.queue_depth,
+                "concurrency": pool.limiter.stats(),
+            }
+
+        return results
+
+    async def aclose(self) -> None:
+        """Close every server pool (connections created on this loop)."""
+        loop = asyncio.get_running_loop()
+
+        for origin, pool in list(self._pools.items()):
+            if pool.loop is loop and not pool.client.is_closed:
+                await pool.client.aclose()
+                logger.debug(f"MCP transport pool closed for {origin}")
+
+        self._pools.clear()
+
+    def _build_transport(self) -> httpx.AsyncBaseTransport:
+        if self._transport_factory is not None:
+            return self._transport_factory()
+        return httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+
+
+# ============================================================================
+# PROCESS-WIDE INSTANCE
+# ============================================================================
+
+_transport: Optional[MCPTransport] = None
+
+
+def get_mcp_transport() -> MCPTransport:
+    """Get the process-wide MCP transport, creating it on first use.
+
+    Returns:
+        Shared MCPTransport instance
+    """
+    global _transport
+    if _transport is None:
+        _transport = MCPTransport()
+    return _transport
+
+
+async def close_mcp_transport() -> None:
+    """Close the process-wide MCP transport (called on application shutdown)."""
+    global _transport
+    if _transport is not None:
+        await _transport.aclose()
+        _transport = None
+        logger.info("MCP transport closed")
+
+
+def mcp_transport_stats() -> Dict[str, Dict[str, Any]]:
+    """Pool metrics of the process-wide transport (empty if not created)."""
+    return _transport.stats() if _transport is not None else {}
+
+
+__all__ = [
+    "MCPTransport",
+    "PoolMetrics",
+    "get_mcp_transport",
+    "close_mcp_transport",
+    "mcp_transport_stats",
+]
@@ -0,0 +1,474 @@
+"""In-Process Pub/Sub Broker for Agent Messages
+
+Writers of ``agent_messages`` rows (the SSE chat path, ``sync_task_to_supabase``)
+publish each inserted row to this broker, and SSE streams subscribe per
+task_id, so messages are pushed to open connections as soon as they are
+written instead of every connection polling the table once per second.
+
+Delivery across processes is pluggable: the default backend fans out within
+the current process only, and ``PostgresNotifyBackend`` relays messages
+through Postgres LISTEN/NOTIFY so every worker sees every write. Delivery is
+best effort either way; subscribers are told when they may have missed
+messages (queue overflow, listener reconnect, oversized notification) and
+backfill from the database.
+
+Key Features:
+    - Per-topic fan-out to bounded per-subscriber queues (slow subscribers
+      drop their oldest messages and are marked stale instead of growing)
+    - Thread-safe publishing (delivery hops onto each subscriber's loop)
+    - Optional Postgres LISTEN/NOTIFY backend (psycopg) with reconnects
+    - Publishing never raises, so writers are not failed by the broker
+
+Key Classes:
+    - MessageBroker: Topic fan-out hub
+    - Subscription: One subscriber's bounded queue and stale flag
+    - BrokerBackend: Delivery backend interface (in-process by default)
+    - PostgresNotifyBackend: Cross-process delivery via LISTEN/NOTIFY
+
+Usage:
+    ```python
+    from src.services.message_broker import get_message_broker
+
+    # Writer, after inserting the row
+    await get_message_broker().publish(task_id, message_record)
+
+    # Reader
+    async with get_message_broker().subscribe(task_id) as subscription:
+        message = await subscription.get(timeout=30.0)  # None on timeout
+        if subscription.take_stale():
+            ...  # backfill from agent_messages
+    ```
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 256
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_PAYLOAD_LIMIT = 7900
+
+_STALE = object()  # Queue marker waking a subscriber that must backfill
+
+
+# ============================================================================
+# SUBSCRIPTION
+# ============================================================================
+
+class Subscription:
+    """One subscriber of a topic.
+
+    Messages are queued up to ``maxsize``; beyond that the oldest message is
+    dropped and the subscription is marked stale, so a stalled reader costs
+    bounded memory and knows to backfill.
+
+    Attributes:
+        topic: Subscribed topic (task_id)
+        dropped: Messages dropped because the queue was full
+    """
+
+    def __init__(self, broker: "MessageBroker", topic: str, maxsize: int):
+        """Initialize a subscription (use MessageBroker.subscribe).
+
+        Args:
+            broker: Owning broker
+            topic: Subscribed topic
+            maxsize: Queue bound
+        """
+        self.topic = topic
+        self.dropped = 0
+        self._broker = broker
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._loop = asyncio.get_running_loop()
+        self._stale = False
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait for the next message.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Next message, or None on timeout or when the subscription was
+            just marked stale (check take_stale())
+        """
+        try:
+            item = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return None if item is _STALE else item
+
+    def get_nowait(self) -> Optional[Dict[str, Any]]:
+        """Next queued message, or None if the queue is empty."""
+        try:
+            item = self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+        return None if item is _STALE else item
+
+    def take_stale(self) -> bool:
+        """Whether messages may have been missed since the last call.
+
+        Resets the flag; the caller is expected to backfill when True.
+        """
+        stale, self._stale = self._stale, False
+        return stale
+
+    def close(self) -> None:
+        """Stop receiving messages."""
+        self._broker._unsubscribe(self)
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def _offer(self, item: Any) -> None:
+        if item is _STALE:
+            self._stale = True
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+            self._stale = True
+        self._queue.put_nowait(item)
+
+    def _dispatch(self, item: Any) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._offer(item)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._offer, item)
+
+
+# ============================================================================
+# BACKENDS
+# ============================================================================
+
+class BrokerBackend:
+    """Delivery backend; the base class delivers within this process.
+
+    Backends call ``broker.deliver(topic, message)`` for every message that
+    should reach local subscribers, and ``broker.invalidate(topic)`` (topic
+    None for all) when messages may have been lost.
+    """
+
+    async def start(self, broker: "MessageBroker") -> None:
+        """Start delivering to broker.
+
+        Args:
+            broker: Broker to deliver to
+        """
+        self._broker = broker
+
+    async def publish(self, topic: str, message: Dict[str, Any]) -> None:
+        """Publish a message to every subscriber of topic.
+
+        Args:
+            topic: Topic (task_id)
+            message: Message dict (JSON-serializable)
+        """
+        self._broker.deliver(topic, message)
+
+    async def close(self) -> None:
+        """Stop delivering and release resources."""
+
+
+class PostgresNotifyBackend(BrokerBackend):
+    """Cross-process delivery through Postgres LISTEN/NOTIFY.
+
+    Every process LISTENs on one channel; publishing sends ``pg_notify`` and
+    the message comes back to all processes, this one included. Messages
+    too large for a notification are announced by topic only and
+    subscribers backfill. After a listener reconnect every topic is
+    invalidated, since notifications sent in between are lost.
+
+    Requires the ``psycopg`` package (installed with
+    langgraph-checkpoint-postgres).
+
+    Example:
+        ```python
+        broker = MessageBroker(PostgresNotifyBackend(os.environ["POSTGRES_CONNECTION_STRING"]))
+        await broker.start()
+        ```
+    """
+
+    def __init__(
+        self,
+        conninfo: str,
+        channel: str = "agent_messages",
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        """Initialize the backend.
+
+        Args:
+            conninfo: Postgres connection string
+            channel: NOTIFY channel name
+            reconnect_delay: Initial listener reconnect delay in seconds
+            max_reconnect_delay: Reconnect delay cap (doubles per failure)
+        """
+        self.conninfo = conninfo
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._listener: Optional[asyncio.Task] = None
+        self._publisher = None
+        self._publish_lock = asyncio.Lock()
+
+    async def start(self, broker: "MessageBroker") -> None:
+        await super().start(broker)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def publish(self, topic: str, message: Dict[str, Any]) -> None:
+        import psycopg
+
+        payload = json.dumps({"topic": topic, "message": message}, default=str)
+        if len(payload.encode()) > NOTIFY_PAYLOAD_LIMIT:
+            payload = json.dumps({"topic": topic})
+
+        async with self._publish_lock:
+            try:
+                if self._publisher is None or self._publisher.closed:
+                    self._publisher = await psycopg.AsyncConnection.connect(
+                        self.conninfo, autocommit=True
+                    )
+                await self._publisher.execute("SELECT pg_notify(%s, %s)", (self.channel, payload))
+            except Exception:
+                self._publisher = None
+                raise
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._publisher is not None:
+            await self._publisher.close()
+            self._publisher = None
+
+    def _handle(self, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+            topic = data["topic"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed notification on {self.channel}")
+            return
+        if "message" in data:
+            self._broker.deliver(topic, data["message"])
+        else:
+            self._broker.invalidate(topic)
+
+    async def _listen(self) -> None:
+        import psycopg
+        from psycopg import sql
+
+        delay = self.reconnect_delay
+        connected_before = False
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    self.conninfo, autocommit=True
+                ) as conn:
+                    await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+                    if connected_before:
+                        self._broker.invalidate(None)
+                    connected_before = True
+                    delay = self.reconnect_delay
+                    logger.info(f"Message broker listening on Postgres channel {self.channel}")
+                    async for notify in conn.notifies():
+                        self._handle(notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Message broker listener failed, reconnecting in {delay:.0f}s: {e}")
+                self._broker.invalidate(None)
+                connected_before = True
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+
+# ============================================================================
+# BROKER
+# ============================================================================
+
+class MessageBroker:
+    """Topic fan-out hub for agent messages.
+
+    Example:
+        ```python
+        broker = MessageBroker()
+        async with broker.subscribe("task-uuid") as subscription:
+            await broker.publish("task-uuid", {"id": "msg-1", "content": "..."})
+            message = await subscription.get(timeout=1.0)
+        ```
+    """
+
+    def __init__(
+        self,
+        backend: Optional[BrokerBackend] = None,
+        queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+    ):
+        """Initialize the broker.
+
+        Args:
+            backend: Delivery backend (in-process when None)
+            queue_size: Per-subscriber queue bound
+        """
+        self.backend = backend or BrokerBackend()
+        self.queue_size = queue_size
+        self.published = 0
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._started = False
+
+    async def start(self) -> None:
+        """Start the backend (idempotent)."""
+        if not self._started:
+            await self.backend.start(self)
+            self._started = True
+
+    async def close(self) -> None:
+        """Stop the backend."""
+        if self._started:
+            await self.backend.close()
+            self._started = False
+
+    def subscribe(self, topic: str, maxsize: Optional[int] = None) -> Subscription:
+        """Subscribe to a topic.
+
+        Must be called from a running event loop; messages are delivered on
+        that loop. Close the subscription (or use it as an async context
+        manager) when done.
+
+        Args:
+            topic: Topic (task_id)
+            maxsize: Queue bound (defaults to queue_size)
+
+        Returns:
+            Subscription receiving messages published from now on
+        """
+        subscription = Subscription(self, topic, maxsize or self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    async def publish(self, topic: str, message: Dict[str, Any]) -> None:
+        """Publish a message to every subscriber of topic.
+
+        Subscribers share the message dict and must not mutate it. Backend
+        failures are logged, never raised: subscribers recover the message
+        by backfilling.
+
+        Args:
+            topic: Topic (task_id)
+            message: Message dict (JSON-serializable)
+        """
+        self.published += 1
+        try:
+            await self.start()
+            await self.backend.publish(topic, message)
+        except Exception as e:
+            logger.warning(f"Failed to publish message for {topic}: {e}")
+
+    def deliver(self, topic: str, message: Dict[str, Any]) -> None:
+        """Hand a message to local subscribers (called by backends).
+
+        Args:
+            topic: Topic (task_id)
+            message: Message dict
+        """
+        for subscription in self._snapshot(topic):
+            subscription._dispatch(message)
+
+    def invalidate(self, topic: Optional[str]) -> None:
+        """Mark subscribers stale so they backfill (called by backends).
+
+        Args:
+            topic: Topic, or None for every topic
+        """
+        for subscription in self._snapshot(topic):
+            subscription._dispatch(_STALE)
+
+    def subscriber_count(self, topic: Optional[str] = None) -> int:
+        """Number of open subscriptions to topic (or to all topics)."""
+        return len(self._snapshot(topic))
+
+    def _snapshot(self, topic: Optional[str]) -> Set[Subscription]:
+        with self._lock:
+            if topic is not None:
+                return set(self._subscribers.get(topic, ()))
+            return {s for subscriptions in self._subscribers.values() for s in subscriptions}
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscribers.get(subscription.topic)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscribers[subscription.topic]
+
+
+# ============================================================================
+# PROCESS-WIDE INSTANCE
+# ============================================================================
+
+_broker: Optional[MessageBroker] = None
+
+
+def _backend_from_env() -> BrokerBackend:
+    kind = os.getenv("MESSAGE_BROKER_BACKEND", "memory").lower()
+    if kind == "postgres":
+        conninfo = os.getenv("POSTGRES_CONNECTION_STRING")
+        if conninfo:
+            return PostgresNotifyBackend(conninfo)
+        logger.warning("MESSAGE_BROKER_BACKEND=postgres without POSTGRES_CONNECTION_STRING; using memory")
+    elif kind != "memory":
+        logger.warning(f"Unknown MESSAGE_BROKER_BACKEND={kind!r}; using memory")
+    return BrokerBackend()
+
+
+def get_message_broker() -> MessageBroker:
+    """Get the process-wide message broker, creating it on first use.
+
+    The backend is chosen by MESSAGE_BROKER_BACKEND: "memory" (default,
+    this process only) or "postgres" (LISTEN/NOTIFY on
+    POSTGRES_CONNECTION_STRING, for multiple workers).
+
+    Returns:
+        Shared MessageBroker instance
+    """
+    global _broker
+    if _broker is None:
+        _broker = MessageBroker(_backend_from_env())
+    return _broker
+
+
+async def close_message_broker() -> None:
+    """Close the process-wide broker (called on application shutdown)."""
+    global _broker
+    if _broker is not None:
+        await _broker.close()
+        _broker = None
+        logger.info("Message broker closed")
+
+
+__all__ = [
+    "BrokerBackend",
+    "MessageBroker",
+    "PostgresNotifyBackend",
+    "Subscription",
+    "close_message_broker",
+    "get_message_broker",
+]
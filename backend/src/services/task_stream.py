@@ -0,0 +1,549 @@
+"""Shared Per-Task Event Streams for SSE
+
+Every SSE connection to ``/api/stream/{task_id}`` reads from one shared
+``TaskStream`` per task instead of running its own broker subscription,
+database backfill and duplicate tracking. The stream turns agent_messages
+rows and token records into numbered events kept in a bounded ring buffer;
+readers are cursors into that buffer, so five reviewers watching one task
+cost one upstream subscription and one set of backfill queries.
+
+Event ids are ``"<epoch>:<seq>"``: seq increases by one per event and the
+epoch identifies the stream instance, so a client reconnecting with
+``Last-Event-ID`` resumes exactly where it stopped while the event is still
+buffered, and falls back to a database replay otherwise (after an eviction,
+a restart or on another worker).
+
+Key Features:
+    - One broker subscription and backfill loop per task_id, shared by all
+      readers, stopped after the last reader has been gone for idle_ttl
+    - Bounded ring buffer of recent events and bounded duplicate tracking
+    - Last-Event-ID resume; database replay when the id is unknown or evicted
+    - Explicit drop policy for readers that fall out of the buffer:
+      "skip" (continue from the oldest buffered event after a "gap" event)
+      or "close" (end the stream so the client reconnects and replays)
+
+Key Classes:
+    - TaskStreamHub: Registry of shared streams per task_id
+    - TaskStream: Upstream subscription, backfill loop and ring buffer
+    - StreamReader: One reader's cursor into a TaskStream
+    - StreamEvent: Numbered SSE event
+
+Usage:
+    ```python
+    from src.services.task_stream import get_task_stream_hub
+
+    async with get_task_stream_hub().open(task_id, last_event_id) as reader:
+        while True:
+            event = await reader.next(timeout=30.0)  # None on timeout
+            if event is not None:
+                yield event.to_sse()
+    ```
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from .message_broker import MessageBroker, get_message_broker
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_BUFFER_SIZE = 2048
+DEFAULT_SEEN_IDS = 8192
+DEFAULT_IDLE_TTL = 30.0  # seconds a stream outlives its last reader
+# Safety-net backfill for rows written by writers that do not publish
+# (e.g. other workers when the broker backend is in-process only)
+BACKFILL_INTERVAL = 15.0  # seconds
+
+DROP_POLICIES = ("skip", "close")
+
+
+class StreamLagError(Exception):
+    """Raised to a reader with drop policy "close" that fell out of the buffer."""
+
+
+# ============================================================================
+# EVENTS
+# ============================================================================
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """One SSE event of a task stream.
+
+    Attributes:
+        id: "<epoch>:<seq>", or None for replayed history (not resumable)
+        event: SSE event type ("message", "token", "progress", "gap")
+        data: JSON-encoded payload
+    """
+    id: Optional[str]
+    event: str
+    data: str
+
+    def to_sse(self) -> Dict[str, Any]:
+        """Dict for EventSourceResponse."""
+        sse = {"event": self.event, "data": self.data}
+        if self.id is not None:
+            sse["id"] = self.id
+        return sse
+
+
+def message_data(row: Dict[str, Any]) -> str:
+    """SSE "message" payload for an agent_messages row."""
+    return json.dumps({
+        "id": row.get("id"),
+        "agent_role": row.get("agent_role"),
+        "content": row.get("content"),
+        "timestamp": row.get("created_at")
+    })
+
+
+def token_data(record: Dict[str, Any]) -> str:
+    """SSE "token" payload for a token record (see llm_stream)."""
+    return json.dumps({
+        "id": record.get("id"),
+        "agent_role": record.get("agent_role"),
+        "delta": record.get("delta"),
+        "index": record.get("index"),
+        "done": record.get("done", False)
+    })
+
+
+def progress_data(record: Dict[str, Any]) -> str:
+    """SSE "progress" payload for a parse progress record (see staff_agents)."""
+    return json.dumps({
+        "agent_role": record.get("agent_role"),
+        "transaction_count": record.get("transaction_count"),
+        "total_amount": record.get("total_amount"),
+        "anomalies_detected": record.get("anomalies_detected"),
+        "pages": record.get("pages"),
+        "done": record.get("done", False)
+    })
+
+
+def parse_event_id(event_id: Optional[str]) -> Optional[Tuple[str, int]]:
+    """Split "<epoch>:<seq>" into (epoch, seq), or None if malformed."""
+    if not event_id:
+        return None
+    epoch, _, seq = event_id.strip().rpartition(":")
+    if not epoch or not seq.isdigit():
+        return None
+    return epoch, int(seq)
+
+
+async def fetch_agent_messages(task_id: str, after: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Read agent_messages rows of a task in creation order.
+
+    Args:
+        task_id: Task UUID
+        after: Only rows created after this timestamp
+
+    Returns:
+        Rows with id, agent_role, content and created_at
+    """
+    from ..db.async_client import get_async_db
+
+    return await get_async_db().agent_messages_after(task_id, after)
+
+
+Fetcher = Callable[[str, Optional[str]], Awaitable[List[Dict[str, Any]]]]
+
+
+# ============================================================================
+# SHARED STREAM
+# ============================================================================
+
+class TaskStream:
+    """Upstream of one task: broker subscription, backfill and ring buffer.
+
+    Attributes:
+        task_id: Task UUID
+        epoch: Identifies this stream instance in event ids
+        last_seq: Sequence number of the newest event (0 before any)
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        broker: MessageBroker,
+        fetch: Fetcher = fetch_agent_messages,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        backfill_interval: float = BACKFILL_INTERVAL,
+    ):
+        """Initialize and start the stream (requires a running loop).
+
+        Args:
+            task_id: Task UUID
+            broker: Message broker to subscribe to
+            fetch: Reads agent_messages rows (task_id, created_after)
+            buffer_size: Events kept for resume and slow readers
+            backfill_interval: Seconds between safety-net backfills
+        """
+        self.task_id = task_id
+        self.epoch = uuid4().hex[:12]
+        self.last_seq = 0
+        self.readers = 0
+        self.fetch = fetch
+        self.backfill_interval = backfill_interval
+
+        self._events: Deque[Tuple[int, StreamEvent]] = deque(maxlen=buffer_size)
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._cursor: Optional[str] = None  # created_at of the newest backfilled row
+        self._changed = asyncio.Event()
+        self._idle_handle: Optional[asyncio.TimerHandle] = None
+        self._subscription = broker.subscribe(task_id)
+        self._pump = asyncio.create_task(self._run())
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest buffered event (last_seq + 1 if empty)."""
+        return self._events[0][0] if self._events else self.last_seq + 1
+
+    @property
+    def complete(self) -> bool:
+        """Whether the buffer still holds every event since the stream started."""
+        return self.first_seq == 1
+
+    def events_after(self, seq: int) -> List[StreamEvent]:
+        """Buffered events newer than seq (caller checks seq >= first_seq - 1)."""
+        start = seq + 1 - self.first_seq
+        return [event for _, event in list(self._events)[max(0, start):]]
+
+    async def wait_for(self, seq: int, timeout: Optional[float]) -> bool:
+        """Wait until an event newer than seq exists.
+
+        Returns:
+            True if one exists, False on timeout
+        """
+        if self.last_seq > seq:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.last_seq > seq
+
+    def close(self) -> None:
+        """Stop the upstream subscription and backfill loop."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+        self._pump.cancel()
+        self._subscription.close()
+
+    # ------------------------------------------------------------------
+    # Upstream
+    # ------------------------------------------------------------------
+
+    def _append(self, event_type: str, data: str) -> None:
+        self.last_seq += 1
+        self._events.append((self.last_seq, StreamEvent(f"{self.epoch}:{self.last_seq}", event_type, data)))
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _add_row(self, row: Dict[str, Any], from_db: bool) -> None:
+        msg_id = row.get("id")
+        if from_db and row.get("created_at"):
+            # Only rows read from the database advance the cursor, so a
+            # pushed message cannot hide an older one not yet delivered
+            self._cursor = row["created_at"]
+        if msg_id in self._seen:
+            return
+        self._seen[msg_id] = None
+        if len(self._seen) > DEFAULT_SEEN_IDS:
+            self._seen.popitem(last=False)
+        self._append("message", message_data(row))
+
+    async def _backfill(self) -> None:
+        try:
+            for row in await self.fetch(self.task_id, self._cursor):
+                self._add_row(row, from_db=True)
+        except Exception as e:
+            logger.error(f"Database query error for task {self.task_id}: {e}")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_backfill = loop.time()  # Backfill history immediately
+        while True:
+            if self._subscription.take_stale() or loop.time() >= next_backfill:
+                await self._backfill()
+                next_backfill = loop.time() + self.backfill_interval
+
+            item = await self._subscription.get(timeout=max(0.0, next_backfill - loop.time()))
+            if item is None:
+                continue
+            if item.get("type") == "token":
+                self._append("token", token_data(item))
+            elif item.get("type") == "progress":
+                self._append("progress", progress_data(item))
+            else:
+                self._add_row(item, from_db=False)
+
+
+# ============================================================================
+# READERS
+# ============================================================================
+
+class StreamReader:
+    """One reader's cursor into a TaskStream.
+
+    Readers never slow the stream down: a reader that falls more than the
+    buffer size behind loses events according to its drop policy.
+
+    Attributes:
+        cursor: Sequence number of the last event returned
+        dropped: Events this reader lost to buffer eviction
+    """
+
+    def __init__(
+        self,
+        hub: "TaskStreamHub",
+        stream: TaskStream,
+        last_event_id: Optional[str],
+        drop_policy: str,
+    ):
+        """Initialize a reader (use TaskStreamHub.open).
+
+        Args:
+            hub: Owning hub
+            stream: Shared stream to read
+            last_event_id: Last-Event-ID sent by a reconnecting client
+            drop_policy: "skip" or "close"
+        """
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"drop_policy must be one of {DROP_POLICIES}, got {drop_policy!r}")
+        self.stream = stream
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self.resumed = False
+        self._hub = hub
+        self._pending: Deque[StreamEvent] = deque()
+        self._replayed: Set[str] = set()
+        self._needs_replay = False
+        self._closed = False
+
+        parsed = parse_event_id(last_event_id)
+        if parsed and parsed[0] == stream.epoch and stream.first_seq - 1 <= parsed[1] <= stream.last_seq:
+            self.cursor = parsed[1]
+            self.resumed = True
+        elif parsed is None and stream.complete:
+            self.cursor = 0  # The buffer still holds the whole history
+        else:
+            self.cursor = stream.last_seq
+            self._needs_replay = True
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[StreamEvent]:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Next event, or None on timeout
+
+        Raises:
+            StreamLagError: The reader fell out of the buffer with drop
+                policy "close"
+        """
+        if self._needs_replay:
+            # Replay before buffered events; overlap is skipped in _fill
+            self._needs_replay = False
+            await self._replay_history()
+        if not self._pending:
+            self._fill()
+        if not self._pending and await self.stream.wait_for(self.cursor, timeout):
+            self._fill()
+        return self._pending.popleft() if self._pending else None
+
+    def close(self) -> None:
+        """Detach from the stream."""
+        if not self._closed:
+            self._closed = True
+            self._hub._release(self.stream)
+
+    async def __aenter__(self) -> "StreamReader":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def _fill(self) -> None:
+        stream = self.stream
+        if self.cursor < stream.first_seq - 1:
+            missed = stream.first_seq - 1 - self.cursor
+            self.dropped += missed
+            if self.drop_policy == "close":
+                raise StreamLagError(
+                    f"Reader of task {stream.task_id} fell {missed} events behind"
+                )
+            self.cursor = stream.first_seq - 1
+            self._pending.append(StreamEvent(
+                f"{stream.epoch}:{self.cursor}", "gap", json.dumps({"missed": missed})
+            ))
+
+        for event in stream.events_after(self.cursor):
+            self.cursor += 1
+            if event.event == "message" and self._replayed:
+                if json.loads(event.data).get("id") in self._replayed:
+                    continue
+            self._pending.append(event)
+
+    async def _replay_history(self) -> None:
+        try:
+            rows = await self.stream.fetch(self.stream.task_id, None)
+        except Exception as e:
+            logger.error(f"History replay failed for task {self.stream.task_id}: {e}")
+            return
+        for row in rows:
+            self._replayed.add(row.get("id"))
+            self._pending.append(StreamEvent(None, "message", message_data(row)))
+
+
+# ============================================================================
+# HUB
+# ============================================================================
+
+class TaskStreamHub:
+    """Registry of shared task streams.
+
+    Example:
+        ```python
+        hub = TaskStreamHub()
+        async with hub.open("task-uuid") as reader:
+            event = await reader.next(timeout=30.0)
+        ```
+    """
+
+    def __init__(
+        self,
+        broker: Optional[MessageBroker] = None,
+        fetch: Fetcher = fetch_agent_messages,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        idle_ttl: float = DEFAULT_IDLE_TTL,
+        drop_policy: str = "skip",
+    ):
+        """Initialize the hub.
+
+        Args:
+            broker: Message broker (process-wide when None)
+            fetch: Reads agent_messages rows (task_id, created_after)
+            buffer_size: Events buffered per task
+            idle_ttl: Seconds a stream outlives its last reader, so quick
+                reconnects resume from the buffer
+            drop_policy: Default policy for readers falling out of the buffer
+        """
+        self.broker = broker
+        self.fetch = fetch
+        self.buffer_size = buffer_size
+        self.idle_ttl = idle_ttl
+        self.drop_policy = drop_policy
+        self._streams: Dict[str, TaskStream] = {}
+
+    def open(
+        self,
+        task_id: str,
+        last_event_id: Optional[str] = None,
+        drop_policy: Optional[str] = None,
+    ) -> StreamReader:
+        """Open a reader on the task's shared stream, starting it if needed.
+
+        Args:
+            task_id: Task UUID
+            last_event_id: Last-Event-ID of a reconnecting client
+            drop_policy: "skip" or "close" (defaults to the hub's policy)
+
+        Returns:
+            StreamReader (close it, or use it as an async context manager)
+        """
+        stream = self._streams.get(task_id)
+        if stream is None:
+            stream = TaskStream(
+                task_id,
+                self.broker or get_message_broker(),
+                fetch=self.fetch,
+                buffer_size=self.buffer_size,
+            )
+            self._streams[task_id] = stream
+        if stream._idle_handle is not None:
+            stream._idle_handle.cancel()
+            stream._idle_handle = None
+
+        reader = StreamReader(self, stream, last_event_id, drop_policy or self.drop_policy)
+        stream.readers += 1
+        return reader
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Readers and buffered events per open stream."""
+        return {
+            task_id: {
+                "readers": stream.readers,
+                "last_seq": stream.last_seq,
+                "buffered": stream.last_seq - stream.first_seq + 1,
+            }
+            for task_id, stream in self._streams.items()
+        }
+
+    async def close(self) -> None:
+        """Stop every stream."""
+        for stream in self._streams.values():
+            stream.close()
+        self._streams.clear()
+
+    def _release(self, stream: TaskStream) -> None:
+        stream.readers -= 1
+        if stream.readers > 0:
+            return
+        if self.idle_ttl <= 0:
+            self._stop(stream)
+        else:
+            loop = asyncio.get_running_loop()
+            stream._idle_handle = loop.call_later(self.idle_ttl, self._stop, stream)
+
+    def _stop(self, stream: TaskStream) -> None:
+        if stream.readers == 0 and self._streams.get(stream.task_id) is stream:
+            del self._streams[stream.task_id]
+            stream.close()
+
+
+_hub: Optional[TaskStreamHub] = None
+
+
+def get_task_stream_hub() -> TaskStreamHub:
+    """Get the process-wide task stream hub, creating it on first use.
+
+    Buffer size and idle TTL come from SSE_BUFFER_SIZE and SSE_IDLE_TTL.
+
+    Returns:
+        Shared TaskStreamHub instance
+    """
+    global _hub
+    if _hub is None:
+        _hub = TaskStreamHub(
+            buffer_size=int(os.getenv("SSE_BUFFER_SIZE", DEFAULT_BUFFER_SIZE)),
+            idle_ttl=float(os.getenv("SSE_IDLE_TTL", DEFAULT_IDLE_TTL)),
+        )
+    return _hub
+
+
+async def close_task_stream_hub() -> None:
+    """Close the process-wide hub (called on application shutdown)."""
+    global _hub
+    if _hub is not None:
+        await _hub.close()
+        _hub = None
+
+
+__all__ = [
+    "StreamEvent",
+    "StreamLagError",
+    "StreamReader",
+    "TaskStream",
+    "TaskStreamHub",
+    "close_task_stream_hub",
+    "fetch_agent_messages",
+    "get_task_stream_hub",
+]
@@ -14,8 +14,9 @@ from typing import Dict, Any, Optional
 from uuid import uuid4
 from datetime import datetime
 
-from ..db.supabase_client import supabase
+from ..db.async_client import get_async_db
 from ..graph.state import TaskState, AuditState
+from .message_broker import get_message_broker
 
 
 async def sync_task_to_supabase(
@@ -27,7 +28,8 @@ async def sync_task_to_supabase(
 
     This function performs the following operations:
     1. Upserts task data to audit_tasks table (using thread_id as unique key)
-    2. Inserts agent messages to agent_messages table
+    2. Inserts agent messages to agent_messages table (and publishes them
+       to open SSE streams through the message broker)
     3. Inserts workpaper artifact if it exists
 
     Args:
@@ -70,10 +72,10 @@ async def sync_task_to_supabase(
     }
 
     # Upsert to audit_tasks table (on conflict, update existing row)
-    response = (
-        supabase.table("audit_tasks")
+    db = get_async_db()
+    response = await db.execute(
+        db.table("audit_tasks")
         .upsert(task_data, on_conflict="thread_id")
-        .execute()
     )
 
     if not response.data:
@@ -107,11 +109,11 @@ async def get_task_by_thread_id(thread_id: str) -> Optional[Dict[str, Any]]:
         ... else:
         ...     print("Task not found")
     """
-    response = (
-        supabase.table("audit_tasks")
+    db = get_async_db()
+    response = await db.execute(
+        db.table("audit_tasks")
         .select("*")
         .eq("thread_id", thread_id)
-        .execute()
     )
 
     if response.data and len(response.data) > 0:
@@ -127,7 +129,9 @@ async def _sync_agent_messages(
     Insert agent messages to agent_messages table.
 
     This is a private helper function that extracts messages from TaskState
-    and inserts them into the agent_messages table.
+    and inserts them into the agent_messages table, then publishes the
+    inserted rows to the message broker so open SSE streams receive them
+    without polling.
 
     Args:
         task_state: The current task state containing messages
@@ -159,15 +163,19 @@ async def _sync_agent_messages(
 
     # Insert all messages in batch
     if message_records:
-        response = (
-            supabase.table("agent_messages")
+        db = get_async_db()
+        response = await db.execute(
+            db.table("agent_messages")
             .insert(message_records)
-            .execute()
         )
 
         if not response.data:
             raise Exception("Failed to insert agent messages")
 
+        broker = get_message_broker()
+        for message_record in message_records:
+            await broker.publish(task_id, message_record)
+
 
 async def _sync_workpaper_artifact(
     task_state: TaskState,
@@ -201,10 +209,10 @@ async def _sync_workpaper_artifact(
     }
 
     # Insert artifact
-    response = (
-        supabase.table("audit_artifacts")
+    db = get_async_db()
+    response = await db.execute(
+        db.table("audit_artifacts")
         .insert(artifact_record)
-        .execute()
     )
 
     if not response.data:
@@ -0,0 +1,668 @@
+"""
+Local Vector Store for AuditGuideRAG
+
+This module provides a built-in, single-node vector store so AuditGuideRAG can
+run semantic search without an external vector database service.
+
+Key Features:
+    - Embeddings kept in one contiguous float32 (or int8-quantized) matrix
+    - Memory-mapped persistence with an append-only chunk metadata sidecar
+    - Cold start is an mmap open plus a sidecar replay, not a re-ingest
+    - Vectorized cosine top-k using blocked dot products and argpartition
+    - In-place append, overwrite, delete-by-id and delete-by-document_id
+
+On-disk layout (``index_dir``):
+    - manifest.json: dimension, capacity and quantization settings
+    - vectors.f32 / vectors.i8: row-major embedding matrix (np.memmap)
+    - scales.f32: per-row dequantization scales (int8 only)
+    - chunks.jsonl: append-only log of chunk text/metadata and deletions
+    - *.compact, compact.commit: compact() output and its commit marker
+      (present only while compacting)
+
+Key Classes:
+    - LocalVectorStore: Vector store implementing the AuditGuideRAG protocol
+"""
+
+from typing import List, Dict, Iterable, Optional, Any
+import json
+import logging
+import os
+
+import numpy as np
+
+from .audit_guide_rag import ChunkMetadata, TextChunk
+
+logger = logging.getLogger(__name__)
+
+
+class LocalVectorStore:
+    """
+    NumPy-backed vector store with optional memory-mapped persistence.
+
+    Vectors are L2-normalized on insert so the dot product equals cosine
+    similarity. Deleted rows are tombstoned and skipped by search until
+    compact() rewrites the matrix.
+
+    Attributes:
+        INITIAL_CAPACITY: Rows allocated on first insert (default 1024)
+        BLOCK_ROWS: Rows scored per matrix product during search (default 16384)
+
+    Examples:
+        >>> store = LocalVectorStore("/var/lib/audit/guide_index")
+        >>> rag = AuditGuideRAG(embedding_model=model, vector_store=store)
+        >>> await rag.initialize()  # reopens the mmap and reloads chunks
+    """
+
+    INITIAL_CAPACITY = 1024
+    BLOCK_ROWS = 16384
+
+    MANIFEST_FILE = "manifest.json"
+    CHUNKS_FILE = "chunks.jsonl"
+    SCALES_FILE = "scales.f32"
+    COMPACT_MARKER = "compact.commit"
+    COMPACT_SUFFIX = ".compact"
+
+    def __init__(
+        self,
+        index_dir: Optional[str] = None,
+        quantize: bool = False
+    ):
+        """
+        Initialize the store, reopening an existing index if present.
+
+        Args:
+            index_dir: Directory for persistent files (None keeps everything in memory)
+            quantize: Store vectors as int8 with per-row scales (4x smaller)
+        """
+        self.index_dir = index_dir
+        self.quantize = quantize
+        self.dim: Optional[int] = None
+
+        self._capacity = 0
+        self._count = 0
+        self._vectors: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._deleted = np.zeros(0, dtype=bool)
+        self._chunks: List[Optional[TextChunk]] = []
+        self._rows: Dict[str, int] = {}
+        self._document_rows: Dict[str, set] = {}
+        self._log = None
+
+        if index_dir:
+            os.makedirs(index_dir, exist_ok=True)
+            self._open()
+
+    def count(self) -> int:
+        """Return the number of live (non-deleted) chunks."""
+        return len(self._rows)
+
+    # ------------------------------------------------------------------
+    # Vector store protocol
+    # ------------------------------------------------------------------
+
+    async def upsert(
+        self,
+        id: str,
+        embedding: List[float],
+        metadata: Dict[str, Any],
+        text: str
+    ) -> None:
+        """Insert or overwrite a single chunk."""
+        await self.upsert_many([
+            {"id": id, "embedding": embedding, "metadata": metadata, "text": text}
+        ])
+
+    async def upsert_many(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Insert or overwrite chunks in bulk.
+
+        Args:
+            records: Dicts with id, embedding, metadata and text keys
+        """
+        records = [r for r in records if r.get("embedding") is not None]
+        if not records:
+            return
+
+        matrix = np.asarray([r["embedding"] for r in records], dtype=np.float32)
+        if self.dim is None:
+            self.dim = matrix.shape[1]
+        elif matrix.shape[1] != self.dim:
+            raise ValueError(
+                f"Embedding dimension {matrix.shape[1]} does not match store dimension {self.dim}"
+            )
+
+        rows = []
+        assigned: Dict[str, int] = {}
+        for record in records:
+            row = assigned.get(record["id"], self._rows.get(record["id"]))
+            if row is None:
+                row = self._count
+                self._count += 1
+            assigned[record["id"]] = row
+            rows.append(row)
+
+        self._ensure_capacity(self._count)
+        self._write_rows(np.asarray(rows), _normalize(matrix))
+
+        for row, record in zip(rows, records):
+            self._set_chunk(row, record["id"], record["text"], record["metadata"])
+            self._append_log({
+                "row": row,
+                "id": record["id"],
+                "text": record["text"],
+                "metadata": record["metadata"]
+            })
+
+        self.flush()
+
+    async def search(
+        self,
+        embedding: List[float],
+        top_k: int
+    ) -> List[tuple]:
+        """
+        Find the chunks most similar to an embedding.
+
+        Args:
+            embedding: Query embedding
+            top_k: Number of results to return
+
+        Returns:
+            List of (chunk, cosine similarity) tuples sorted by score descending
+        """
+        if not self._rows or self.dim is None:
+            return []
+
+        query = _normalize(np.asarray([embedding], dtype=np.float32))
+        return [
+            (self._chunks[row], score)
+            for row, score in self._top_k(query, top_k)[0]
+        ]
+
+    async def search_many(
+        self,
+        embeddings: List[List[float]],
+        top_k: int
+    ) -> List[List[tuple]]:
+        """
+        Find the most similar chunks for many embeddings at once.
+
+        All queries are scored against each matrix block with a single
+        matrix product.
+
+        Args:
+            embeddings: Query embeddings
+            top_k: Number of results per query
+
+        Returns:
+            Per query, a list of (chunk, cosine similarity) tuples sorted by
+            score descending
+        """
+        if not embeddings:
+            return []
+        if not self._rows or self.dim is None:
+            return [[] for _ in embeddings]
+
+        queries = _normalize(np.asarray(embeddings, dtype=np.float32))
+        return [
+            [(self._chunks[row], score) for row, score in ranked]
+            for ranked in self._top_k(queries, top_k)
+        ]
+
+    async def delete_document(self, document_id: str, keep: Iterable[str] = ()) -> int:
+        """
+        Tombstone every chunk of a source document.
+
+        Args:
+            document_id: ID of the source document
+            keep: Chunk ids to keep (the new version of a re-ingested document)
+
+        Returns:
+            Number of chunks deleted
+        """
+        keep = set(keep)
+        rows = [
+            row for row in self._document_rows.get(document_id, ())
+            if self._chunks[row].metadata.chunk_id not in keep
+        ]
+
+        self._tombstone(rows)
+        return len(rows)
+
+    async def delete(self, ids: Iterable[str]) -> int:
+        """
+        Tombstone chunks by id.
+
+        Args:
+            ids: Chunk ids to delete (unknown ids are ignored)
+
+        Returns:
+            Number of chunks deleted
+        """
+        rows = [self._rows[chunk_id] for chunk_id in set(ids) if chunk_id in self._rows]
+        self._tombstone(rows)
+        return len(rows)
+
+    async def load_chunks(self) -> List[TextChunk]:
+        """
+        Return all live chunks in insertion order (embeddings stay in the matrix).
+
+        Returns:
+            List of TextChunk objects with embedding=None
+        """
+        return [chunk for chunk in self._chunks if chunk is not None]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Flush the memory-mapped matrix, sidecar log and manifest to disk."""
+        if not self.index_dir:
+            return
+
+        if isinstance(self._vectors, np.memmap):
+            self._vectors.flush()
+        if isinstance(self._scales, np.memmap):
+            self._scales.flush()
+        if self._log:
+            self._log.flush()
+
+        manifest = {
+            "dim": self.dim,
+            "capacity": self._capacity,
+            "quantize": self.quantize,
+        }
+        tmp_path = self._path(self.MANIFEST_FILE) + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self._path(self.MANIFEST_FILE))
+
+    def compact(self) -> int:
+        """
+        Drop tombstoned rows and rewrite the matrix and sidecar.
+
+        A persistent index is written to temporary files next to the live
+        ones and swapped in with os.replace() behind a commit marker, so a
+        crash leaves either the old or the compacted index (finished on the
+        next open), never a partial one.
+
+        Returns:
+            Number of rows reclaimed
+        """
+        live_rows = np.flatnonzero(~self._deleted[:self._count])
+        reclaimed = self._count - len(live_rows)
+        if reclaimed == 0:
+            return 0
+
+        vectors = np.array(self._vectors[live_rows])
+        scales = np.array(self._scales[live_rows]) if self.quantize else None
+        chunks = [self._chunks[row] for row in live_rows]
+
+        if self.index_dir:
+            self._write_compacted(vectors, scales, chunks)
+            self.close()
+            self._finish_compaction()
+            self._reset()
+            self._open()
+        else:
+            self._reset()
+            if chunks:
+                self._ensure_capacity(len(chunks))
+                self._vectors[:len(chunks)] = vectors
+                if scales is not None:
+                    self._scales[:len(chunks)] = scales
+            self._count = len(chunks)
+            for row, chunk in enumerate(chunks):
+                self._set_chunk(row, chunk.metadata.chunk_id, chunk.text, vars(chunk.metadata))
+
+        logger.info(f"LocalVectorStore compacted, reclaimed {reclaimed} rows")
+        return reclaimed
+
+    def close(self) -> None:
+        """Flush and release file handles and memory maps."""
+        self.flush()
+        if self._log:
+            self._log.close()
+            self._log = None
+        self._vectors = None
+        self._scales = None
+
+    def _open(self) -> None:
+        """Reopen an existing index: mmap the matrix and replay the sidecar."""
+        self._recover_compaction()
+        manifest_path = self._path(self.MANIFEST_FILE)
+
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            self.dim = manifest["dim"]
+            self.quantize = manifest["quantize"]
+            if self.dim and manifest["capacity"]:
+                self._map(manifest["capacity"])
+
+            self._replay_log(self._path(self.CHUNKS_FILE))
+            logger.info(
+                f"LocalVectorStore opened {self.index_dir} with {self.count()} chunks"
+            )
+
+        self._log = open(self._path(self.CHUNKS_FILE), "a", encoding="utf-8")
+
+    def _replay_log(self, path: str) -> None:
+        """Rebuild row bookkeeping from the append-only sidecar log."""
+        if not os.path.exists(path):
+            return
+
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                row = entry["row"]
+                if row >= self._count:
+                    self._count = row + 1
+                    self._grow_deleted(self._count)
+
+                if entry.get("deleted"):
+                    chunk = self._chunks[row]
+                    if chunk is not None:
+                        self._forget(row, chunk)
+                    self._deleted[row] = True
+                else:
+                    self._set_chunk(row, entry["id"], entry["text"], entry["metadata"])
+
+    # ------------------------------------------------------------------
+    # Compaction files
+    # ------------------------------------------------------------------
+
+    def _compaction_files(self) -> List[str]:
+        names = [self._vectors_file(), self.CHUNKS_FILE, self.MANIFEST_FILE]
+        if self.quantize:
+            names.append(self.SCALES_FILE)
+        return names
+
+    def _write_compacted(
+        self,
+        vectors: np.ndarray,
+        scales: Optional[np.ndarray],
+        chunks: List[TextChunk]
+    ) -> None:
+        """Write the compacted index to temporary files, then the commit marker."""
+        capacity = 0
+        if chunks:
+            capacity = self.INITIAL_CAPACITY
+            while capacity < len(chunks):
+                capacity *= 2
+
+        _write_file(
+            self._path(self._vectors_file()) + self.COMPACT_SUFFIX,
+            vectors.tobytes(),
+            capacity * self.dim * self._itemsize()
+        )
+        if scales is not None:
+            _write_file(
+                self._path(self.SCALES_FILE) + self.COMPACT_SUFFIX,
+                scales.astype(np.float32).tobytes(),
+                capacity * 4
+            )
+
+        lines = []
+        for row, chunk in enumerate(chunks):
+            entry = {
+                "row": row,
+                "id": chunk.metadata.chunk_id,
+                "text": chunk.text,
+                "metadata": vars(chunk.metadata)
+            }
+            lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+        _write_file(
+            self._path(self.CHUNKS_FILE) + self.COMPACT_SUFFIX,
+            "".join(lines).encode("utf-8")
+        )
+
+        manifest = {"dim": self.dim, "capacity": capacity, "quantize": self.quantize}
+        _write_file(
+            self._path(self.MANIFEST_FILE) + self.COMPACT_SUFFIX,
+            json.dumps(manifest).encode("utf-8")
+        )
+
+        # Commit point: from here on the compacted files replace the live ones
+        marker = self._path(self.COMPACT_MARKER)
+        _write_file(marker + ".tmp", json.dumps(self._compaction_files()).encode("utf-8"))
+        os.replace(marker + ".tmp", marker)
+
+    def _finish_compaction(self) -> None:
+        """Move committed compaction files into place and drop the marker."""
+        marker = self._path(self.COMPACT_MARKER)
+        with open(marker) as f:
+            names = json.load(f)
+        for name in names:
+            tmp_path = self._path(name) + self.COMPACT_SUFFIX
+            if os.path.exists(tmp_path):
+                os.replace(tmp_path, self._path(name))
+        os.remove(marker)
+
+    def _recover_compaction(self) -> None:
+        """Finish a committed compaction, or discard an interrupted one."""
+        if os.path.exists(self._path(self.COMPACT_MARKER)):
+            self._finish_compaction()
+            logger.info(f"LocalVectorStore finished interrupted compaction in {self.index_dir}")
+            return
+
+        for name in ("vectors.f32", "vectors.i8", self.SCALES_FILE, self.CHUNKS_FILE, self.MANIFEST_FILE):
+            tmp_path = self._path(name) + self.COMPACT_SUFFIX
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _append_log(self, entry: Dict[str, Any]) -> None:
+        if self._log:
+            self._log.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    # ------------------------------------------------------------------
+    # Matrix management
+    # ------------------------------------------------------------------
+
+    def _ensure_capacity(self, rows: int) -> None:
+        """Grow the matrix (doubling) so it holds at least `rows` rows."""
+        if rows > self._capacity:
+            capacity = max(self._capacity, self.INITIAL_CAPACITY)
+            while capacity < rows:
+                capacity *= 2
+            self._resize(capacity)
+        self._grow_deleted(rows)
+
+    def _resize(self, capacity: int) -> None:
+        if self.index_dir:
+            # Extend the backing files in place and remap; no data copy
+            self._vectors = None
+            self._scales = None
+            _extend_file(self._path(self._vectors_file()), capacity * self.dim * self._itemsize())
+            if self.quantize:
+                _extend_file(self._path(self.SCALES_FILE), capacity * 4)
+            self._map(capacity)
+            return
+
+        vectors = np.zeros((capacity, self.dim), dtype=self._dtype())
+        if self._vectors is not None:
+            vectors[:self._capacity] = self._vectors
+        self._vectors = vectors
+
+        if self.quantize:
+            scales = np.zeros(capacity, dtype=np.float32)
+            if self._scales is not None:
+                scales[:self._capacity] = self._scales
+            self._scales = scales
+
+        self._capacity = capacity
+
+    def _map(self, capacity: int) -> None:
+        self._vectors = np.memmap(
+            self._path(self._vectors_file()),
+            dtype=self._dtype(),
+            mode="r+",
+            shape=(capacity, self.dim)
+        )
+        if self.quantize:
+            self._scales = np.memmap(
+                self._path(self.SCALES_FILE),
+                dtype=np.float32,
+                mode="r+",
+                shape=(capacity,)
+            )
+        self._capacity = capacity
+
+    def _write_rows(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        if self.quantize:
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            self._vectors[rows] = np.round(vectors / scales[:, None]).astype(np.int8)
+            self._scales[rows] = scales
+        else:
+            self._vectors[rows] = vectors
+        self._deleted[rows] = False
+
+    def _top_k(self, queries: np.ndarray, top_k: int) -> List[List[tuple]]:
+        """
+        Score normalized queries against every live row in blocks.
+
+        Each block keeps only its own top-k candidates (argpartition), so the
+        temporary score matrix never exceeds BLOCK_ROWS x len(queries).
+
+        Args:
+            queries: (n_queries, dim) float32 matrix of normalized queries
+            top_k: Number of results per query
+
+        Returns:
+            Per query, a list of (row, score) tuples sorted by score descending
+        """
+        n_queries = queries.shape[0]
+        candidate_rows: List[np.ndarray] = []
+        candidate_scores: List[np.ndarray] = []
+
+        for start in range(0, self._count, self.BLOCK_ROWS):
+            end = min(start + self.BLOCK_ROWS, self._count)
+            block = self._vectors[start:end]
+
+            if self.quantize:
+                scores = (block.astype(np.float32) @ queries.T) * self._scales[start:end, None]
+            else:
+                scores = block @ queries.T
+            scores[self._deleted[start:end]] = -np.inf
+
+            k = min(top_k, end - start)
+            part = np.argpartition(-scores, k - 1, axis=0)[:k]
+            candidate_rows.append(part + start)
+            candidate_scores.append(np.take_along_axis(scores, part, axis=0))
+
+        rows = np.concatenate(candidate_rows, axis=0)
+        scores = np.concatenate(candidate_scores, axis=0)
+
+        k = min(top_k, rows.shape[0])
+        part = np.argpartition(-scores, k - 1, axis=0)[:k]
+        rows = np.take_along_axis(rows, part, axis=0)
+        scores = np.take_along_axis(scores, part, axis=0)
+        order = np.argsort(-scores, axis=0, kind="stable")
+        rows = np.take_along_axis(rows, order, axis=0)
+        scores = np.take_along_axis(scores, order, axis=0)
+
+        return [
+            [
+                (int(row), float(score))
+                for row, score in zip(rows[:, q], scores[:, q])
+                if score != -np.inf
+            ]
+            for q in range(n_queries)
+        ]
+
+    # ------------------------------------------------------------------
+    # Row bookkeeping
+    # ------------------------------------------------------------------
+
+    def _set_chunk(
+        self,
+        row: int,
+        chunk_id: str,
+        text: str,
+        metadata: Dict[str, Any]
+    ) -> None:
+        previous = self._chunks[row] if row < len(self._chunks) else None
+        if previous is not None:
+            self._forget(row, previous)
+
+        chunk = TextChunk(text=text, metadata=ChunkMetadata(**metadata))
+        if row >= len(self._chunks):
+            self._chunks.extend([None] * (row + 1 - len(self._chunks)))
+        self._chunks[row] = chunk
+        self._rows[chunk_id] = row
+        self._document_rows.setdefault(chunk.metadata.document_id, set()).add(row)
+        self._deleted[row] = False
+
+    def _forget(self, row: int, chunk: TextChunk) -> None:
+        self._rows.pop(chunk.metadata.chunk_id, None)
+        document_rows = self._document_rows.get(chunk.metadata.document_id)
+        if document_rows is not None:
+            document_rows.discard(row)
+            if not document_rows:
+                del self._document_rows[chunk.metadata.document_id]
+        self._chunks[row] = None
+
+    def _tombstone(self, rows: List[int]) -> None:
+        for row in rows:
+            self._forget(row, self._chunks[row])
+            self._deleted[row] = True
+            self._append_log({"row": row, "deleted": True})
+
+        if rows:
+            self.flush()
+
+    def _grow_deleted(self, rows: int) -> None:
+        if rows > len(self._deleted):
+            grown = np.zeros(max(rows, 2 * len(self._deleted)), dtype=bool)
+            grown[:len(self._deleted)] = self._deleted
+            self._deleted = grown
+
+    def _reset(self) -> None:
+        self._vectors = None
+        self._scales = None
+        self._capacity = 0
+        self._count = 0
+        self._deleted = np.zeros(0, dtype=bool)
+        self._chunks = []
+        self._rows = {}
+        self._document_rows = {}
+
+    def _dtype(self):
+        return np.int8 if self.quantize else np.float32
+
+    def _itemsize(self) -> int:
+        return np.dtype(self._dtype()).itemsize
+
+    def _vectors_file(self) -> str:
+        return "vectors.i8" if self.quantize else "vectors.f32"
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.index_dir, name)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows so dot products are cosine similarities."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _write_file(path: str, data: bytes, size: int = 0) -> None:
+    """Write `data` (zero-padded to `size` bytes) and fsync it."""
+    with open(path, "wb") as f:
+        f.write(data)
+        if size > len(data):
+            f.truncate(size)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _extend_file(path: str, size: int) -> None:
+    """Grow a file to `size` bytes (zero-filled) without rewriting it."""
+    with open(path, "ab") as f:
+        if f.tell() < size:
+            f.truncate(size)
@@ -101,8 +101,8 @@ async def search_standards(
     try:
         client = await _get_rag_client()
 
-        # Check health first
-        if not await client.health_check():
+        # Cached health state (no extra round trip before the call)
+        if not client.is_available():
             logger.warning("MCP RAG server unavailable, returning fallback")
             return json.dumps({
                 "status": "unavailable",
@@ -190,7 +190,7 @@ async def get_paragraph_by_id(
     try:
         client = await _get_rag_client()
 
-        if not await client.health_check():
+        if not client.is_available():
             return json.dumps({
                 "status": "unavailable",
                 "message": "MCP RAG server is not available",
@@ -280,7 +280,7 @@ async def read_excel_structure(
     try:
         client = await _get_excel_client()
 
-        if not await client.health_check():
+        if not client.is_available():
             return json.dumps({
                 "status": "unavailable",
                 "message": "MCP Excel server is not available",
@@ -370,7 +370,7 @@ async def analyze_workpaper_structure(
     try:
         client = await _get_excel_client()
 
-        if not await client.health_check():
+        if not client.is_available():
             return json.dumps({
                 "status": "unavailable",
                 "message": "MCP Excel server is not available",
@@ -28,6 +28,7 @@ Key Assumptions:
 """
 
 import pytest
+from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 from uuid import uuid4
@@ -46,6 +47,26 @@ from src.graph.state import TaskState
 # FIXTURES - Mock Data and Supabase Client
 # ============================================================================
 
+@contextmanager
+def patch_supabase():
+    """
+    Replace the async database layer used by task_sync with a mock client.
+
+    Query chains on the yielded mock are configured synchronously
+    (``...execute.return_value``); the fake ``db.execute`` runs the chain
+    and returns its result.
+
+    Yields:
+        MagicMock: Mock Supabase client
+    """
+    mock_supabase = MagicMock()
+    db = MagicMock()
+    db.table = lambda name: mock_supabase.table(name)
+    db.execute = AsyncMock(side_effect=lambda query, timeout=None: query.execute())
+    with patch("src.services.task_sync.get_async_db", return_value=db):
+        yield mock_supabase
+
+
 @pytest.fixture
 def sample_task_state() -> TaskState:
     """
@@ -162,7 +183,7 @@ async def test_sync_task_creates_record(sample_task_state, sample_project_id):
     - Returns task_id from response
     - No messages or artifacts are synced when empty
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         # Setup mock response
         expected_task_id = str(uuid4())
         mock_response = MagicMock()
@@ -216,7 +237,7 @@ async def test_sync_task_upserts_on_conflict(sample_task_state, sample_project_i
     - Upsert operation updates existing task when thread_id exists
     - Task ID is correctly returned from updated record
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         expected_task_id = str(uuid4())
         mock_response = MagicMock()
         mock_response.data = [{"id": expected_task_id}]
@@ -255,7 +276,7 @@ async def test_sync_inserts_messages(sample_task_state_with_messages, sample_pro
     - Insert operation is called for agent_messages table
     - All messages are inserted in batch
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         expected_task_id = str(uuid4())
 
         # Setup mock responses
@@ -310,7 +331,7 @@ async def test_sync_inserts_workpaper(sample_task_state, sample_project_id):
     - Insert operation called for audit_artifacts table
     - Artifact is not created if workpaper_draft is empty
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         expected_task_id = str(uuid4())
 
         upsert_response = MagicMock()
@@ -359,7 +380,7 @@ async def test_get_task_by_thread_id():
     - Returns task dict when found
     - All task fields are in response
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         expected_task = {
             "id": str(uuid4()),
             "thread_id": "task-001",
@@ -409,7 +430,7 @@ async def test_get_task_not_found():
     - Returns None when no data in response
     - Still calls correct query chain
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         mock_response = MagicMock()
         mock_response.data = []
 
@@ -465,7 +486,7 @@ async def test_sync_multiple_tasks(sample_project_id):
         for i, category in enumerate(["Sales", "Inventory", "AR"], 1)
     ]
 
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         mock_table = MagicMock()
 
         def execute_side_effect():
@@ -538,7 +559,7 @@ async def test_sync_error_upsert_failure(sample_task_state, sample_project_id):
     - Exception raised when upsert returns empty data
     - Error message indicates upsert failure
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         # Setup mock to return empty data (failure)
         mock_response = MagicMock()
         mock_response.data = []  # Empty response indicates failure
@@ -571,7 +592,7 @@ async def test_sync_error_message_insertion(
     - Exception raised when message insert returns empty data
     - Error message indicates message insertion failure
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         upsert_response = MagicMock()
         upsert_response.data = [{"id": str(uuid4())}]
 
@@ -614,7 +635,7 @@ async def test_sync_error_workpaper_insertion(
     - Exception raised when artifact insert returns empty data
     - Error message indicates artifact insertion failure
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         upsert_response = MagicMock()
         upsert_response.data = [{"id": str(uuid4())}]
 
@@ -651,7 +672,7 @@ async def test_sync_without_workpaper(sample_task_state_no_workpaper, sample_pro
     - No artifact insertion when workpaper_draft is empty
     - Task is still synced successfully
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         expected_task_id = str(uuid4())
 
         mock_response = MagicMock()
@@ -696,7 +717,7 @@ async def test_sync_preserves_metadata(sample_task_state, sample_project_id):
     - Boolean flags are correctly set based on data presence
     - Metadata is included in upsert payload
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         expected_task_id = str(uuid4())
 
         mock_response = MagicMock()
@@ -743,7 +764,7 @@ async def test_sync_includes_iso_timestamp(sample_task_state, sample_project_id)
     - updated_at field is present
     - Timestamp is in ISO format (YYYY-MM-DDTHH:MM:SS.ffffff)
     """
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         expected_task_id = str(uuid4())
 
         mock_response = MagicMock()
@@ -810,7 +831,7 @@ async def test_sync_extracts_message_agent_role(sample_project_id):
         risk_score=50,
     )
 
-    with patch("src.services.task_sync.supabase") as mock_supabase:
+    with patch_supabase() as mock_supabase:
         expected_task_id = str(uuid4())
 
         upsert_response = MagicMock()
@@ -11,18 +11,29 @@ Test Classes:
     - TestPDFIngestion: PDF ingestion workflow tests
     - TestChunkMetadata: Metadata handling tests
     - TestAssertionClassification: Assertion keyword detection tests
+    - TestBM25Index: Inverted index and tokenizer tests
+    - TestIncrementalIndex: In-place index update tests
+    - TestBatchedIngestion: Batched embedding and bulk upsert tests
+    - TestStreamingPipeline: Staged ingestion pipeline tests
+    - TestSearchCache: Search result cache tests
+    - TestSearchMany: Batch search API tests
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.services.audit_guide_rag import (
+    AssertionClassifier,
     AuditGuideRAG,
     AuditProcedure,
+    BM25Index,
     RAGSearchResult,
+    SearchCache,
     SearchMode,
     TextChunk,
     ChunkMetadata,
-    create_audit_guide_rag
+    create_audit_guide_rag,
+    tokenize
 )
 
 
@@ -584,6 +595,105 @@ class TestBM25Search:
         assert scores == sorted(scores, reverse=True)
 
 
+# ============================================================================
+# BM25 INDEX TESTS
+# ============================================================================
+
+class TestBM25Index:
+    """Tests for the inverted-index BM25 engine."""
+
+    def test_tokenize_hangul_bigrams(self):
+        """Should split Hangul runs into bigrams so particles don't block matches."""
+        assert tokenize("은행조회서를") == ["은행", "행조", "조회", "회서", "서를"]
+
+    def test_tokenize_keeps_ascii_words_and_codes(self):
+        """Should lowercase ASCII words and keep section codes whole."""
+        assert tokenize("FSLI: AR 3.1") == ["fsli", "ar", "3.1"]
+
+    def test_tokenize_single_syllable(self):
+        """Should keep single Hangul syllables as-is."""
+        assert tokenize("및 은") == ["및", "은"]
+
+    def test_build_creates_postings(self, rag_service, sample_chunks):
+        """Should build postings, document lengths and IDF once."""
+        rag_service.chunks = sample_chunks
+        rag_service._build_bm25_index()
+
+        index = rag_service.bm25_index
+        assert isinstance(index, BM25Index)
+        assert len(index) == 3
+        assert set(index.postings["은행"].keys()) == {0}
+        assert index._term_idf("은행") > index._term_idf("확인")
+
+    def test_search_matches_stem_with_particle(self, sample_chunks):
+        """Should match '잔액' inside '잔액을' via bigrams."""
+        index = BM25Index()
+        index.add(sample_chunks)
+
+        results = index.search("잔액", top_k=5)
+
+        ids = {chunk.metadata.chunk_id for chunk, _ in results}
+        assert ids == {"doc1_0", "doc1_1"}
+
+    def test_search_only_returns_matching_documents(self, sample_chunks):
+        """Should not score documents outside the query term postings."""
+        index = BM25Index()
+        index.add(sample_chunks)
+
+        results = index.search("재고자산", top_k=10)
+
+        assert [c.metadata.chunk_id for c, _ in results] == ["doc1_2"]
+
+    def test_search_scores_normalized(self, sample_chunks):
+        """Should keep scores within (0, 1]."""
+        index = BM25Index()
+        index.add(sample_chunks)
+
+        results = index.search("은행 존재성 확인", top_k=10)
+
+        assert results
+        assert all(0.0 < score <= 1.0 for _, score in results)
+
+    def test_unseen_terms_lower_score(self, sample_chunks):
+        """Should penalize query terms that do not occur in the corpus."""
+        index = BM25Index()
+        index.add(sample_chunks)
+
+        full = index.search("금융기관", top_k=1)[0][1]
+        partial = index.search("금융기관 xyznonexistent", top_k=1)[0][1]
+
+        assert partial < full
+
+    def test_term_frequency_ranks_higher(self):
+        """Should rank a chunk with more occurrences of the term first."""
+        chunks = [
+            TextChunk(
+                text=text,
+                metadata=ChunkMetadata(
+                    chunk_id=f"tf_{i}",
+                    document_id="tf",
+                    section_code="1.0",
+                    section_title="TF",
+                    page_number=1,
+                    chunk_index=i,
+                    total_chunks=3
+                )
+            )
+            for i, text in enumerate([
+                "재고 실사 절차",
+                "재고 재고 재고 실사",
+                "매출 인식 검토",
+            ])
+        ]
+        index = BM25Index()
+        index.add(chunks)
+
+        results = index.search("재고", top_k=3)
+
+        assert results[0][0].metadata.chunk_id == "tf_1"
+        assert len(results) == 2
+
+
 # ============================================================================
 # FACTORY FUNCTION TESTS
 # ============================================================================
@@ -728,6 +838,630 @@ class TestPDFIngestion:
         mock_store.upsert.assert_called()
 
 
+# ============================================================================
+# BATCHED INGESTION TESTS
+# ============================================================================
+
+class BatchEmbeddingModel:
+    """Embedding model with a batch API that records batch sizes."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    async def embed(self, text):
+        return [0.0]
+
+    async def embed_batch(self, texts):
+        self.batch_sizes.append(len(texts))
+        return [[float(len(t))] for t in texts]
+
+
+class BulkVectorStore:
+    """Vector store with a bulk upsert API that tracks concurrency."""
+
+    def __init__(self):
+        self.records = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def upsert(self, id, embedding, metadata, text):
+        raise AssertionError("per-chunk upsert should not be used")
+
+    async def upsert_many(self, records):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.records.extend(records)
+        self.in_flight -= 1
+
+    async def search(self, embedding, top_k):
+        return []
+
+
+def _make_chunks(count):
+    return [
+        TextChunk(
+            text=f"chunk {i}",
+            metadata=ChunkMetadata(
+                chunk_id=f"bulk_{i}",
+                document_id="bulk",
+                section_code="1.0",
+                section_title="Bulk",
+                page_number=1,
+                chunk_index=i,
+                total_chunks=count
+            )
+        )
+        for i in range(count)
+    ]
+
+
+class TestBatchedIngestion:
+    """Tests for batched embedding and bulk upserts."""
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_api_used(self):
+        """Should call embed_batch once per batch when available."""
+        model = BatchEmbeddingModel()
+        rag = AuditGuideRAG(embedding_model=model, batch_size=4)
+        chunks = _make_chunks(10)
+
+        await rag._generate_embeddings(chunks)
+
+        assert sorted(model.batch_sizes) == [2, 4, 4]
+        assert chunks[7].embedding == [float(len("chunk 7"))]
+
+    @pytest.mark.asyncio
+    async def test_embed_fallback_preserves_order(self):
+        """Should map concurrent single embeddings back to their chunks."""
+        model = AsyncMock()
+        model.embed = AsyncMock(side_effect=lambda text: [float(text.split()[1])])
+        rag = AuditGuideRAG(embedding_model=model, batch_size=3)
+        chunks = _make_chunks(7)
+
+        await rag._generate_embeddings(chunks)
+
+        assert [c.embedding for c in chunks] == [[float(i)] for i in range(7)]
+        assert model.embed.await_count == 7
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_bounded_concurrency(self):
+        """Should use upsert_many and keep in-flight batches bounded."""
+        store = BulkVectorStore()
+        rag = AuditGuideRAG(vector_store=store, batch_size=2, max_concurrency=2)
+        chunks = _make_chunks(9)
+
+        await rag._store_chunks(chunks)
+
+        assert len(store.records) == 9
+        assert store.max_in_flight <= 2
+        assert {"id", "embedding", "metadata", "text"} <= set(store.records[0])
+
+    @pytest.mark.asyncio
+    async def test_ingest_reports_stage_throughput(self):
+        """Should report per-stage timings and throughput."""
+        rag = AuditGuideRAG(
+            embedding_model=BatchEmbeddingModel(),
+            vector_store=BulkVectorStore()
+        )
+        with patch.object(
+            rag,
+            '_extract_pdf_text',
+            new_callable=AsyncMock,
+            return_value=[{"page_number": 1, "text": "A" * 3000, "section": "1.1"}]
+        ):
+            result = await rag.ingest_pdf("/path/to/test.pdf")
+
+        stages = {"extract", "chunk", "embed", "store"}
+        assert set(result["stage_times_ms"]) == stages
+        assert set(result["stage_throughput"]) == stages
+        assert all(v >= 0 for v in result["stage_throughput"].values())
+
+    def test_default_batch_settings(self, rag_service):
+        """Should fall back to class-level batch defaults."""
+        assert rag_service.batch_size == AuditGuideRAG.EMBED_BATCH_SIZE
+        assert rag_service.max_concurrency == AuditGuideRAG.MAX_CONCURRENT_REQUESTS
+
+
+# ============================================================================
+# STREAMING PIPELINE TESTS
+# ============================================================================
+
+class TestStreamingPipeline:
+    """Tests for the staged, bounded-queue ingestion pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_stages_overlap_with_bounded_buffering(self):
+        """Should start storing before extraction finishes."""
+        store = BulkVectorStore()
+        rag = AuditGuideRAG(
+            embedding_model=BatchEmbeddingModel(),
+            vector_store=store,
+            batch_size=1,
+            max_concurrency=1
+        )
+        rag.PIPELINE_QUEUE_SIZE = 2
+        progress = {"pages_yielded": 0, "yielded_at_first_store": None}
+        original_upsert = store.upsert_many
+
+        async def pages(pdf_path):
+            for i in range(100):
+                progress["pages_yielded"] += 1
+                yield {"page_number": i + 1, "text": f"page {i}", "section": "1.1"}
+
+        async def tracking_upsert(records):
+            if progress["yielded_at_first_store"] is None:
+                progress["yielded_at_first_store"] = progress["pages_yielded"]
+            await original_upsert(records)
+
+        store.upsert_many = tracking_upsert
+        with patch.object(rag, '_iter_pdf_pages', pages):
+            result = await rag.ingest_pdf("/big.pdf", document_id="big")
+
+        assert result["pages_processed"] == 100
+        assert result["chunks_created"] == 100
+        assert progress["yielded_at_first_store"] < 20
+
+    @pytest.mark.asyncio
+    async def test_chunks_ordered_and_counted(self):
+        """Should keep chunk order and set total_chunks after streaming."""
+        rag = AuditGuideRAG(
+            embedding_model=BatchEmbeddingModel(),
+            vector_store=BulkVectorStore(),
+            batch_size=2,
+            max_concurrency=3
+        )
+        pages = [
+            {"page_number": i, "text": "A" * 1500, "section": "1.1"}
+            for i in range(1, 6)
+        ]
+        with patch.object(rag, '_extract_pdf_text', new_callable=AsyncMock, return_value=pages):
+            result = await rag.ingest_pdf("/guide.pdf", document_id="guide")
+
+        indexes = [c.metadata.chunk_index for c in rag.chunks]
+        assert indexes == list(range(result["chunks_created"]))
+        assert all(c.metadata.total_chunks == len(rag.chunks) for c in rag.chunks)
+        assert all(c.embedding is None for c in rag.chunks)
+
+    @pytest.mark.asyncio
+    async def test_stage_failure_propagates(self):
+        """Should cancel the pipeline and raise when a stage fails."""
+        model = AsyncMock()
+        model.embed = AsyncMock(side_effect=RuntimeError("embedding service down"))
+        rag = AuditGuideRAG(embedding_model=model, batch_size=1)
+        pages = [{"page_number": i, "text": f"page {i}", "section": "1.1"} for i in range(50)]
+
+        with patch.object(rag, '_extract_pdf_text', new_callable=AsyncMock, return_value=pages):
+            with pytest.raises(RuntimeError, match="embedding service down"):
+                await asyncio.wait_for(rag.ingest_pdf("/guide.pdf"), timeout=5)
+
+        assert rag.chunks == []
+
+
+# ============================================================================
+# SEARCH CACHE TESTS
+# ============================================================================
+
+class TestSearchCache:
+    """Tests for the TTL/LRU search result cache."""
+
+    def test_lru_eviction(self):
+        """Should evict the least recently used entry when full."""
+        cache = SearchCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Should treat expired entries as misses."""
+        cache = SearchCache(max_entries=10, ttl_seconds=60)
+        with patch("src.services.audit_guide_rag.time.monotonic", return_value=1000.0):
+            cache.set("a", 1)
+        with patch("src.services.audit_guide_rag.time.monotonic", return_value=1061.0):
+            assert cache.get("a") is None
+
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_hits_cache(self, rag_service, sample_chunks):
+        """Should serve normalized repeat queries from the cache."""
+        rag_service.chunks = sample_chunks
+        rag_service._build_bm25_index()
+
+        first = await rag_service.search("은행 잔액", mode=SearchMode.BM25, min_score=0.1)
+        with patch.object(rag_service, '_bm25_search') as bm25:
+            second = await rag_service.search("  은행   잔액 ", mode=SearchMode.BM25, min_score=0.1)
+
+        bm25.assert_not_called()
+        assert [p.id for p in second.procedures] == [p.id for p in first.procedures]
+        assert second.query == "  은행   잔액 "
+        stats = rag_service.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_results_isolated_from_callers(self, rag_service, sample_chunks):
+        """Should not let a caller's edits leak into later cache hits."""
+        rag_service.chunks = sample_chunks
+        rag_service._build_bm25_index()
+
+        first = await rag_service.search("은행 잔액", mode=SearchMode.BM25, min_score=0.1)
+        first.procedures[0].related_assertions.append("tampered")
+        first.procedures[0].relevance_score = -1.0
+        second = await rag_service.search("은행 잔액", mode=SearchMode.BM25, min_score=0.1)
+        second.procedures[0].section_title = "tampered"
+        third = await rag_service.search("은행 잔액", mode=SearchMode.BM25, min_score=0.1)
+
+        assert rag_service.get_cache_stats()["hits"] == 2
+        assert "tampered" not in third.procedures[0].related_assertions
+        assert third.procedures[0].relevance_score > 0
+        assert third.procedures[0].section_title != "tampered"
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_parameters(self, rag_service, sample_chunks):
+        """Should not share entries across modes or top_k values."""
+        rag_service.chunks = sample_chunks
+        rag_service._build_bm25_index()
+
+        await rag_service.search("은행", mode=SearchMode.BM25, top_k=1)
+        await rag_service.search("은행", mode=SearchMode.BM25, top_k=2)
+        await rag_service.search("은행", mode=SearchMode.HYBRID, top_k=1)
+
+        assert rag_service.get_cache_stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_ingest_invalidates_cache(self, rag_service, sample_chunks):
+        """Should recompute results after the corpus changes."""
+        rag_service.chunks = list(sample_chunks)
+        rag_service._build_bm25_index()
+        await rag_service.search("재고", mode=SearchMode.BM25, min_score=0.1)
+        version = rag_service.get_cache_stats()["index_version"]
+
+        with patch.object(
+            rag_service,
+            '_extract_pdf_text',
+            new_callable=AsyncMock,
+            return_value=[{"page_number": 1, "text": "재고 재고 평가", "section": "9.1"}]
+        ):
+            await rag_service.ingest_pdf("/new.pdf", document_id="new")
+
+        result = await rag_service.search("재고", mode=SearchMode.BM25, min_score=0.1)
+
+        stats = rag_service.get_cache_stats()
+        assert stats["index_version"] > version
+        assert stats["hits"] == 0
+        new_ids = {c.metadata.chunk_id for c in rag_service.chunks if c.metadata.document_id == "new"}
+        assert new_ids & {p.id for p in result.procedures}
+
+    @pytest.mark.asyncio
+    async def test_search_for_ega_reuses_embedding(self, sample_chunks):
+        """Should embed a repeated EGA query only once."""
+        model = AsyncMock()
+        model.embed = AsyncMock(return_value=[0.1, 0.2])
+        store = AsyncMock()
+        store.search = AsyncMock(return_value=[(sample_chunks[0], 0.9)])
+        rag = AuditGuideRAG(embedding_model=model, vector_store=store)
+        rag.chunks = sample_chunks
+        rag._build_bm25_index()
+        rag._initialized = True
+
+        for _ in range(3):
+            await rag.search_for_ega("은행 잔액을 확인한다", context={"fsli": "Cash"})
+
+        assert model.embed.await_count == 1
+
+
+# ============================================================================
+# BATCH SEARCH TESTS
+# ============================================================================
+
+class VocabEmbeddingModel:
+    """Deterministic batch embedding model over a fixed vocabulary."""
+
+    VOCAB = ["은행", "재고", "매출"]
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    async def embed(self, text):
+        return [float(text.count(word)) + 0.01 for word in self.VOCAB]
+
+    async def embed_batch(self, texts):
+        self.batch_sizes.append(len(texts))
+        return [await self.embed(text) for text in texts]
+
+
+def _search_corpus():
+    pages = [
+        ("1.1", "은행 잔액 조회서를 발송한다"),
+        ("2.1", "재고 실사에 입회한다"),
+        ("3.1", "매출 거래의 기간귀속을 검토한다"),
+    ]
+    return [
+        TextChunk(
+            text=text,
+            metadata=ChunkMetadata(
+                chunk_id=f"guide_{i}",
+                document_id="guide",
+                section_code=code,
+                section_title=f"{code} Section",
+                page_number=i + 1,
+                chunk_index=i,
+                total_chunks=len(pages)
+            )
+        )
+        for i, (code, text) in enumerate(pages)
+    ]
+
+
+class TestSearchMany:
+    """Tests for the batch search API."""
+
+    def test_bm25_search_many_matches_search(self):
+        """Should score each query exactly like a single-query search."""
+        index = BM25Index()
+        index.add(_search_corpus())
+        queries = ["은행 잔액", "재고 실사 입회", "매출 은행", "없는단어"]
+
+        batched = index.search_many(queries, top_k=3)
+
+        for query, results in zip(queries, batched):
+            single = index.search(query, top_k=3)
+            assert [c.metadata.chunk_id for c, _ in results] == [c.metadata.chunk_id for c, _ in single]
+            assert [s for _, s in results] == pytest.approx([s for _, s in single])
+        assert batched[3] == []
+
+    @pytest.mark.asyncio
+    async def test_search_many_matches_search(self):
+        """Should return the same procedures as one search per query."""
+        from src.services.vector_store import LocalVectorStore
+
+        rag = AuditGuideRAG(embedding_model=VocabEmbeddingModel(), vector_store=LocalVectorStore())
+        rag.chunks = _search_corpus()
+        await rag._generate_embeddings(rag.chunks)
+        await rag._store_chunks(rag.chunks)
+        rag._build_bm25_index()
+        rag._initialized = True
+        queries = ["은행 잔액", "재고 실사", "매출 기간귀속"]
+
+        batched = await rag.search_many(queries, min_score=0.01)
+        rag.search_cache.clear()
+        single = [await rag.search(q, min_score=0.01) for q in queries]
+
+        for b, s in zip(batched, single):
+            assert b.query == s.query
+            assert [p.section_code for p in b.procedures] == [p.section_code for p in s.procedures]
+
+    @pytest.mark.asyncio
+    async def test_queries_embedded_in_one_batch(self):
+        """Should embed all uncached queries with a single batch call."""
+        model = VocabEmbeddingModel()
+        store = AsyncMock()
+        store.search = AsyncMock(return_value=[])
+        rag = AuditGuideRAG(embedding_model=model, vector_store=store)
+        rag._initialized = True
+
+        await rag.search_many(["은행", "재고", "매출"], mode=SearchMode.SEMANTIC)
+
+        assert model.batch_sizes == [3]
+        assert store.search.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicates_and_cache_hits_not_recomputed(self):
+        """Should compute each distinct uncached query once."""
+        model = VocabEmbeddingModel()
+        store = AsyncMock()
+        store.search = AsyncMock(return_value=[])
+        rag = AuditGuideRAG(embedding_model=model, vector_store=store)
+        rag._initialized = True
+        await rag.search("은행", mode=SearchMode.SEMANTIC)
+
+        results = await rag.search_many(
+            ["은행", "재고", " 재고 ", "매출"], mode=SearchMode.SEMANTIC
+        )
+
+        assert model.batch_sizes == [2]
+        assert [r.query for r in results] == ["은행", "재고", " 재고 ", "매출"]
+
+    @pytest.mark.asyncio
+    async def test_search_for_egas(self):
+        """Should return one procedure list per EGA in input order."""
+        rag = AuditGuideRAG()
+        rag._initialized = True
+        rag.chunks = _search_corpus()
+        rag._build_bm25_index()
+
+        with patch.object(rag, 'search_many', wraps=rag.search_many) as search_many:
+            results = await rag.search_for_egas([
+                {"ega_name": "재고 실사"},
+                {"ega_name": "은행 잔액", "context": {"fsli": "현금"}},
+            ])
+
+        assert len(results) == 2
+        assert all(isinstance(procedures, list) for procedures in results)
+        assert search_many.await_args.args[0] == ["재고 실사", "은행 잔액 FSLI: 현금"]
+
+
+# ============================================================================
+# INCREMENTAL INDEX TESTS
+# ============================================================================
+
+class TestIncrementalIndex:
+    """Tests for in-place index updates on ingest and removal."""
+
+    def test_index_remove_document(self, sample_chunks, chunk_with_rights):
+        """Should drop postings and lengths of the removed document only."""
+        index = BM25Index()
+        index.add(sample_chunks + [chunk_with_rights])
+
+        removed = index.remove_document("doc1")
+
+        assert removed == 3
+        assert len(index) == 1
+        assert not index.has_document("doc1")
+        assert "은행" not in index.postings
+        assert index.search("은행", top_k=5) == []
+        assert index.search("권리", top_k=5)[0][0] is chunk_with_rights
+
+    def test_index_remove_unknown_document(self, sample_chunks):
+        """Should be a no-op for unknown document IDs."""
+        index = BM25Index()
+        index.add(sample_chunks)
+
+        assert index.remove_document("missing") == 0
+        assert len(index) == 3
+
+    def test_index_add_updates_idf(self, sample_chunks, chunk_with_rights):
+        """Should invalidate memoized IDF values when the corpus grows."""
+        index = BM25Index()
+        index.add([chunk_with_rights])
+        index.search("권리", top_k=1)
+        before = index.idf["권리"]
+
+        index.add(sample_chunks)
+        index.search("권리", top_k=1)
+
+        assert index.idf["권리"] > before
+
+    @pytest.mark.asyncio
+    async def test_ingest_does_not_rebuild_index(self, rag_service):
+        """Should append to the existing index instead of rebuilding it."""
+        pages = [{"page_number": 1, "text": "은행 잔액 확인", "section": "1.1"}]
+        with patch.object(
+            rag_service,
+            '_extract_pdf_text',
+            new_callable=AsyncMock,
+            return_value=pages
+        ):
+            await rag_service.ingest_pdf("/a.pdf", document_id="a")
+            index = rag_service.bm25_index
+
+            with patch.object(rag_service, '_build_bm25_index') as build:
+                await rag_service.ingest_pdf("/b.pdf", document_id="b")
+
+        build.assert_not_called()
+        assert rag_service.bm25_index is index
+        assert len(index) == 2
+
+    @pytest.mark.asyncio
+    async def test_reingest_replaces_document(self, rag_service):
+        """Should replace chunks when the same document_id is ingested again."""
+        with patch.object(
+            rag_service,
+            '_extract_pdf_text',
+            new_callable=AsyncMock,
+            return_value=[{"page_number": 1, "text": "구버전 재고 실사", "section": "1.1"}]
+        ):
+            await rag_service.ingest_pdf("/guide.pdf", document_id="guide")
+
+        with patch.object(
+            rag_service,
+            '_extract_pdf_text',
+            new_callable=AsyncMock,
+            return_value=[{"page_number": 1, "text": "신버전 매출 인식", "section": "1.1"}]
+        ):
+            result = await rag_service.ingest_pdf("/guide.pdf", document_id="guide")
+
+        assert result["chunks_replaced"] == 1
+        assert len(rag_service.chunks) == 1
+        assert rag_service._bm25_search("재고", top_k=5) == []
+        assert rag_service._bm25_search("매출", top_k=5)
+
+    @pytest.mark.asyncio
+    async def test_remove_document(self, rag_service, sample_chunks, chunk_with_rights):
+        """Should remove a document from the cache and the index."""
+        rag_service.chunks = sample_chunks + [chunk_with_rights]
+        rag_service._build_bm25_index()
+
+        removed = await rag_service.remove_document("doc3")
+
+        assert removed == 1
+        assert chunk_with_rights not in rag_service.chunks
+        assert len(rag_service.bm25_index) == 3
+
+    @pytest.mark.asyncio
+    async def test_remove_document_deletes_from_vector_store(self, rag_service, sample_chunks):
+        """Should delete from vector stores that support delete_document."""
+        mock_store = AsyncMock()
+        rag_service.vector_store = mock_store
+        rag_service.chunks = list(sample_chunks)
+        rag_service._build_bm25_index()
+
+        await rag_service.remove_document("doc1")
+
+        mock_store.delete_document.assert_awaited_once_with(document_id="doc1")
+
+    @pytest.mark.asyncio
+    async def test_remove_unindexed_document_deletes_from_vector_store(self, rag_service):
+        """Should delete stored chunks even when nothing is indexed locally."""
+        mock_store = AsyncMock()
+        rag_service.vector_store = mock_store
+
+        assert await rag_service.remove_document("doc1") == 0
+        mock_store.delete_document.assert_awaited_once_with(document_id="doc1")
+
+    @pytest.mark.asyncio
+    async def test_failed_reingest_keeps_previous_version(self, rag_service):
+        """Should keep the old chunks when the new version fails to ingest."""
+        with patch.object(
+            rag_service,
+            '_extract_pdf_text',
+            new_callable=AsyncMock,
+            return_value=[{"page_number": 1, "text": "구버전 재고 실사", "section": "1.1"}]
+        ):
+            await rag_service.ingest_pdf("/guide.pdf", document_id="guide")
+
+        with patch.object(
+            rag_service,
+            '_extract_pdf_text',
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("corrupt PDF")
+        ):
+            with pytest.raises(RuntimeError):
+                await rag_service.ingest_pdf("/guide.pdf", document_id="guide")
+
+        assert len(rag_service.chunks) == 1
+        assert rag_service._bm25_search("재고", top_k=5)
+
+    @pytest.mark.asyncio
+    async def test_failed_reingest_leaves_stored_version_intact(self):
+        """Should discard chunks stored before a mid-document failure."""
+        from src.services.vector_store import LocalVectorStore
+
+        class FlakyEmbeddingModel(BatchEmbeddingModel):
+            fail_after = None
+
+            async def embed_batch(self, texts):
+                if self.fail_after is not None and len(self.batch_sizes) >= self.fail_after:
+                    raise RuntimeError("embedding service down")
+                return await super().embed_batch(texts)
+
+        model = FlakyEmbeddingModel()
+        store = LocalVectorStore()
+        rag = AuditGuideRAG(embedding_model=model, vector_store=store, batch_size=1, max_concurrency=1)
+        pages = [{"page_number": i, "text": f"page {i}", "section": "1.1"} for i in range(4)]
+
+        with patch.object(rag, '_extract_pdf_text', new_callable=AsyncMock, return_value=pages):
+            await rag.ingest_pdf("/guide.pdf", document_id="guide")
+        old_version = {(c.metadata.chunk_id, c.text) for c in await store.load_chunks()}
+
+        model.fail_after = len(model.batch_sizes) + 3
+        new_pages = [dict(page, text=f"revised {page['text']}") for page in pages]
+        with patch.object(rag, '_extract_pdf_text', new_callable=AsyncMock, return_value=new_pages):
+            with pytest.raises(RuntimeError, match="embedding service down"):
+                await rag.ingest_pdf("/guide.pdf", document_id="guide")
+
+        assert {(c.metadata.chunk_id, c.text) for c in await store.load_chunks()} == old_version
+        assert {(c.metadata.chunk_id, c.text) for c in rag.chunks} == old_version
+
+
 # ============================================================================
 # ASSERTION KEYWORD TESTS
 # ============================================================================
@@ -756,6 +1490,60 @@ class TestAssertionClassification:
             for keyword in keywords:
                 assert isinstance(keyword, str)
 
+    def test_classifier_matches_substring_semantics(self):
+        """Should tag exactly the assertions whose keywords occur in the text."""
+        keywords = {
+            "a": ["기록", "ab"],
+            "b": ["기록물", "b"],
+            "c": ["물건"],
+        }
+        classifier = AssertionClassifier(keywords)
+
+        for text in ["기록물건", "AB", "기록", "없음", "xaby", "물건 기록물"]:
+            expected = [
+                name for name, words in keywords.items()
+                if any(w.lower() in text.lower() for w in words)
+            ]
+            assert classifier.classify(text) == expected
+
+    def test_tags_computed_at_ingest(self, rag_service):
+        """Should store assertion tags on chunk metadata when chunking."""
+        chunks = rag_service._chunk_text(
+            [{"page_number": 1, "text": "재고자산의 실재성을 확인하고 평가한다", "section": "2.1"}],
+            "doc"
+        )
+
+        assert chunks[0].metadata.assertions == ["existence", "valuation"]
+
+    def test_procedure_uses_stored_tags(self, rag_service, sample_chunks):
+        """Should use precomputed tags instead of rescanning the text."""
+        chunk = sample_chunks[0]
+        chunk.metadata.assertions = ["rights"]
+
+        procedure = rag_service._chunk_to_procedure(chunk, 0.9)
+
+        assert procedure.related_assertions == ["rights"]
+
+    def test_procedure_tags_untagged_chunk(self, rag_service):
+        """Should classify and remember tags for chunks loaded without them."""
+        chunk = TextChunk(
+            text="주석 공시 사항을 검토한다",
+            metadata=ChunkMetadata(
+                chunk_id="legacy_0",
+                document_id="legacy",
+                section_code="9.1",
+                section_title="9.1 Disclosure",
+                page_number=1,
+                chunk_index=0,
+                total_chunks=1
+            )
+        )
+
+        procedure = rag_service._chunk_to_procedure(chunk, 0.9)
+
+        assert procedure.related_assertions == ["presentation"]
+        assert chunk.metadata.assertions == ["presentation"]
+
 
 # ============================================================================
 # SEARCH MODE ENUM TESTS
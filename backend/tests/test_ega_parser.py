@@ -703,7 +703,7 @@ class TestParseAssignedWorkflow:
     async def test_fallback_when_server_unavailable(self):
         """Test fallback behavior when MCP server unavailable."""
         mock_client = AsyncMock()
-        mock_client.health_check = AsyncMock(return_value=False)
+        mock_client.is_available = MagicMock(return_value=False)
         mock_client.close = AsyncMock()
 
         result = await parse_assigned_workflow(
@@ -720,7 +720,7 @@ class TestParseAssignedWorkflow:
     async def test_successful_parsing(self, sample_excel_data: Dict[str, Any]):
         """Test successful document parsing."""
         mock_client = AsyncMock()
-        mock_client.health_check = AsyncMock(return_value=True)
+        mock_client.is_available = MagicMock(return_value=True)
         mock_client.parse_excel = AsyncMock(return_value={
             "status": "success",
             "data": sample_excel_data,
@@ -741,7 +741,7 @@ class TestParseAssignedWorkflow:
     async def test_parse_error_handling(self):
         """Test error handling during parsing."""
         mock_client = AsyncMock()
-        mock_client.health_check = AsyncMock(return_value=True)
+        mock_client.is_available = MagicMock(return_value=True)
         mock_client.parse_excel = AsyncMock(return_value={
             "status": "error",
             "error": "Invalid file format",
@@ -788,7 +788,7 @@ class TestEGAParserNode:
         """Test EGA extraction from workflow document."""
         with patch("src.graph.nodes.ega_parser.MCPExcelClient") as MockClient:
             mock_instance = AsyncMock()
-            mock_instance.health_check = AsyncMock(return_value=True)
+            mock_instance.is_available = MagicMock(return_value=True)
             mock_instance.parse_excel = AsyncMock(return_value={
                 "status": "success",
                 "data": sample_excel_data,
@@ -822,7 +822,7 @@ class TestEGAParserNode:
 
         with patch("src.graph.nodes.ega_parser.MCPExcelClient") as MockClient:
             mock_instance = AsyncMock()
-            mock_instance.health_check = AsyncMock(return_value=True)
+            mock_instance.is_available = MagicMock(return_value=True)
             mock_instance.parse_excel = AsyncMock(return_value={
                 "status": "success",
                 "data": sample_excel_data,
@@ -888,7 +888,7 @@ class TestEGAParserIntegration:
 
         with patch("src.graph.nodes.ega_parser.MCPExcelClient") as MockClient:
             mock_instance = AsyncMock()
-            mock_instance.health_check = AsyncMock(return_value=True)
+            mock_instance.is_available = MagicMock(return_value=True)
             mock_instance.parse_excel = AsyncMock(return_value={
                 "status": "success",
                 "data": sample_excel_data,
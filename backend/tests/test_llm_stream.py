@@ -0,0 +1,191 @@
+"""
+Tests for Token-Level LLM Streaming
+
+This module tests src/services/llm_stream.py, the streaming mode of the SSE
+chat path (stream_agent_messages?stream=true) and of WorkPaperGeneratorAgent,
+using a fake chat model whose astream is gated by the test.
+
+Test Classes:
+    - TestTokenPublisher: Delta coalescing and end-of-stream records
+    - TestChatTokenStreaming: Token events before the completion finishes
+    - TestWorkPaperStreaming: Draft deltas published to the message broker
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from langchain_core.messages import AIMessageChunk
+
+from src.agents.staff_agents import WorkPaperGeneratorAgent
+from src.api.sse import stream_agent_messages
+from src.db.async_client import AsyncDatabase
+from src.services.llm_stream import TokenPublisher, astream_text
+from src.services.message_broker import MessageBroker
+from src.services.task_stream import TaskStreamHub
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class FakeStreamingLLM:
+    """Chat model streaming fixed tokens; waits on `release` after the first."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.release = asyncio.Event()
+        self.finished = False
+
+    async def astream(self, messages):
+        for i, token in enumerate(self.tokens):
+            if i == 1:
+                await self.release.wait()
+            yield AIMessageChunk(content=token)
+        self.finished = True
+
+    async def ainvoke(self, messages):
+        raise AssertionError("streaming mode must not call ainvoke")
+
+
+class _Request:
+    headers = {}
+
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+@pytest.fixture
+def broker():
+    """Fresh process-wide broker."""
+    fresh = MessageBroker()
+    hub = TaskStreamHub(broker=fresh, idle_ttl=0)
+    with patch("src.api.sse.get_message_broker", return_value=fresh), \
+         patch("src.api.sse.get_task_stream_hub", return_value=hub), \
+         patch("src.services.llm_stream.get_message_broker", return_value=fresh):
+        yield fresh
+
+
+@pytest.fixture
+def supabase():
+    """Supabase client accepting inserts, with no stored messages."""
+    client = MagicMock()
+    client.table.return_value.insert.return_value.execute = AsyncMock(return_value=MagicMock(data=[{}]))
+    ordered = client.table.return_value.select.return_value.eq.return_value.order.return_value
+    ordered.execute = AsyncMock(return_value=MagicMock(data=[]))
+    ordered.limit.return_value.execute = AsyncMock(return_value=MagicMock(data=[]))
+    db = AsyncDatabase(url="http://supabase.test", service_key="test-key", conninfo="")
+    db._client = client
+    with patch("src.db.async_client._db", db):
+        yield client
+
+
+# ============================================================================
+# PUBLISHER TESTS
+# ============================================================================
+
+class TestTokenPublisher:
+    """Tests for TokenPublisher."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_deltas_and_marks_done(self, broker):
+        """Should publish buffered deltas together and end with done=True."""
+        publisher = TokenPublisher("task-1", agent_role="partner", flush_interval=60)
+
+        async with broker.subscribe("task-1") as subscription:
+            for delta in ("Rev", "enue", " is"):
+                await publisher.add(delta)
+            await publisher.close()
+
+            record = await subscription.get(timeout=1)
+
+        assert record["type"] == "token"
+        assert record["delta"] == "Revenue is"
+        assert record["done"] is True
+        assert record["id"] == publisher.message_id
+        assert broker.published == 1
+
+    @pytest.mark.asyncio
+    async def test_astream_text_skips_empty_chunks(self):
+        """Should yield only non-empty text, joining content blocks."""
+        llm = FakeStreamingLLM(["a", "", [{"type": "text", "text": "b"}]])
+        llm.release.set()
+
+        assert [delta async for delta in astream_text(llm, [])] == ["a", "b"]
+
+
+# ============================================================================
+# SSE CHAT TESTS
+# ============================================================================
+
+class TestChatTokenStreaming:
+    """Tests for ?stream=true on the SSE chat path."""
+
+    @pytest.mark.asyncio
+    async def test_first_token_before_completion(self, broker, supabase):
+        """Should emit the first token while the LLM is still generating."""
+        llm = FakeStreamingLLM(["Revenue ", "is ", "recognized."])
+
+        with patch("src.api.sse.get_chat_llm", return_value=llm), \
+             patch("src.api.sse.detect_mcp_intents", AsyncMock(return_value=[])):
+            events = stream_agent_messages(
+                "task-1", _Request(), message="revenue?", stream=True
+            ).body_iterator
+
+            async def next_event():
+                return await asyncio.wait_for(events.__anext__(), 1)
+
+            user = await next_event()
+            first = await next_event()
+            assert not llm.finished
+            llm.release.set()
+
+            rest = [await next_event() for _ in range(4)]
+            await events.aclose()
+
+        assert user["event"] == "message"
+        assert json.loads(user["data"])["agent_role"] == "user"
+
+        tokens = [json.loads(e["data"]) for e in [first] + rest[:3]]
+        assert [e["event"] for e in [first] + rest[:3]] == ["token"] * 4
+        assert [t["delta"] for t in tokens] == ["Revenue ", "is ", "recognized.", ""]
+        assert [t["index"] for t in tokens] == [0, 1, 2, 3]
+        assert tokens[-1]["done"] is True
+
+        final = json.loads(rest[3]["data"])
+        assert rest[3]["event"] == "message"
+        assert final["id"] == tokens[0]["id"]
+        assert final["content"] == "Revenue is recognized."
+
+        inserted = [c.args[0] for c in supabase.table.return_value.insert.call_args_list]
+        assert [r["agent_role"] for r in inserted] == ["user", "partner"]
+
+
+# ============================================================================
+# WORKPAPER TESTS
+# ============================================================================
+
+class TestWorkPaperStreaming:
+    """Tests for WorkPaperGeneratorAgent streaming mode."""
+
+    @pytest.mark.asyncio
+    async def test_draft_deltas_published(self, broker):
+        """Should publish draft deltas and return the full workpaper once."""
+        with patch("src.agents.staff_agents.ChatOpenAI"):
+            agent = WorkPaperGeneratorAgent(stream_tokens=True)
+        agent.llm = FakeStreamingLLM(["## Objective\n", "Verify revenue."])
+        agent.llm.release.set()
+        agent._generate_document = AsyncMock(return_value=None)
+
+        async with broker.subscribe("task-1") as subscription:
+            result = await agent.run({"task_id": "task-1", "category": "Sales"})
+
+            records = []
+            while (record := subscription.get_nowait()) is not None:
+                records.append(record)
+
+        assert "## Objective\nVerify revenue." in result["workpaper_draft"]
+        assert "".join(r["delta"] for r in records) == "## Objective\nVerify revenue."
+        assert records[-1]["done"] is True
+        assert {r["agent_role"] for r in records} == {"Staff_WorkPaper_Generator"}
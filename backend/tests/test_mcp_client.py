@@ -0,0 +1,684 @@
+"""
+Tests for MCP Client Infrastructure
+
+This module tests the MCP client layer in src/services/mcp_client.py
+against an in-process fake MCP server (httpx.MockTransport).
+
+Test Classes:
+    - TestHealthMonitor: Background probing and cached health state
+    - TestRegistryHealth: MCPToolRegistry health monitor integration
+    - TestSingleFlight: Coalescing of identical concurrent tool calls
+    - TestToolResultCache: Two-tier cache for deterministic RAG tools
+    - TestBatching: JSON-RPC batch requests and micro-batching
+    - TestRegistration: Concurrent, deadline-bounded and lazy registration
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from src.services.mcp_cache import ToolResultCache, ToolSchemaCache
+from src.services.mcp_client import (
+    CircuitBreaker,
+    CircuitState,
+    MCPClient,
+    MCPClientConfig,
+    MCPConnectionError,
+    MCPHealthMonitor,
+    MCPRagClient,
+    MCPToolExecutionError,
+    MCPToolRegistry,
+    MCPServerType,
+    MicroBatcher,
+    SingleFlight,
+)
+from src.services.mcp_resilience import ServerResilience
+from src.services.mcp_transport import MCPTransport
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class _BodyStream(httpx.AsyncByteStream):
+    """Unread response body, as a real network transport returns it."""
+
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+
+    async def __aiter__(self):
+        yield self._body
+
+
+class FakeMCPServer:
+    """Fake MCP server with a switchable health endpoint and request log.
+
+    Answers JSON-RPC batch arrays unless batch_supported is False; the tool
+    named "fail" returns a JSON-RPC error. The server on port 8001 lists
+    "search_standards", other ports list "tool_<port>"; port_delays slows
+    down single ports and port_gates (asyncio.Event) hold them until set.
+    """
+
+    def __init__(self):
+        self.healthy = True
+        self.delay = 0.0
+        self.port_delays = {}
+        self.port_gates = {}
+        self.batch_supported = True
+        self.requests = []
+        self.calls = []
+
+    def _answer(self, body, port):
+        if body["method"] == "tools/list":
+            name = "search_standards" if port == 8001 else f"tool_{port}"
+            result = {"tools": [{"name": name, "description": "", "input_schema": {}}]}
+            return {"jsonrpc": "2.0", "id": body["id"], "result": result}
+
+        name = body["params"]["name"]
+        self.calls.append(name)
+        if name == "fail":
+            return {"jsonrpc": "2.0", "id": body["id"], "error": {"code": -32000, "message": "boom"}}
+        result = {"status": "success", "data": {"tool": name, "arguments": body["params"]["arguments"]}}
+        return {"jsonrpc": "2.0", "id": body["id"], "result": result}
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        delay = self.port_delays.get(request.url.port, self.delay)
+        if delay:
+            await asyncio.sleep(delay)
+        gate = self.port_gates.get(request.url.port)
+        if gate is not None:
+            await gate.wait()
+        if not self.healthy:
+            raise httpx.ConnectError("connection refused", request=request)
+        if request.url.path == "/health":
+            return httpx.Response(200, stream=_BodyStream({"status": "ok"}))
+
+        body = json.loads(request.content)
+        if isinstance(body, list):
+            if not self.batch_supported:
+                error = {"code": -32600, "message": "Invalid Request"}
+                return httpx.Response(200, stream=_BodyStream({"jsonrpc": "2.0", "id": None, "error": error}))
+            return httpx.Response(200, stream=_BodyStream([self._answer(item, request.url.port) for item in reversed(body)]))
+        return httpx.Response(200, stream=_BodyStream(self._answer(body, request.url.port)))
+
+
+@pytest.fixture
+def server():
+    return FakeMCPServer()
+
+
+def _fresh_resilience():
+    """Per-test replacement for get_server_resilience (isolated retry budgets)."""
+    servers = {}
+    return lambda base_url: servers.setdefault(base_url.rstrip('/'), ServerResilience())
+
+
+@pytest.fixture
+def tool_cache():
+    """Tool result cache; disabled (no TTLs) unless a test enables it."""
+    return ToolResultCache(ttls={})
+
+
+@pytest.fixture
+def mcp_env(server, tool_cache):
+    """Patch the shared transport, health monitor, single-flight group and caches."""
+    transport = MCPTransport(
+        http2=False,
+        transport_factory=lambda: httpx.MockTransport(server.handler)
+    )
+    monitor = MCPHealthMonitor(interval=0.01)
+    with patch("src.services.mcp_client.get_mcp_transport", return_value=transport), \
+         patch("src.services.mcp_client.get_health_monitor", return_value=monitor), \
+         patch("src.services.mcp_client.get_single_flight", return_value=SingleFlight()), \
+         patch("src.services.mcp_client.get_tool_cache", return_value=tool_cache), \
+         patch("src.services.mcp_client.get_schema_cache", return_value=ToolSchemaCache()), \
+         patch("src.services.mcp_client._batch_unsupported", set()), \
+         patch("src.services.mcp_client.get_server_resilience", side_effect=_fresh_resilience()):
+        yield monitor
+
+
+# ============================================================================
+# HEALTH MONITOR TESTS
+# ============================================================================
+
+class TestHealthMonitor:
+    """Tests for the background health monitor."""
+
+    def test_unobserved_server_is_available(self):
+        """Should not block calls to servers that were never observed."""
+        monitor = MCPHealthMonitor()
+
+        assert monitor.is_healthy("http://localhost:8001")
+        monitor.watch("mcp-rag", "http://localhost:8001/")
+        assert monitor.is_healthy("http://localhost:8001")
+
+    @pytest.mark.asyncio
+    async def test_probe_updates_state_and_breaker(self, mcp_env, server):
+        """Should record probe results and feed the circuit breaker."""
+        breaker = CircuitBreaker(fail_max=2)
+        mcp_env.watch("mcp-rag", "http://localhost:8001", breaker)
+
+        server.healthy = False
+        await mcp_env.probe_all()
+        await mcp_env.probe_all()
+
+        state = mcp_env.get_state("http://localhost:8001")
+        assert state.healthy is False
+        assert state.consecutive_failures == 2
+        assert breaker.state == CircuitState.OPEN
+        assert not mcp_env.is_healthy("http://localhost:8001")
+
+        server.healthy = True
+        assert await mcp_env.probe("http://localhost:8001")
+        assert state.healthy is True
+        assert state.latency_ms is not None
+        # A passing probe only lets the next real call test the server
+        assert breaker.state == CircuitState.HALF_OPEN
+
+    @pytest.mark.asyncio
+    async def test_passing_probe_keeps_call_failures(self, mcp_env, server):
+        """Should not reset failures of real tool calls when /health answers 200."""
+        breaker = CircuitBreaker(fail_max=2)
+        mcp_env.watch("mcp-rag", "http://localhost:8001", breaker)
+
+        breaker.record_failure()
+        await mcp_env.probe_all()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_background_probing(self, mcp_env, server):
+        """Should probe periodically once started and stop cleanly."""
+        mcp_env.watch("mcp-rag", "http://localhost:8001")
+
+        mcp_env.start()
+        await asyncio.sleep(0.05)
+        await mcp_env.stop()
+
+        assert not mcp_env.running
+        assert server.requests.count("/health") >= 2
+        assert mcp_env.snapshot()["mcp-rag"]["available"] is True
+
+    @pytest.mark.asyncio
+    async def test_healthy_call_is_one_round_trip(self, mcp_env, server):
+        """Should issue only the tool request when the server is healthy."""
+        client = MCPRagClient(base_url="http://localhost:8001")
+
+        assert client.is_available()
+        await client.search_standards("수익인식")
+
+        assert server.requests == ["/mcp"]
+        assert mcp_env.get_state("http://localhost:8001").healthy is True
+
+    @pytest.mark.asyncio
+    async def test_failed_call_marks_unavailable(self, mcp_env, server):
+        """Should publish a failed call so later callers skip the server."""
+        mcp_env.interval = 60
+        client = MCPRagClient(base_url="http://localhost:8001")
+        client.config.retry_delay = 0
+        server.healthy = False
+
+        with pytest.raises(MCPConnectionError):
+            await client.search_standards("수익인식")
+
+        assert not MCPRagClient(base_url="http://localhost:8001").is_available()
+
+    @pytest.mark.asyncio
+    async def test_stale_failure_lets_call_through_without_probes(self, mcp_env, server):
+        """Should let a real call retry the server once a failure is older than interval."""
+        mcp_env.interval = 60
+        client = MCPRagClient(base_url="http://localhost:8001")
+        client.config.retry_delay = 0
+        server.healthy = False
+
+        with pytest.raises(MCPConnectionError):
+            await client.search_standards("수익인식")
+        state = mcp_env.get_state("http://localhost:8001")
+        state.last_checked -= 60
+
+        assert client.is_available()
+        server.healthy = True
+        await client.search_standards("수익인식")
+        assert state.healthy is True
+
+    @pytest.mark.asyncio
+    async def test_failure_not_stale_while_probing(self, mcp_env, server):
+        """Should leave recovery to the probes while the monitor runs."""
+        mcp_env.watch("mcp-rag", "http://localhost:8001")
+        mcp_env.record("http://localhost:8001", healthy=False, error="down")
+        mcp_env.get_state("http://localhost:8001").last_checked -= 60
+        mcp_env.interval = 60
+        server.healthy = False
+
+        mcp_env.start()
+        try:
+            assert not mcp_env.is_healthy("http://localhost:8001")
+        finally:
+            await mcp_env.stop()
+
+
+# ============================================================================
+# REGISTRY HEALTH TESTS
+# ============================================================================
+
+class TestRegistryHealth:
+    """Tests for MCPToolRegistry health monitoring."""
+
+    @pytest.mark.asyncio
+    async def test_registry_cached_health(self, mcp_env, server):
+        """Should expose cached per-server health fed by probes."""
+        registry = MCPToolRegistry(health_monitor=mcp_env)
+        await registry.register_server(MCPServerType.RAG, url="http://localhost:8001")
+
+        assert registry.is_server_healthy("mcp-rag")
+        assert not registry.is_server_healthy("mcp-unknown")
+
+        server.healthy = False
+        for _ in range(5):
+            await mcp_env.probe_all()
+
+        states = registry.get_health_states()
+        assert states["mcp-rag"]["available"] is False
+        assert states["mcp-rag"]["circuit_state"] == "open"
+        assert not registry.is_server_healthy("mcp-rag")
+
+    @pytest.mark.asyncio
+    async def test_registry_start_stop(self, mcp_env):
+        """Should start and stop the shared monitor."""
+        registry = MCPToolRegistry(health_monitor=mcp_env)
+
+        registry.start_health_monitor(interval=0.5)
+        assert mcp_env.running
+        assert mcp_env.interval == 0.5
+
+        await registry.stop_health_monitor()
+        assert not mcp_env.running
+
+
+# ============================================================================
+# SINGLE-FLIGHT TESTS
+# ============================================================================
+
+class TestSingleFlight:
+    """Tests for coalescing identical concurrent tool calls."""
+
+    def test_key_canonicalizes_arguments(self):
+        """Should ignore argument order and trailing slashes."""
+        first = SingleFlight.key("http://localhost:8001/", "t", {"a": 1, "b": [1, 2]})
+        second = SingleFlight.key("http://localhost:8001", "t", {"b": [1, 2], "a": 1})
+
+        assert first == second
+        assert first != SingleFlight.key("http://localhost:8001", "t", {"a": 2, "b": [1, 2]})
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_request(self, mcp_env, server):
+        """Should send one request for identical concurrent searches."""
+        server.delay = 0.02
+        clients = [MCPRagClient(base_url="http://localhost:8001") for _ in range(10)]
+
+        results = await asyncio.gather(*(
+            c.search_standards("수익인식", top_k=5) for c in clients
+        ))
+
+        assert server.requests.count("/mcp") == 1
+        assert all(r == results[0] for r in results)
+        results[0]["data"]["mutated"] = True
+        assert "mutated" not in results[1]["data"]
+
+        registry = MCPToolRegistry(health_monitor=mcp_env)
+        stats = registry.get_coalescing_stats()
+        assert stats["executed"] == 1
+        assert stats["coalesced"] == 9
+        assert stats["tools"]["search_standards"]["calls"] == 10
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_arguments_not_coalesced(self, mcp_env, server):
+        """Should send separate requests for different arguments."""
+        server.delay = 0.01
+        client = MCPRagClient(base_url="http://localhost:8001")
+
+        await asyncio.gather(
+            client.search_standards("수익인식"),
+            client.search_standards("리스")
+        )
+
+        assert server.calls == ["search_standards", "search_standards"]
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_cached(self, mcp_env, server):
+        """Should release the key once the request completes."""
+        client = MCPRagClient(base_url="http://localhost:8001")
+
+        await client.search_standards("수익인식")
+        await client.search_standards("수익인식")
+
+        assert server.requests.count("/mcp") == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_shared_and_cancellation_isolated(self):
+        """Should propagate the error to all waiters and survive a cancelled caller."""
+        flight = SingleFlight()
+        gate = asyncio.Event()
+
+        async def failing():
+            await gate.wait()
+            raise RuntimeError("boom")
+
+        key = flight.key("http://x", "t", {})
+        leader = asyncio.create_task(flight.do(key, failing))
+        follower = asyncio.create_task(flight.do(key, failing))
+        await asyncio.sleep(0)
+        leader.cancel()
+        gate.set()
+
+        with pytest.raises(RuntimeError):
+            await follower
+        assert flight.stats()["executed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_registry_call_tool_coalesced(self, mcp_env, server):
+        """Should coalesce identical calls routed through the registry."""
+        registry = MCPToolRegistry(health_monitor=mcp_env)
+        await registry.register_server(MCPServerType.RAG, url="http://localhost:8001")
+        server.delay = 0.02
+        server.requests.clear()
+
+        await asyncio.gather(*(
+            registry.call_tool("search_standards", {"query_text": "q", "top_k": 3})
+            for _ in range(5)
+        ))
+
+        assert server.requests.count("/mcp") == 1
+        assert registry.get_coalescing_stats()["coalesced"] == 4
+
+
+# ============================================================================
+# TOOL RESULT CACHE TESTS
+# ============================================================================
+
+class TestToolResultCache:
+    """Tests for the two-tier cache of deterministic tool results."""
+
+    @pytest.fixture
+    def tool_cache(self, tmp_path):
+        return ToolResultCache(path=str(tmp_path / "tools.sqlite"), corpus_version="v1")
+
+    def test_key_canonicalizes_arguments(self, tool_cache):
+        """Should ignore argument order and include the corpus version."""
+        first = tool_cache.key("http://localhost:8001/", "t", {"a": 1, "b": 2})
+        second = tool_cache.key("http://localhost:8001", "t", {"b": 2, "a": 1})
+
+        assert first == second
+        tool_cache.set_corpus_version("v2")
+        assert tool_cache.key("http://localhost:8001", "t", {"a": 1, "b": 2}) != first
+
+    def test_uncacheable_and_error_results_skipped(self, tool_cache):
+        """Should only store successful results of tools with a TTL."""
+        tool_cache.set("http://x", "generate_workpaper", {}, {"status": "success"})
+        tool_cache.set("http://x", "search_standards", {"q": 1}, {"status": "error"})
+
+        assert tool_cache.get("http://x", "generate_workpaper", {}) is None
+        assert tool_cache.get("http://x", "search_standards", {"q": 1}) is None
+        assert tool_cache.stats()["disk_size"] == 0
+
+    def test_disk_tier_survives_restart(self, tool_cache, tmp_path):
+        """Should serve entries from SQLite to a new cache instance."""
+        tool_cache.set("http://x", "get_paragraph_by_id", {"id": "1115-31"}, {"text": "수익"})
+        tool_cache.close()
+
+        reopened = ToolResultCache(path=str(tmp_path / "tools.sqlite"), corpus_version="v1")
+        assert reopened.get("http://x", "get_paragraph_by_id", {"id": "1115-31"}) == {"text": "수익"}
+        assert reopened.get("http://x", "get_paragraph_by_id", {"id": "1115-31"}) is not None
+
+        stats = reopened.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["memory_hits"] == 1
+
+    def test_ttl_and_lru_eviction(self, tmp_path):
+        """Should expire entries after their tool TTL and bound the memory tier."""
+        cache = ToolResultCache(max_entries=2, ttls={"search_standards": 60, "stale": 1e-9})
+
+        cache.set("http://x", "stale", {}, {"v": 1})
+        assert cache.get("http://x", "stale", {}) is None
+
+        for i in range(3):
+            cache.set("http://x", "search_standards", {"i": i}, {"v": i})
+        assert cache.stats()["memory_size"] == 2
+        assert cache.get("http://x", "search_standards", {"i": 0}) is None
+        assert cache.get("http://x", "search_standards", {"i": 2}) == {"v": 2}
+
+    def test_corpus_version_purges_disk(self, tool_cache):
+        """Should drop entries of older corpus versions from both tiers."""
+        tool_cache.set("http://x", "search_standards", {"q": "리스"}, {"v": 1})
+
+        tool_cache.set_corpus_version("v2")
+
+        assert tool_cache.get("http://x", "search_standards", {"q": "리스"}) is None
+        assert tool_cache.stats()["disk_size"] == 0
+        assert tool_cache.stats()["corpus_version"] == "v2"
+
+    @pytest.mark.asyncio
+    async def test_repeated_rag_calls_hit_cache(self, mcp_env, server, tool_cache):
+        """Should send one request for repeated deterministic RAG calls."""
+        client = MCPRagClient(base_url="http://localhost:8001")
+
+        first = await client.get_paragraph_by_id("K-IFRS1115", "31")
+        first["data"]["mutated"] = True
+        second = await client.get_paragraph_by_id("K-IFRS1115", "31")
+
+        assert server.requests.count("/mcp") == 1
+        assert "mutated" not in second["data"]
+
+        registry = MCPToolRegistry(health_monitor=mcp_env)
+        registry.set_corpus_version("v2")
+        await client.get_paragraph_by_id("K-IFRS1115", "31")
+
+        assert server.requests.count("/mcp") == 2
+        assert registry.get_cache_stats()["memory_hits"] == 1
+
+
+# ============================================================================
+# JSON-RPC BATCHING TESTS
+# ============================================================================
+
+class TestBatching:
+    """Tests for JSON-RPC batch requests and automatic micro-batching."""
+
+    @pytest.mark.asyncio
+    async def test_call_tools_batch_maps_results_and_errors(self, mcp_env, server):
+        """Should send one batch and map out-of-order responses by id."""
+        client = MCPClient(name="mcp-rag", base_url="http://localhost:8001")
+
+        results = await client.call_tools_batch([
+            ("search_standards", {"query_text": "a"}),
+            ("fail", {}),
+            ("get_paragraph_by_id", {"paragraph_no": "9"}),
+        ])
+
+        assert server.requests == ["/mcp"]
+        assert results[0]["data"]["arguments"] == {"query_text": "a"}
+        assert isinstance(results[1], MCPToolExecutionError)
+        assert "boom" in str(results[1])
+        assert results[2]["data"]["tool"] == "get_paragraph_by_id"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_micro_batched(self, mcp_env, server):
+        """Should turn concurrent paragraph fetches into one round trip."""
+        client = MCPRagClient(config=MCPClientConfig(base_url="http://localhost:8001", batch_window=0.002))
+
+        results = await asyncio.gather(*(
+            client.get_paragraph_by_id("K-IFRS 1115", no) for no in ("9", "22", "B34")
+        ))
+
+        assert server.requests == ["/mcp"]
+        assert [r["data"]["arguments"]["paragraph_no"] for r in results] == ["9", "22", "B34"]
+        assert client._batcher.batches_sent == 1
+        assert client._batcher.calls_sent == 3
+
+    @pytest.mark.asyncio
+    async def test_lone_call_not_wrapped_in_batch(self, mcp_env, server):
+        """Should send a single call as a plain request, raising its error."""
+        client = MCPClient(name="mcp-rag", base_url="http://localhost:8001")
+
+        with pytest.raises(MCPToolExecutionError):
+            await client.call_tool("fail", {})
+
+        assert server.calls == ["fail"]
+
+    @pytest.mark.asyncio
+    async def test_unsupported_server_falls_back(self, mcp_env, server):
+        """Should remember servers rejecting batches and call them one by one."""
+        server.batch_supported = False
+        client = MCPClient(name="mcp-rag", base_url="http://localhost:8001")
+        calls = [("search_standards", {"query_text": q}) for q in ("a", "b")]
+
+        first = await client.call_tools_batch(calls)
+        second = await client.call_tools_batch(calls)
+
+        assert [r["data"]["arguments"]["query_text"] for r in first] == ["a", "b"]
+        assert second == first
+        # One rejected batch, then individual requests only
+        assert server.requests.count("/mcp") == 1 + 2 + 2
+
+    @pytest.mark.asyncio
+    async def test_micro_batching_off_by_default(self, mcp_env, server):
+        """Should send concurrent calls individually unless batch_window is set."""
+        client = MCPRagClient(base_url="http://localhost:8001")
+
+        await asyncio.gather(*(
+            client.get_paragraph_by_id("K-IFRS 1115", no) for no in ("9", "22")
+        ))
+
+        assert client._batcher is None
+        assert sorted(server.calls) == ["get_paragraph_by_id"] * 2
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_caller(self):
+        """Should propagate a failed batch request to all waiting callers."""
+        async def send_batch(calls):
+            raise MCPConnectionError("down")
+
+        batcher = MicroBatcher(send_batch, window=0.001, max_batch_size=2)
+        results = await asyncio.gather(
+            batcher.submit("t", {"i": 1}),
+            batcher.submit("t", {"i": 2}),
+            batcher.submit("t", {"i": 3}),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, MCPConnectionError) for r in results)
+        assert batcher.batches_sent == 2
+
+    @pytest.mark.asyncio
+    async def test_registry_batch_groups_by_server(self, mcp_env, server):
+        """Should route known tools in one batch and report unknown tools."""
+        registry = MCPToolRegistry(health_monitor=mcp_env)
+        await registry.register_server(MCPServerType.RAG, url="http://localhost:8001")
+        server.requests.clear()
+
+        results = await registry.call_tools_batch([
+            ("search_standards", {"query_text": "a"}),
+            ("unknown_tool", {}),
+            ("search_standards", {"query_text": "b"}),
+        ])
+
+        assert server.requests == ["/mcp"]
+        assert isinstance(results[1], ValueError)
+        assert results[2]["data"]["arguments"] == {"query_text": "b"}
+
+
+# ============================================================================
+# REGISTRATION TESTS
+# ============================================================================
+
+class TestRegistration:
+    """Tests for concurrent, deadline-bounded and lazy server registration."""
+
+    @pytest.mark.asyncio
+    async def test_registration_is_concurrent_and_bounded(self, mcp_env, server):
+        """Should register servers in parallel and defer servers past the deadline."""
+        # mcp-vision (4th of 7) hangs; sequential registration would block the
+        # three servers after it as well
+        server.port_gates = {8004: asyncio.Event()}
+        registry = MCPToolRegistry(health_monitor=mcp_env)
+
+        results = await registry.register_all_servers(startup_deadline=1.0)
+
+        assert {name for name, ok in results.items() if not ok} == {"mcp-vision"}
+        assert set(registry.servers) == {
+            "mcp-rag", "mcp-processor", "mcp-finance", "mcp-filesystem",
+            "mcp-web-research", "mcp-excel-processor",
+        }
+        assert registry.pending_servers == ["mcp-vision"]
+
+        # The deferred registration finishes in the background
+        server.port_gates[8004].set()
+        await registry.call_tool("tool_8004", {})
+        assert registry.pending_servers == []
+        await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_wait_is_bounded(self, mcp_env, server):
+        """Should not wait for a hanging registration longer than startup_deadline."""
+        server.port_gates = {8004: asyncio.Event()}
+        registry = MCPToolRegistry(health_monitor=mcp_env)
+        await registry.register_all_servers(startup_deadline=0.05)
+
+        with pytest.raises(ValueError, match="Unknown tool: tool_800"):
+            await asyncio.wait_for(registry.call_tool("tool_800", {}), timeout=5.0)
+        assert registry.pending_servers == ["mcp-vision"]
+
+        server.port_gates[8004].set()
+        await registry.close_all()
+
+    @pytest.mark.asyncio
+    async def test_failed_server_registered_on_first_use(self, mcp_env, server):
+        """Should retry registration of a failed server when its tool is called."""
+        schema_cache = ToolSchemaCache()
+        schema_cache.set("mcp-rag", "http://localhost:8001", [{"name": "search_standards"}])
+        registry = MCPToolRegistry(health_monitor=mcp_env, schema_cache=schema_cache)
+
+        server.healthy = False
+        results = await registry.register_all_servers(startup_deadline=1.0)
+        assert not any(results.values())
+        assert [t["name"] for t in registry.get_tool_schemas()] == ["search_standards"]
+
+        with pytest.raises(MCPConnectionError):
+            await registry.call_tool("search_standards", {"query_text": "a"})
+
+        server.healthy = True
+        result = await registry.call_tool("search_standards", {"query_text": "a"})
+        assert result["data"]["arguments"] == {"query_text": "a"}
+        assert "mcp-rag" in registry.servers
+
+    @pytest.mark.asyncio
+    async def test_schemas_served_from_disk_after_restart(self, mcp_env, server, tmp_path):
+        """Should serve cached schemas immediately and refresh them on registration."""
+        path = str(tmp_path / "schemas.json")
+        first = MCPToolRegistry(health_monitor=mcp_env, schema_cache=ToolSchemaCache(path))
+        await first.register_server(MCPServerType.RAG, url="http://localhost:8001")
+
+        restarted = MCPToolRegistry(health_monitor=mcp_env, schema_cache=ToolSchemaCache(path))
+        assert restarted.load_cached_schemas() == 1
+        assert [t["name"] for t in restarted.get_tool_schemas()] == ["search_standards"]
+        assert restarted.registered_server_count == 0
+
+        server.requests.clear()
+        await restarted.call_tool("search_standards", {"query_text": "a"})
+        assert server.requests == ["/health", "/mcp", "/mcp"]  # register, then call
+        assert restarted.registered_server_count == 1
+
+    def test_schema_cache_ignores_other_url(self, tmp_path):
+        """Should not serve schemas cached for a different server URL."""
+        path = str(tmp_path / "schemas.json")
+        ToolSchemaCache(path).set("mcp-rag", "http://localhost:8001/", [{"name": "x"}])
+
+        cache = ToolSchemaCache(path)
+        assert cache.get("mcp-rag", "http://localhost:8001") == [{"name": "x"}]
+        assert cache.get("mcp-rag", "http://rag:8001") is None
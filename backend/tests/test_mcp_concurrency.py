@@ -0,0 +1,230 @@
+"""
+Tests for Adaptive MCP Concurrency Limits
+
+This module tests the AIMD limiter in src/services/mcp_concurrency.py and
+its integration with the shared MCP transport.
+
+Test Classes:
+    - TestAdaptiveConcurrencyLimiter: Queueing and AIMD limit adjustment
+    - TestServerSettings: Per-server settings from MCP_SERVER_CONFIG
+    - TestTransportLimits: Limits applied to pooled MCP requests
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.services.mcp_client import get_concurrency_settings
+from src.services.mcp_concurrency import AdaptiveConcurrencyLimiter, ConcurrencySettings
+from src.services.mcp_transport import MCPTransport
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class _BodyStream(httpx.AsyncByteStream):
+    """Unread response body, as a real network transport returns it."""
+
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+
+    async def __aiter__(self):
+        yield self._body
+
+
+class SlowServer:
+    """Fake MCP server recording its peak number of concurrent requests."""
+
+    def __init__(self, delay: float = 0.01, status_code: int = 200):
+        self.delay = delay
+        self.status_code = status_code
+        self.active = 0
+        self.peak = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if not request.url.path.endswith("/health"):
+                await asyncio.sleep(self.delay)
+            return httpx.Response(self.status_code, stream=_BodyStream({"ok": True}))
+        finally:
+            self.active -= 1
+
+
+def _transport(server: SlowServer, settings: ConcurrencySettings) -> MCPTransport:
+    return MCPTransport(
+        http2=False,
+        transport_factory=lambda: httpx.MockTransport(server.handler),
+        concurrency_resolver=lambda origin: settings
+    )
+
+
+# ============================================================================
+# LIMITER TESTS
+# ============================================================================
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for queueing and AIMD adjustment."""
+
+    @pytest.mark.asyncio
+    async def test_excess_calls_queue(self):
+        """Should never run more calls than the limit and drain the queue."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "s", ConcurrencySettings(initial_limit=2, max_limit=2)
+        )
+        active, peak, depths = 0, 0, []
+
+        async def call():
+            nonlocal active, peak
+            started = await limiter.acquire()
+            active += 1
+            peak = max(peak, active)
+            depths.append(limiter.queue_depth)
+            await asyncio.sleep(0.01)
+            active -= 1
+            limiter.release(started)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+        assert max(depths) >= 1
+        stats = limiter.stats()
+        assert stats["queued_total"] == 4
+        assert stats["peak_queue_depth"] == 4
+        assert stats["in_flight"] == 0
+        assert stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_multiplicative_decrease(self):
+        """Should grow on fast successes and back off once per round on errors."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "s", ConcurrencySettings(initial_limit=4, max_limit=8, backoff=0.5)
+        )
+
+        for _ in range(20):
+            limiter.release(await limiter.acquire())
+        assert 4 < limiter.limit <= 8
+        grown = limiter.limit
+
+        starts = [await limiter.acquire() for _ in range(3)]
+        for started in starts:
+            limiter.release(started, overloaded=True)
+
+        assert limiter.limit == pytest.approx(max(1, grown * 0.5))
+        assert limiter.stats()["decreases"] == 1
+
+    @pytest.mark.asyncio
+    async def test_latency_spike_counts_as_overload(self):
+        """Should back off when latency far exceeds the baseline."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "s", ConcurrencySettings(initial_limit=4, latency_tolerance=2.0)
+        )
+        limiter.baseline_latency = 0.001
+
+        started = await limiter.acquire()
+        await asyncio.sleep(0.02)
+        limiter.release(started)
+
+        assert limiter.limit == pytest.approx(3.0)
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_and_cancellation(self):
+        """Should time out queued calls and not leak slots of cancelled waiters."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "s", ConcurrencySettings(initial_limit=1, max_limit=1, queue_timeout=0.01)
+        )
+        held = await limiter.acquire()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        limiter.release(held)
+
+        assert limiter.in_flight == 0
+        assert limiter.stats()["queue_timeouts"] == 1
+        limiter.release(await limiter.acquire())
+
+
+# ============================================================================
+# SETTINGS TESTS
+# ============================================================================
+
+class TestServerSettings:
+    """Tests for per-server settings resolution."""
+
+    def test_server_config_settings(self):
+        """Should map server origins to their MCP_SERVER_CONFIG limits."""
+        vision = get_concurrency_settings("http://localhost:8004")
+        rag = get_concurrency_settings("http://LOCALHOST:8001")
+
+        assert vision.max_limit < rag.max_limit
+        assert vision.initial_limit == 2
+        assert get_concurrency_settings("http://localhost:9999") is None
+
+    def test_from_config_defaults(self):
+        """Should fill missing keys with defaults."""
+        settings = ConcurrencySettings.from_config({"max": 5, "queue_timeout": 1.5})
+
+        assert settings.max_limit == 5
+        assert settings.queue_timeout == 1.5
+        assert settings.initial_limit == ConcurrencySettings().initial_limit
+
+
+# ============================================================================
+# TRANSPORT INTEGRATION TESTS
+# ============================================================================
+
+class TestTransportLimits:
+    """Tests for limits applied by the shared transport."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_bounded_by_limit(self):
+        """Should cap concurrent requests per server and report queue depth."""
+        server = SlowServer()
+        transport = _transport(server, ConcurrencySettings(initial_limit=3, min_limit=3, max_limit=3))
+        client = transport.client_for("http://localhost:8004")
+
+        await asyncio.gather(*(
+            client.post("http://localhost:8004/mcp", json={}) for _ in range(12)
+        ))
+
+        assert server.peak == 3
+        stats = transport.stats()["http://localhost:8004"]
+        assert stats["concurrency_limit"] == 3
+        assert stats["queue_depth"] == 0
+        assert stats["concurrency"]["queued_total"] == 9
+        assert stats["concurrency"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_overload_responses_shrink_limit(self):
+        """Should shrink the limit on 503 responses."""
+        server = SlowServer(delay=0, status_code=503)
+        transport = _transport(server, ConcurrencySettings(initial_limit=8, max_limit=8))
+        client = transport.client_for("http://localhost:8007")
+
+        for _ in range(3):
+            await client.post("http://localhost:8007/mcp", json={})
+
+        assert transport.stats()["http://localhost:8007"]["concurrency_limit"] < 8
+
+    @pytest.mark.asyncio
+    async def test_health_probes_bypass_queue(self):
+        """Should not queue /health probes behind tool calls."""
+        server = SlowServer(delay=0.05)
+        transport = _transport(server, ConcurrencySettings(initial_limit=1, max_limit=1))
+        client = transport.client_for("http://localhost:8004")
+
+        call = asyncio.create_task(client.post("http://localhost:8004/mcp", json={}))
+        await asyncio.sleep(0.01)
+        response = await asyncio.wait_for(client.get("http://localhost:8004/health"), 0.03)
+
+        assert response.status_code == 200
+        await call
@@ -0,0 +1,283 @@
+"""
+Tests for Paged Excel Parsing
+
+This module tests MCPExcelClient.iter_excel_pages, ExcelParseAggregator in
+src/services/mcp_excel_stream.py and ExcelParserAgent.stream_raw_data
+against an in-process fake mcp-excel-processor (httpx.MockTransport).
+
+Test Classes:
+    - TestExcelParseAggregator: Running summary, period and bounded samples
+    - TestIterExcelPages: Cursor paging, prefetch bound and legacy servers
+    - TestExcelParserAgentStreaming: Partial raw_data snapshots
+"""
+
+import asyncio
+import json
+import statistics
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from src.agents.staff_agents import ExcelParserAgent
+from src.services.mcp_client import (
+    MCPExcelClient,
+    MCPExcelParseError,
+    MCPHealthMonitor,
+    SingleFlight,
+)
+from src.services.mcp_excel_stream import ExcelParseAggregator
+from src.services.message_broker import MessageBroker
+from src.services.mcp_resilience import ServerResilience
+from src.services.mcp_transport import MCPTransport
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class _BodyStream(httpx.AsyncByteStream):
+    """Unread response body, as a real network transport returns it."""
+
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+
+    async def __aiter__(self):
+        yield self._body
+
+
+def _ledger(rows):
+    return [
+        {"date": f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}", "amount": float(1000 + i),
+         "description": f"Customer {i}", "reference": f"INV-{i}"}
+        for i in range(rows)
+    ]
+
+
+class FakeExcelServer:
+    """Fake mcp-excel-processor serving a ledger in cursor-paged chunks.
+
+    With paging False it ignores page_size/cursor and returns everything.
+    Every 10th row is reported as an anomaly.
+    """
+
+    def __init__(self, rows: int, paging: bool = True):
+        self.ledger = _ledger(rows)
+        self.paging = paging
+        self.fail_at_cursor = None
+        self.page_requests = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        arguments = body["params"]["arguments"]
+        self.page_requests += 1
+
+        if not self.paging:
+            start, end = 0, len(self.ledger)
+        else:
+            start = int(arguments.get("cursor") or 0)
+            end = min(start + arguments["page_size"], len(self.ledger))
+
+        if self.fail_at_cursor is not None and start == self.fail_at_cursor:
+            result = {"status": "error", "message": "sheet is corrupt"}
+        else:
+            data = {
+                "transactions": self.ledger[start:end],
+                "anomalies": [
+                    {"type": "round_amount", "row": i, "severity": "LOW"}
+                    for i in range(start, end) if i % 10 == 0
+                ],
+            }
+            if self.paging:
+                data["next_cursor"] = str(end) if end < len(self.ledger) else None
+            result = {"status": "success", "data": data, "metadata": {"sheet_name": "GL"}}
+
+        return httpx.Response(
+            200, stream=_BodyStream({"jsonrpc": "2.0", "id": body["id"], "result": result})
+        )
+
+
+@pytest.fixture
+def excel_server():
+    return FakeExcelServer(rows=250)
+
+
+@pytest.fixture
+def excel_env(excel_server):
+    """Patch the shared transport, health monitor and per-server state."""
+    transport = MCPTransport(
+        http2=False,
+        transport_factory=lambda: httpx.MockTransport(excel_server.handler)
+    )
+    with patch("src.services.mcp_client.get_mcp_transport", return_value=transport), \
+         patch("src.services.mcp_client.get_health_monitor", return_value=MCPHealthMonitor()), \
+         patch("src.services.mcp_client.get_single_flight", return_value=SingleFlight()), \
+         patch("src.services.mcp_client.get_server_resilience", return_value=ServerResilience()):
+        yield
+
+
+# ============================================================================
+# AGGREGATOR TESTS
+# ============================================================================
+
+class TestExcelParseAggregator:
+    """Tests for incremental aggregation of transaction pages."""
+
+    def test_running_summary_matches_full_computation(self):
+        """Should compute the same statistics as over the full ledger."""
+        ledger = _ledger(100)
+        aggregator = ExcelParseAggregator("Sales")
+        for start in range(0, 100, 7):
+            aggregator.add_transactions(ledger[start:start + 7])
+
+        amounts = [txn["amount"] for txn in ledger]
+        summary = aggregator.result()["summary"]
+        assert aggregator.transaction_count == 100
+        assert aggregator.total_amount == sum(amounts)
+        assert summary["min_amount"] == min(amounts)
+        assert summary["max_amount"] == max(amounts)
+        assert summary["avg_amount"] == pytest.approx(statistics.mean(amounts))
+        assert summary["std_dev"] == pytest.approx(statistics.pstdev(amounts))
+
+    def test_period_samples_and_anomalies_bounded(self):
+        """Should keep a bounded sample and anomaly list but count everything."""
+        aggregator = ExcelParseAggregator("Sales", sample_size=3, max_anomalies=2)
+        aggregator.add_page({
+            "transactions": _ledger(50),
+            "anomalies": [{"row": i} for i in range(5)],
+        })
+
+        result = aggregator.result()
+        assert len(result["transactions"]) == 3
+        assert result["anomalies"] == [{"row": 0}, {"row": 1}]
+        assert result["anomaly_count"] == 5
+        assert result["period"] == "2024-01-01 to 2024-12-24"
+        assert result["data_quality"] == "POOR"
+
+    def test_unpaged_server_totals_used(self):
+        """Should report the server's totals for an unpaged result."""
+        totals = {
+            "total_amount": 123.0,
+            "transaction_count": 500,
+            "period": "2024-01-01 to 2024-06-30",
+            "summary": {"min_amount": 1.0, "max_amount": 9.0, "avg_amount": 5.0, "std_dev": 2.0},
+        }
+        unpaged = ExcelParseAggregator("Sales")
+        unpaged.add_page(dict(totals, transactions=_ledger(10)))
+        paged = ExcelParseAggregator("Sales")
+        paged.add_page(dict(totals, transactions=_ledger(10), next_cursor="10"))
+
+        assert {key: unpaged.result()[key] for key in totals} == totals
+        assert paged.result()["transaction_count"] == 10
+
+    def test_empty_result(self):
+        """Should report an empty parse without errors."""
+        result = ExcelParseAggregator().result()
+
+        assert result["transaction_count"] == 0
+        assert result["period"] == "Unknown"
+        assert result["data_quality"] == "GOOD"
+
+
+# ============================================================================
+# CLIENT PAGING TESTS
+# ============================================================================
+
+class TestIterExcelPages:
+    """Tests for cursor-paged parsing in MCPExcelClient."""
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_cursor(self, excel_env, excel_server):
+        """Should fetch every page once and yield them in order."""
+        client = MCPExcelClient(base_url="http://localhost:8007")
+
+        pages = [page async for page in client.iter_excel_pages(
+            file_path="ledger.xlsx", page_size=100
+        )]
+
+        assert [len(page["transactions"]) for page in pages] == [100, 100, 50]
+        assert pages[0]["transactions"][0]["reference"] == "INV-0"
+        assert pages[0]["metadata"] == {"sheet_name": "GL"}
+        assert excel_server.page_requests == 3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_is_bounded(self, excel_env, excel_server):
+        """Should not run ahead of a slow consumer by more than prefetch_pages."""
+        client = MCPExcelClient(base_url="http://localhost:8007")
+        client.config.prefetch_pages = 1
+
+        async for _ in client.iter_excel_pages(file_path="ledger.xlsx", page_size=10):
+            await asyncio.sleep(0.01)
+            # The page being consumed, one queued page and one being fetched
+            assert excel_server.page_requests <= 3
+            break
+
+    @pytest.mark.asyncio
+    async def test_error_page_raises(self, excel_env, excel_server):
+        """Should raise MCPExcelParseError when a page fails."""
+        excel_server.fail_at_cursor = 100
+        client = MCPExcelClient(base_url="http://localhost:8007")
+
+        with pytest.raises(MCPExcelParseError):
+            async for _ in client.iter_excel_pages(file_path="ledger.xlsx", page_size=100):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_server_without_paging(self, excel_env, excel_server):
+        """Should slice a full result from servers that ignore the cursor."""
+        excel_server.paging = False
+        client = MCPExcelClient(base_url="http://localhost:8007")
+
+        pages = [page async for page in client.iter_excel_pages(
+            file_path="ledger.xlsx", page_size=100
+        )]
+
+        assert [len(page["transactions"]) for page in pages] == [100, 100, 50]
+        assert len(pages[0]["anomalies"]) == 25
+        assert pages[1]["anomalies"] == []
+        assert excel_server.page_requests == 1
+
+
+# ============================================================================
+# AGENT STREAMING TESTS
+# ============================================================================
+
+class TestExcelParserAgentStreaming:
+    """Tests for ExcelParserAgent partial raw_data snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_snapshots_grow_until_complete(self, excel_env, excel_server):
+        """Should yield a snapshot per page and a complete final raw_data."""
+        with patch("src.agents.staff_agents.ChatOpenAI"):
+            agent = ExcelParserAgent(bind_tools=False, page_size=100)
+        agent._mcp_client = MCPExcelClient(base_url="http://localhost:8007")
+
+        snapshots = [raw async for raw in agent.stream_raw_data(None, "ledger.xlsx", "Sales")]
+
+        assert [s["transaction_count"] for s in snapshots] == [100, 200, 250, 250]
+        assert [s["parse_complete"] for s in snapshots] == [False, False, False, True]
+        assert snapshots[0]["sample_transactions"][0]["invoice_no"] == "INV-0"
+
+        result = await agent.run({"task_id": "T1", "category": "Sales", "file_path": "ledger.xlsx"})
+        raw_data = result["raw_data"]
+        assert raw_data["transaction_count"] == 250
+        assert raw_data["anomalies_detected"] == 25
+        assert raw_data["total_sales"] == sum(1000 + i for i in range(250))
+        assert raw_data["mcp_metadata"]["pages"] == 3
+
+    @pytest.mark.asyncio
+    async def test_run_publishes_progress(self, excel_env, excel_server):
+        """Should publish each snapshot to the task's broker topic."""
+        with patch("src.agents.staff_agents.ChatOpenAI"):
+            agent = ExcelParserAgent(bind_tools=False, page_size=100)
+        agent._mcp_client = MCPExcelClient(base_url="http://localhost:8007")
+        broker = MessageBroker()
+
+        with patch("src.services.message_broker.get_message_broker", return_value=broker):
+            async with broker.subscribe("T1") as subscription:
+                await agent.run({"task_id": "T1", "category": "Sales", "file_path": "ledger.xlsx"})
+                records = [await subscription.get(timeout=1.0) for _ in range(4)]
+
+        assert [r["type"] for r in records] == ["progress"] * 4
+        assert [r["transaction_count"] for r in records] == [100, 200, 250, 250]
+        assert [r["done"] for r in records] == [False, False, False, True]
@@ -0,0 +1,150 @@
+"""
+Tests for MCP Intent Detection
+
+This module tests the compiled keyword matcher behind detect_mcp_need and
+detect_mcp_intents (src/api/sse.py) against the previous per-pattern
+re.search loop, and concurrent dispatch of several intents on the chat path.
+
+Test Classes:
+    - TestIntentMatcher: Equivalence with per-pattern search, priority order
+    - TestDetectIntents: detect_mcp_intents / detect_mcp_need results
+    - TestMultiIntentDispatch: Concurrent tool calls from one chat message
+"""
+
+import asyncio
+import re
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.api.sse import (
+    MCP_KEYWORDS,
+    MCPIntentMatcher,
+    _process_chat_message,
+    detect_mcp_intents,
+    detect_mcp_need,
+)
+from src.db.async_client import AsyncDatabase
+
+
+MESSAGES = [
+    "K-IFRS 1115 수익인식 기준에 대해 설명해주세요",
+    "중요성 기준 금액을 계산해줘",
+    "중요성  기준 산정",
+    "리스 기준 계산 방법",
+    "시산표 엑셀 기준으로 중요성 금액을 계산하고 조서로 정리해줘",
+    "Compute MATERIALITY from the Trial Balance and export a PDF",
+    "kgaas audit standard",
+    "문서   생성 해줘",
+    "안녕하세요, 오늘 회의 일정이 어떻게 되나요?",
+    "",
+]
+
+
+def _legacy_servers(message: str):
+    """Every server the previous per-pattern loop would have matched."""
+    message_lower = message.lower()
+    return [
+        server for server, config in MCP_KEYWORDS.items()
+        if any(re.search(p, message_lower, re.IGNORECASE) for p in config["patterns"])
+    ]
+
+
+# ============================================================================
+# MATCHER TESTS
+# ============================================================================
+
+class TestIntentMatcher:
+    """Tests for MCPIntentMatcher."""
+
+    @pytest.mark.parametrize("message", MESSAGES)
+    def test_matches_per_pattern_search(self, message):
+        """Should find exactly the servers a per-pattern search finds."""
+        assert MCPIntentMatcher(MCP_KEYWORDS).match(message) == _legacy_servers(message)
+
+    def test_overlapping_keywords_of_different_servers(self):
+        """Should report servers whose keywords start at the same position."""
+        matcher = MCPIntentMatcher({
+            "a": {"patterns": [r"trial"]},
+            "b": {"patterns": [r"trial balance"]},
+            "c": {"patterns": [r"balance sheet"]},
+        })
+
+        assert matcher.match("Trial Balance Sheet") == ["a", "b", "c"]
+
+    def test_uppercase_patterns_still_ignore_case(self):
+        """Should fall back to case-insensitive matching for mixed-case tables."""
+        matcher = MCPIntentMatcher({"a": {"patterns": [r"IFRS\S*"]}})
+
+        assert matcher.match("k-ifrs1115") == ["a"]
+
+
+# ============================================================================
+# DETECTION TESTS
+# ============================================================================
+
+class TestDetectIntents:
+    """Tests for detect_mcp_intents and detect_mcp_need."""
+
+    @pytest.mark.asyncio
+    async def test_all_intents_in_priority_order(self):
+        """Should return every intent, finance and excel before rag."""
+        intents = await detect_mcp_intents("K-IFRS 기준으로 시산표 엑셀의 중요성 금액 1,000원 계산")
+
+        assert [server for server, _, _ in intents] == ["mcp-finance", "mcp-excel", "mcp-rag"]
+        assert intents[0][1] == "calculate_materiality"
+        assert intents[0][2]["amounts"] == [1000.0]
+
+    @pytest.mark.asyncio
+    async def test_detect_need_returns_primary_intent(self):
+        """Should keep returning the highest-priority intent only."""
+        assert (await detect_mcp_need("중요성 기준 금액"))[0] == "mcp-finance"
+        assert (await detect_mcp_need("수익인식 기준"))[0] == "mcp-rag"
+        assert await detect_mcp_need("회의 일정 알려줘") is None
+        assert await detect_mcp_intents("회의 일정 알려줘") == []
+
+
+# ============================================================================
+# CHAT DISPATCH TESTS
+# ============================================================================
+
+class TestMultiIntentDispatch:
+    """Tests for running several MCP tools from one chat message."""
+
+    @pytest.mark.asyncio
+    async def test_tools_run_concurrently(self):
+        """Should call every detected tool at once and record them all."""
+        running = []
+        both_started = asyncio.Event()
+
+        async def fake_execute(server_name, tool_name, arguments):
+            running.append(server_name)
+            if len(running) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), 1)
+            return {"status": "success", "server": server_name}, None
+
+        supabase = MagicMock()
+        supabase.table.return_value.insert.return_value.execute = AsyncMock(
+            return_value=MagicMock(data=[{}])
+        )
+        ordered = supabase.table.return_value.select.return_value.eq.return_value.order.return_value
+        ordered.limit.return_value.execute = AsyncMock(return_value=MagicMock(data=[]))
+        db = AsyncDatabase(url="http://supabase.test", service_key="test-key", conninfo="")
+        db._client = supabase
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value=MagicMock(content="answer"))
+
+        with patch("src.db.async_client._db", db), \
+             patch("src.api.sse.get_chat_llm", return_value=llm), \
+             patch("src.api.sse.execute_mcp_tool", fake_execute), \
+             patch("src.api.sse.store_mcp_result", AsyncMock()), \
+             patch("src.api.sse.publish_agent_message", AsyncMock()):
+            await _process_chat_message("task-1", "시산표 엑셀로 중요성 금액 계산", stream=False)
+
+        assert sorted(running) == ["mcp-excel", "mcp-finance"]
+        inserted = [c.args[0] for c in supabase.table.return_value.insert.call_args_list]
+        metadata = inserted[-1]["metadata"]
+        assert metadata["mcp_tool"]["server"] == "mcp-finance"
+        assert [t["server"] for t in metadata["mcp_tools"]] == ["mcp-finance", "mcp-excel"]
+        assert all(t["used"] for t in metadata["mcp_tools"])
@@ -0,0 +1,252 @@
+"""
+Tests for MCP Latency Histograms and Tracing
+
+This module tests src/services/mcp_metrics.py and the instrumentation of
+the MCP client layer against an in-process fake MCP server
+(httpx.MockTransport).
+
+Test Classes:
+    - TestLatencyHistogram: HDR-style bucketing and percentile accuracy
+    - TestCallInstrumentation: Per-call counters, flags and spans
+    - TestMetricsExposure: /api/metrics and MCPToolRegistry.health_check_all
+"""
+
+import asyncio
+import json
+import random
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from src.api.routes.health import metrics as metrics_endpoint
+from src.services.mcp_cache import ToolResultCache, ToolSchemaCache
+from src.services.mcp_client import (
+    MCPHealthMonitor,
+    MCPRagClient,
+    MCPServerType,
+    MCPToolExecutionError,
+    MCPToolRegistry,
+    SingleFlight,
+)
+from src.services.mcp_metrics import LatencyHistogram, MCPMetrics, observe_call
+from src.services.mcp_resilience import ServerResilience
+from src.services.mcp_transport import MCPTransport
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class _BodyStream(httpx.AsyncByteStream):
+    """Unread response body, as a real network transport returns it."""
+
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+
+    async def __aiter__(self):
+        yield self._body
+
+
+class EchoServer:
+    """Fake MCP server echoing tool arguments; the tool "fail" errors."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/health":
+            return httpx.Response(200, stream=_BodyStream({"status": "ok"}))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        body = json.loads(request.content)
+        if body["method"] == "tools/list":
+            payload = {"jsonrpc": "2.0", "id": body["id"], "result": {"tools": [{"name": "search_standards"}]}}
+        elif body["params"]["name"] == "fail":
+            payload = {"jsonrpc": "2.0", "id": body["id"], "error": {"code": -32000, "message": "boom"}}
+        else:
+            result = {"status": "success", "data": body["params"]["arguments"]}
+            payload = {"jsonrpc": "2.0", "id": body["id"], "result": result}
+        return httpx.Response(200, stream=_BodyStream(payload))
+
+
+@pytest.fixture
+def server():
+    return EchoServer()
+
+
+@pytest.fixture
+def metrics():
+    """Fresh process-wide metrics registry."""
+    fresh = MCPMetrics()
+    with patch("src.services.mcp_metrics._metrics", fresh):
+        yield fresh
+
+
+@pytest.fixture
+def mcp_env(server, metrics):
+    """Patch the shared transport, health monitor, caches and per-server state."""
+    transport = MCPTransport(
+        http2=False,
+        transport_factory=lambda: httpx.MockTransport(server.handler)
+    )
+    monitor = MCPHealthMonitor()
+    with patch("src.services.mcp_client.get_mcp_transport", return_value=transport), \
+         patch("src.services.mcp_client.get_health_monitor", return_value=monitor), \
+         patch("src.services.mcp_client.get_single_flight", return_value=SingleFlight()), \
+         patch("src.services.mcp_client.get_tool_cache", return_value=ToolResultCache()), \
+         patch("src.services.mcp_client.get_schema_cache", return_value=ToolSchemaCache()), \
+         patch("src.services.mcp_client.get_server_resilience", return_value=ServerResilience()):
+        yield monitor
+
+
+# ============================================================================
+# HISTOGRAM TESTS
+# ============================================================================
+
+class TestLatencyHistogram:
+    """Tests for HDR-style bucketing."""
+
+    def test_percentiles_within_relative_error(self):
+        """Should report percentiles within 1% of the exact values."""
+        rng = random.Random(7)
+        samples = [rng.lognormvariate(-4, 1.2) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for sample in samples:
+            histogram.record(sample)
+
+        ordered = sorted(samples)
+        for q in (0.5, 0.9, 0.99, 0.999):
+            exact = ordered[int(q * len(ordered)) - 1]
+            assert histogram.percentile(q) == pytest.approx(exact, rel=0.01)
+        assert histogram.percentile(1.0) == pytest.approx(max(samples), rel=0.01)
+        assert len(histogram._counts) < 3000  # Buckets, not samples
+
+    def test_bucket_bounds_contain_values(self):
+        """Should map every value into a bucket whose bounds contain it."""
+        histogram = LatencyHistogram(sub_bucket_bits=4)
+        for micros in list(range(0, 2000)) + [10**6, 10**9]:
+            low, high = histogram._bounds(histogram._index(micros))
+            assert low <= micros <= high
+
+    def test_empty_snapshot(self):
+        """Should report no percentiles without samples."""
+        snapshot = LatencyHistogram().snapshot()
+
+        assert snapshot["count"] == 0
+        assert snapshot["p99_ms"] is None
+
+
+# ============================================================================
+# INSTRUMENTATION TESTS
+# ============================================================================
+
+class TestCallInstrumentation:
+    """Tests for per-call counters and flags set by the client layers."""
+
+    @pytest.mark.asyncio
+    async def test_attempts_bytes_and_cache_hits(self, mcp_env, metrics):
+        """Should count attempts and payload bytes, and flag cache hits."""
+        client = MCPRagClient(base_url="http://localhost:8001")
+
+        await client.get_paragraph_by_id("K-IFRS 1115", "9")
+        await client.get_paragraph_by_id("K-IFRS 1115", "9")
+
+        tool = metrics.snapshot()["mcp-rag"]["tools"]["get_paragraph_by_id"]
+        assert tool["calls"] == 2
+        assert tool["cache_hits"] == 1
+        assert tool["attempts"] == 1
+        assert tool["request_bytes"] > 0
+        assert tool["response_bytes"] > 0
+        assert tool["p50_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_coalesced_and_error_calls(self, mcp_env, metrics, server):
+        """Should flag coalesced calls and count errors."""
+        server.delay = 0.02
+        client = MCPRagClient(base_url="http://localhost:8001")
+        client.config.cache_results = False
+
+        await asyncio.gather(*(
+            client.search_standards("리스", top_k=5) for _ in range(3)
+        ))
+        with pytest.raises(MCPToolExecutionError):
+            await client._call_tool("fail", {})
+
+        snapshot = metrics.snapshot()["mcp-rag"]
+        assert snapshot["tools"]["search_standards"]["coalesced"] == 2
+        assert snapshot["tools"]["search_standards"]["attempts"] == 1
+        assert snapshot["tools"]["fail"]["errors"] == 1
+        assert snapshot["calls"] == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelled_calls_not_timed(self, metrics):
+        """Should count cancelled calls without recording their latency."""
+        async def call():
+            with observe_call("mcp-rag", "search_standards"):
+                await asyncio.sleep(1)
+
+        task = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        tool = metrics.snapshot()["mcp-rag"]["tools"]["search_standards"]
+        assert tool["cancelled"] == 1
+        assert tool["count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_spans_carry_call_attributes(self, mcp_env):
+        """Should emit mcp.call and mcp.attempt spans when an SDK is configured."""
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+        with patch("src.services.mcp_metrics.otel_trace.get_tracer", provider.get_tracer):
+            await MCPRagClient(base_url="http://localhost:8001").get_paragraph_by_id("K-IFRS 1115", "9")
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        assert spans["mcp.call"].attributes["mcp.tool"] == "get_paragraph_by_id"
+        assert spans["mcp.call"].attributes["mcp.cache_hit"] is False
+        assert spans["mcp.attempt"].attributes["mcp.attempt"] == 1
+        assert spans["mcp.attempt"].attributes["http.status_code"] == 200
+
+
+# ============================================================================
+# EXPOSURE TESTS
+# ============================================================================
+
+class TestMetricsExposure:
+    """Tests for the metrics endpoint and registry health report."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_formats(self, mcp_env, metrics):
+        """Should render Prometheus text by default and JSON on request."""
+        await MCPRagClient(base_url="http://localhost:8001").search_standards("리스", top_k=5)
+
+        text = (await metrics_endpoint(format="prometheus")).body.decode()
+        assert 'mcp_call_duration_seconds_count{server="mcp-rag",tool="search_standards"} 1' in text
+        assert 'quantile="0.99"' in text
+        assert "# TYPE mcp_calls_total counter" in text
+
+        data = await metrics_endpoint(format="json")
+        assert data["mcp_servers"]["mcp-rag"]["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_health_check_all_reports_latency(self, mcp_env, metrics):
+        """Should include per-server latency in health_check_all()."""
+        registry = MCPToolRegistry(health_monitor=mcp_env)
+        await registry.register_server(MCPServerType.RAG, url="http://localhost:8001")
+        await registry.call_tool("search_standards", {"query_text": "a"})
+
+        status = await registry.health_check_all()
+
+        latency = status["mcp-rag"]["latency"]
+        assert latency["calls"] == 1
+        assert latency["tools"]["search_standards"]["p99_ms"] is not None
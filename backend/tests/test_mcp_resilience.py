@@ -0,0 +1,241 @@
+"""
+Tests for MCP Retry Budgets and Hedged Requests
+
+This module tests src/services/mcp_resilience.py and its use by the MCP
+clients' retry loops.
+
+Test Classes:
+    - TestRetryBudget: Token bucket and decorrelated jitter
+    - TestHedgedCall: Duplicate requests after a delay
+    - TestClientResilience: Retry budget and hedging in MCP clients
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from src.services.mcp_cache import ToolResultCache
+from src.services.mcp_client import (
+    MCPClient,
+    MCPClientConfig,
+    MCPConnectionError,
+    MCPHealthMonitor,
+    MCPRagClient,
+    SingleFlight,
+)
+from src.services.mcp_resilience import (
+    LatencyWindow,
+    RetryBudget,
+    ServerResilience,
+    decorrelated_jitter,
+    hedged_call,
+)
+from src.services.mcp_transport import MCPTransport
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class _BodyStream(httpx.AsyncByteStream):
+    """Unread response body, as a real network transport returns it."""
+
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+
+    async def __aiter__(self):
+        yield self._body
+
+
+class FlakyServer:
+    """Fake MCP server whose first `slow_requests` requests stall."""
+
+    def __init__(self, slow_requests: int = 0, slow_delay: float = 1.0, down: bool = False):
+        self.slow_requests = slow_requests
+        self.slow_delay = slow_delay
+        self.down = down
+        self.requests = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.down:
+            raise httpx.ConnectError("connection refused", request=request)
+        if self.requests <= self.slow_requests:
+            await asyncio.sleep(self.slow_delay)
+        body = json.loads(request.content)
+        result = {"status": "success", "data": {"request": self.requests}}
+        return httpx.Response(
+            200, stream=_BodyStream({"jsonrpc": "2.0", "id": body["id"], "result": result})
+        )
+
+
+@pytest.fixture
+def server():
+    return FlakyServer()
+
+
+@pytest.fixture
+def resilience():
+    return ServerResilience()
+
+
+@pytest.fixture
+def mcp_env(server, resilience):
+    """Patch the transport, health monitor, coalescing, cache and resilience state."""
+    transport = MCPTransport(
+        http2=False,
+        transport_factory=lambda: httpx.MockTransport(server.handler)
+    )
+    with patch("src.services.mcp_client.get_mcp_transport", return_value=transport), \
+         patch("src.services.mcp_client.get_health_monitor", return_value=MCPHealthMonitor()), \
+         patch("src.services.mcp_client.get_single_flight", return_value=SingleFlight()), \
+         patch("src.services.mcp_client.get_tool_cache", return_value=ToolResultCache(ttls={})), \
+         patch("src.services.mcp_client.get_server_resilience", return_value=resilience):
+        yield resilience
+
+
+# ============================================================================
+# RETRY BUDGET TESTS
+# ============================================================================
+
+class TestRetryBudget:
+    """Tests for the token bucket and backoff jitter."""
+
+    def test_budget_caps_retries(self):
+        """Should deny retries once tokens run out and refill per request."""
+        budget = RetryBudget(ratio=0.5, min_per_second=0.0, capacity=2.0)
+
+        assert budget.try_withdraw()
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+
+        budget.deposit()
+        budget.deposit()
+        assert budget.try_withdraw()
+        assert budget.rejected == 1
+
+    def test_decorrelated_jitter_bounds(self):
+        """Should stay between base and cap and grow from the previous delay."""
+        delays = [decorrelated_jitter(0.1, 2.0, previous) for previous in (0.1, 0.5, 5.0) * 50]
+
+        assert all(0.1 <= d <= 2.0 for d in delays)
+        assert len(set(delays)) > 1
+        assert decorrelated_jitter(0, 2.0, 1.0) == 0.0
+
+    def test_latency_window_quantiles(self):
+        """Should report quantiles only after enough samples."""
+        window = LatencyWindow(size=100, min_samples=10)
+        for i in range(5):
+            window.record(i / 100)
+        assert window.quantile(0.95) is None
+
+        for i in range(5, 100):
+            window.record(i / 100)
+        assert window.quantile(0.5) == pytest.approx(0.5)
+        assert window.quantile(0.95) == pytest.approx(0.95)
+
+
+# ============================================================================
+# HEDGING TESTS
+# ============================================================================
+
+class TestHedgedCall:
+    """Tests for hedged_call."""
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_over_slow_primary(self):
+        """Should return the duplicate's result and cancel the slow attempt."""
+        calls = []
+        won = []
+
+        async def attempt():
+            calls.append(len(calls))
+            await asyncio.sleep(1.0 if len(calls) == 1 else 0.0)
+            return len(calls)
+
+        result = await asyncio.wait_for(
+            hedged_call(attempt, delay=0.01, on_hedge_won=lambda: won.append(True)), 0.5
+        )
+
+        assert result == 2
+        assert won == [True]
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self):
+        """Should not send a duplicate when the first attempt is fast."""
+        calls = []
+
+        async def attempt():
+            calls.append(1)
+            return "ok"
+
+        assert await hedged_call(attempt, delay=0.05) == "ok"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_denied_waits_for_primary(self):
+        """Should keep waiting for the first attempt when hedging is denied."""
+        calls = []
+
+        async def attempt():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        assert await hedged_call(attempt, delay=0.001, allow_hedge=lambda: False) == "ok"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_error_raised_when_both_fail(self):
+        """Should raise only after both attempts failed."""
+        async def attempt():
+            await asyncio.sleep(0.02)
+            raise httpx.ConnectError("refused")
+
+        with pytest.raises(httpx.ConnectError):
+            await hedged_call(attempt, delay=0.001)
+
+
+# ============================================================================
+# CLIENT INTEGRATION TESTS
+# ============================================================================
+
+class TestClientResilience:
+    """Tests for retry budgets and hedging inside the MCP clients."""
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_limits_outage_amplification(self, mcp_env, server):
+        """Should stop retrying once the server's budget is spent."""
+        server.down = True
+        mcp_env.budget = RetryBudget(ratio=0.1, min_per_second=0.0, capacity=2.0)
+        client = MCPClient(
+            name="mcp-rag",
+            base_url="http://localhost:8001",
+            config=MCPClientConfig(max_retries=3, retry_delay=0, circuit_breaker_fail_max=100)
+        )
+
+        for _ in range(5):
+            with pytest.raises(MCPConnectionError):
+                await client.call_tool("search_standards", {"query_text": "q"})
+
+        # 5 first attempts plus only the 2 retries the budget allowed
+        assert server.requests == 7
+        assert mcp_env.stats()["retries_denied"] >= 3
+
+    @pytest.mark.asyncio
+    async def test_rag_client_hedges_slow_request(self, mcp_env, server):
+        """Should answer from the hedge when the first request stalls."""
+        client = MCPRagClient(base_url="http://localhost:8001", hedge_requests=True)
+        client.config.hedge_min_delay = 0.01
+        for i in range(25):
+            await client.search_standards(f"warm-up {i}")
+
+        server.slow_requests = server.requests + 1
+        result = await asyncio.wait_for(client.search_standards("slow"), 0.5)
+
+        assert result["data"]["request"] == server.requests
+        assert mcp_env.hedges_sent == 1
+        assert mcp_env.hedges_won == 1
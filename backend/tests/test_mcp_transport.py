@@ -0,0 +1,171 @@
+"""
+Tests for the Shared MCP Transport
+
+This module tests the process-wide connection-pooled transport that all MCP
+clients borrow their HTTP client from.
+
+Test Classes:
+    - TestMCPTransport: Per-server pooling, metrics and lifecycle
+    - TestClientIntegration: MCP clients sharing the transport
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from src.services.mcp_cache import ToolResultCache
+from src.services.mcp_client import MCPClient, MCPExcelClient, MCPRagClient
+from src.services.mcp_transport import MCPTransport
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class _BodyStream(httpx.AsyncByteStream):
+    """Unread response body, as a real network transport returns it."""
+
+    def __init__(self, payload):
+        self._body = json.dumps(payload).encode()
+
+    async def __aiter__(self):
+        yield self._body
+
+
+def _jsonrpc_handler(request: httpx.Request) -> httpx.Response:
+    """Fake MCP server answering every JSON-RPC call with its tool name."""
+    if request.url.path == "/health":
+        return httpx.Response(200, stream=_BodyStream({"status": "ok"}))
+    body = json.loads(request.content)
+    return httpx.Response(
+        200,
+        stream=_BodyStream(
+            {"jsonrpc": "2.0", "id": body["id"], "result": {"tool": body["params"]["name"]}}
+        )
+    )
+
+
+@pytest.fixture
+def transport():
+    """Transport backed by an in-process fake MCP server."""
+    return MCPTransport(
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+        http2=False,
+        transport_factory=lambda: httpx.MockTransport(_jsonrpc_handler)
+    )
+
+
+# ============================================================================
+# TRANSPORT TESTS
+# ============================================================================
+
+class TestMCPTransport:
+    """Tests for per-server pooled clients."""
+
+    @pytest.mark.asyncio
+    async def test_same_origin_shares_client(self, transport):
+        """Should hand out one client per server origin."""
+        first = transport.client_for("http://localhost:8001")
+        second = transport.client_for("http://LOCALHOST:8001/mcp")
+        other = transport.client_for("http://localhost:8007")
+
+        assert first is second
+        assert first is not other
+        assert set(transport.stats()) == {"http://localhost:8001", "http://localhost:8007"}
+
+    @pytest.mark.asyncio
+    async def test_metrics_track_requests(self, transport):
+        """Should count requests and release in-flight slots after reading."""
+        client = transport.client_for("http://localhost:8001")
+        request = {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+                   "params": {"name": "t", "arguments": {}}}
+
+        await asyncio.gather(*(
+            client.post("http://localhost:8001/mcp", json=request) for _ in range(3)
+        ))
+
+        stats = transport.stats()["http://localhost:8001"]
+        assert stats["requests_total"] == 3
+        assert stats["in_flight"] == 0
+        assert 1 <= stats["peak_in_flight"] <= 3
+        assert stats["max_connections"] == 4
+        assert stats["utilization"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_counted(self):
+        """Should count failed requests and not leak in-flight slots."""
+        def refuse(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        transport = MCPTransport(http2=False, transport_factory=lambda: httpx.MockTransport(refuse))
+        client = transport.client_for("http://localhost:8002")
+
+        with pytest.raises(httpx.ConnectError):
+            await client.get("http://localhost:8002/health")
+
+        stats = transport.stats()["http://localhost:8002"]
+        assert stats["errors_total"] == 1
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_pools(self, transport):
+        """Should close every pooled client and forget it."""
+        client = transport.client_for("http://localhost:8001")
+
+        await transport.aclose()
+
+        assert client.is_closed
+        assert transport.stats() == {}
+        assert transport.client_for("http://localhost:8001") is not client
+
+    def test_env_limits(self, monkeypatch):
+        """Should read pool limits from the environment."""
+        monkeypatch.setenv("MCP_POOL_MAX_CONNECTIONS", "7")
+        monkeypatch.setenv("MCP_POOL_MAX_KEEPALIVE", "3")
+        monkeypatch.setenv("MCP_HTTP2", "false")
+
+        transport = MCPTransport()
+
+        assert transport.limits.max_connections == 7
+        assert transport.limits.max_keepalive_connections == 3
+        assert transport.http2 is False
+
+
+# ============================================================================
+# CLIENT INTEGRATION TESTS
+# ============================================================================
+
+class TestClientIntegration:
+    """Tests for MCP clients borrowing from the shared transport."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_pool(self, transport):
+        """Should route different client classes for one server through one pool."""
+        with patch("src.services.mcp_client.get_mcp_transport", return_value=transport), \
+             patch("src.services.mcp_client.get_tool_cache", return_value=ToolResultCache(ttls={})):
+            generic = MCPClient(name="mcp-rag", base_url="http://localhost:8001")
+            rag = MCPRagClient(base_url="http://localhost:8001")
+
+            assert await generic._get_client() is await rag._get_client()
+
+            result = await generic.call_tool("search_standards", {"query_text": "q"})
+            raw = await rag._call_tool("search_standards", {"query_text": "q"})
+
+        assert result == {"tool": "search_standards"}
+        assert raw == {"tool": "search_standards"}
+        assert transport.stats()["http://localhost:8001"]["requests_total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_pool_open(self, transport):
+        """Should not close pooled connections when a client is released."""
+        with patch("src.services.mcp_client.get_mcp_transport", return_value=transport):
+            async with MCPExcelClient(base_url="http://localhost:8007") as excel:
+                shared = await excel._get_client()
+                assert await excel.health_check()
+
+            assert not shared.is_closed
+            async with MCPExcelClient(base_url="http://localhost:8007") as again:
+                assert await again._get_client() is shared
@@ -0,0 +1,213 @@
+"""
+Tests for the Agent Message Broker and SSE Push Delivery
+
+This module tests src/services/message_broker.py and its use by the SSE
+stream (src/api/sse.py) and sync_task_to_supabase, with the Supabase client
+replaced by a MagicMock behind AsyncDatabase.
+
+Test Classes:
+    - TestMessageBroker: Fan-out, bounded queues, staleness and threads
+    - TestPostgresNotifyBackend: Notification decoding (no database needed)
+    - TestSSEPushDelivery: Backfill on connect, then pushed messages
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from langchain_core.messages import AIMessage
+
+from src.api.sse import stream_agent_messages
+from src.db.async_client import AsyncDatabase
+from src.services.message_broker import BrokerBackend, MessageBroker, PostgresNotifyBackend
+from src.services.task_stream import TaskStreamHub
+from src.services.task_sync import _sync_agent_messages
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def _database(client):
+    """Async database layer on a mocked PostgREST client (no direct pool)."""
+    db = AsyncDatabase(url="http://supabase.test", service_key="test-key", conninfo="")
+    db._client = client
+    return db
+
+
+@pytest.fixture
+def broker():
+    """Fresh process-wide broker."""
+    fresh = MessageBroker()
+    hub = TaskStreamHub(broker=fresh, idle_ttl=0)
+    with patch("src.api.sse.get_message_broker", return_value=fresh), \
+         patch("src.api.sse.get_task_stream_hub", return_value=hub), \
+         patch("src.services.task_sync.get_message_broker", return_value=fresh):
+        yield fresh
+
+
+def _row(msg_id: str, content: str = "hello", created_at: str = "2024-01-06T12:00:00Z"):
+    return {
+        "id": msg_id,
+        "task_id": "task-1",
+        "agent_role": "partner",
+        "content": content,
+        "created_at": created_at,
+    }
+
+
+class _Request:
+    """Connected client for the SSE endpoint."""
+
+    headers = {}
+
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+class _FailingBackend(BrokerBackend):
+    async def publish(self, topic, message):
+        raise ConnectionError("broker down")
+
+
+# ============================================================================
+# BROKER TESTS
+# ============================================================================
+
+class TestMessageBroker:
+    """Tests for topic fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_per_topic(self, broker):
+        """Should deliver to every subscriber of the topic and no other."""
+        async with broker.subscribe("task-1") as first, \
+                broker.subscribe("task-1") as second, \
+                broker.subscribe("task-2") as other:
+            await broker.publish("task-1", _row("m1"))
+
+            assert (await first.get(timeout=1))["id"] == "m1"
+            assert (await second.get(timeout=1))["id"] == "m1"
+            assert await other.get(timeout=0.01) is None
+
+        assert broker.subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_overflow_drops_oldest_and_marks_stale(self, broker):
+        """Should keep the newest messages and ask the reader to backfill."""
+        async with broker.subscribe("task-1", maxsize=2) as subscription:
+            for i in range(5):
+                await broker.publish("task-1", _row(f"m{i}"))
+
+            assert subscription.dropped == 3
+            assert subscription.take_stale() is True
+            assert subscription.take_stale() is False
+            assert [subscription.get_nowait()["id"] for _ in range(2)] == ["m3", "m4"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_wakes_waiting_subscriber(self, broker):
+        """Should wake a waiting reader and mark it stale."""
+        async with broker.subscribe("task-1") as subscription:
+            waiter = asyncio.create_task(subscription.get(timeout=5))
+            await asyncio.sleep(0)
+            broker.invalidate(None)
+
+            assert await asyncio.wait_for(waiter, timeout=1) is None
+            assert subscription.take_stale() is True
+
+    @pytest.mark.asyncio
+    async def test_publish_from_another_thread(self, broker):
+        """Should hand messages published off-loop to the subscriber's loop."""
+        async with broker.subscribe("task-1") as subscription:
+            thread = threading.Thread(target=broker.deliver, args=("task-1", _row("m1")))
+            thread.start()
+            thread.join()
+
+            assert (await subscription.get(timeout=1))["id"] == "m1"
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_not_raised(self):
+        """Should log, not raise, when the backend cannot publish."""
+        failing = MessageBroker(_FailingBackend())
+
+        await failing.publish("task-1", _row("m1"))
+
+        assert failing.published == 1
+
+
+# ============================================================================
+# POSTGRES BACKEND TESTS
+# ============================================================================
+
+class TestPostgresNotifyBackend:
+    """Tests for decoding LISTEN/NOTIFY payloads."""
+
+    @pytest.mark.asyncio
+    async def test_notifications_delivered_or_invalidated(self, broker):
+        """Should deliver full payloads and invalidate for topic-only ones."""
+        backend = PostgresNotifyBackend("postgresql://unused")
+        backend._broker = broker
+
+        async with broker.subscribe("task-1") as subscription:
+            backend._handle(json.dumps({"topic": "task-1", "message": _row("m1")}))
+            backend._handle(json.dumps({"topic": "task-1"}))  # Too large to inline
+            backend._handle("not json")
+
+            assert (await subscription.get(timeout=1))["id"] == "m1"
+            assert await subscription.get(timeout=1) is None
+            assert subscription.take_stale() is True
+            assert subscription.get_nowait() is None
+
+
+# ============================================================================
+# SSE AND WRITER TESTS
+# ============================================================================
+
+class TestSSEPushDelivery:
+    """Tests for push delivery in stream_agent_messages."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_then_push_without_polling(self, broker):
+        """Should backfill once on connect, then stream published messages."""
+        supabase = MagicMock()
+        query = supabase.table.return_value.select.return_value.eq.return_value.order.return_value
+        query.execute = AsyncMock(return_value=MagicMock(data=[_row("m1", "earlier")]))
+
+        with patch("src.db.async_client._db", _database(supabase)):
+            events = stream_agent_messages("task-1", _Request()).body_iterator
+
+            first = json.loads((await asyncio.wait_for(events.__anext__(), 1))["data"])
+            assert first["id"] == "m1"
+
+            await broker.publish("task-1", _row("m1", "earlier"))  # Duplicate
+            await broker.publish("task-1", _row("m2", "pushed", "2024-01-06T12:00:01Z"))
+            pushed = json.loads((await asyncio.wait_for(events.__anext__(), 1))["data"])
+            await events.aclose()
+
+        assert pushed == {
+            "id": "m2",
+            "agent_role": "partner",
+            "content": "pushed",
+            "timestamp": "2024-01-06T12:00:01Z",
+        }
+        assert query.execute.call_count == 1
+        assert broker.subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_task_sync_publishes_inserted_messages(self, broker):
+        """Should publish rows inserted by _sync_agent_messages."""
+        state = {"messages": [AIMessage(content="done", additional_kwargs={"agent_role": "staff"})]}
+
+        async with broker.subscribe("task-1") as subscription:
+            supabase = MagicMock()
+            supabase.table.return_value.insert.return_value.execute = AsyncMock(
+                return_value=MagicMock(data=[{}])
+            )
+            with patch("src.db.async_client._db", _database(supabase)):
+                await _sync_agent_messages(state, "task-1")
+
+            message = await subscription.get(timeout=1)
+
+        assert message["content"] == "done"
+        assert message["agent_role"] == "staff"
@@ -0,0 +1,208 @@
+"""
+Tests for Shared Per-Task SSE Streams
+
+This module tests src/services/task_stream.py with an in-process message
+broker and an in-memory stand-in for the agent_messages table.
+
+Test Classes:
+    - TestSharedUpstream: One subscription and backfill per task
+    - TestResume: Last-Event-ID resume and database replay
+    - TestSlowReaders: Drop policies for readers falling out of the buffer
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.services.message_broker import MessageBroker
+from src.services.task_stream import StreamLagError, TaskStreamHub, parse_event_id
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class FakeMessages:
+    """agent_messages rows of one task, counting reads."""
+
+    def __init__(self, count: int = 0):
+        self.rows = [self.row(i) for i in range(count)]
+        self.reads = 0
+
+    @staticmethod
+    def row(i: int):
+        return {
+            "id": f"m{i}",
+            "task_id": "task-1",
+            "agent_role": "partner",
+            "content": f"message {i}",
+            "created_at": f"2024-01-06T12:00:{i:02d}Z",
+        }
+
+    async def fetch(self, task_id, after):
+        self.reads += 1
+        return [row for row in self.rows if after is None or row["created_at"] > after]
+
+
+@pytest.fixture
+def broker():
+    return MessageBroker()
+
+
+@pytest.fixture
+def messages():
+    return FakeMessages(count=3)
+
+
+@pytest.fixture
+def hub(broker, messages):
+    return TaskStreamHub(broker=broker, fetch=messages.fetch, idle_ttl=0)
+
+
+async def _drain(reader, timeout: float = 0.05):
+    events = []
+    while (event := await reader.next(timeout=timeout)) is not None:
+        events.append(event)
+    return events
+
+
+def _ids(events):
+    return [json.loads(event.data)["id"] for event in events if event.event == "message"]
+
+
+# ============================================================================
+# SHARED UPSTREAM TESTS
+# ============================================================================
+
+class TestSharedUpstream:
+    """Tests for sharing one upstream among readers."""
+
+    @pytest.mark.asyncio
+    async def test_readers_share_subscription_and_backfill(self, hub, broker, messages):
+        """Should subscribe and backfill once however many readers attach."""
+        readers = [hub.open("task-1") for _ in range(5)]
+        await broker.publish("task-1", FakeMessages.row(3))
+
+        for reader in readers:
+            assert _ids(await _drain(reader)) == ["m0", "m1", "m2", "m3"]
+
+        assert broker.subscriber_count("task-1") == 1
+        assert messages.reads == 1
+        assert hub.stats()["task-1"]["readers"] == 5
+
+        for reader in readers:
+            reader.close()
+        assert broker.subscriber_count() == 0
+        assert hub.stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_event_ids_are_monotonic(self, hub, broker):
+        """Should number events consecutively and drop duplicate messages."""
+        async with hub.open("task-1") as reader:
+            await broker.publish("task-1", FakeMessages.row(1))  # Already backfilled
+            await broker.publish("task-1", {"type": "token", "id": "m9", "delta": "a", "index": 0})
+            events = await _drain(reader)
+
+        assert [e.event for e in events] == ["message"] * 3 + ["token"]
+        seqs = [parse_event_id(e.id)[1] for e in events]
+        assert seqs == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_progress_records_become_progress_events(self, hub, broker):
+        """Should relay parse progress records as "progress" events."""
+        async with hub.open("task-1") as reader:
+            await broker.publish("task-1", {
+                "type": "progress", "agent_role": "Excel Parser", "transaction_count": 100,
+                "total_amount": 5000, "anomalies_detected": 2, "pages": 1, "done": False
+            })
+            events = await _drain(reader)
+
+        assert events[-1].event == "progress"
+        assert json.loads(events[-1].data)["transaction_count"] == 100
+
+
+# ============================================================================
+# RESUME TESTS
+# ============================================================================
+
+class TestResume:
+    """Tests for Last-Event-ID handling."""
+
+    @pytest.mark.asyncio
+    async def test_resume_after_last_event_id(self, broker, messages):
+        """Should continue right after the last event the client saw."""
+        hub = TaskStreamHub(broker=broker, fetch=messages.fetch, idle_ttl=60)
+        reader = hub.open("task-1")
+        seen = await _drain(reader)
+        reader.close()  # Stream kept for idle_ttl
+
+        await broker.publish("task-1", FakeMessages.row(3))
+        await asyncio.sleep(0.01)
+
+        async with hub.open("task-1", last_event_id=seen[1].id) as resumed:
+            events = await _drain(resumed)
+
+        assert resumed.resumed
+        assert _ids(events) == ["m2", "m3"]
+        assert messages.reads == 1
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_epoch_replays_history(self, hub, broker, messages):
+        """Should replay from the database once, without duplicates."""
+        async with hub.open("task-1") as first:
+            await _drain(first)
+
+            async with hub.open("task-1", last_event_id="other-epoch:2") as reader:
+                await broker.publish("task-1", FakeMessages.row(3))
+                events = await _drain(reader)
+
+        assert not reader.resumed
+        assert _ids(events) == ["m0", "m1", "m2", "m3"]
+        assert events[0].id is None  # Replayed history is not resumable
+        assert events[-1].id is not None
+
+
+# ============================================================================
+# SLOW READER TESTS
+# ============================================================================
+
+class TestSlowReaders:
+    """Tests for readers falling out of the ring buffer."""
+
+    @pytest.mark.asyncio
+    async def test_skip_policy_emits_gap(self, broker):
+        """Should report missed events and continue from the buffer."""
+        hub = TaskStreamHub(broker=broker, fetch=FakeMessages().fetch, buffer_size=4, idle_ttl=0)
+        fast = hub.open("task-1")
+        slow = hub.open("task-1")
+
+        for i in range(10):
+            await broker.publish("task-1", FakeMessages.row(i))
+            assert _ids(await _drain(fast, timeout=0.01)) == [f"m{i}"]
+
+        events = await _drain(slow)
+
+        assert events[0].event == "gap"
+        assert json.loads(events[0].data) == {"missed": 6}
+        assert _ids(events) == ["m6", "m7", "m8", "m9"]
+        assert slow.dropped == 6
+        fast.close()
+        slow.close()
+
+    @pytest.mark.asyncio
+    async def test_close_policy_raises(self, broker):
+        """Should raise StreamLagError for readers with drop policy "close"."""
+        hub = TaskStreamHub(broker=broker, fetch=FakeMessages().fetch, buffer_size=4, idle_ttl=0)
+        fast = hub.open("task-1")
+        slow = hub.open("task-1", drop_policy="close")
+
+        for i in range(10):
+            await broker.publish("task-1", FakeMessages.row(i))
+            assert _ids(await _drain(fast, timeout=0.01)) == [f"m{i}"]
+
+        with pytest.raises(StreamLagError):
+            await slow.next(timeout=0.05)
+        fast.close()
+        slow.close()
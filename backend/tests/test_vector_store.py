@@ -0,0 +1,334 @@
+"""
+Tests for the Local Vector Store
+
+This module tests the NumPy-backed LocalVectorStore used as the built-in
+vector store for AuditGuideRAG.
+
+Test Classes:
+    - TestLocalVectorStore: Upsert, search and delete behaviour
+    - TestPersistence: Memory-mapped persistence and cold start
+    - TestQuantization: int8-quantized storage
+    - TestRAGIntegration: AuditGuideRAG with the built-in store
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.services.audit_guide_rag import AuditGuideRAG, SearchMode
+from src.services.vector_store import LocalVectorStore
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def _record(chunk_id, embedding, document_id="doc1", text=None):
+    return {
+        "id": chunk_id,
+        "embedding": embedding,
+        "text": text or f"text of {chunk_id}",
+        "metadata": {
+            "chunk_id": chunk_id,
+            "document_id": document_id,
+            "section_code": "1.1",
+            "section_title": "1.1 Test",
+            "page_number": 1,
+            "chunk_index": 0,
+            "total_chunks": 1,
+        },
+    }
+
+
+@pytest.fixture
+def records():
+    """Three orthogonal-ish chunks across two documents."""
+    return [
+        _record("doc1_0", [1.0, 0.0, 0.0]),
+        _record("doc1_1", [0.0, 1.0, 0.0]),
+        _record("doc2_0", [0.0, 0.0, 1.0], document_id="doc2"),
+    ]
+
+
+class KeywordEmbedding:
+    """Deterministic embedding model for RAG integration tests."""
+
+    VOCAB = ["은행", "재고", "매출"]
+
+    async def embed(self, text):
+        return [float(text.count(word)) + 0.01 for word in self.VOCAB]
+
+
+# ============================================================================
+# CORE TESTS
+# ============================================================================
+
+class TestLocalVectorStore:
+    """Tests for in-memory LocalVectorStore behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_search_returns_nearest(self, records):
+        """Should return the most similar chunk first."""
+        store = LocalVectorStore()
+        await store.upsert_many(records)
+
+        results = await store.search([0.1, 0.9, 0.0], top_k=2)
+
+        assert results[0][0].metadata.chunk_id == "doc1_1"
+        assert results[0][1] == pytest.approx(0.9 / np.linalg.norm([0.1, 0.9]))
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_search_empty_store(self):
+        """Should return no results before anything is inserted."""
+        store = LocalVectorStore()
+
+        assert await store.search([1.0, 0.0], top_k=5) == []
+
+    @pytest.mark.asyncio
+    async def test_upsert_overwrites_existing_id(self, records):
+        """Should overwrite in place instead of adding a row."""
+        store = LocalVectorStore()
+        await store.upsert_many(records)
+
+        await store.upsert(**_record("doc1_0", [0.0, 1.0, 0.0], text="updated"))
+
+        assert store.count() == 3
+        results = await store.search([0.0, 1.0, 0.0], top_k=3)
+        top_ids = {chunk.metadata.chunk_id for chunk, score in results if score > 0.99}
+        assert top_ids == {"doc1_0", "doc1_1"}
+
+    @pytest.mark.asyncio
+    async def test_delete_document(self, records):
+        """Should exclude deleted document chunks from search."""
+        store = LocalVectorStore()
+        await store.upsert_many(records)
+
+        deleted = await store.delete_document("doc1")
+
+        assert deleted == 2
+        results = await store.search([1.0, 1.0, 0.0], top_k=5)
+        assert [c.metadata.chunk_id for c, _ in results] == ["doc2_0"]
+
+    @pytest.mark.asyncio
+    async def test_delete_document_keeps_new_version(self, records):
+        """Should only delete chunks of the old version not overwritten by the new one."""
+        store = LocalVectorStore()
+        await store.upsert_many(records)
+
+        deleted = await store.delete_document("doc1", keep={"doc1_0"})
+
+        assert deleted == 1
+        assert store.count() == 2
+        assert await store.delete_document("doc1") == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_by_id(self, records):
+        """Should delete only the given chunk ids and ignore unknown ones."""
+        store = LocalVectorStore()
+        await store.upsert_many(records)
+
+        deleted = await store.delete(["doc1_1", "missing"])
+
+        assert deleted == 1
+        assert [c.metadata.chunk_id for c in await store.load_chunks()] == ["doc1_0", "doc2_0"]
+
+    @pytest.mark.asyncio
+    async def test_dimension_mismatch(self, records):
+        """Should reject embeddings with a different dimension."""
+        store = LocalVectorStore()
+        await store.upsert_many(records)
+
+        with pytest.raises(ValueError):
+            await store.upsert(**_record("bad", [1.0, 0.0]))
+
+    @pytest.mark.asyncio
+    async def test_grows_past_initial_capacity(self):
+        """Should grow the matrix and still rank across blocks."""
+        store = LocalVectorStore()
+        store.INITIAL_CAPACITY = 4
+        store.BLOCK_ROWS = 3
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(20, 8))
+        await store.upsert_many([_record(f"c{i}", v.tolist()) for i, v in enumerate(vectors)])
+
+        results = await store.search(vectors[13].tolist(), top_k=5)
+
+        assert results[0][0].metadata.chunk_id == "c13"
+        scores = [score for _, score in results]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_search_many_matches_search(self):
+        """Should rank each query exactly like a single search."""
+        store = LocalVectorStore()
+        store.BLOCK_ROWS = 7
+        rng = np.random.default_rng(2)
+        vectors = rng.normal(size=(30, 8))
+        await store.upsert_many([_record(f"c{i}", v.tolist()) for i, v in enumerate(vectors)])
+        queries = rng.normal(size=(4, 8)).tolist()
+
+        batched = await store.search_many(queries, top_k=5)
+
+        assert len(batched) == 4
+        for query, results in zip(queries, batched):
+            single = await store.search(query, top_k=5)
+            assert [c.metadata.chunk_id for c, _ in results] == [c.metadata.chunk_id for c, _ in single]
+            assert [s for _, s in results] == pytest.approx([s for _, s in single])
+
+    @pytest.mark.asyncio
+    async def test_search_many_empty_store(self):
+        """Should return one empty list per query before anything is inserted."""
+        store = LocalVectorStore()
+
+        assert await store.search_many([[1.0, 0.0], [0.0, 1.0]], top_k=3) == [[], []]
+
+    @pytest.mark.asyncio
+    async def test_compact_reclaims_rows(self, records):
+        """Should drop tombstoned rows and keep search results intact."""
+        store = LocalVectorStore()
+        await store.upsert_many(records)
+        await store.delete_document("doc1")
+
+        assert store.compact() == 2
+        results = await store.search([0.0, 0.0, 1.0], top_k=5)
+        assert [c.metadata.chunk_id for c, _ in results] == ["doc2_0"]
+
+
+# ============================================================================
+# PERSISTENCE TESTS
+# ============================================================================
+
+class TestPersistence:
+    """Tests for memory-mapped persistence."""
+
+    @pytest.mark.asyncio
+    async def test_reopen_restores_chunks_and_vectors(self, tmp_path, records):
+        """Should serve searches after reopening without re-ingesting."""
+        store = LocalVectorStore(str(tmp_path))
+        await store.upsert_many(records)
+        await store.delete_document("doc2")
+        store.close()
+
+        reopened = LocalVectorStore(str(tmp_path))
+
+        assert isinstance(reopened._vectors, np.memmap)
+        assert reopened.count() == 2
+        results = await reopened.search([0.0, 1.0, 0.0], top_k=1)
+        assert results[0][0].metadata.chunk_id == "doc1_1"
+        assert [c.metadata.chunk_id for c in await reopened.load_chunks()] == ["doc1_0", "doc1_1"]
+
+    @pytest.mark.asyncio
+    async def test_reopen_after_compact(self, tmp_path, records):
+        """Should persist the compacted layout."""
+        store = LocalVectorStore(str(tmp_path))
+        await store.upsert_many(records)
+        await store.delete_document("doc1")
+        store.compact()
+        store.close()
+
+        reopened = LocalVectorStore(str(tmp_path))
+
+        assert reopened.count() == 1
+        results = await reopened.search([0.0, 0.0, 1.0], top_k=3)
+        assert [c.metadata.chunk_id for c, _ in results] == ["doc2_0"]
+
+    @pytest.mark.asyncio
+    async def test_crash_after_compaction_commit(self, tmp_path, records):
+        """Should finish a committed compaction on the next open."""
+        store = LocalVectorStore(str(tmp_path))
+        await store.upsert_many(records)
+        await store.delete_document("doc1")
+
+        with patch.object(LocalVectorStore, "_finish_compaction", side_effect=OSError("crash")):
+            with pytest.raises(OSError):
+                store.compact()
+
+        reopened = LocalVectorStore(str(tmp_path))
+
+        assert reopened._count == 1
+        assert not (tmp_path / LocalVectorStore.COMPACT_MARKER).exists()
+        results = await reopened.search([0.0, 0.0, 1.0], top_k=3)
+        assert [c.metadata.chunk_id for c, _ in results] == ["doc2_0"]
+
+    @pytest.mark.asyncio
+    async def test_crash_before_compaction_commit(self, tmp_path, records):
+        """Should discard uncommitted compaction files and keep the old index."""
+        store = LocalVectorStore(str(tmp_path))
+        await store.upsert_many(records)
+        store.close()
+        (tmp_path / "chunks.jsonl.compact").write_text("partial")
+
+        reopened = LocalVectorStore(str(tmp_path))
+
+        assert reopened.count() == 3
+        assert not (tmp_path / "chunks.jsonl.compact").exists()
+
+
+# ============================================================================
+# QUANTIZATION TESTS
+# ============================================================================
+
+class TestQuantization:
+    """Tests for int8-quantized storage."""
+
+    @pytest.mark.asyncio
+    async def test_int8_scores_close_to_float(self, tmp_path):
+        """Should approximate float32 cosine scores."""
+        rng = np.random.default_rng(1)
+        vectors = rng.normal(size=(50, 16))
+        recs = [_record(f"c{i}", v.tolist()) for i, v in enumerate(vectors)]
+
+        exact = LocalVectorStore()
+        quantized = LocalVectorStore(str(tmp_path), quantize=True)
+        await exact.upsert_many(recs)
+        await quantized.upsert_many(recs)
+
+        query = vectors[7].tolist()
+        exact_results = await exact.search(query, top_k=5)
+        quant_results = await quantized.search(query, top_k=5)
+
+        assert quantized._vectors.dtype == np.int8
+        assert quant_results[0][0].metadata.chunk_id == "c7"
+        assert quant_results[0][1] == pytest.approx(exact_results[0][1], abs=0.02)
+
+        quantized.close()
+        reopened = LocalVectorStore(str(tmp_path))
+        assert reopened.quantize
+        assert (await reopened.search(query, top_k=1))[0][0].metadata.chunk_id == "c7"
+
+
+# ============================================================================
+# RAG INTEGRATION TESTS
+# ============================================================================
+
+class TestRAGIntegration:
+    """Tests for AuditGuideRAG with the built-in store."""
+
+    def test_index_dir_creates_local_store(self, tmp_path):
+        """Should create a LocalVectorStore when index_dir is given."""
+        rag = AuditGuideRAG(index_dir=str(tmp_path))
+
+        assert isinstance(rag.vector_store, LocalVectorStore)
+
+    @pytest.mark.asyncio
+    async def test_cold_start_loads_corpus(self, tmp_path):
+        """Should reload chunks from disk on initialize after a restart."""
+        pages = [
+            {"page_number": 1, "text": "은행 잔액 조회", "section": "1.1 Bank"},
+            {"page_number": 2, "text": "재고 실사 입회", "section": "2.1 Inventory"},
+        ]
+        rag = AuditGuideRAG(embedding_model=KeywordEmbedding(), index_dir=str(tmp_path))
+        with patch.object(rag, '_extract_pdf_text', new_callable=AsyncMock, return_value=pages):
+            await rag.ingest_pdf("/guide.pdf", document_id="guide")
+        assert all(c.metadata.total_chunks is None for c in await rag.vector_store.load_chunks())
+        rag.vector_store.close()
+
+        restarted = AuditGuideRAG(embedding_model=KeywordEmbedding(), index_dir=str(tmp_path))
+        await restarted.initialize()
+
+        assert len(restarted.chunks) == 2
+        assert [c.metadata.total_chunks for c in restarted.chunks] == [2, 2]
+        result = await restarted.search("재고", mode=SearchMode.SEMANTIC, min_score=0.5)
+        assert result.procedures[0].section_code == "2.1"
+        bm25 = await restarted.search("은행", mode=SearchMode.BM25, min_score=0.1)
+        assert bm25.procedures[0].section_code == "1.1"
@@ -0,0 +1,177 @@
+"""
+Unit Tests for the Async Database Access Layer
+
+This module tests src/db/async_client.py with the PostgREST client and the
+direct Postgres pool replaced by mocks:
+
+- Query execution and per-query timeouts (QueryTimeoutError)
+- Hot queries on the direct pool as prepared statements
+- PostgREST fallback when no pool is configured or it fails to open
+- Row conversion to the PostgREST shape (ISO timestamps, string UUIDs)
+
+IMPORTANT: No real database connections are made during tests.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.db.async_client import (
+    AGENT_MESSAGES_AFTER_SQL,
+    RECENT_AGENT_MESSAGES_SQL,
+    AsyncDatabase,
+    QueryTimeoutError,
+    _jsonable_row,
+)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+class FakePool:
+    """Connection pool handing out one mocked connection."""
+
+    def __init__(self, rows):
+        self.cursor = MagicMock()
+        self.cursor.fetchall = AsyncMock(return_value=rows)
+        self.conn = MagicMock()
+        self.conn.execute = AsyncMock(return_value=self.cursor)
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self.conn
+
+
+@pytest.fixture
+def client():
+    """Mock supabase-py AsyncClient."""
+    return MagicMock()
+
+
+@pytest.fixture
+def db(client):
+    """AsyncDatabase on the mock client, without a direct pool."""
+    database = AsyncDatabase(url="http://supabase.test", service_key="test-key", conninfo="", timeout=1.0)
+    database._client = client
+    return database
+
+
+# ============================================================================
+# TEST: execute()
+# ============================================================================
+
+class TestExecute:
+    """Tests for AsyncDatabase.execute()."""
+
+    @pytest.mark.asyncio
+    async def test_returns_response(self, db):
+        """Should await the builder and return its response."""
+        query = MagicMock()
+        query.execute = AsyncMock(return_value=MagicMock(data=[{"id": "p1"}]))
+
+        result = await db.execute(query)
+
+        assert result.data == [{"id": "p1"}]
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self, db):
+        """Should abandon a slow query with QueryTimeoutError."""
+        async def slow():
+            await asyncio.sleep(5)
+
+        query = MagicMock()
+        query.execute = slow
+
+        with pytest.raises(QueryTimeoutError):
+            await db.execute(query, timeout=0.01)
+
+    def test_missing_credentials(self):
+        """Should raise ValueError when the client cannot be configured."""
+        database = AsyncDatabase(url="", service_key="", conninfo="")
+        database.url = None
+
+        with pytest.raises(ValueError, match="SUPABASE_URL"):
+            database.table("audit_projects")
+
+
+# ============================================================================
+# TEST: Hot queries
+# ============================================================================
+
+class TestHotQueries:
+    """Tests for agent_messages_after() and recent_agent_messages()."""
+
+    @pytest.mark.asyncio
+    async def test_postgrest_fallback(self, db, client):
+        """Should filter by cursor through PostgREST without a pool."""
+        ordered = client.table.return_value.select.return_value.eq.return_value.order.return_value
+        ordered.gt.return_value.execute = AsyncMock(return_value=MagicMock(data=[{"id": "m2"}]))
+
+        rows = await db.agent_messages_after("task-1", after="2024-01-06T12:00:00+00:00")
+
+        assert rows == [{"id": "m2"}]
+        ordered.gt.assert_called_once_with("created_at", "2024-01-06T12:00:00+00:00")
+
+    @pytest.mark.asyncio
+    async def test_prepared_statement_on_pool(self, db, client):
+        """Should run hot queries as prepared statements when a pool is open."""
+        created = datetime(2024, 1, 6, 12, 0, 1, tzinfo=timezone.utc)
+        pool = FakePool([{"id": UUID(int=1), "agent_role": "partner", "content": "hi", "created_at": created}])
+        db._pool = pool
+
+        rows = await db.agent_messages_after("task-1")
+
+        pool.conn.execute.assert_awaited_once_with(
+            AGENT_MESSAGES_AFTER_SQL, {"task_id": "task-1", "after": None}, prepare=True
+        )
+        assert rows[0]["id"] == str(UUID(int=1))
+        assert rows[0]["created_at"] == "2024-01-06T12:00:01+00:00"
+        client.table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recent_messages_on_pool(self, db):
+        """Should pass the limit to the prepared history query."""
+        pool = FakePool([])
+        db._pool = pool
+
+        assert await db.recent_agent_messages("task-1", limit=5) == []
+        pool.conn.execute.assert_awaited_once_with(
+            RECENT_AGENT_MESSAGES_SQL, {"task_id": "task-1", "limit": 5}, prepare=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_pool_failure_falls_back(self, client):
+        """Should use PostgREST after the direct pool fails to open."""
+        database = AsyncDatabase(
+            url="http://supabase.test",
+            service_key="test-key",
+            conninfo="postgresql://nobody@127.0.0.1:1/none",
+            timeout=0.5,
+        )
+        database._client = client
+        ordered = client.table.return_value.select.return_value.eq.return_value.order.return_value
+        ordered.limit.return_value.execute = AsyncMock(return_value=MagicMock(data=[]))
+
+        assert await database.recent_agent_messages("task-1") == []
+        assert database._pool is None
+        assert database._pool_failed is True
+
+
+# ============================================================================
+# TEST: Row conversion
+# ============================================================================
+
+def test_jsonable_row():
+    """Should convert datetimes and UUIDs, leaving other values alone."""
+    created = datetime(2024, 1, 6, 12, 0, tzinfo=timezone.utc)
+
+    assert _jsonable_row({"id": UUID(int=2), "created_at": created, "content": "x"}) == {
+        "id": str(UUID(int=2)),
+        "created_at": "2024-01-06T12:00:00+00:00",
+        "content": "x",
+    }
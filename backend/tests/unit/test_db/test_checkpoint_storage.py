@@ -0,0 +1,304 @@
+"""
+Unit Tests for Compact Checkpoint Storage
+
+This module tests src/db/checkpoint_storage.py without a database:
+
+- CheckpointSerializer round-trips (plain values, deltas, zstd compression)
+- Delta planning in DeltaPostgresSaver (append-only prefix, snapshot interval)
+- Delta chain resolution on read
+- Blob selection for compaction (kept checkpoints and delta bases survive)
+- CheckpointCompactor statements against a fake connection pool
+
+IMPORTANT: No real database connections are made during tests.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.db.checkpoint_storage import (
+    ChannelDelta,
+    CheckpointCompactor,
+    CheckpointSerializer,
+    DeltaPostgresSaver,
+    delta_base,
+    plan_blob_pruning,
+)
+
+
+def version(n: int) -> str:
+    """Channel version in the Postgres saver format."""
+    return f"{n:032}.{0.5:016}"
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def serde():
+    return CheckpointSerializer(compress_min_bytes=256)
+
+
+@pytest.fixture
+async def saver(serde):
+    """DeltaPostgresSaver on a mock pool (snapshot every 3 versions)."""
+    return DeltaPostgresSaver(MagicMock(), serde=serde, snapshot_every=3)
+
+
+class FakeCursor:
+    """Cursor answering the compactor's SELECTs and counting DELETEd rows."""
+
+    def __init__(self, blobs, checkpoints, thread_ids=()):
+        self.results = {"checkpoint_blobs": blobs, "checkpoints": checkpoints, "DISTINCT": thread_ids}
+        self.statements = []
+        self.rowcount = 0
+        self._rows = []
+
+    async def execute(self, sql, params=None):
+        self.statements.append((" ".join(sql.split()), params))
+        if sql.startswith("DELETE"):
+            self.rowcount = len(params[-1])
+        elif "DISTINCT" in sql:
+            self._rows = [{"thread_id": t} for t in self.results["DISTINCT"]]
+        elif "FROM checkpoint_blobs" in sql:
+            self._rows = self.results["checkpoint_blobs"]
+        else:
+            self._rows = self.results["checkpoints"]
+        return self
+
+    async def fetchall(self):
+        return self._rows
+
+
+class FakePool:
+    """AsyncConnectionPool handing out one connection over a FakeCursor."""
+
+    def __init__(self, cursor):
+        self.cur = cursor
+        self.conn = MagicMock()
+        self.conn.cursor.return_value = cursor
+        self.conn.execute = cursor.execute
+        self.conn.transaction = self._transaction
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def _transaction(self):
+        self.transactions += 1
+        yield
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self.conn
+
+
+@pytest.fixture
+def pool():
+    """Thread "t" with four checkpoints in the root namespace and one in "sub"."""
+    blobs = [
+        {"checkpoint_ns": "", "channel": "messages", "version": version(n), "type": "msgpack"}
+        for n in range(1, 5)
+    ] + [{"checkpoint_ns": "", "channel": "tasks", "version": version(1), "type": "msgpack"}]
+    checkpoints = [
+        {"checkpoint_ns": "", "checkpoint_id": f"c{n}",
+         "channel_versions": {"messages": version(n), "tasks": version(1)}}
+        for n in range(4, 0, -1)
+    ] + [{"checkpoint_ns": "sub", "checkpoint_id": "s1", "channel_versions": {}}]
+    return FakePool(FakeCursor(blobs, checkpoints, thread_ids=["t"]))
+
+
+def checkpoint(messages):
+    return {"v": 1, "id": "cp", "channel_values": {"messages": messages, "status": "x"}, "channel_versions": {}}
+
+
+def write(saver, messages, n):
+    """Encode a checkpoint as aput() does and remember its bases."""
+    stored, bases = saver._encode_deltas(("t", ""), checkpoint(messages), {"messages": version(n)})
+    saver._remember(("t", "", "messages"), bases["messages"])
+    return stored["channel_values"]["messages"]
+
+
+# ============================================================================
+# TEST: CheckpointSerializer
+# ============================================================================
+
+class TestCheckpointSerializer:
+    """Tests for CheckpointSerializer."""
+
+    def test_plain_round_trip(self, serde):
+        """Small values should be stored as plain msgpack."""
+        type_, data = serde.dumps_typed({"status": "In-Progress"})
+
+        assert not type_.endswith("+zstd")
+        assert serde.loads_typed((type_, data)) == {"status": "In-Progress"}
+
+    def test_delta_round_trip(self, serde):
+        """Deltas should carry their base version in the stored type."""
+        delta = ChannelDelta(version(4), 2, ["c", "d"])
+
+        type_, data = serde.dumps_typed(delta)
+
+        assert delta_base(type_) == version(4)
+        assert serde.loads_typed((type_, data)) == delta
+
+    def test_large_blob_compressed(self, serde):
+        """Blobs above the threshold should be zstd-compressed."""
+        pytest.importorskip("zstandard")
+        rows = [{"account": "Sales", "balance": 1000.0}] * 200
+
+        type_, data = serde.dumps_typed(rows)
+
+        assert type_.endswith("+zstd")
+        assert len(data) < len(CheckpointSerializer(compress_min_bytes=10**9).dumps_typed(rows)[1])
+        assert serde.loads_typed((type_, data)) == rows
+
+
+# ============================================================================
+# TEST: DeltaPostgresSaver
+# ============================================================================
+
+class TestDeltaPlanning:
+    """Tests for delta encoding and resolution."""
+
+    @pytest.mark.asyncio
+    async def test_first_write_is_snapshot(self, saver):
+        """Without a known base the full list should be stored."""
+        stored, bases = saver._encode_deltas(("t", ""), checkpoint(["a"]), {"messages": version(1)})
+
+        assert stored["channel_values"]["messages"] == ["a"]
+        assert bases["messages"].chain == 0
+
+    @pytest.mark.asyncio
+    async def test_append_becomes_delta(self, saver):
+        """Appending to the previous version should store only the tail."""
+        write(saver, ["a"], 1)
+
+        assert write(saver, ["a", "b"], 2) == ChannelDelta(version(1), 1, ["b"])
+
+    @pytest.mark.asyncio
+    async def test_rewrite_or_gap_is_snapshot(self, saver):
+        """A changed prefix or a skipped version should store the full list."""
+        write(saver, ["a"], 1)
+
+        rewritten, _ = saver._encode_deltas(("t", ""), checkpoint(["z", "b"]), {"messages": version(2)})
+        gap, _ = saver._encode_deltas(("t", ""), checkpoint(["a", "b"]), {"messages": version(3)})
+
+        assert rewritten["channel_values"]["messages"] == ["z", "b"]
+        assert gap["channel_values"]["messages"] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_interval(self, saver):
+        """A full snapshot should follow snapshot_every deltas."""
+        stored_values = [write(saver, [f"m{i}" for i in range(n)], n) for n in range(1, 7)]
+
+        kinds = ["delta" if isinstance(v, ChannelDelta) else "full" for v in stored_values]
+        assert kinds == ["full", "delta", "delta", "delta", "full", "delta"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_chain(self, saver):
+        """Reads should apply a delta chain to its snapshot."""
+        blobs = {
+            version(1): ["a", "b"],
+            version(2): ChannelDelta(version(1), 2, ["c"]),
+        }
+
+        async def load_blob(thread_key, channel, blob_version):
+            return blobs[blob_version]
+
+        saver._load_blob = load_blob
+        tuple_ = MagicMock()
+        tuple_.config = {"configurable": {"thread_id": "t", "checkpoint_ns": ""}}
+        tuple_.checkpoint = {
+            "channel_values": {"messages": ChannelDelta(version(2), 3, ["d"])},
+            "channel_versions": {"messages": version(3)},
+        }
+
+        await saver._resolve_checkpoint(tuple_)
+
+        assert tuple_.checkpoint["channel_values"]["messages"] == ["a", "b", "c", "d"]
+        base = saver._bases[("t", "", "messages")]
+        assert (base.version, base.chain) == (version(3), 2)
+
+
+# ============================================================================
+# TEST: Compaction planning
+# ============================================================================
+
+class TestPlanBlobPruning:
+    """Tests for plan_blob_pruning()."""
+
+    def test_keeps_referenced_and_delta_bases(self):
+        """Blobs of kept checkpoints and their delta bases should survive."""
+        blobs = [
+            ("", "messages", version(1), "msgpack"),
+            ("", "messages", version(2), "msgpack"),
+            ("", "messages", version(3), f"delta@{version(2)}"),
+            ("", "messages", version(4), f"delta@{version(3)}+zstd"),
+            ("", "tasks", version(1), "msgpack"),
+            ("", "tasks", version(2), "msgpack+zstd"),
+        ]
+        kept = [("", {"messages": version(4), "tasks": version(2)})]
+
+        assert plan_blob_pruning(blobs, kept) == {
+            ("", "messages"): [version(1)],
+            ("", "tasks"): [version(1)],
+        }
+
+    def test_never_prunes_newer_blobs(self):
+        """Blobs newer than the latest checkpoint (a write in flight) stay."""
+        blobs = [("", "messages", version(1), "msgpack"), ("", "messages", version(5), "msgpack")]
+        kept = [("", {"messages": version(1)})]
+
+        assert plan_blob_pruning(blobs, kept) == {}
+
+
+# ============================================================================
+# TEST: CheckpointCompactor
+# ============================================================================
+
+class TestCheckpointCompactor:
+    """Tests for compact_thread() and compact_all()."""
+
+    @pytest.mark.asyncio
+    async def test_compact_thread_deletes_superseded(self, pool):
+        """Should keep keep_last checkpoints per namespace and prune the rest in one transaction."""
+        compactor = CheckpointCompactor(MagicMock(conn=pool), keep_last=2, interval=0)
+
+        result = await compactor.compact_thread("t")
+
+        deletes = [(sql, params) for sql, params in pool.cur.statements if sql.startswith("DELETE")]
+        assert deletes == [
+            ("DELETE FROM checkpoint_writes WHERE thread_id = %s AND checkpoint_ns = %s "
+             "AND checkpoint_id = ANY(%s)", ("t", "", ["c2", "c1"])),
+            ("DELETE FROM checkpoints WHERE thread_id = %s AND checkpoint_ns = %s "
+             "AND checkpoint_id = ANY(%s)", ("t", "", ["c2", "c1"])),
+            ("DELETE FROM checkpoint_blobs WHERE thread_id = %s AND checkpoint_ns = %s "
+             "AND channel = %s AND version = ANY(%s)", ("t", "", "messages", [version(1), version(2)])),
+        ]
+        assert pool.cur.statements[0][1] == ("t",)
+        assert pool.transactions == 1
+        assert result.to_dict() == {"threads": 1, "checkpoints": 2, "blobs": 2, "writes": 2}
+
+    @pytest.mark.asyncio
+    async def test_compact_thread_within_keep_last(self, pool):
+        """Should delete nothing when no namespace exceeds keep_last."""
+        compactor = CheckpointCompactor(MagicMock(conn=pool), keep_last=4, interval=0)
+
+        result = await compactor.compact_thread("t")
+
+        assert not any(sql.startswith("DELETE") for sql, _ in pool.cur.statements)
+        assert result.to_dict() == {"threads": 0, "checkpoints": 0, "blobs": 0, "writes": 0}
+
+    @pytest.mark.asyncio
+    async def test_compact_all(self, pool):
+        """Should select threads over keep_last and sum their results."""
+        compactor = CheckpointCompactor(MagicMock(conn=pool), keep_last=2, interval=0)
+
+        result = await compactor.compact_all()
+
+        sql, params = pool.cur.statements[0]
+        assert "HAVING count(*) > %s" in sql
+        assert params == (2,)
+        assert result.checkpoints == 2
+        assert compactor.last_result is result
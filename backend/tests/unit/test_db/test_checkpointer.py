@@ -19,12 +19,15 @@ Target Coverage: 100%
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import AsyncMock, Mock, MagicMock, patch, call
 import os
 from dotenv import load_dotenv
 
 # Import the module under test
 from src.db.checkpointer import (
+    checkpoint_pool_size,
+    get_async_checkpointer,
+    get_graph_max_concurrency,
     get_checkpointer,
     setup_checkpoint_tables,
     get_checkpoint_by_thread_id,
@@ -661,6 +664,74 @@ class TestIntegration:
                 assert call_obj[0][0] == test_conn_string
 
 
+# ============================================================================
+# TEST: get_async_checkpointer() and pool sizing
+# ============================================================================
+
+
+class TestAsyncCheckpointer:
+    """Tests for the pooled DeltaPostgresSaver and its pool sizing."""
+
+    def test_pool_size_follows_fan_out(self, monkeypatch):
+        """Pool holds one connection per concurrent subgraph plus headroom."""
+        monkeypatch.setenv("GRAPH_MAX_CONCURRENCY", "32")
+        monkeypatch.delenv("CHECKPOINT_POOL_MAX_SIZE", raising=False)
+
+        assert get_graph_max_concurrency() == 32
+        assert checkpoint_pool_size() == 36
+        assert checkpoint_pool_size(8) == 12
+
+    def test_pool_size_override(self, monkeypatch):
+        """CHECKPOINT_POOL_MAX_SIZE takes precedence over the fan-out."""
+        monkeypatch.setenv("CHECKPOINT_POOL_MAX_SIZE", "50")
+
+        assert checkpoint_pool_size(8) == 50
+
+    @pytest.mark.asyncio
+    async def test_opens_pool_and_sets_up(self, valid_connection_string):
+        """Should open the pool, run setup() and close the pool on exit."""
+        pool = MagicMock()
+        pool.open = AsyncMock()
+        pool.close = AsyncMock()
+        saver = MagicMock()
+        saver.setup = AsyncMock()
+
+        with patch("psycopg_pool.AsyncConnectionPool", return_value=pool) as pool_cls, \
+             patch("src.db.checkpoint_storage.DeltaPostgresSaver", return_value=saver) as saver_cls:
+            async with get_async_checkpointer(valid_connection_string, max_size=12) as result:
+                assert result is saver
+                pool.close.assert_not_awaited()
+
+        assert pool_cls.call_args.kwargs["max_size"] == 12
+        assert pool_cls.call_args.kwargs["kwargs"]["autocommit"] is True
+        saver_cls.assert_called_once_with(pool)
+        saver.setup.assert_awaited_once()
+        pool.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_closes_pool_when_open_fails(self, valid_connection_string):
+        """Should not leak a pool whose connections could not be opened."""
+        pool = MagicMock()
+        pool.open = AsyncMock(side_effect=TimeoutError("pool timeout"))
+        pool.close = AsyncMock()
+
+        with patch("psycopg_pool.AsyncConnectionPool", return_value=pool):
+            with pytest.raises(TimeoutError):
+                async with get_async_checkpointer(valid_connection_string, max_size=4):
+                    pass
+
+        pool.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_raises_on_missing_env(self, monkeypatch):
+        """Should require POSTGRES_CONNECTION_STRING like get_checkpointer."""
+        monkeypatch.delenv("POSTGRES_CONNECTION_STRING", raising=False)
+
+        with pytest.raises(ValueError, match="POSTGRES_CONNECTION_STRING"):
+            async with get_async_checkpointer():
+                pass
+
+
 # ============================================================================
 # TEST: Load_dotenv Behavior
 # ============================================================================